@@ -0,0 +1 @@
+"""Benchmarks et outils de simulation Pool Control."""
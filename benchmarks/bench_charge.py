@@ -0,0 +1,179 @@
+"""Montée en charge : N bassins dans une seule boucle d'événements.
+
+Démarre N `PoolController` sur un faux Home Assistant en mémoire
+(`tests.fakehass`), cadencés par le planificateur partagé et une horloge
+virtuelle, puis mesure pour chaque N :
+
+- le temps CPU par minute simulée et par cycle de bassin ;
+- la mémoire occupée par bassin (tracemalloc, après une minute de chauffe) ;
+- les écritures du store, les appels de services et les états analysés par le
+  cache des lectures, par bassin et par heure ;
+- la durée maximum d'une seconde de la roue.
+
+Les bassins lisent l'heure sur l'horloge virtuelle, qui démarre à minuit. La
+temporisation entre deux commandes d'équipements est ramenée à zéro : c'est une
+attente, pas du temps CPU.
+
+Usage :
+    python -m benchmarks.bench_charge
+    python -m benchmarks.bench_charge --bassins 1 50 500 --minutes 120
+"""
+
+import argparse
+import asyncio
+from datetime import date, datetime, time as dtime
+import logging
+import math
+import time
+import tracemalloc
+
+from custom_components.pool_control.controller import PoolController
+from custom_components.pool_control.horloge import HorlogeVirtuelle
+from custom_components.pool_control.lectures import CacheLectures
+from custom_components.pool_control.planificateur import PLANIFICATEUR_CASES, Planificateur
+from tests.fakehass import FakeHass, integrationSimulee
+
+BASSINS = (1, 10, 100, 300)
+MINUTES = 60
+
+# Capteurs partagés par tous les bassins du site
+TEMPERATURE_EXTERIEURE = "sensor.temperature_exterieure"
+LEVER_SOLEIL = "sensor.lever_soleil"
+
+
+def configBassin(index: int) -> dict:
+    """Configuration d'un bassin : capteur d'eau et relais propres."""
+
+    return {
+        "temperatureWater": f"sensor.bassin_{index}_eau",
+        "temperatureOutdoor": TEMPERATURE_EXTERIEURE,
+        "leverSoleil": LEVER_SOLEIL,
+        "filtration": f"switch.bassin_{index}_filtration",
+        "traitement": f"switch.bassin_{index}_traitement",
+        "surpresseur": f"switch.bassin_{index}_surpresseur",
+    }
+
+
+def temperatureEau(index: int, timestamp: float) -> float:
+    """Température de l'eau : cycle journalier, décalé par bassin."""
+
+    heure = (timestamp % 86400) / 3600
+    return round(24.0 + (index % 5) + 2.0 * math.sin((heure - 9) * math.pi / 12), 1)
+
+
+async def creerBassins(
+    hass: FakeHass, planificateur: Planificateur, cache: CacheLectures, nombre: int
+) -> list:
+    """Crée et démarre les bassins."""
+
+    hass.states.async_set(TEMPERATURE_EXTERIEURE, 20.0)
+    hass.states.async_set(
+        LEVER_SOLEIL, datetime.combine(date.today(), dtime(6, 30)).isoformat()
+    )
+
+    controllers = []
+    for index in range(nombre):
+        config = configBassin(index)
+        for cle in ("filtration", "traitement", "surpresseur"):
+            hass.states.async_set(config[cle], "off")
+        hass.states.async_set(
+            config["temperatureWater"], temperatureEau(index, hass.horloge.time())
+        )
+
+        controller = PoolController(hass, config, f"bassin_{index}", f"Bassin {index}")
+        controller.horloge = hass.horloge
+        controller.planificateur = planificateur
+        controller.cacheLectures = cache
+        await controller.async_initialize()
+        await controller.startLectures()
+        await controller.startFirstCron()
+        controllers.append(controller)
+
+    return controllers
+
+
+async def tournerMinute(hass: FakeHass, horloge: HorlogeVirtuelle, planificateur: Planificateur, controllers: list) -> float:
+    """Une minute simulée ; retourne le temps CPU passé dans l'intégration."""
+
+    for index, controller in enumerate(controllers):
+        hass.states.async_set(
+            controller.temperatureWater, temperatureEau(index, horloge.time())
+        )
+
+    cpu = 0.0
+    for _ in range(PLANIFICATEUR_CASES):
+        horloge.avancer(1)
+        debut = time.process_time()
+        await planificateur._async_tick()
+        await hass.async_block_till_done()
+        cpu += time.process_time() - debut
+
+    return cpu
+
+
+async def mesurer(nombre: int, minutes: int) -> dict:
+    """Mesures pour N bassins."""
+
+    horloge = HorlogeVirtuelle(datetime.combine(date.today(), dtime(0, 0)).timestamp())
+    hass = FakeHass(horloge)
+    planificateur = Planificateur(hass)
+    cache = CacheLectures(hass)
+
+    with integrationSimulee():
+        # Mémoire : création et première minute sous tracemalloc
+        tracemalloc.start()
+        avant = tracemalloc.get_traced_memory()[0]
+        controllers = await creerBassins(hass, planificateur, cache, nombre)
+        await tournerMinute(hass, horloge, planificateur, controllers)
+        memoire = tracemalloc.get_traced_memory()[0] - avant
+        tracemalloc.stop()
+
+        ecritures = sum(c.store.ecritures for c in controllers)
+        appels = hass.services.appels
+        analyses = cache.analyses
+
+        cpu = 0.0
+        for _ in range(minutes):
+            cpu += await tournerMinute(hass, horloge, planificateur, controllers)
+
+        ecritures = sum(c.store.ecritures for c in controllers) - ecritures
+        appels = hass.services.appels - appels
+        analyses = cache.analyses - analyses
+
+    heures = minutes / 60
+    return {
+        "bassins": nombre,
+        "cpuMinute": cpu / minutes * 1000,
+        "cpuCycle": cpu / (minutes * nombre) * 1e6,
+        "memoire": memoire / nombre / 1024,
+        "ecritures": ecritures / nombre / heures,
+        "appels": appels / nombre / heures,
+        "analyses": analyses / nombre / heures,
+        "secondeMax": planificateur.dureeTick.snapshot().get("max", 0.0),
+    }
+
+
+def main() -> None:
+    """Affiche les mesures pour chaque nombre de bassins."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bassins", type=int, nargs="+", default=BASSINS)
+    parser.add_argument("--minutes", type=int, default=MINUTES)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    print(
+        f"{'bassins':>8}{'CPU ms/min':>12}{'µs/cycle':>10}{'KiB/bassin':>12}"
+        f"{'store/h':>9}{'services/h':>12}{'lectures/h':>12}{'seconde max ms':>16}"
+    )
+    for nombre in args.bassins:
+        r = asyncio.run(mesurer(nombre, args.minutes))
+        print(
+            f"{r['bassins']:>8}{r['cpuMinute']:>12.2f}{r['cpuCycle']:>10.1f}{r['memoire']:>12.1f}"
+            f"{r['ecritures']:>9.1f}{r['appels']:>12.1f}{r['analyses']:>12.1f}{r['secondeMax']:>16.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
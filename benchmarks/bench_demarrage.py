@@ -0,0 +1,163 @@
+"""Démarrage de l'intégration : de l'import à la première décision.
+
+Chaque mesure tourne dans un interpréteur neuf, après l'import des modules de
+Home Assistant déjà chargés quand l'intégration est installée (config entries,
+helpers, `http` dont elle dépend). Elle chronomètre :
+
+- l'import du paquet `custom_components.pool_control` ;
+- `async_setup_entry` sur le faux Home Assistant (`tests.fakehass`) en
+  cours de démarrage, plateformes `sensor` et `button` comprises ;
+- après `homeassistant_started`, le calcul jusqu'à la première décision,
+  l'attente étant sautée sur horloge virtuelle.
+
+Affiche la médiane des mesures et les modules de flow chargés en chemin (aucun
+attendu : ils ne le sont qu'à l'ouverture d'un flow).
+
+Usage :
+    python -m benchmarks.bench_demarrage
+    python -m benchmarks.bench_demarrage --mesures 20
+"""
+
+import argparse
+import asyncio
+from datetime import datetime
+import importlib
+import json
+import logging
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+MESURES = 10
+
+# Modules de Home Assistant chargés avant l'intégration
+HA_CHARGE = (
+    "homeassistant.config_entries",
+    "homeassistant.components.http",
+    "homeassistant.helpers.config_validation",
+    "homeassistant.helpers.entity_registry",
+    "homeassistant.helpers.event",
+    "homeassistant.helpers.storage",
+)
+
+DEBUT = datetime(2025, 6, 15, 10, 0)
+
+# Attente maximum de la première décision (secondes virtuelles)
+DECISION_DELAI = 600
+
+
+def mesurer() -> dict:
+    """Une mesure, dans l'interpréteur courant qui doit être neuf."""
+
+    for module in HA_CHARGE:
+        importlib.import_module(module)
+
+    debut = time.perf_counter()
+    integration = importlib.import_module("custom_components.pool_control")
+    dureeImport = time.perf_counter() - debut
+
+    # Le faux Home Assistant importe l'intégration : après la mesure de l'import
+    from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
+    from homeassistant.core import CoreState
+
+    from custom_components.pool_control.const import DOMAIN
+    from custom_components.pool_control.horloge import HorlogeVirtuelle
+
+    from tests.fakehass import FakeConfigEntry, FakeHass, integrationSimulee
+    from .simulation_saison import CONFIG
+
+    hass = FakeHass(HorlogeVirtuelle(DEBUT.timestamp()))
+    hass.state = CoreState.starting
+    hass.states.async_set(CONFIG["temperatureWater"], 26.0)
+    hass.states.async_set(CONFIG["temperatureOutdoor"], 24.0)
+    hass.states.async_set(CONFIG["leverSoleil"], datetime(2025, 6, 16, 5, 50).isoformat())
+    for cle in ("filtration", "traitement", "surpresseur"):
+        hass.states.async_set(CONFIG[cle], "off")
+
+    entry = FakeConfigEntry(dict(CONFIG))
+
+    async def demarrer() -> tuple[float, float]:
+        """Installe l'entry puis avance jusqu'à la première décision."""
+
+        debut = time.perf_counter()
+        await integration.async_setup_entry(hass, entry)
+        await hass.async_block_till_done()
+        dureeSetup = time.perf_counter() - debut
+
+        controller = hass.data[DOMAIN][entry.entry_id]
+        debut = time.perf_counter()
+        hass.state = CoreState.running
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+        await hass.async_block_till_done()
+        for _ in range(DECISION_DELAI):
+            if controller.traceDecisions:
+                break
+            await hass.async_avancer(1)
+        dureeDecision = time.perf_counter() - debut
+
+        await integration.async_unload_entry(hass, entry)
+        return dureeSetup, dureeDecision
+
+    with integrationSimulee():
+        dureeSetup, dureeDecision = asyncio.run(demarrer())
+
+    return {
+        "import": dureeImport,
+        "setup": dureeSetup,
+        "decision": dureeDecision,
+        "flows": sorted(
+            module
+            for module in sys.modules
+            if module.startswith("custom_components.") and module.endswith("_flow")
+        ),
+    }
+
+
+def main() -> None:
+    """Affiche la médiane des mesures, chacune dans un interpréteur neuf."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mesures", type=int, default=MESURES)
+    parser.add_argument("--mesure", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    if args.mesure:
+        print(json.dumps(mesurer()))
+        return
+
+    racine = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    mesures = [
+        json.loads(
+            subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_demarrage", "--mesure"],
+                cwd=racine,
+                capture_output=True,
+                check=True,
+                text=True,
+            ).stdout
+        )
+        for _ in range(args.mesures)
+    ]
+
+    print(f"{'étape':<24}{'médiane ms':>12}{'min ms':>10}{'max ms':>10}")
+    for etape, libelle in (
+        ("import", "import"),
+        ("setup", "async_setup_entry"),
+        ("decision", "première décision"),
+    ):
+        durees = [mesure[etape] * 1000 for mesure in mesures]
+        print(
+            f"{libelle:<24}{statistics.median(durees):>12.2f}"
+            f"{min(durees):>10.2f}{max(durees):>10.2f}"
+        )
+
+    flows = sorted({module for mesure in mesures for module in mesure["flows"]})
+    print(f"\n{len(mesures)} mesures ; modules de flow chargés : {', '.join(flows) or 'aucun'}")
+
+
+if __name__ == "__main__":
+    main()
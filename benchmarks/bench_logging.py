@@ -0,0 +1,83 @@
+"""Coût par cycle de la journalisation du calcul de statut.
+
+Compare, pour un cycle d'une minute, l'ancienne journalisation (3 lignes INFO
+avec `datetime.fromtimestamp(...).strftime(...)` évalués à chaque appel) et la
+journalisation actuelle (logger de décision en DEBUG avec `LazyTimestamp`).
+
+Usage :
+    python -m benchmarks.bench_logging
+"""
+
+from datetime import datetime
+import logging
+import os
+import time
+import timeit
+
+from custom_components.pool_control.log import DECISION_LOGGER, LazyTimestamp
+
+TICKS = 20000
+
+_LOGGER = logging.getLogger("custom_components.pool_control.saison")
+
+
+def tick_avant(timeNow: float, filtrationDebut: float, filtrationFin: float) -> None:
+    """Journalisation d'origine de calculateStatusFiltration."""
+
+    _LOGGER.info(
+        "calculateStatusFiltration: timeNow=%s",
+        datetime.fromtimestamp(timeNow).strftime("%H:%M %d-%m-%Y"),
+    )
+    _LOGGER.info(
+        "calculateStatusFiltration: filtrationDebut=%s",
+        datetime.fromtimestamp(filtrationDebut).strftime("%H:%M %d-%m-%Y"),
+    )
+    _LOGGER.info(
+        "calculateStatusFiltration: filtrationFin=%s",
+        datetime.fromtimestamp(filtrationFin).strftime("%H:%M %d-%m-%Y"),
+    )
+
+
+def tick_apres(timeNow: float, filtrationDebut: float, filtrationFin: float) -> None:
+    """Journalisation actuelle de calculateStatusFiltration."""
+
+    DECISION_LOGGER.debug(
+        "calculateStatusFiltration: timeNow=%s filtrationDebut=%s filtrationFin=%s",
+        LazyTimestamp(timeNow),
+        LazyTimestamp(filtrationDebut),
+        LazyTimestamp(filtrationFin),
+    )
+
+
+def mesurer(fonction, niveau: int) -> float:
+    """Durée moyenne d'un cycle en microsecondes pour un niveau de log."""
+
+    logging.getLogger("custom_components.pool_control").setLevel(niveau)
+    timeNow = time.time()
+    duree = timeit.timeit(
+        lambda: fonction(timeNow, timeNow - 3600, timeNow + 3600), number=TICKS
+    )
+    return duree / TICKS * 1e6
+
+
+def main() -> None:
+    """Affiche le coût par cycle avant/après pour chaque niveau de log."""
+
+    # Les lignes émises sont écrites comme dans home-assistant.log
+    handler = logging.StreamHandler(open(os.devnull, "w", encoding="utf-8"))
+    handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s (%(threadName)s) [%(name)s] %(message)s")
+    )
+    root = logging.getLogger()
+    root.handlers[:] = [handler]
+    root.setLevel(logging.DEBUG)
+
+    print(f"{'niveau':<10}{'avant (µs/cycle)':>20}{'après (µs/cycle)':>20}")
+    for nom, niveau in (("WARNING", logging.WARNING), ("INFO", logging.INFO), ("DEBUG", logging.DEBUG)):
+        avant = mesurer(tick_avant, niveau)
+        apres = mesurer(tick_apres, niveau)
+        print(f"{nom:<10}{avant:>20.2f}{apres:>20.2f}")
+
+
+if __name__ == "__main__":
+    main()
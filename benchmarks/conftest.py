@@ -0,0 +1,74 @@
+"""Fixtures des benchmarks pytest : un bassin sur le faux Home Assistant.
+
+Le bassin est piloté par une horloge virtuelle fixée au 15 juin 2025 à 10h,
+au milieu de sa plage de filtration ; les commandes d'équipements ne sont
+pas temporisées.
+"""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+
+# Les benchmarks demandent Home Assistant et pytest-benchmark
+pytest.importorskip("homeassistant")
+pytest.importorskip("pytest_benchmark")
+
+from custom_components.pool_control.controller import PoolController
+from custom_components.pool_control.horloge import HorlogeVirtuelle
+from tests.fakehass import FakeHass, integrationSimulee
+
+DEBUT = datetime(2025, 6, 15, 10, 0)
+
+CONFIG = {
+    "temperatureWater": "sensor.temperature_eau",
+    "temperatureOutdoor": "sensor.temperature_exterieure",
+    "leverSoleil": "sensor.lever_soleil",
+    "filtration": "switch.filtration",
+    "traitement": "switch.traitement",
+    "surpresseur": "switch.surpresseur",
+}
+
+
+@pytest.fixture
+def boucle():
+    """Boucle d'événements dédiée, les benchmarks étant synchrones."""
+    boucle = asyncio.new_event_loop()
+    yield boucle
+    boucle.close()
+
+
+@pytest.fixture
+def hass(tmp_path):
+    """Faux Home Assistant sur horloge virtuelle, capteurs et relais renseignés."""
+    hass = FakeHass(HorlogeVirtuelle(DEBUT.timestamp()), str(tmp_path))
+
+    hass.states.async_set(CONFIG["temperatureWater"], 26.0)
+    hass.states.async_set(CONFIG["temperatureOutdoor"], 24.0)
+    hass.states.async_set(CONFIG["leverSoleil"], datetime(2025, 6, 16, 5, 50).isoformat())
+    for cle in ("filtration", "traitement", "surpresseur"):
+        hass.states.async_set(CONFIG[cle], "off")
+
+    return hass
+
+
+def creerBassin(hass, boucle):
+    """Bassin initialisé sur le faux Home Assistant."""
+    controller = PoolController(hass, dict(CONFIG), "benchmark", "Benchmark")
+    controller.horloge = hass.horloge
+    boucle.run_until_complete(controller.async_initialize())
+    return controller
+
+
+@pytest.fixture
+def bassin(hass, boucle):
+    """Bassin en saison."""
+    with integrationSimulee():
+        yield creerBassin(hass, boucle)
+
+
+@pytest.fixture
+def bassinHivernage(hass, boucle):
+    """Bassin en hivernage."""
+    with integrationSimulee({"hivernageWidgetStatus": 1}):
+        yield creerBassin(hass, boucle)
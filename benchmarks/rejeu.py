@@ -0,0 +1,290 @@
+"""Rejeu d'un historique Home Assistant sur le contrôleur.
+
+Lit un export de l'historique (CSV du panneau Historique : `entity_id`,
+`state`, `last_changed` ; JSON Lines `.jsonl`, un état par ligne avec les
+mêmes champs ; ou réponse JSON `.json` de l'API `/api/history/period`, un
+tableau d'états par entité) et le rejoue sur un bassin du faux Home Assistant, seconde par seconde
+sur horloge virtuelle. Les capteurs de température et de lever du soleil sont
+rejoués tels quels ; l'historique des actionneurs n'est pas injecté, il sert de
+référence : le rejeu compte les minutes où la filtration rejouée diffère de la
+filtration enregistrée.
+
+La sortie est un flux JSON Lines : plannings calculés (`planning`), décisions
+avec leurs commandes (`decision`), appels de services émis (`commande`), puis
+un bilan (`bilan`). Les exports CSV et JSON Lines sont lus en flux, entité par
+entité, et fusionnés par horodatage : un historique de plusieurs années à la
+minute ne tient jamais en mémoire. La réponse JSON de l'API est un seul
+document, chargé en entier.
+
+Usage :
+    python -m benchmarks.rejeu historique.csv --config config.json
+    python -m benchmarks.rejeu historique.jsonl --config diagnostics.json --sortie rejeu.jsonl
+    python -m benchmarks.rejeu history.json --config diagnostics.json
+
+`--config` accepte la configuration du bassin ou le fichier de diagnostics
+téléchargé depuis Home Assistant (section `config`).
+"""
+
+import argparse
+import asyncio
+import csv
+from datetime import datetime
+import heapq
+import json
+import logging
+import sys
+from typing import Any, AsyncIterator, Iterable, Iterator, Optional
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.pool_control.controller import PoolController
+from custom_components.pool_control.horloge import HorlogeVirtuelle
+from custom_components.pool_control.lectures import CacheLectures
+from custom_components.pool_control.planificateur import PLANIFICATEUR_CASES, Planificateur
+from tests.fakehass import FakeHass, integrationSimulee
+
+# Capteurs rejoués, actionneurs comparés (clés de configuration)
+CAPTEURS = ("temperatureWater", "temperatureOutdoor", "leverSoleil")
+ACTIONNEURS = ("filtration", "traitement", "traitement_2", "surpresseur")
+
+# Clés du store formant le planning
+PLANNING = ("filtrationDebut", "filtrationPauseDebut", "filtrationPauseFin", "filtrationFin")
+
+
+def _horodatage(valeur: str) -> Optional[float]:
+    """Timestamp d'une date ISO 8601 de l'export."""
+
+    instant = dt_util.parse_datetime(valeur)
+    return None if instant is None else instant.timestamp()
+
+
+def lireCsv(chemin: str, entity_id: str) -> Iterator[tuple[float, str, str]]:
+    """États d'une entité dans un export CSV, dans l'ordre du fichier."""
+
+    with open(chemin, newline="", encoding="utf-8") as fichier:
+        for ligne in csv.DictReader(fichier):
+            if ligne.get("entity_id") != entity_id:
+                continue
+            horodatage = _horodatage(ligne.get("last_changed", ""))
+            if horodatage is not None:
+                yield horodatage, entity_id, ligne["state"]
+
+
+def lireJsonl(chemin: str, entity_id: str) -> Iterator[tuple[float, str, str]]:
+    """États d'une entité dans un export JSON Lines, dans l'ordre du fichier."""
+
+    with open(chemin, encoding="utf-8") as fichier:
+        for ligne in fichier:
+            if not ligne.strip():
+                continue
+            etat = json.loads(ligne)
+            if etat.get("entity_id") != entity_id:
+                continue
+            horodatage = _horodatage(etat.get("last_changed") or etat.get("last_updated", ""))
+            if horodatage is not None:
+                yield horodatage, entity_id, etat["state"]
+
+
+def lireJson(chemin: str, entites: Iterable[str]) -> Iterator[tuple[float, str, str]]:
+    """États des entités dans une réponse JSON de l'API, fusionnés par horodatage.
+
+    La réponse de `/api/history/period` est un tableau d'états par entité ;
+    avec `minimal_response`, seul le premier état porte l'`entity_id`.
+    """
+
+    with open(chemin, encoding="utf-8") as fichier:
+        historique = json.load(fichier)
+
+    entites = set(entites)
+    flux = []
+    for etats in historique:
+        entity_id = next((etat["entity_id"] for etat in etats if etat.get("entity_id")), None)
+        if entity_id not in entites:
+            continue
+        evenements = []
+        for etat in etats:
+            horodatage = _horodatage(etat.get("last_changed") or etat.get("last_updated", ""))
+            if horodatage is not None:
+                evenements.append((horodatage, entity_id, etat["state"]))
+        flux.append(sorted(evenements))
+
+    return heapq.merge(*flux)
+
+
+def lireHistorique(chemin: str, entites: Iterable[str]) -> Iterator[tuple[float, str, str]]:
+    """États des entités, fusionnés par horodatage.
+
+    Le format suit l'extension : `.json` pour la réponse de l'API, `.jsonl`
+    pour JSON Lines, CSV sinon. En CSV et JSON Lines, chaque entité est lue par
+    son propre passage sur le fichier : l'export peut être groupé par entité
+    (CSV de Home Assistant) ou entrelacé, seul l'état courant de chaque entité
+    est en mémoire.
+    """
+
+    if chemin.endswith(".json"):
+        return lireJson(chemin, entites)
+
+    lire = lireJsonl if chemin.endswith(".jsonl") else lireCsv
+    return heapq.merge(*(lire(chemin, entity_id) for entity_id in entites))
+
+
+def lireConfig(chemin: str) -> dict:
+    """Configuration du bassin, seule ou dans un fichier de diagnostics."""
+
+    with open(chemin, encoding="utf-8") as fichier:
+        contenu = json.load(fichier)
+
+    contenu = contenu.get("data", contenu)
+    return contenu.get("config", contenu)
+
+
+def _iso(timestamp: Any) -> Optional[str]:
+    """Timestamp du store en date ISO locale."""
+
+    if not timestamp:
+        return None
+    return datetime.fromtimestamp(float(timestamp)).isoformat()
+
+
+async def rejouer(
+    evenements: Iterable[tuple[float, str, str]], config: dict
+) -> AsyncIterator[dict[str, Any]]:
+    """Rejoue l'historique ; produit plannings, décisions, commandes puis le bilan."""
+
+    evenements = iter(evenements)
+    premier = next(evenements, None)
+    if premier is None:
+        return
+
+    # Démarrage à la minute de la première mesure
+    horloge = HorlogeVirtuelle(premier[0] - premier[0] % 60)
+    hass = FakeHass(horloge)
+    hass.services.journal = []
+    capteurs = {config[cle] for cle in CAPTEURS if config.get(cle)}
+    actionneurs = {config[cle]: cle for cle in ACTIONNEURS if config.get(cle)}
+
+    # Dernier état enregistré de chaque actionneur
+    enregistres = {}
+
+    with integrationSimulee():
+        for entity_id in actionneurs:
+            hass.states.async_set(entity_id, "off")
+
+        controller = PoolController(hass, config, "rejeu", "Rejeu")
+        controller.horloge = horloge
+        controller.planificateur = Planificateur(hass)
+        controller.cacheLectures = CacheLectures(hass)
+        await controller.async_initialize()
+        await controller.startLectures()
+        await controller.startFirstCron()
+
+        roue = controller.planificateur.roue
+        suivant = premier
+        planning = None
+        derniereDecision = None
+        minutes = ecarts = decisions = 0
+
+        while suivant is not None:
+            # États enregistrés jusqu'à l'instant courant
+            while suivant is not None and suivant[0] <= horloge.maintenant:
+                _, entity_id, etat = suivant
+                if entity_id in capteurs:
+                    hass.states.async_set(entity_id, etat)
+                elif entity_id in actionneurs:
+                    enregistres[actionneurs[entity_id]] = etat
+                suivant = next(evenements, None)
+
+            if roue[controller.planificateur.position]:
+                await controller.planificateur._async_tick()
+                if hass.taches:
+                    await hass.async_block_till_done()
+
+                # Décisions émises pendant la seconde, dans l'ordre
+                nouvelles = []
+                for decision in reversed(controller.traceDecisions):
+                    if decision is derniereDecision:
+                        break
+                    nouvelles.append(decision)
+                for decision in reversed(nouvelles):
+                    decisions += 1
+                    yield {"type": "decision", **decision.as_dict()}
+                if nouvelles:
+                    derniereDecision = nouvelles[0]
+
+                for domain, service, service_data in hass.services.journal:
+                    yield {
+                        "type": "commande",
+                        "horodatage": horloge.now().isoformat(),
+                        "service": f"{domain}.{service}",
+                        "entity_id": service_data.get("entity_id"),
+                    }
+                hass.services.journal.clear()
+
+                courant = tuple(controller.get_data(cle) for cle in PLANNING)
+                if courant != planning:
+                    planning = courant
+                    yield {
+                        "type": "planning",
+                        "horodatage": horloge.now().isoformat(),
+                        **{cle: _iso(valeur) for cle, valeur in zip(PLANNING, courant)},
+                    }
+            else:
+                controller.planificateur.position = (
+                    controller.planificateur.position + 1
+                ) % PLANIFICATEUR_CASES
+
+            # Filtration rejouée et enregistrée, comparées chaque minute
+            if horloge.maintenant % 60 == 0 and "filtration" in enregistres:
+                minutes += 1
+                rejouee = hass.states.get(config["filtration"]).state
+                if rejouee != enregistres["filtration"]:
+                    ecarts += 1
+
+            horloge.avancer(1)
+
+        await controller.stopFirstCron()
+        await controller.stopSecondCron()
+        await controller.stopLectures()
+
+    yield {
+        "type": "bilan",
+        "debut": datetime.fromtimestamp(premier[0]).isoformat(),
+        "fin": horloge.now().isoformat(),
+        "decisions": decisions,
+        "commandes": hass.services.appels,
+        "minutesComparees": minutes,
+        "minutesEcart": ecarts,
+    }
+
+
+async def _ecrire(chemin: str, config: dict, sortie: Any) -> None:
+    """Écrit le flux du rejeu, une ligne JSON par enregistrement."""
+
+    entites = [config[cle] for cle in CAPTEURS + ACTIONNEURS if config.get(cle)]
+
+    async for enregistrement in rejouer(lireHistorique(chemin, entites), config):
+        sortie.write(json.dumps(enregistrement, ensure_ascii=False) + "\n")
+
+
+def main() -> None:
+    """Rejoue un export d'historique."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("historique")
+    parser.add_argument("--config", required=True)
+    parser.add_argument("--sortie")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    config = lireConfig(args.config)
+
+    if args.sortie:
+        with open(args.sortie, "w", encoding="utf-8") as sortie:
+            asyncio.run(_ecrire(args.historique, config, sortie))
+    else:
+        asyncio.run(_ecrire(args.historique, config, sys.stdout))
+
+
+if __name__ == "__main__":
+    main()
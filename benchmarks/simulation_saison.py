@@ -0,0 +1,234 @@
+"""Simulation d'une saison sur horloge virtuelle.
+
+Un bassin sur le faux Home Assistant (`tests.fakehass`), piloté seconde par
+seconde par le planificateur partagé (`cron()` chaque minute, `pull()` toutes les
+5 secondes pendant un lavage ou un surpresseur). Les capteurs suivent un profil
+synthétique : température de l'eau et de l'air sur un cycle annuel et un cycle
+journalier, prochain lever du soleil selon le jour de l'année.
+
+Affiche pour chaque jour la durée du dernier planning calculé, les temps de marche
+de la filtration et du traitement, puis le débit de la simulation en secondes
+virtuelles (ticks) par seconde réelle.
+
+Usage :
+    python -m benchmarks.simulation_saison
+    python -m benchmarks.simulation_saison --debut 2025-10-01 --jours 90 --hivernage
+"""
+
+import argparse
+import asyncio
+from datetime import date, datetime, time as dtime, timedelta
+import logging
+import math
+import time
+from typing import Optional
+
+from custom_components.pool_control.controller import PoolController
+from custom_components.pool_control.horloge import HorlogeVirtuelle
+from custom_components.pool_control.lectures import CacheLectures
+from custom_components.pool_control.planificateur import PLANIFICATEUR_CASES, Planificateur
+from tests.fakehass import FakeHass, integrationSimulee
+
+JOURS = 183
+
+# Rafraîchissement des capteurs simulés (secondes)
+MESURE_INTERVALLE = 600
+
+CONFIG = {
+    "temperatureWater": "sensor.temperature_eau",
+    "temperatureOutdoor": "sensor.temperature_exterieure",
+    "leverSoleil": "sensor.lever_soleil",
+    "filtration": "switch.filtration",
+    "traitement": "switch.traitement",
+    "surpresseur": "switch.surpresseur",
+}
+
+
+def temperatureEau(instant: datetime) -> float:
+    """Eau : 19 °C ± 8 sur l'année (maximum fin juillet), ± 1 sur la journée."""
+
+    annee = math.sin(2 * math.pi * (instant.timetuple().tm_yday - 105) / 365)
+    heure = instant.hour + instant.minute / 60
+    return round(19.0 + 8.0 * annee + math.sin((heure - 11) * math.pi / 12), 1)
+
+
+def temperatureAir(instant: datetime) -> float:
+    """Air : 14 °C ± 10 sur l'année, ± 5 sur la journée."""
+
+    annee = math.sin(2 * math.pi * (instant.timetuple().tm_yday - 110) / 365)
+    heure = instant.hour + instant.minute / 60
+    return round(14.0 + 10.0 * annee + 5.0 * math.sin((heure - 9) * math.pi / 12), 1)
+
+
+def leverSoleil(jour: date) -> datetime:
+    """Lever du soleil : 5h40 au solstice d'été, 8h30 au solstice d'hiver."""
+
+    ecart = math.cos(2 * math.pi * (jour.timetuple().tm_yday - 172) / 365)
+    minutes = int(425 - 85 * ecart)
+    return datetime.combine(jour, dtime(minutes // 60, minutes % 60))
+
+
+def prochainLever(instant: datetime) -> str:
+    """Prochain lever du soleil, comme `sun.next_rising`."""
+
+    lever = leverSoleil(instant.date())
+    if lever <= instant:
+        lever = leverSoleil(instant.date() + timedelta(days=1))
+    return lever.isoformat()
+
+
+def mesurer(hass: FakeHass) -> dict:
+    """Publie les capteurs à l'instant courant ; retourne les températures."""
+
+    instant = hass.horloge.now()
+    mesures = {"eau": temperatureEau(instant), "air": temperatureAir(instant)}
+
+    hass.states.async_set(CONFIG["temperatureWater"], mesures["eau"])
+    hass.states.async_set(CONFIG["temperatureOutdoor"], mesures["air"])
+    hass.states.async_set(CONFIG["leverSoleil"], prochainLever(instant))
+
+    return mesures
+
+
+class Journee:
+    """Bilan d'une journée simulée."""
+
+    def __init__(self, jour: date, controller: PoolController) -> None:
+        """Initialize the Journee."""
+
+        self.jour = jour
+        self.eauMax = None
+        self.airMax = None
+        self.fonctionnement = dict(controller.metriquesFonctionnement)
+
+    def mesure(self, mesures: dict) -> None:
+        """Retient les maximums du jour."""
+
+        self.eauMax = max(mesures["eau"], self.eauMax or mesures["eau"])
+        self.airMax = max(mesures["air"], self.airMax or mesures["air"])
+
+    def bilan(self, controller: PoolController) -> dict:
+        """Températures, durée planifiée et temps de marche du jour."""
+
+        def heures(equipement: str) -> float:
+            """Temps de marche du jour (heures)."""
+
+            return (
+                controller.metriquesFonctionnement.get(equipement, 0.0)
+                - self.fonctionnement.get(equipement, 0.0)
+            ) / 3600
+
+        duree = controller.filtrationDureeStatus.value
+        return {
+            "jour": self.jour,
+            "mode": "Hivernage" if controller.getHivernage() else "Saison",
+            "eauMax": self.eauMax,
+            "airMax": self.airMax,
+            "planifiee": None if duree is None else duree / 3600,
+            "filtration": heures("filtration"),
+            "traitement": heures("traitement"),
+        }
+
+
+async def simuler(debut: date, jours: int, hivernage: bool = False) -> tuple[list, dict]:
+    """Simule `jours` jours ; retourne les bilans quotidiens et le débit."""
+
+    horloge = HorlogeVirtuelle(datetime.combine(debut, dtime(0, 0)).timestamp())
+    hass = FakeHass(horloge)
+    planificateur = Planificateur(hass)
+    cache = CacheLectures(hass)
+    donnees = {"hivernageWidgetStatus": 1} if hivernage else None
+
+    with integrationSimulee(donnees):
+        for cle in ("filtration", "traitement", "surpresseur"):
+            hass.states.async_set(CONFIG[cle], "off")
+        mesures = mesurer(hass)
+
+        controller = PoolController(hass, CONFIG, "simulation", "Simulation")
+        controller.horloge = horloge
+        controller.planificateur = planificateur
+        controller.cacheLectures = cache
+        await controller.async_initialize()
+        await controller.startLectures()
+        await controller.startFirstCron()
+
+        roue = planificateur.roue
+        journee = Journee(debut, controller)
+        journee.mesure(mesures)
+        bilans = []
+
+        prochaineMesure = horloge.time() + MESURE_INTERVALLE
+        minuit = datetime.combine(debut + timedelta(days=1), dtime(0, 0)).timestamp()
+        fin = datetime.combine(debut + timedelta(days=jours), dtime(0, 0)).timestamp()
+        ticks = 0
+        debutCpu = time.perf_counter()
+
+        while horloge.maintenant < fin:
+            horloge.avancer(1)
+            ticks += 1
+
+            if horloge.maintenant >= prochaineMesure:
+                journee.mesure(mesurer(hass))
+                prochaineMesure += MESURE_INTERVALLE
+
+            if roue[planificateur.position]:
+                await planificateur._async_tick()
+                if hass.taches:
+                    await hass.async_block_till_done()
+            else:
+                planificateur.position = (planificateur.position + 1) % PLANIFICATEUR_CASES
+
+            if horloge.maintenant >= minuit:
+                controller.observerEquipements()
+                bilans.append(journee.bilan(controller))
+                journee = Journee(horloge.now().date(), controller)
+                minuit = datetime.combine(
+                    journee.jour + timedelta(days=1), dtime(0, 0)
+                ).timestamp()
+
+        duree = time.perf_counter() - debutCpu
+
+    return bilans, {"ticks": ticks, "duree": duree, "debit": ticks / duree}
+
+
+def _heures(valeur: Optional[float]) -> str:
+    """Durée en heures, ou tiret."""
+
+    return "-" if valeur is None else f"{valeur:.2f}"
+
+
+def main() -> None:
+    """Affiche le bilan quotidien et le débit de la simulation."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--debut", type=date.fromisoformat, default=date(date.today().year, 4, 1)
+    )
+    parser.add_argument("--jours", type=int, default=JOURS)
+    parser.add_argument("--hivernage", action="store_true")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    bilans, debit = asyncio.run(simuler(args.debut, args.jours, args.hivernage))
+
+    print(
+        f"{'jour':<12}{'mode':<11}{'eau max':>8}{'air max':>8}"
+        f"{'planifiée h':>13}{'filtration h':>14}{'traitement h':>14}"
+    )
+    for bilan in bilans:
+        print(
+            f"{bilan['jour'].isoformat():<12}{bilan['mode']:<11}"
+            f"{bilan['eauMax']:>8.1f}{bilan['airMax']:>8.1f}"
+            f"{_heures(bilan['planifiee']):>13}{bilan['filtration']:>14.2f}"
+            f"{bilan['traitement']:>14.2f}"
+        )
+
+    print(
+        f"\n{len(bilans)} jours, {debit['ticks']} ticks en {debit['duree']:.2f} s "
+        f"({debit['debit']:,.0f} ticks/s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+"""Benchmarks pytest des chemins chauds du contrôleur.
+
+Mesurés sur le faux Home Assistant (services sans latence, store en mémoire
+sauf pour le chargement) ; les résultats s'enregistrent en JSON pour comparer
+une modification à une référence locale (voir README, « Performances »).
+
+Functions benchmarked:
+1. cron() - Cycle complet en saison et en hivernage
+2. calculateTimeFiltration() - Chaque distributionDatePivot
+3. activatingDevices() - Commandes évitées et bascule marche/arrêt
+4. set_data() - Rafale d'écritures et sauvegardes du store
+5. async_initialize() - Chargement du store de Home Assistant
+6. Import du paquet et async_setup_entry() - Démarrage de l'intégration
+"""
+
+import importlib
+from itertools import count
+import json
+import os
+import sys
+
+import pytest
+
+from homeassistant.helpers.storage import STORAGE_DIR, Store
+
+from custom_components.pool_control.controller import STORAGE_KEY, STORAGE_VERSION
+from custom_components.pool_control.horloge import HorlogeVirtuelle
+from tests.fakehass import FakeConfigEntry, FakeHass, integrationSimulee
+
+from .conftest import CONFIG, DEBUT, creerBassin
+
+# Écritures par rafale de set_data
+RAFALE = 100
+
+
+async def dansBoucle(benchmark, fonction, *args):
+    """Mesure une fonction synchrone depuis la boucle (elle peut créer des tâches)."""
+    return benchmark(fonction, *args)
+
+
+def cycle(boucle, hass, controller):
+    """Un passage de cron(), tâches du store comprises."""
+
+    async def passage():
+        await controller.cron()
+        await hass.async_block_till_done()
+
+    boucle.run_until_complete(passage())
+
+
+@pytest.mark.benchmark(group="cron")
+class TestCron:
+    """Benchmarks de cron()."""
+
+    def test_saison(self, benchmark, boucle, hass, bassin):
+        """Cycle en saison, pendant la plage de filtration."""
+        cycle(boucle, hass, bassin)
+
+        benchmark(cycle, boucle, hass, bassin)
+
+        assert bassin.get_data("filtrationTemperature") == 1
+
+    def test_hivernage(self, benchmark, boucle, hass, bassinHivernage):
+        """Cycle en hivernage."""
+        cycle(boucle, hass, bassinHivernage)
+
+        benchmark(cycle, boucle, hass, bassinHivernage)
+
+        assert bassinHivernage.getHivernage() is True
+
+
+@pytest.mark.benchmark(group="calculateTimeFiltration")
+@pytest.mark.parametrize("distribution", [1, 2, 3, 4, 5])
+def test_calculate_time_filtration(benchmark, boucle, bassin, distribution):
+    """Calcul de la plage de filtration pour une répartition autour du pivot."""
+    bassin.distributionDatePivot = distribution
+
+    boucle.run_until_complete(
+        dansBoucle(benchmark, bassin.calculateTimeFiltration, 26.0, False)
+    )
+
+    assert bassin.get_data("filtrationFin") > bassin.get_data("filtrationDebut")
+
+
+@pytest.mark.benchmark(group="activatingDevices")
+class TestActivatingDevices:
+    """Benchmarks de activatingDevices() sur services sans latence."""
+
+    def test_evitees(self, benchmark, boucle, hass, bassin):
+        """Équipements déjà dans l'état demandé : aucune commande émise."""
+        bassin.data["filtrationTemperature"] = 1
+        boucle.run_until_complete(bassin.activatingDevices())
+        appels = hass.services.appels
+
+        benchmark(lambda: boucle.run_until_complete(bassin.activatingDevices()))
+
+        assert hass.services.appels == appels
+
+    def test_bascule(self, benchmark, boucle, hass, bassin):
+        """Marche et arrêt en alternance : filtration et traitement commandés."""
+        etats = count()
+
+        def basculer():
+            bassin.data["filtrationTemperature"] = next(etats) % 2
+            boucle.run_until_complete(bassin.activatingDevices())
+
+        benchmark(basculer)
+
+        assert hass.services.appels >= 2 * next(etats) - 2
+
+
+@pytest.mark.benchmark(group="set_data")
+def test_set_data_rafale(benchmark, boucle, hass, bassin):
+    """Rafale de valeurs modifiées, puis sauvegardes du store."""
+    valeurs = count()
+
+    async def rafale():
+        for index in range(RAFALE):
+            bassin.set_data(f"rafale{index % 10}", next(valeurs))
+        await hass.async_block_till_done()
+
+    benchmark(lambda: boucle.run_until_complete(rafale()))
+
+    assert bassin.store.ecritures >= RAFALE
+
+
+@pytest.mark.benchmark(group="store")
+def test_store_load(benchmark, boucle, hass):
+    """Chargement du store réel de Home Assistant depuis le disque."""
+    # État mémorisé après un cycle, au format du store de Home Assistant
+    with integrationSimulee():
+        source = creerBassin(hass, boucle)
+        cycle(boucle, hass, source)
+
+    key = f"{STORAGE_KEY}.benchmark"
+    os.makedirs(hass.config.path(STORAGE_DIR), exist_ok=True)
+    with open(hass.config.path(STORAGE_DIR, key), "w", encoding="utf-8") as fichier:
+        json.dump(
+            {"version": STORAGE_VERSION, "minor_version": 1, "key": key, "data": source.data},
+            fichier,
+        )
+
+    controller = creerBassin(hass, boucle)
+
+    def charger():
+        controller.store = Store(hass, STORAGE_VERSION, key)
+        boucle.run_until_complete(controller.async_initialize())
+        hass.taches.clear()
+
+    benchmark(charger)
+
+    assert controller.data == source.data
+
+
+@pytest.mark.benchmark(group="demarrage")
+class TestDemarrage:
+    """Benchmarks du démarrage de l'intégration."""
+
+    PAQUET = "custom_components.pool_control"
+
+    def test_import(self, benchmark):
+        """Import du paquet, modules de Home Assistant déjà chargés ; sans les flows."""
+        originaux = {
+            nom: module
+            for nom, module in sys.modules.items()
+            if nom == self.PAQUET or nom.startswith(f"{self.PAQUET}.")
+        }
+
+        def purger():
+            """Retire l'intégration des modules chargés."""
+            for nom in [
+                nom
+                for nom in sys.modules
+                if nom == self.PAQUET or nom.startswith(f"{self.PAQUET}.")
+            ]:
+                del sys.modules[nom]
+
+        try:
+            benchmark.pedantic(
+                importlib.import_module, args=(self.PAQUET,), setup=purger, rounds=20
+            )
+            charges = set(sys.modules)
+        finally:
+            # Les autres benchmarks gardent les modules d'origine
+            purger()
+            sys.modules.update(originaux)
+
+        assert f"{self.PAQUET}.config_flow" not in charges
+        assert f"{self.PAQUET}.options_flow" not in charges
+
+    def test_setup_entry(self, benchmark, boucle, tmp_path):
+        """async_setup_entry sur un Home Assistant neuf, plateformes comprises."""
+        from custom_components.pool_control import async_setup_entry
+
+        def preparer():
+            """Home Assistant neuf, capteurs et relais renseignés."""
+            hass = FakeHass(HorlogeVirtuelle(DEBUT.timestamp()), str(tmp_path))
+            for cle, valeur in (("temperatureWater", 26.0), ("temperatureOutdoor", 24.0)):
+                hass.states.async_set(CONFIG[cle], valeur)
+            for cle in ("filtration", "traitement", "surpresseur"):
+                hass.states.async_set(CONFIG[cle], "off")
+            return (hass, FakeConfigEntry(dict(CONFIG))), {}
+
+        def installer(hass, entry):
+            """Installe l'entry, tâches créées comprises."""
+            boucle.run_until_complete(async_setup_entry(hass, entry))
+            boucle.run_until_complete(hass.async_block_till_done())
+
+        with integrationSimulee():
+            benchmark.pedantic(installer, setup=preparer, rounds=20)
@@ -0,0 +1,159 @@
+"""Tests du rejeu d'historique (benchmarks/rejeu.py).
+
+Functions tested:
+1. lireHistorique() - Export CSV, JSON Lines ou JSON de l'API fusionné par horodatage
+2. lireConfig() - Configuration seule ou fichier de diagnostics
+3. rejouer() - Plannings, décisions, commandes et bilan d'un rejeu
+"""
+
+import asyncio
+import csv
+from datetime import datetime, timedelta
+import json
+
+from .conftest import CONFIG
+from .rejeu import lireConfig, lireHistorique, rejouer
+
+DEBUT = datetime(2025, 6, 15, 0, 0)
+
+
+def etats():
+    """Historique d'une demi-journée, groupé par entité comme l'export CSV."""
+    lignes = []
+    for heure in range(12):
+        instant = DEBUT + timedelta(hours=heure)
+        lignes.append((CONFIG["temperatureWater"], 24.0 + heure / 10, instant))
+    for heure in range(0, 12, 4):
+        instant = DEBUT + timedelta(hours=heure)
+        lignes.append((CONFIG["temperatureOutdoor"], 20.0 + heure, instant))
+    lignes.append((CONFIG["leverSoleil"], datetime(2025, 6, 15, 5, 50).isoformat(), DEBUT))
+    lignes.append((CONFIG["filtration"], "off", DEBUT))
+    return [
+        {"entity_id": entity_id, "state": str(etat), "last_changed": instant.isoformat()}
+        for entity_id, etat, instant in lignes
+    ]
+
+
+def ecrireCsv(chemin):
+    """Écrit l'historique au format CSV du panneau Historique."""
+    with open(chemin, "w", newline="", encoding="utf-8") as fichier:
+        writer = csv.DictWriter(fichier, fieldnames=["entity_id", "state", "last_changed"])
+        writer.writeheader()
+        writer.writerows(etats())
+
+
+def collecter(evenements, config):
+    """Enregistrements du rejeu, dans l'ordre."""
+
+    async def lire():
+        return [enregistrement async for enregistrement in rejouer(evenements, config)]
+
+    return asyncio.run(lire())
+
+
+class TestLireHistorique:
+    """Tests de la lecture en flux des exports."""
+
+    def test_csv_groupe_fusionne(self, tmp_path):
+        """Un export groupé par entité est restitué dans l'ordre chronologique."""
+        chemin = str(tmp_path / "historique.csv")
+        ecrireCsv(chemin)
+
+        evenements = list(
+            lireHistorique(chemin, [CONFIG["temperatureWater"], CONFIG["temperatureOutdoor"]])
+        )
+
+        horodatages = [horodatage for horodatage, _, _ in evenements]
+        assert horodatages == sorted(horodatages)
+        assert len(evenements) == 15
+        assert evenements[0][0] == DEBUT.timestamp()
+
+    def test_jsonl(self, tmp_path):
+        """Un export JSON Lines ne restitue que les entités demandées."""
+        chemin = tmp_path / "historique.jsonl"
+        chemin.write_text(
+            "\n".join(json.dumps(etat) for etat in etats()) + "\n\n", encoding="utf-8"
+        )
+
+        evenements = list(lireHistorique(str(chemin), [CONFIG["filtration"]]))
+
+        assert evenements == [(DEBUT.timestamp(), CONFIG["filtration"], "off")]
+
+    def test_json_api(self, tmp_path):
+        """Une réponse de /api/history/period (tableau par entité) est aplatie et fusionnée."""
+        parEntite = {}
+        for etat in etats():
+            parEntite.setdefault(etat["entity_id"], []).append(etat)
+        # minimal_response : seul le premier état porte l'entity_id
+        historique = [
+            [liste[0]] + [{k: v for k, v in etat.items() if k != "entity_id"} for etat in liste[1:]]
+            for liste in parEntite.values()
+        ]
+        chemin = tmp_path / "history.json"
+        chemin.write_text(json.dumps(historique), encoding="utf-8")
+
+        evenements = list(
+            lireHistorique(str(chemin), [CONFIG["temperatureWater"], CONFIG["temperatureOutdoor"]])
+        )
+
+        horodatages = [horodatage for horodatage, _, _ in evenements]
+        assert horodatages == sorted(horodatages)
+        assert len(evenements) == 15
+        assert {entity_id for _, entity_id, _ in evenements} == {
+            CONFIG["temperatureWater"],
+            CONFIG["temperatureOutdoor"],
+        }
+
+
+class TestLireConfig:
+    """Tests de la lecture de la configuration."""
+
+    def test_config_seule(self, tmp_path):
+        """Une configuration seule est lue telle quelle."""
+        chemin = tmp_path / "config.json"
+        chemin.write_text(json.dumps(CONFIG), encoding="utf-8")
+
+        assert lireConfig(str(chemin)) == CONFIG
+
+    def test_diagnostics(self, tmp_path):
+        """La configuration est extraite d'un fichier de diagnostics."""
+        chemin = tmp_path / "diagnostics.json"
+        chemin.write_text(
+            json.dumps({"data": {"config": CONFIG, "data": {}}}), encoding="utf-8"
+        )
+
+        assert lireConfig(str(chemin)) == CONFIG
+
+
+class TestRejouer:
+    """Tests du rejeu sur le faux Home Assistant."""
+
+    def test_rejeu(self, tmp_path):
+        """Le rejeu produit le planning, les commandes puis le bilan."""
+        chemin = str(tmp_path / "historique.csv")
+        ecrireCsv(chemin)
+        entites = [
+            CONFIG[cle]
+            for cle in ("temperatureWater", "temperatureOutdoor", "leverSoleil", "filtration")
+        ]
+
+        enregistrements = collecter(lireHistorique(chemin, entites), dict(CONFIG))
+
+        types = {enregistrement["type"] for enregistrement in enregistrements}
+        assert {"planning", "commande", "bilan"} <= types
+
+        planning = next(e for e in enregistrements if e["type"] == "planning")
+        assert planning["filtrationDebut"] < planning["filtrationFin"]
+
+        bilan = enregistrements[-1]
+        assert bilan["type"] == "bilan"
+        assert bilan["debut"] == DEBUT.isoformat()
+        assert bilan["fin"] == (DEBUT + timedelta(hours=11, seconds=1)).isoformat()
+        assert bilan["minutesComparees"] == 11 * 60 + 1
+        assert bilan["commandes"] == sum(
+            1 for e in enregistrements if e["type"] == "commande"
+        )
+
+    def test_historique_vide(self):
+        """Un historique vide ne produit aucun enregistrement."""
+        assert collecter(iter([]), dict(CONFIG)) == []
@@ -1,17 +1,41 @@
 """Integration for Pool Control."""
 
 import logging
+from typing import TYPE_CHECKING, Any, Optional
 
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+import voluptuous as vol
 
-from .const import DOMAIN
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers import entity_registry as er
+
+from .const import DOMAIN, SERVICE_GET_DECISIONS
 from .controller import PoolController
-from .options_flow import PoolControlOptionsFlowHandler
+from .lectures import CacheLectures
+from .metriques import PoolControlMetricsView
+from .planificateur import Planificateur
+
+if TYPE_CHECKING:
+    from .options_flow import PoolControlOptionsFlowHandler
 
 PLATFORMS = ["sensor", "button"]
 _LOGGER = logging.getLogger(__name__)
 
+GET_DECISIONS_SCHEMA = vol.Schema(
+    {
+        vol.Optional("config_entry_id"): cv.string,
+        vol.Optional("limite"): cv.positive_int,
+    }
+)
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Installer Pool Control à partir d'un config entry."""
@@ -20,16 +44,34 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     conf = {**entry.data, **entry.options}
 
-    controller = PoolController(hass, conf)
-    hass.data.setdefault(DOMAIN, controller)
+    controller = PoolController(hass, conf, entry.entry_id, entry.title)
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = controller
+
+    # Une seule roue pour tous les bassins, crons décalés
+    if f"{DOMAIN}_planificateur" not in hass.data:
+        hass.data[f"{DOMAIN}_planificateur"] = Planificateur(hass)
+    controller.planificateur = hass.data[f"{DOMAIN}_planificateur"]
+
+    # Capteurs partagés entre bassins : une seule analyse par changement d'état
+    if f"{DOMAIN}_lectures" not in hass.data:
+        hass.data[f"{DOMAIN}_lectures"] = CacheLectures(hass)
+    controller.cacheLectures = hass.data[f"{DOMAIN}_lectures"]
 
     await controller.async_initialize()
 
+    # Les unique_id des versions mono-bassin sont préfixés par le config entry
+    await er.async_migrate_entries(hass, entry.entry_id, _async_migrate_unique_id(entry))
+
     # Démarrer les plateformes déclarées (sensor.py, button.py seront appelés ici)
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    # Ensuite on peut lancer le cron
-    await controller.startFirstCron()
+    # Premier cycle au démarrage de Home Assistant ou dès que les capteurs sont valides
+    await controller.startLectures()
+    await controller.startDemarrage()
+    await controller.startSolaire()
+
+    _async_register_services(hass)
+    _async_register_views(hass)
 
     return True
 
@@ -39,15 +81,100 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     _LOGGER.info("Unloading Pool Control")
 
+    controller = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if controller is not None:
+        await controller.stopDemarrage()
+        await controller.stopFirstCron()
+        await controller.stopSecondCron()
+        await controller.stopSolaire()
+        await controller.stopLectures()
+
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
-        hass.data.pop(DOMAIN, None)
+        controllers = hass.data.get(DOMAIN, {})
+        controllers.pop(entry.entry_id, None)
+
+        # Le service reste disponible tant qu'un bassin est chargé
+        if not controllers:
+            hass.data.pop(DOMAIN, None)
+            hass.data.pop(f"{DOMAIN}_planificateur", None)
+            hass.data.pop(f"{DOMAIN}_lectures", None)
+            hass.services.async_remove(DOMAIN, SERVICE_GET_DECISIONS)
 
     return unload_ok
 
 
-async def async_get_options_flow(config_entry: ConfigEntry) -> PoolControlOptionsFlowHandler:
+async def async_get_options_flow(config_entry: ConfigEntry) -> "PoolControlOptionsFlowHandler":
     """Retourne le flow d'options."""
 
+    # Schémas des options chargés à l'ouverture du flow seulement
+    from .options_flow import PoolControlOptionsFlowHandler
+
     return PoolControlOptionsFlowHandler(config_entry)
+
+
+def _async_migrate_unique_id(entry: ConfigEntry):
+    """Callback de migration des unique_id d'un config entry."""
+
+    @callback
+    def _migrate(entity_entry: er.RegistryEntry) -> Optional[dict[str, Any]]:
+        """Préfixe un unique_id mono-bassin par l'entry_id."""
+
+        if not entity_entry.unique_id.startswith(f"{DOMAIN}_"):
+            return None
+
+        return {"new_unique_id": f"{entry.entry_id}_{entity_entry.unique_id}"}
+
+    return _migrate
+
+
+def getController(hass: HomeAssistant, entry_id: Optional[str] = None) -> Optional[PoolController]:
+    """Controller d'un config entry ; sans entry_id, le seul bassin chargé."""
+
+    controllers = hass.data.get(DOMAIN, {})
+
+    if entry_id is None:
+        if len(controllers) != 1:
+            return None
+        return next(iter(controllers.values()))
+
+    return controllers.get(entry_id)
+
+
+def _async_register_services(hass: HomeAssistant) -> None:
+    """Enregistre les services de l'intégration."""
+
+    if hass.services.has_service(DOMAIN, SERVICE_GET_DECISIONS):
+        return
+
+    async def async_get_decisions(call: ServiceCall) -> ServiceResponse:
+        """Retourne les dernières décisions ayant commandé un actionneur."""
+
+        controller = getController(hass, call.data.get("config_entry_id"))
+        if controller is None:
+            raise ServiceValidationError(
+                "Plusieurs bassins sont chargés : préciser config_entry_id"
+                if call.data.get("config_entry_id") is None
+                else f"Bassin inconnu : {call.data['config_entry_id']}"
+            )
+
+        return {"decisions": controller.getDecisions(call.data.get("limite"))}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_DECISIONS,
+        async_get_decisions,
+        schema=GET_DECISIONS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+
+def _async_register_views(hass: HomeAssistant) -> None:
+    """Enregistre l'export des métriques (une seule fois, les vues ne se retirent pas)."""
+
+    if hass.data.get(f"{DOMAIN}_views"):
+        return
+
+    hass.http.register_view(PoolControlMetricsView())
+    hass.data[f"{DOMAIN}_views"] = True
@@ -4,15 +4,27 @@ import asyncio
 import logging
 from typing import Optional
 
+from .profilage import mesurer
+
 _LOGGER = logging.getLogger(__name__)
 
 # Constants for delays
 DEVICE_ACTIVATION_DELAY = 2  # seconds
 
+# Flags requesting the filtration, by priority
+FILTRATION_REASONS = (
+    "filtrationTemperature",
+    "filtrationSolaire",
+    "filtrationHivernage",
+    "filtrationSurpresseur",
+    "marcheForcee",
+)
+
 
 class ActivationMixin:
     """Mixin for activation logic of pool control devices."""
 
+    @mesurer("activation")
     async def activatingDevices(self) -> None:
         """Active les appareils de filtration et de traitement."""
 
@@ -21,11 +33,17 @@ class ActivationMixin:
         # Update status display
         self._update_status_display()
 
-        # Handle device activation based on current mode
-        if int(self.get_data("arretTotal", 0)) == 0:
-            await self._handle_active_mode()
-        else:
-            await self._handle_stop_all()
+        # Trace the commands issued by this decision
+        jeton = self.debutDecision(self._decision_reason())
+
+        try:
+            # Handle device activation based on current mode
+            if int(self.get_data("arretTotal", 0)) == 0:
+                await self._handle_active_mode()
+            else:
+                await self._handle_stop_all()
+        finally:
+            self.finDecision(jeton)
 
         _LOGGER.debug("activatingDevices() end")
 
@@ -67,13 +85,27 @@ class ActivationMixin:
     def _should_activate_filtration(self) -> bool:
         """Determine if filtration should be activated."""
 
-        return (
-            int(self.get_data("filtrationTemperature", 0)) == 1
-            or int(self.get_data("filtrationSolaire", 0)) == 1
-            or int(self.get_data("filtrationHivernage", 0)) == 1
-            or int(self.get_data("filtrationSurpresseur", 0)) == 1
-            or int(self.get_data("marcheForcee", 0)) == 1
-        )
+        return self._filtration_reason() is not None
+
+    def _filtration_reason(self) -> Optional[str]:
+        """Return the first flag requesting the filtration, None if none."""
+
+        for key in FILTRATION_REASONS:
+            if int(self.get_data(key, 0)) == 1:
+                return key
+        return None
+
+    def _decision_reason(self) -> str:
+        """Return the reason driving the devices in the current mode."""
+
+        if int(self.get_data("arretTotal", 0)) != 0:
+            return "arretTotal"
+
+        filtration_lavage = int(self.get_data("filtrationLavage", 0))
+        if filtration_lavage != 0:
+            return f"filtrationLavage={filtration_lavage}"
+
+        return self._filtration_reason() or "aucune"
 
     async def _activate_filtration_system(self) -> None:
         """Activate filtration and associated devices."""
@@ -15,7 +15,7 @@ async def async_setup_entry(
 ) -> None:
     """Set up Pool Control buttons."""
 
-    controller = hass.data[DOMAIN]
+    controller = hass.data[DOMAIN][entry.entry_id]
 
     entities = [
         PoolControlButton(
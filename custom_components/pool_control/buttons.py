@@ -1,10 +1,10 @@
 """Button handlers for pool control integration."""
 
-from datetime import datetime
 import logging
-import time
 from typing import Any
 
+from .log import DECISION_LOGGER, LazyTimestamp
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -20,14 +20,10 @@ class ButtonMixin:
             self.set_data("filtrationSurpresseur", 0)
             if self.surpresseurStatus:
                 self.surpresseurStatus.set_status("Arrêté")
+            self.surpresseurFinStatus.set_status(None)
             await self.activatingDevices()
 
-        if int(self.get_data("filtrationLavageEtat", 0)) != 0:
-            self.set_data("filtrationLavageEtat", 0)
-            self.set_data("filtrationLavage", 0)
-            if self.filtreSableLavageStatus:
-                self.filtreSableLavageStatus.set_status("Arrêté")
-            await self.activatingDevices()
+        await self.arreterLavage()
 
     async def executeButtonReset(self) -> None:
         """Reinitialise le calcul."""
@@ -42,15 +38,12 @@ class ButtonMixin:
 
             # Verifie si la plage calculée est passée
             filtrationFin = self.get_data("filtrationFin", 0)
-            timeNow = time.time()
+            timeNow = self.horloge.time()
 
-            _LOGGER.debug(
-                "filtrationFin=%s",
-                datetime.fromtimestamp(filtrationFin).strftime("%H:%M %d-%m-%Y"),
-            )
-            _LOGGER.info(
-                "timeNow=%s",
-                datetime.fromtimestamp(time.time()).strftime("%H:%M %d-%m-%Y"),
+            DECISION_LOGGER.debug(
+                "filtrationFin=%s timeNow=%s",
+                LazyTimestamp(filtrationFin),
+                LazyTimestamp(timeNow),
             )
 
             if timeNow > filtrationFin:
@@ -69,15 +62,12 @@ class ButtonMixin:
 
             # Verifie si la plage calculée est passée
             filtrationFin = self.get_data("filtrationFin", 0)
-            timeNow = time.time()
+            timeNow = self.horloge.time()
 
-            _LOGGER.debug(
-                "filtrationFin=%s",
-                datetime.fromtimestamp(filtrationFin).strftime("%H:%M %d-%m-%Y"),
-            )
-            _LOGGER.info(
-                "timeNow=%s",
-                datetime.fromtimestamp(time.time()).strftime("%H:%M %d-%m-%Y"),
+            DECISION_LOGGER.debug(
+                "filtrationFin=%s timeNow=%s",
+                LazyTimestamp(filtrationFin),
+                LazyTimestamp(timeNow),
             )
 
             if timeNow > filtrationFin:
@@ -1,6 +1,6 @@
 """Config flow for Pool Control integration."""
 
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 import voluptuous as vol
 
@@ -10,7 +10,9 @@ from homeassistant.core import callback
 from homeassistant.helpers.selector import selector
 
 from .const import DOMAIN
-from .options_flow import PoolControlOptionsFlowHandler
+
+if TYPE_CHECKING:
+    from .options_flow import PoolControlOptionsFlowHandler
 
 
 class PoolControlConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -19,12 +21,15 @@ class PoolControlConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     async def async_step_user(self, user_input: Optional[dict[str, Any]] = None) -> FlowResult:
         """Étape initiale de configuration."""
         if user_input is not None:
-            return self.async_create_entry(title="Pool Control", data=user_input)
+            # Le nom distingue les bassins (piscine, spa...) d'une même instance
+            title = user_input.pop("nom", "Pool Control")
+            return self.async_create_entry(title=title, data=user_input)
 
         return self.async_show_form(
             step_id="user",
             data_schema=vol.Schema(
                 {
+                    vol.Optional("nom", default="Pool Control"): str,
                     vol.Required("temperatureWater"): selector(
                         {"entity": {"domain": ["sensor", "input_number"]}}
                     ),
@@ -52,7 +57,10 @@ class PoolControlConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     @staticmethod
     @callback
-    def async_get_options_flow(config_entry: ConfigEntry) -> PoolControlOptionsFlowHandler:
+    def async_get_options_flow(config_entry: ConfigEntry) -> "PoolControlOptionsFlowHandler":
         """Retourne le flow d'options amélioré."""
 
+        # Schémas des options chargés à l'ouverture du flow seulement
+        from .options_flow import PoolControlOptionsFlowHandler
+
         return PoolControlOptionsFlowHandler(config_entry)
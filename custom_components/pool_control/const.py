@@ -1,3 +1,5 @@
 """Constants for the Pool Control integration."""
 
 DOMAIN = "pool_control"
+
+SERVICE_GET_DECISIONS = "get_decisions"
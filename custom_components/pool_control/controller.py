@@ -5,18 +5,29 @@ from typing import Any, Optional
 
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.storage import Store
 
 from .activation import ActivationMixin
 from .buttons import ButtonMixin
+from .const import DOMAIN
+from .demarrage import DemarrageMixin
 from .filtration import FiltrationMixin
 from .hivernage import HivernageMixin
+from .horloge import Horloge
 from .lavage import LavageMixin
+from .metriques import MetriquesMixin
+from .prevision import PrevisionMixin
+from .publication import PublicationMixin
+from .profilage import ProfilageMixin
 from .saison import SaisonMixin
 from .scheduler import SchedulerMixin
 from .sensors import SensorMixin
 from .service import ServiceMixin
+from .solaire import SolaireMixin
 from .surpresseur import SurpresseurMixin
+from .tarif import TarifMixin
+from .trace import TraceMixin
 from .traitement import TraitementMixin
 from .utils import FiltrationUtilsMixin
 
@@ -28,20 +39,34 @@ STORAGE_KEY = "pool_control_data"
 class PoolController(
     ActivationMixin,
     ButtonMixin,
+    DemarrageMixin,
     FiltrationMixin,
     HivernageMixin,
     LavageMixin,
+    MetriquesMixin,
+    PrevisionMixin,
+    ProfilageMixin,
+    PublicationMixin,
     SaisonMixin,
     SchedulerMixin,
     SensorMixin,
     ServiceMixin,
+    SolaireMixin,
     SurpresseurMixin,
+    TarifMixin,
+    TraceMixin,
     TraitementMixin,
     FiltrationUtilsMixin,
 ):
     """Pool controller for managing pool automation logic."""
 
-    def __init__(self, hass: HomeAssistant, config: dict) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config: dict,
+        entry_id: Optional[str] = None,
+        title: str = "Pool Control",
+    ) -> None:
         """Initialize the pool controller."""
 
         # Initialisation de la classe mère
@@ -50,7 +75,17 @@ class PoolController(
 
         # configuration.yaml
         self.hass = hass
-        self.store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self.entry_id = entry_id
+        self.title = title
+
+        # Horloge de toutes les échéances (virtuelle en simulation)
+        self.horloge = Horloge()
+
+        # Un store par config entry : plusieurs bassins par instance
+        if entry_id is not None:
+            self.store = Store(hass, STORAGE_VERSION, f"{STORAGE_KEY}.{entry_id}")
+        else:
+            self.store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
         self.data = {}
         self.initialized = False
 
@@ -59,6 +94,9 @@ class PoolController(
         self.temperatureOutdoor = config.get("temperatureOutdoor")
         self.leverSoleil = config.get("leverSoleil")
 
+        # Âge maximum d'un relevé avant péremption (minutes, 0 : sans limite)
+        self.ageMaximumCapteurs = config.get("ageMaximumCapteurs", 120)
+
         # Entités
         self.filtration = config.get("filtration")
         self.traitement = config.get("traitement")
@@ -96,26 +134,86 @@ class PoolController(
         self.lavageDuree = config.get("lavageDuree", 2)
         self.rincageDuree = config.get("rincageDuree", 2)
 
+        self.capteursProfilage = config.get("capteursProfilage", False)
+
+        # Optimisation tarifaire
+        self.optimisationTarif = config.get("optimisationTarif", False)
+        self.tarifCapteur = config.get("tarifCapteur")
+        self.tarifProfil = config.get("tarifProfil", "")
+        self.dureeSegmentMinimum = config.get("dureeSegmentMinimum", 60)
+        self.pausePlageMaximum = config.get("pausePlageMaximum", 120)
+
+        # Filtration sur surplus solaire
+        self.capteurExport = config.get("capteurExport")
+        self.seuilSolaireMarche = config.get("seuilSolaireMarche", 1000)
+        self.seuilSolaireArret = config.get("seuilSolaireArret", 0)
+        self.dureeMinimumSolaireMarche = config.get("dureeMinimumSolaireMarche", 15)
+        self.dureeMinimumSolaireArret = config.get("dureeMinimumSolaireArret", 10)
+
+        # Planification sur prévision météo
+        self.meteo = config.get("meteo")
+
     async def async_initialize(self) -> None:
         """Initialise PoolController by loading data from store."""
 
         raw_data = await self.store.async_load()
 
+        if not raw_data and self.entry_id is not None:
+            raw_data = await self.async_migrate_store()
+
         if raw_data:
             self.data = raw_data
-            _LOGGER.info("Loaded data from store: %s", self.data)
+            _LOGGER.info("Loaded %s values from store", len(self.data))
+            _LOGGER.debug("Loaded data from store: %s", self.data)
         else:
             _LOGGER.info("No data found in store")
 
+        # Planning affiché dès la création des entités, recalculé par le cron
+        self.publierPlanningMemorise()
+
         self.initialized = True
 
         self.hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, self.async_save_data)
 
+    async def async_migrate_store(self) -> Optional[dict]:
+        """Reprend le store commun des versions mono-bassin, puis le supprime."""
+
+        legacy = Store(self.hass, STORAGE_VERSION, STORAGE_KEY)
+        raw_data = await legacy.async_load()
+
+        if raw_data:
+            _LOGGER.info("Migrating store %s to %s", STORAGE_KEY, self.store.key)
+            await self.store.async_save(raw_data)
+            await legacy.async_remove()
+
+        return raw_data
+
+    @property
+    def deviceInfo(self) -> Optional[DeviceInfo]:
+        """Appareil regroupant les entités du bassin."""
+
+        if self.entry_id is None:
+            return None
+
+        return DeviceInfo(
+            identifiers={(DOMAIN, self.entry_id)},
+            name=self.title,
+            entry_type=DeviceEntryType.SERVICE,
+        )
+
+    def uniqueId(self, suffix: str) -> str:
+        """unique_id d'une entité, préfixé par le config entry."""
+
+        if self.entry_id is None:
+            return suffix
+        return f"{self.entry_id}_{suffix}"
+
     async def async_save_data(self, event: Optional[Any] = None) -> None:
         """Save the current data to the store."""
 
         if self.initialized:
             await self.store.async_save(self.data)
+            self.compterEcritureStore()
             if event is not None:
                 _LOGGER.info("Saved data to store: %s", self.data)
 
@@ -0,0 +1,88 @@
+"""Deferred start mixin for pool control integration."""
+
+import logging
+from typing import Any, Optional
+
+from homeassistant.core import CoreState
+from homeassistant.helpers.start import async_at_started
+
+from .sensors import LECTURES_CAPTEURS
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class DemarrageMixin:
+    """Mixin deferring the first cycle until Home Assistant has started."""
+
+    def __init__(self) -> None:
+        """Initialize the DemarrageMixin with default values."""
+
+        super().__init__()
+
+        # Attente du démarrage de Home Assistant (None : cycle lancé ou arrêté)
+        self.demarrageCancel = None
+
+    async def startDemarrage(self) -> None:
+        """Lance le cron quand Home Assistant a démarré ou que les capteurs sont valides.
+
+        Au démarrage de Home Assistant, les capteurs ne sont pas encore restaurés :
+        un premier cycle lirait 0 °C et calculerait une plage à refaire.
+        """
+
+        await self.stopDemarrage()
+
+        # Rechargement de l'entry, ou capteurs déjà restaurés : premier cycle au
+        # prochain passage du cron, sans retarder l'installation
+        if self.hass.state is CoreState.running or self.capteursValides():
+            await self.startFirstCron()
+            return
+
+        self.demarrageCancel = async_at_started(self.hass, self._demarrer)
+
+        _LOGGER.info("First cycle deferred until Home Assistant has started")
+
+    async def stopDemarrage(self) -> None:
+        """Abandonne l'attente du démarrage."""
+
+        if self.demarrageCancel is not None:
+            self.demarrageCancel()
+            self.demarrageCancel = None
+
+    def capteursValides(self) -> bool:
+        """Tous les capteurs configurés ont une valeur à jour (lectures du cache)."""
+
+        if self.cacheLectures is None:
+            return False
+
+        for cle, _ in LECTURES_CAPTEURS:
+            if not getattr(self, cle):
+                continue
+            lecture = self.lectures.get(cle)
+            if lecture is None or lecture.valeur is None or self.lecturePerimee(lecture):
+                return False
+
+        return True
+
+    def verifierDemarrage(self) -> None:
+        """Démarre le cycle en attente dès que les capteurs sont valides."""
+
+        if self.demarrageCancel is None or not self.capteursValides():
+            return
+
+        self.demarrageCancel()
+        self.demarrageCancel = None
+        self.hass.async_create_task(self._demarrer())
+
+    async def _demarrer(self, hass: Optional[Any] = None) -> None:
+        """Premier cycle (plage et réconciliation des équipements) sans attendre le cron."""
+
+        # Déjà démarré par l'autre déclencheur
+        if self.firstCronCancel is not None:
+            return
+
+        await self.stopDemarrage()
+
+        _LOGGER.info("Starting first cycle")
+
+        await self.startFirstCron()
+        await self.cron()
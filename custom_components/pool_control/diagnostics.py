@@ -0,0 +1,113 @@
+"""Diagnostics support for Pool Control."""
+
+from datetime import datetime
+from typing import Any, Optional
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+
+# Horodatages du store exposés en date lisible
+PLAGE_CLES = (
+    "filtrationDebut",
+    "filtrationPauseDebut",
+    "filtrationPauseFin",
+    "filtrationFin",
+    "filtrationSolaireDepuis",
+    "filtrationTempsRestant",
+)
+
+
+def _horodatage(timestamp: Any) -> Optional[str]:
+    """Timestamp du store en date ISO locale."""
+
+    if not timestamp:
+        return None
+    try:
+        return datetime.fromtimestamp(float(timestamp)).isoformat()
+    except (TypeError, ValueError, OverflowError, OSError):
+        return None
+
+
+def _observation(hass: HomeAssistant, entity_id: Optional[str]) -> Optional[dict[str, Any]]:
+    """Dernier état connu d'une entité, sans appel de service."""
+
+    if not entity_id:
+        return None
+
+    state = hass.states.get(entity_id)
+    if state is None:
+        return {"entity_id": entity_id, "state": None}
+
+    return {
+        "entity_id": entity_id,
+        "state": state.state,
+        "last_changed": state.last_changed.isoformat(),
+        "last_updated": state.last_updated.isoformat(),
+    }
+
+
+def _ecrituresStatut(controller: Any) -> dict[str, dict[str, int]]:
+    """Écritures des capteurs de statut publiées et supprimées, par capteur."""
+
+    ecritures = {}
+    for (capteur, resultat), nombre in controller.metriquesEcrituresStatut.items():
+        ecritures.setdefault(capteur, {})[resultat] = nombre
+    return ecritures
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+
+    controller = hass.data[DOMAIN][entry.entry_id]
+
+    return {
+        "config": {**entry.data, **entry.options},
+        "etat": dict(controller.data),
+        "plages": {
+            "hivernage": controller.getHivernage(),
+            **{cle: _horodatage(controller.data.get(cle)) for cle in PLAGE_CLES},
+            "filtrationFinSolaire": _horodatage(
+                controller.getFiltrationFinSolaire(controller.horloge.time())
+            ),
+        },
+        "capteurs": {
+            "temperatureWater": _observation(hass, controller.temperatureWater),
+            "temperatureOutdoor": _observation(hass, controller.temperatureOutdoor),
+            "leverSoleil": _observation(hass, controller.leverSoleil),
+            "capteurExport": _observation(hass, controller.capteurExport),
+        },
+        "lectures": {
+            cle: {**lecture.snapshot(), "perimee": controller.lecturePerimee(lecture)}
+            for cle, lecture in controller.lectures.items()
+        },
+        "actionneurs": {
+            "filtration": _observation(hass, controller.filtration),
+            "traitement": _observation(hass, controller.traitement),
+            "traitement_2": _observation(hass, controller.traitement_2),
+            "surpresseur": _observation(hass, controller.surpresseur),
+        },
+        "minuteurs": {
+            "firstCron": controller.firstCronCancel is not None,
+            "secondCron": controller.secondCronCancel is not None,
+            "solaireListener": controller.solaireListenerCancel is not None,
+            "solaireTimer": controller.solaireTimerCancel is not None,
+            "filtrationRefreshCounter": controller.filtrationRefreshCounter,
+        },
+        "profilage": controller.getProfilage(),
+        "planificateur": (
+            controller.planificateur.snapshot()
+            if controller.planificateur is not None
+            else None
+        ),
+        "cacheLectures": (
+            controller.cacheLectures.snapshot()
+            if controller.cacheLectures is not None
+            else None
+        ),
+        "ecrituresStatut": _ecrituresStatut(controller),
+        "decisions": controller.getDecisions(),
+    }
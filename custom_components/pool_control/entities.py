@@ -1,13 +1,28 @@
 """Entities for Pool Control integration."""
 
+from datetime import datetime
+import time
 from typing import Any, Callable, Optional
 
 from homeassistant.components.button import ButtonEntity
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import (
+    RestoreSensor,
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
+from homeassistant.const import UnitOfTime
+from homeassistant.helpers.event import async_call_later
+import homeassistant.util.dt as dt_util
 
+from .lavage import LAVAGE_PHASES
 
-class PoolControlStatusSensor(SensorEntity):
-    """Sensor générique pour afficher un statut Pool Control."""
+
+class PoolControlStatusSensor(RestoreSensor):
+    """Sensor générique pour afficher un statut Pool Control, restauré au redémarrage."""
+
+    # entity_id préfixé par le nom du bassin (appareil du config entry)
+    _attr_has_entity_name = True
 
     def __init__(
         self,
@@ -15,35 +30,224 @@ class PoolControlStatusSensor(SensorEntity):
         name: str,
         unique_id: str,
         controller_attribute_name: str,
-        default_state: str = "Arrêté",
+        default_state: Any = "Arrêté",
+        min_interval: float = 0,
     ) -> None:
         """Initialize the PoolControlStatusSensor."""
 
         self._controller = controller
         self._attr_name = name
-        self._attr_unique_id = unique_id
+        self._attr_unique_id = controller.uniqueId(unique_id)
+        self._attr_device_info = controller.deviceInfo
         self._controller_attribute_name = controller_attribute_name
         self._state = default_state
         self._ready = False
 
-        # Dès la création, on attache l'entité au controller dynamiquement
-        setattr(controller, controller_attribute_name, self)
+        # Intervalle minimum entre deux écritures (secondes), 0 = immédiat
+        self._min_interval = min_interval
+        self._last_write = None
+        self._pending_write = None
+
+        # Dès la création, l'entité s'abonne au statut du controller
+        controller.statusCoordinator.subscribe(controller_attribute_name, self)
 
     async def async_added_to_hass(self) -> None:
         """Call when the entity is added to hass."""
 
+        # Statut pas encore publié par le controller : valeur d'avant le redémarrage
+        if self._controller_attribute_name not in self._controller.statusCoordinator.values:
+            last = await self.async_get_last_sensor_data()
+            if last is not None and last.native_value is not None:
+                self._state = self._restored_status(last.native_value)
+
         self._ready = True
 
+    def _restored_status(self, native_value: Any) -> Any:
+        """Convert the restored native value to a status value."""
+
+        return native_value
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Call when the entity is about to be removed from hass."""
+
+        self._ready = False
+        self._controller.statusCoordinator.unsubscribe(self._controller_attribute_name, self)
+        if self._pending_write is not None:
+            self._pending_write()
+            self._pending_write = None
+
     @property
-    def state(self) -> str:
+    def native_value(self) -> Any:
         """Return the state of the sensor."""
 
         return self._state
 
-    def set_status(self, value: str) -> None:
+    def set_status(self, value: Any) -> None:
         """Set the status of the sensor."""
 
+        # Valeur inchangée : aucune écriture
+        if value == self._state:
+            self._controller.compterEcritureStatut(self._controller_attribute_name, "unchanged")
+            return
+
         self._state = value
+        if not self._ready:
+            return
+
+        # Écriture trop rapprochée : la dernière valeur sera publiée à l'échéance
+        if self._min_interval and self._last_write is not None:
+            delay = self._last_write + self._min_interval - time.monotonic()
+            if delay > 0:
+                self._controller.compterEcritureStatut(
+                    self._controller_attribute_name, "throttled"
+                )
+                if self._pending_write is None:
+                    self._pending_write = async_call_later(
+                        self.hass, delay, self._async_write_pending
+                    )
+                return
+
+        self._write_status()
+
+    async def _async_write_pending(self, now: Optional[Any] = None) -> None:
+        """Publish the status held back by the minimum interval."""
+
+        self._pending_write = None
+        if self._ready:
+            self._write_status()
+
+    def _write_status(self) -> None:
+        """Write the status to Home Assistant."""
+
+        self._last_write = time.monotonic()
+        self.async_write_ha_state()
+        self._controller.compterEcritureStatut(self._controller_attribute_name, "written")
+
+
+class PoolControlTimestampSensor(PoolControlStatusSensor):
+    """Sensor de fin de phase : le frontend affiche le compte à rebours."""
+
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+
+    def __init__(
+        self, controller: Any, name: str, unique_id: str, controller_attribute_name: str
+    ) -> None:
+        """Initialize the PoolControlTimestampSensor."""
+
+        super().__init__(
+            controller, name, unique_id, controller_attribute_name, default_state=None
+        )
+
+    @property
+    def native_value(self) -> Optional[datetime]:
+        """Return the end of the phase, None when no phase is running."""
+
+        if not self._state:
+            return None
+        return dt_util.utc_from_timestamp(self._state)
+
+    def _restored_status(self, native_value: Any) -> Optional[int]:
+        """Convert the restored datetime to the timestamp published by the controller."""
+
+        if not isinstance(native_value, datetime):
+            return None
+        return int(native_value.timestamp())
+
+
+class PoolControlMeasureSensor(PoolControlStatusSensor):
+    """Sensor numérique du planning, conservé dans les statistiques long terme."""
+
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(
+        self,
+        controller: Any,
+        name: str,
+        unique_id: str,
+        controller_attribute_name: str,
+        device_class: SensorDeviceClass,
+        unit: str,
+    ) -> None:
+        """Initialize the PoolControlMeasureSensor."""
+
+        self._attr_device_class = device_class
+        self._attr_native_unit_of_measurement = unit
+
+        super().__init__(
+            controller, name, unique_id, controller_attribute_name, default_state=None
+        )
+
+
+class PoolControlLavagePhaseSensor(PoolControlStatusSensor):
+    """Sensor enum de la phase du lavage du filtre à sable."""
+
+    _attr_device_class = SensorDeviceClass.ENUM
+    _attr_options = list(LAVAGE_PHASES)
+    _attr_translation_key = "filtre_sable_lavage_phase"
+
+    def __init__(
+        self, controller: Any, name: str, unique_id: str, controller_attribute_name: str
+    ) -> None:
+        """Initialize the PoolControlLavagePhaseSensor."""
+
+        super().__init__(
+            controller,
+            name,
+            unique_id,
+            controller_attribute_name,
+            default_state=LAVAGE_PHASES[0],
+        )
+
+
+class PoolControlProfilingSensor(SensorEntity):
+    """Sensor de durée moyenne d'une phase de la boucle de contrôle."""
+
+    _attr_has_entity_name = True
+
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+
+    def __init__(self, controller: Any, name: str, unique_id: str, phase: str) -> None:
+        """Initialize the PoolControlProfilingSensor."""
+
+        self._controller = controller
+        self._attr_name = name
+        self._attr_unique_id = controller.uniqueId(unique_id)
+        self._attr_device_info = controller.deviceInfo
+        self._phase = phase
+        self._ready = False
+
+        # Publié par le controller à la fin de chaque cycle
+        controller.profilageCapteurs.append(self)
+
+    async def async_added_to_hass(self) -> None:
+        """Call when the entity is added to hass."""
+
+        self._ready = True
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Call when the entity is about to be removed from hass."""
+
+        self._ready = False
+        if self in self._controller.profilageCapteurs:
+            self._controller.profilageCapteurs.remove(self)
+
+    @property
+    def native_value(self) -> Optional[float]:
+        """Return the rolling mean duration of the phase."""
+
+        return self._controller.profilage[self._phase].snapshot().get("moyenne")
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the rolling statistics of the phase."""
+
+        return self._controller.profilage[self._phase].snapshot()
+
+    def refresh(self) -> None:
+        """Publish the latest statistics."""
+
         if self._ready:
             self.async_write_ha_state()
 
@@ -51,16 +255,20 @@ class PoolControlStatusSensor(SensorEntity):
 class PoolControlButton(ButtonEntity):
     """Button générique pour Pool Control."""
 
+    _attr_has_entity_name = True
+
     def __init__(self, controller: Any, name: str, unique_id: str, callback: Callable) -> None:
         """Initialize the PoolControlButton."""
 
         self._controller = controller
         self._attr_name = name
-        self._attr_unique_id = unique_id
+        self._attr_unique_id = controller.uniqueId(unique_id)
+        self._attr_device_info = controller.deviceInfo
         self._callback = callback
 
     async def async_press(self) -> None:
         """Handle the button press."""
 
         if self._callback:
-            await self._callback()
+            with self._controller.statusCoordinator.batch():
+                await self._callback()
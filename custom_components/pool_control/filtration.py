@@ -43,6 +43,7 @@ class FiltrationMixin:
             return
 
         if not repeat and filtrationState.state == "on":
+            self.compterCommande("filtration", "avoided")
             return
 
         # Active la filtration
@@ -72,6 +73,7 @@ class FiltrationMixin:
             return
 
         if not repeat and filtrationState.state == "off":
+            self.compterCommande("filtration", "avoided")
             return
 
         # Arrête la filtration
@@ -2,9 +2,11 @@
 
 from datetime import datetime, timedelta
 import logging
-import time
 from typing import Optional
 
+from .log import DECISION_LOGGER, LazyTimestamp
+from .profilage import mesurer
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -31,6 +33,7 @@ class HivernageMixin:
 
         return status
 
+    @mesurer("calcul")
     def calculateTimeFiltrationHivernage(self, temperatureWater: float, flgTomorrow: bool) -> None:
         """Calculate the filtration period in hivernage mode."""
 
@@ -53,18 +56,12 @@ class HivernageMixin:
             datePivot = self.datePivotHivernage
 
         # filtrationPivotSecondes = strtotime(datePivot)
-        todayDate = datetime.today().date()
+        todayDate = self.horloge.now().date()
         combinedDatetime = datetime.strptime(
             str(todayDate) + " " + datePivot, "%Y-%m-%d %H:%M"
         )
         filtrationPivotSecondes = combinedDatetime.timestamp()
 
-        # la plage doit-elle etre celle de demain ?
-        if flgTomorrow is True:
-            if filtrationPivotSecondes < time.time():
-                _LOGGER.info("+1 day")
-                filtrationPivotSecondes += timedelta(days=1).total_seconds()
-
         # Repartition de la filtration suivant Config
         if self.distributionDatePivotHivernage == 1:
             # 1/2 <> 1/2
@@ -105,6 +102,17 @@ class HivernageMixin:
             filtrationDebut = filtrationPivotSecondes
             filtrationFin = filtrationPivotSecondes + filtrationSecondes
 
+        # la plage doit-elle etre celle de demain ?
+        # Le lever du soleil recule d'un jour à l'autre : un pivot encore à venir
+        # ne suffit pas, la plage ne doit pas chevaucher celle qui vient de finir
+        if flgTomorrow is True:
+            if filtrationPivotSecondes < self.horloge.time() or (
+                filtrationDebut < self.get_data("filtrationFin", 0)
+            ):
+                _LOGGER.info("+1 day")
+                filtrationDebut += timedelta(days=1).total_seconds()
+                filtrationFin += timedelta(days=1).total_seconds()
+
         # Memorise les resultats du calcul
         if self.filtrationTimeStatus:
             self.filtrationTimeStatus.set_status(filtrationTime)
@@ -119,6 +127,8 @@ class HivernageMixin:
         if self.filtrationScheduleStatus:
             self.filtrationScheduleStatus.set_status(display)
 
+        self.publierPlanning(filtrationDebut, None, None, filtrationFin, temperatureCalcul)
+
         self.set_data("filtrationDebut", int(filtrationDebut))
         self.set_data("filtrationFin", int(filtrationFin))
 
@@ -132,13 +142,14 @@ class HivernageMixin:
 
         _LOGGER.info(
             "filtrationDebut=%s",
-            datetime.fromtimestamp(filtrationDebut).strftime("%H:%M %d-%m-%Y"),
+            LazyTimestamp(filtrationDebut),
         )
         _LOGGER.info(
             "filtrationFin=%s",
-            datetime.fromtimestamp(filtrationFin).strftime("%H:%M %d-%m-%Y"),
+            LazyTimestamp(filtrationFin),
         )
 
+    @mesurer("statut")
     async def calculateStatusFiltrationHivernage(
         self, temperatureWater: float, temperatureOutdoor: float
     ) -> None:
@@ -149,18 +160,12 @@ class HivernageMixin:
         filtrationDebut = self.get_data("filtrationDebut", 0)
         filtrationFin = self.get_data("filtrationFin", 0)
 
-        timeNow = time.time()
-        _LOGGER.info(
-            "calculateStatusFiltration: timeNow=%s",
-            datetime.fromtimestamp(timeNow).strftime("%H:%M %d-%m-%Y"),
-        )
-        _LOGGER.info(
-            "calculateStatusFiltration: filtrationDebut=%s",
-            datetime.fromtimestamp(filtrationDebut).strftime("%H:%M %d-%m-%Y"),
-        )
-        _LOGGER.info(
-            "calculateStatusFiltration: filtrationFin=%s",
-            datetime.fromtimestamp(filtrationFin).strftime("%H:%M %d-%m-%Y"),
+        timeNow = self.horloge.time()
+        DECISION_LOGGER.debug(
+            "calculateStatusFiltrationHivernage: timeNow=%s filtrationDebut=%s filtrationFin=%s",
+            LazyTimestamp(timeNow),
+            LazyTimestamp(filtrationDebut),
+            LazyTimestamp(filtrationFin),
         )
 
         if filtrationDebut == 0 or filtrationFin == 0:
@@ -169,7 +174,7 @@ class HivernageMixin:
 
             # Verifie si la plage calculée est passée
             filtrationFin = self.get_data("filtrationFin", 0)
-            timeNow = time.time()
+            timeNow = self.horloge.time()
 
             if timeNow > filtrationFin:
                 # On est apres la plage de filtration, relancer le calcul pour la plage de demain
@@ -189,9 +194,9 @@ class HivernageMixin:
                         if temperatureWater > temperatureMaxi:
                             self.set_data("temperatureMaxi", temperatureWater)
 
-                            _LOGGER.debug("temperatureMaxi: %s", temperatureMaxi)
-                            _LOGGER.debug("temperatureWater: %s", temperatureWater)
-                            _LOGGER.debug(
+                            DECISION_LOGGER.debug("temperatureMaxi: %s", temperatureMaxi)
+                            DECISION_LOGGER.debug("temperatureWater: %s", temperatureWater)
+                            DECISION_LOGGER.debug(
                                 "(temperatureWater > temperatureMaxi) >> temperatureMaxi=: %s",
                                 temperatureWater,
                             )
@@ -203,9 +208,9 @@ class HivernageMixin:
                     if temperatureWater > temperatureMaxi:
                         self.set_data("temperatureMaxi", temperatureWater)
 
-                        _LOGGER.debug("temperatureMaxi: %s", temperatureMaxi)
-                        _LOGGER.debug("temperatureWater: %s", temperatureWater)
-                        _LOGGER.debug(
+                        DECISION_LOGGER.debug("temperatureMaxi: %s", temperatureMaxi)
+                        DECISION_LOGGER.debug("temperatureWater: %s", temperatureWater)
+                        DECISION_LOGGER.debug(
                             "(temperatureWater > temperatureMaxi) >> temperatureMaxi=: %s",
                             temperatureWater,
                         )
@@ -238,7 +243,7 @@ class HivernageMixin:
             if temperatureOutdoor > (
                 self.temperatureSecurite + self.temperatureHysteresis
             ):
-                _LOGGER.debug(
+                DECISION_LOGGER.debug(
                     "Arret securité gel sur temperature exterieure > %s",
                     self.temperatureSecurite + self.temperatureHysteresis,
                 )
@@ -246,12 +251,18 @@ class HivernageMixin:
                 filtrationHivernageSecurite = 0
 
         elif temperatureOutdoor < self.temperatureSecurite:
-            _LOGGER.debug(
+            DECISION_LOGGER.debug(
                 "Securité gel sur temperature exterieure < %s", self.temperatureSecurite
             )
 
             filtrationHivernageSecurite = 1
 
+        if (
+            int(self.get_data("filtrationHivernageSecurite", 0))
+            != filtrationHivernageSecurite
+        ):
+            _LOGGER.info("filtrationHivernageSecurite=%s", filtrationHivernageSecurite)
+
         self.set_data("filtrationHivernageSecurite", filtrationHivernageSecurite)
 
         # Securité gel sur temperature exterieure < temperatureSecurite
@@ -260,7 +271,7 @@ class HivernageMixin:
 
         # 5mn toutes les 3H
         if self.filtration5mn3h:
-            currentTime = datetime.now().strftime("%H%M")
+            currentTime = self.horloge.now().strftime("%H%M")
 
             if (
                 "0200" <= currentTime <= "0205"
@@ -276,6 +287,7 @@ class HivernageMixin:
 
         if int(self.get_data("filtrationHivernage", 0)) != filtrationHivernage:
             self.set_data("filtrationHivernage", filtrationHivernage)
+            _LOGGER.info("filtrationHivernage=%s", filtrationHivernage)
 
         if int(self.get_data("filtrationTemperature", 0)) != 0:
             self.set_data("filtrationTemperature", 0)
@@ -0,0 +1,44 @@
+"""Injectable clock for the pool controller."""
+
+from datetime import datetime
+import time
+
+
+class Horloge:
+    """Horloge système, lue par le controller pour toutes ses échéances."""
+
+    def time(self) -> float:
+        """Timestamp courant."""
+
+        return time.time()
+
+    def now(self) -> datetime:
+        """Date et heure locales courantes."""
+
+        return datetime.fromtimestamp(time.time())
+
+
+class HorlogeVirtuelle(Horloge):
+    """Horloge avancée explicitement, pour la simulation et les tests."""
+
+    __slots__ = ("maintenant",)
+
+    def __init__(self, debut: float) -> None:
+        """Initialize the HorlogeVirtuelle."""
+
+        self.maintenant = debut
+
+    def time(self) -> float:
+        """Timestamp virtuel."""
+
+        return self.maintenant
+
+    def now(self) -> datetime:
+        """Date et heure locales virtuelles."""
+
+        return datetime.fromtimestamp(self.maintenant)
+
+    def avancer(self, secondes: float) -> None:
+        """Avance l'horloge."""
+
+        self.maintenant += secondes
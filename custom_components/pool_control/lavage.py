@@ -1,87 +1,49 @@
 """Lavage mixin for pool control."""
 
-from datetime import datetime
-import time
-from typing import Optional
+from .machine import MachineEtats, Phase
+
+# Cycle du lavage du filtre à sable, index mémorisé dans filtrationLavageEtat.
+# Commande des équipements (filtrationLavage) : 0 normal, 1 arrêt, 2 filtration
+LAVAGE = MachineEtats(
+    (
+        Phase("arret", "Arrêté", 0, entree=("stopSecondCron",)),
+        Phase(
+            "position_lavage", "Arrêt, position lavage", 1, entree=("startSecondCron",)
+        ),
+        Phase("lavage", "Lavage", 2, duree="lavageDuree"),
+        Phase(
+            "position_rincage", "Arrêt, position rinçage", 1, requiert="rincageDuree"
+        ),
+        Phase("rincage", "Rinçage", 2, duree="rincageDuree"),
+        Phase("position_filtration", "Arrêt, position filtration", 1),
+    ),
+    cleEtat="filtrationLavageEtat",
+    cleEcheance="filtrationTempsRestant",
+    cleCommande="filtrationLavage",
+    statut="filtreSableLavageStatus",
+    statutPhase="filtreSableLavagePhaseStatus",
+    statutFin="filtreSableLavageFinStatus",
+)
+
+# Phase du lavage exposée par le capteur enum, indexée par filtrationLavageEtat
+LAVAGE_PHASES = LAVAGE.noms
 
 
 class LavageMixin:
     """Mixin class providing lavage (filter cleaning) logic for pool control."""
 
     async def executeFiltreSableLavageOn(self) -> None:
-        """Lance le lavage du filtre à sable."""
+        """Passe le lavage du filtre à sable à la phase suivante."""
 
         if self.get_data("filtrationSurpresseur", 0) == 0:
-            lavageState = int(self.get_data("filtrationLavageEtat", 0))
+            await LAVAGE.avancer(self)
 
-            if lavageState == 0:
-                # Arrêt, mettre la vanne sur la position lavage
-                self.set_data("filtrationLavageEtat", 1)
-                if self.filtreSableLavageStatus:
-                    self.filtreSableLavageStatus.set_status("Arrêt, position lavage")
-                self.set_data("filtrationLavage", 1)
-                await self.activatingDevices()
+    async def arreterLavage(self) -> None:
+        """Interrompt le lavage en cours."""
 
-                await self.startSecondCron()
+        await LAVAGE.arreter(self)
 
-            elif lavageState == 1:
-                if self.rincageDuree == 0:
-                    # Si le temps de rinçage est == 0 on passe directement à la fin
-                    self.set_data("filtrationLavageEtat", 4)  # Rinçage en cours...
-                else:
-                    self.set_data("filtrationLavageEtat", 2)  # Lavage en cours...
+    def etatLavage(self) -> int:
+        """Index de la phase en cours ; un index inconnu du store vaut arrêt."""
 
-                timeFin = time.time() + (self.lavageDuree * 60)
-                self.set_data("filtrationTempsRestant", int(timeFin))
-
-                timeRestant = timeFin - int(time.time())
-                display = "Lavage"
-                display += " : "
-                display += datetime.fromtimestamp(timeRestant).strftime("%M:%S")
-                if self.filtreSableLavageStatus:
-                    self.filtreSableLavageStatus.set_status(display)
-                self.set_data("filtrationLavage", 2)
-                await self.activatingDevices()
-
-            elif lavageState == 2:
-                # Arrêt, mettre la vanne sur la position rinçage
-                self.set_data("filtrationLavageEtat", 3)
-                if self.filtreSableLavageStatus:
-                    self.filtreSableLavageStatus.set_status("Arrêt, position rinçage")
-                self.set_data("filtrationLavage", 1)
-                await self.activatingDevices()
-
-            elif lavageState == 3:
-                # Rinçage en cours...
-                self.set_data("filtrationLavageEtat", 4)
-                timeFin = time.time() + (self.rincageDuree * 60)
-                self.set_data("filtrationTempsRestant", int(timeFin))
-
-                timeRestant = timeFin - time.time()
-                display = "Rinçage"
-                display += " : "
-                display += datetime.fromtimestamp(timeRestant).strftime("%M:%S")
-                if self.filtreSableLavageStatus:
-                    self.filtreSableLavageStatus.set_status(display)
-                self.set_data("filtrationLavage", 2)
-                await self.activatingDevices()
-
-            elif lavageState == 4:
-                # Arrêt, mettre la vanne sur la position filtration
-                self.set_data("filtrationLavageEtat", 5)
-                if self.filtreSableLavageStatus:
-                    self.filtreSableLavageStatus.set_status(
-                        "Arrêt, position filtration"
-                    )
-                self.set_data("filtrationLavage", 1)
-                await self.activatingDevices()
-
-            elif lavageState == 5:
-                # Arrêté
-                self.set_data("filtrationLavageEtat", 0)
-                if self.filtreSableLavageStatus:
-                    self.filtreSableLavageStatus.set_status("Arrêté")
-                self.set_data("filtrationLavage", 0)
-                await self.activatingDevices()
-
-                await self.stopSecondCron()
+        return LAVAGE.etat(self)
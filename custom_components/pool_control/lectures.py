@@ -0,0 +1,201 @@
+"""Shared cache of the sensor readings of the domain."""
+
+from datetime import datetime
+import logging
+from typing import Any, Callable, Optional
+
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import HomeAssistant, State, callback
+from homeassistant.helpers.event import async_track_state_change_event
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def parseTemperature(etat: str) -> float:
+    """Température en °C."""
+
+    return float(etat)
+
+
+def parseHoraire(etat: str) -> str:
+    """Heure "HH:MM" d'une date ISO 8601 (lever du soleil)."""
+
+    return datetime.fromisoformat(etat).strftime("%H:%M")
+
+
+class Lecture:
+    """Valeur typée d'un capteur, partagée par tous les controllers abonnés.
+
+    `horodatage` est l'instant du dernier relevé valide ; `indisponible` indique
+    que la source est depuis devenue indisponible ou illisible, la valeur
+    étant alors la dernière connue (None si aucune). La péremption dépend de
+    l'âge maximum configuré par chaque bassin : voir `perimee()`.
+    """
+
+    __slots__ = ("valeur", "horodatage", "indisponible")
+
+    def __init__(self, valeur: Any, horodatage: Optional[float], indisponible: bool) -> None:
+        """Initialize the Lecture."""
+
+        self.valeur = valeur
+        self.horodatage = horodatage
+        self.indisponible = indisponible
+
+    def perimee(self, maintenant: float, ageMaximum: float) -> bool:
+        """Source indisponible, ou dernier relevé plus ancien que `ageMaximum` secondes (0 : sans limite)."""
+
+        if self.indisponible or self.horodatage is None:
+            return True
+
+        return bool(ageMaximum) and maintenant - self.horodatage > ageMaximum
+
+    def snapshot(self) -> dict[str, Any]:
+        """Lecture sérialisable, pour les diagnostics."""
+
+        return {
+            "valeur": self.valeur,
+            "horodatage": self.horodatage,
+            "indisponible": self.indisponible,
+        }
+
+
+def horodatageReleve(state: State) -> float:
+    """Instant du dernier relevé : un capteur qui republie la même valeur reste à jour."""
+
+    # last_reported : Home Assistant 2024.4 et suivants
+    return (getattr(state, "last_reported", None) or state.last_updated).timestamp()
+
+
+LECTURE_ABSENTE = Lecture(None, None, True)
+
+
+class EntreeCache:
+    """Dernière lecture d'une entité et controllers abonnés."""
+
+    __slots__ = ("parseur", "lecture", "abonnes", "listenerCancel")
+
+    def __init__(self, parseur: Callable[[str], Any]) -> None:
+        """Initialize the EntreeCache."""
+
+        self.parseur = parseur
+        self.lecture = LECTURE_ABSENTE
+        self.abonnes = []
+        self.listenerCancel = None
+
+
+class CacheLectures:
+    """Un abonnement et une analyse par entité, quel que soit le nombre de bassins."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the CacheLectures."""
+
+        self.hass = hass
+        self.entrees = {}
+
+        # Nombre d'états analysés, toutes entités confondues
+        self.analyses = 0
+
+    def abonner(
+        self,
+        entity_id: str,
+        parseur: Callable[[str], Any],
+        rappel: Callable[[Lecture], None],
+    ) -> Callable[[], None]:
+        """Abonne un controller aux lectures d'une entité.
+
+        Le rappel reçoit immédiatement la lecture courante, puis chaque nouvelle
+        lecture. Retourne la fonction de désabonnement.
+        """
+
+        entree = self.entrees.get(entity_id)
+
+        if entree is None:
+            entree = EntreeCache(parseur)
+            self.entrees[entity_id] = entree
+            entree.lecture = self._analyser(entity_id, entree, self.hass.states.get(entity_id))
+            entree.listenerCancel = async_track_state_change_event(
+                self.hass, [entity_id], self._handleStateChange
+            )
+        elif entree.parseur is not parseur:
+            raise ValueError(f"{entity_id} déjà lu comme {entree.parseur.__name__}")
+
+        entree.abonnes.append(rappel)
+        rappel(entree.lecture)
+
+        def annuler() -> None:
+            """Retire l'abonnement ; l'entité n'est plus suivie sans abonné."""
+
+            self._retirer(entity_id, rappel)
+
+        return annuler
+
+    def lire(self, entity_id: str) -> Lecture:
+        """Dernière lecture d'une entité suivie."""
+
+        entree = self.entrees.get(entity_id)
+        if entree is None:
+            return LECTURE_ABSENTE
+        return entree.lecture
+
+    def _retirer(self, entity_id: str, rappel: Callable[[Lecture], None]) -> None:
+        """Retire un abonné ; le suivi de l'entité s'arrête avec le dernier."""
+
+        entree = self.entrees.get(entity_id)
+        if entree is None or rappel not in entree.abonnes:
+            return
+
+        entree.abonnes.remove(rappel)
+
+        if not entree.abonnes:
+            entree.listenerCancel()
+            del self.entrees[entity_id]
+
+    @callback
+    def _handleStateChange(self, event: Any) -> None:
+        """Analyse le nouvel état une fois et le diffuse aux abonnés."""
+
+        entity_id = event.data["entity_id"]
+        entree = self.entrees.get(entity_id)
+        if entree is None:
+            return
+
+        entree.lecture = self._analyser(entity_id, entree, event.data.get("new_state"))
+
+        for rappel in list(entree.abonnes):
+            rappel(entree.lecture)
+
+    def _analyser(self, entity_id: str, entree: EntreeCache, state: Optional[State]) -> Lecture:
+        """Lecture d'un état ; la dernière valeur valide est conservée, marquée indisponible."""
+
+        precedente = entree.lecture
+
+        if state is None or state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+            valeur = None
+        else:
+            self.analyses += 1
+            try:
+                valeur = entree.parseur(state.state)
+            except (TypeError, ValueError):
+                _LOGGER.error("Invalid value for %s: %s", entity_id, state.state)
+                valeur = None
+
+        if valeur is None:
+            if not precedente.indisponible:
+                _LOGGER.warning("Sensor %s unavailable", entity_id)
+            return Lecture(precedente.valeur, precedente.horodatage, True)
+
+        return Lecture(valeur, horodatageReleve(state), False)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Entités suivies, abonnés et lectures, pour les diagnostics."""
+
+        return {
+            "analyses": self.analyses,
+            "entites": {
+                entity_id: {
+                    "abonnes": len(entree.abonnes),
+                    **entree.lecture.snapshot(),
+                }
+                for entity_id, entree in self.entrees.items()
+            },
+        }
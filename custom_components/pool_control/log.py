@@ -0,0 +1,25 @@
+"""Logging helpers for pool control integration."""
+
+from datetime import datetime
+import logging
+
+# Journal des décisions de chaque cycle (niveau DEBUG uniquement).
+# Activation : logger "custom_components.pool_control.decision: debug"
+DECISION_LOGGER = logging.getLogger(f"{__package__}.decision")
+
+
+class LazyTimestamp:
+    """Timestamp formaté uniquement si la ligne de log est émise."""
+
+    __slots__ = ("timestamp", "format")
+
+    def __init__(self, timestamp: float, format: str = "%H:%M %d-%m-%Y") -> None:
+        """Initialize the LazyTimestamp."""
+
+        self.timestamp = timestamp
+        self.format = format
+
+    def __str__(self) -> str:
+        """Return the formatted timestamp."""
+
+        return datetime.fromtimestamp(self.timestamp).strftime(self.format)
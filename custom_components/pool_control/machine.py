@@ -0,0 +1,192 @@
+"""Table-driven state machine for the pool control cycles."""
+
+from functools import partial
+import logging
+from typing import Any, Callable, Optional
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class Phase:
+    """Phase d'un cycle : statut affiché, commande des équipements, durée et actions.
+
+    `duree` et `requiert` sont des noms d'options du controller (en minutes) :
+    une phase minutée se termine à l'échéance, une phase dont l'option requise
+    vaut 0 est sautée. `entree` et `sortie` sont des noms de méthodes du
+    controller appelées en entrant dans la phase et en la quittant.
+    """
+
+    __slots__ = ("nom", "statut", "commande", "duree", "requiert", "entree", "sortie")
+
+    def __init__(
+        self,
+        nom: str,
+        statut: str,
+        commande: int,
+        duree: Optional[str] = None,
+        requiert: Optional[str] = None,
+        entree: tuple[str, ...] = (),
+        sortie: tuple[str, ...] = (),
+    ) -> None:
+        """Initialize the Phase."""
+
+        self.nom = nom
+        self.statut = statut
+        self.commande = commande
+        self.duree = duree
+        self.requiert = requiert
+        self.entree = entree
+        self.sortie = sortie
+
+    @property
+    def minutee(self) -> bool:
+        """La phase se termine à son échéance."""
+
+        return self.duree is not None
+
+    def ignoree(self, option: Callable[[str], Any]) -> bool:
+        """La phase est sautée : sa durée ou l'option requise vaut 0."""
+
+        return any(
+            cle is not None and not option(cle) for cle in (self.duree, self.requiert)
+        )
+
+
+class MachineEtats:
+    """Cycle de phases parcouru dans l'ordre, qui revient à la première (arrêt).
+
+    Chaque appui ou échéance passe à la phase suivante non sautée ; l'arrêt est
+    possible depuis toute phase. La machine ne garde aucun état : l'index de la
+    phase (`cleEtat`), l'échéance de la phase minutée (`cleEcheance`) et la
+    commande des équipements (`cleCommande`) sont mémorisés dans le store du
+    controller, le statut et la phase sont publiés sur ses status handles.
+    """
+
+    def __init__(
+        self,
+        phases: tuple[Phase, ...],
+        cleEtat: str,
+        cleEcheance: str,
+        cleCommande: str,
+        statut: str,
+        statutPhase: Optional[str] = None,
+        statutFin: Optional[str] = None,
+        appliquer: str = "activatingDevices",
+    ) -> None:
+        """Initialize the MachineEtats, the table being checked once."""
+
+        noms = [phase.nom for phase in phases]
+        if len(phases) < 2 or len(set(noms)) != len(noms):
+            raise ValueError(f"Invalid cycle: {noms}")
+
+        # L'arrêt n'est ni minuté ni sauté : le parcours du cycle s'y termine toujours
+        if phases[0].minutee or phases[0].requiert is not None:
+            raise ValueError(f"First phase {phases[0].nom} must be a plain stop")
+
+        self.phases = phases
+        self.noms = tuple(noms)
+        self.cleEtat = cleEtat
+        self.cleEcheance = cleEcheance
+        self.cleCommande = cleCommande
+        self.statut = statut
+        self.statutPhase = statutPhase
+        self.statutFin = statutFin
+        self.appliquer = appliquer
+
+    def phase(self, etat: int) -> Phase:
+        """Phase d'un index mémorisé."""
+
+        if not 0 <= etat < len(self.phases):
+            raise ValueError(f"Unknown phase {etat}")
+
+        return self.phases[etat]
+
+    def suivante(self, etat: int, option: Callable[[str], Any]) -> int:
+        """Index de la phase suivante, phases sautées comprises."""
+
+        suivante = (etat + 1) % len(self.phases)
+        while self.phases[suivante].ignoree(option):
+            suivante = (suivante + 1) % len(self.phases)
+
+        return suivante
+
+    def valider(self, etat: int, vers: int, option: Callable[[str], Any]) -> None:
+        """Vérifie la transition : phase suivante, ou arrêt depuis toute phase."""
+
+        self.phase(vers)
+        if vers != 0 and vers != self.suivante(etat, option):
+            raise ValueError(
+                f"Invalid transition {self.phase(etat).nom} -> {self.phases[vers].nom}"
+            )
+
+    def etat(self, controller: Any) -> int:
+        """Index de la phase en cours ; un index inconnu du store vaut arrêt."""
+
+        etat = int(controller.get_data(self.cleEtat, 0))
+
+        if not 0 <= etat < len(self.phases):
+            _LOGGER.warning("Unknown phase %s for %s, stopping", etat, self.cleEtat)
+            return 0
+
+        return etat
+
+    def echeanceDepassee(self, controller: Any) -> bool:
+        """La phase en cours est minutée et son échéance est passée."""
+
+        return (
+            self.phase(self.etat(controller)).minutee
+            and controller.get_data(self.cleEcheance, 0) <= controller.horloge.time()
+        )
+
+    async def avancer(self, controller: Any) -> None:
+        """Passe à la phase suivante."""
+
+        await self.changer(
+            controller,
+            self.suivante(self.etat(controller), partial(getattr, controller)),
+        )
+
+    async def arreter(self, controller: Any) -> None:
+        """Interrompt le cycle en cours."""
+
+        if self.etat(controller) != 0:
+            await self.changer(controller, 0)
+
+    async def changer(self, controller: Any, etat: int) -> None:
+        """Entre dans une phase : statut, échéance, équipements et actions."""
+
+        depuis = self.etat(controller)
+        option = partial(getattr, controller)
+        self.valider(depuis, etat, option)
+        phase = self.phase(etat)
+
+        for action in self.phase(depuis).sortie:
+            await getattr(controller, action)()
+
+        controller.set_data(self.cleEtat, etat)
+        if phase.minutee:
+            timeFin = controller.horloge.time() + (option(phase.duree) * 60)
+            controller.set_data(self.cleEcheance, int(timeFin))
+
+        statut = getattr(controller, self.statut)
+        if statut:
+            statut.set_status(phase.statut)
+        self.publier(controller)
+        controller.set_data(self.cleCommande, phase.commande)
+        await getattr(controller, self.appliquer)()
+
+        for action in phase.entree:
+            await getattr(controller, action)()
+
+    def publier(self, controller: Any) -> None:
+        """Publie la phase en cours et l'heure de fin de la phase minutée."""
+
+        phase = self.phase(self.etat(controller))
+
+        if self.statutPhase is not None:
+            getattr(controller, self.statutPhase).set_status(phase.nom)
+
+        if self.statutFin is not None:
+            getattr(controller, self.statutFin).set_status(
+                controller.get_data(self.cleEcheance, 0) if phase.minutee else None
+            )
@@ -0,0 +1,221 @@
+"""Prometheus metrics mixin for pool control integration."""
+
+from bisect import bisect_left
+from typing import Any
+
+from aiohttp import web
+
+from homeassistant.components.http import HomeAssistantView
+
+from .const import DOMAIN
+from .trace import TRACE_ENTREES
+
+METRIQUES_URL = "/api/pool_control/metrics"
+
+# Bornes de l'histogramme de durée des cycles (secondes)
+METRIQUES_BORNES = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Équipements suivis : nom, attribut du controller portant l'entity_id
+METRIQUES_EQUIPEMENTS = (
+    ("filtration", "filtration"),
+    ("traitement", "traitement"),
+    ("traitement_2", "traitement_2"),
+    ("surpresseur", "surpresseur"),
+)
+
+
+class Histogramme:
+    """Histogramme à bornes fixes, cumulé uniquement à l'export."""
+
+    __slots__ = ("compteurs", "somme", "nombre")
+
+    def __init__(self) -> None:
+        """Initialize the Histogramme."""
+
+        self.compteurs = [0] * (len(METRIQUES_BORNES) + 1)
+        self.somme = 0.0
+        self.nombre = 0
+
+    def observer(self, valeur: float) -> None:
+        """Ajoute une observation."""
+
+        self.compteurs[bisect_left(METRIQUES_BORNES, valeur)] += 1
+        self.somme += valeur
+        self.nombre += 1
+
+
+def _echapper(valeur: Any) -> str:
+    """Valeur de label échappée au format texte Prometheus."""
+
+    return str(valeur).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: Any) -> str:
+    """Labels au format texte Prometheus."""
+
+    return ",".join(f'{cle}="{_echapper(valeur)}"' for cle, valeur in labels.items())
+
+
+class MetriquesMixin:
+    """Mixin keeping Prometheus counters and gauges incrementally."""
+
+    def __init__(self) -> None:
+        """Initialize the MetriquesMixin with default values."""
+
+        super().__init__()
+
+        self.metriquesCycles = 0
+        self.metriquesDureeCycle = Histogramme()
+        self.metriquesEcrituresStore = 0
+
+        # (equipement, resultat) -> nombre de commandes
+        self.metriquesCommandes = {}
+
+        # (capteur, resultat) -> nombre d'écritures de statut
+        self.metriquesEcrituresStatut = {}
+
+        # equipement -> secondes de marche cumulées, dernière observation
+        self.metriquesFonctionnement = {}
+        self.metriquesObservation = {}
+
+    def compterCommande(self, equipement: Any, resultat: str) -> None:
+        """Compte une commande envoyée (sent), en échec (failed) ou évitée (avoided)."""
+
+        cle = (equipement, resultat)
+        self.metriquesCommandes[cle] = self.metriquesCommandes.get(cle, 0) + 1
+
+    def compterEcritureStatut(self, capteur: str, resultat: str) -> None:
+        """Compte une écriture de statut publiée (written) ou supprimée (unchanged, throttled)."""
+
+        cle = (capteur, resultat)
+        self.metriquesEcrituresStatut[cle] = self.metriquesEcrituresStatut.get(cle, 0) + 1
+
+    def compterEcritureStore(self) -> None:
+        """Compte une écriture du store."""
+
+        self.metriquesEcrituresStore += 1
+
+    def observerCycle(self, duree: float) -> None:
+        """Enregistre un cycle de contrôle et sa durée (secondes)."""
+
+        self.metriquesCycles += 1
+        self.metriquesDureeCycle.observer(duree)
+
+    def observerEquipements(self) -> None:
+        """Cumule le temps de marche des équipements depuis la dernière observation."""
+
+        timeNow = self.horloge.time()
+
+        for equipement, attribut in METRIQUES_EQUIPEMENTS:
+            entity_id = getattr(self, attribut, None)
+            if not entity_id:
+                continue
+
+            state = self.hass.states.get(entity_id)
+            marche = state is not None and state.state == "on"
+
+            derniere = self.metriquesObservation.get(equipement)
+            if derniere is not None and derniere[1]:
+                self.metriquesFonctionnement[equipement] = (
+                    self.metriquesFonctionnement.get(equipement, 0.0)
+                    + max(0.0, timeNow - derniere[0])
+                )
+            else:
+                self.metriquesFonctionnement.setdefault(equipement, 0.0)
+
+            self.metriquesObservation[equipement] = (timeNow, marche)
+
+    def exportMetriques(self) -> str:
+        """Métriques au format texte Prometheus."""
+
+        lignes = [
+            "# HELP pool_control_cycles_total Control passes run.",
+            "# TYPE pool_control_cycles_total counter",
+            f"pool_control_cycles_total {self.metriquesCycles}",
+            "# HELP pool_control_cycle_duration_seconds Duration of a control pass.",
+            "# TYPE pool_control_cycle_duration_seconds histogram",
+        ]
+
+        cumul = 0
+        histogramme = self.metriquesDureeCycle
+        for borne, nombre in zip(METRIQUES_BORNES, histogramme.compteurs):
+            cumul += nombre
+            lignes.append(
+                f'pool_control_cycle_duration_seconds_bucket{{le="{borne}"}} {cumul}'
+            )
+        lignes += [
+            f'pool_control_cycle_duration_seconds_bucket{{le="+Inf"}} {histogramme.nombre}',
+            f"pool_control_cycle_duration_seconds_sum {histogramme.somme}",
+            f"pool_control_cycle_duration_seconds_count {histogramme.nombre}",
+            "# HELP pool_control_commands_total Actuator commands by result.",
+            "# TYPE pool_control_commands_total counter",
+        ]
+        lignes += [
+            f"pool_control_commands_total{{{_labels(device=equipement, result=resultat)}}} {nombre}"
+            for (equipement, resultat), nombre in self.metriquesCommandes.items()
+        ]
+        lignes += [
+            "# HELP pool_control_store_writes_total Writes of the persistent store.",
+            "# TYPE pool_control_store_writes_total counter",
+            f"pool_control_store_writes_total {self.metriquesEcrituresStore}",
+            "# HELP pool_control_status_writes_total Status sensor writes, published or suppressed.",
+            "# TYPE pool_control_status_writes_total counter",
+        ]
+        lignes += [
+            f"pool_control_status_writes_total{{{_labels(sensor=capteur, result=resultat)}}} {nombre}"
+            for (capteur, resultat), nombre in self.metriquesEcrituresStatut.items()
+        ]
+        lignes += [
+            "# HELP pool_control_device_runtime_seconds_total Observed running time per device.",
+            "# TYPE pool_control_device_runtime_seconds_total counter",
+        ]
+        lignes += [
+            f"pool_control_device_runtime_seconds_total{{{_labels(device=equipement)}}} {duree}"
+            for equipement, duree in self.metriquesFonctionnement.items()
+        ]
+        lignes += [
+            "# HELP pool_control_device_on Last observed device state.",
+            "# TYPE pool_control_device_on gauge",
+        ]
+        lignes += [
+            f"pool_control_device_on{{{_labels(device=equipement)}}} {int(observation[1])}"
+            for equipement, observation in self.metriquesObservation.items()
+        ]
+        lignes += [
+            "# HELP pool_control_target_state Current target flags of the controller.",
+            "# TYPE pool_control_target_state gauge",
+        ]
+        lignes += [
+            f"pool_control_target_state{{{_labels(flag=cle)}}} {int(self.get_data(cle, 0))}"
+            for cle in TRACE_ENTREES
+        ]
+
+        return "\n".join(lignes) + "\n"
+
+
+class PoolControlMetricsView(HomeAssistantView):
+    """Expose les métriques Pool Control au format Prometheus."""
+
+    url = METRIQUES_URL
+    name = "api:pool_control:metrics"
+    requires_auth = True
+
+    async def get(self, request: web.Request) -> web.Response:
+        """Return the metrics of the controller."""
+
+        # Un bassin par config entry : ?entry_id=... dès que plusieurs sont chargés
+        controllers = request.app["hass"].data.get(DOMAIN, {})
+        entry_id = request.query.get("entry_id")
+        if entry_id is None and len(controllers) == 1:
+            entry_id = next(iter(controllers))
+
+        controller = controllers.get(entry_id)
+        if controller is None:
+            return web.Response(status=404)
+
+        return web.Response(
+            text=controller.exportMetriques(),
+            content_type="text/plain",
+            charset="utf-8",
+            headers={"Cache-Control": "no-cache"},
+        )
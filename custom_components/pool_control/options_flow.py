@@ -8,6 +8,9 @@ from homeassistant import config_entries
 from homeassistant.config_entries import ConfigEntry, FlowResult
 from homeassistant.helpers.selector import selector
 
+# Entités facultatives de l'étape énergie : effacées quand le champ est vidé
+ENTITES_ENERGIE = ("tarifCapteur", "capteurExport", "meteo")
+
 
 class PoolControlOptionsFlowHandler(config_entries.OptionsFlow):
     """Gestion des options de Pool Control avec menu de navigation."""
@@ -31,6 +34,7 @@ class PoolControlOptionsFlowHandler(config_entries.OptionsFlow):
                 "filtration",
                 "hivernage",
                 "avance",
+                "energie",
                 "confirm",
             ],
         )
@@ -251,6 +255,76 @@ class PoolControlOptionsFlowHandler(config_entries.OptionsFlow):
                     vol.Optional(
                         "rincageDuree", default=self.options.get("rincageDuree", 2)
                     ): int,
+                    vol.Optional(
+                        "capteursProfilage",
+                        default=self.options.get("capteursProfilage", False),
+                    ): bool,
+                    vol.Optional(
+                        "ageMaximumCapteurs",
+                        default=self.options.get("ageMaximumCapteurs", 120),
+                    ): int,
+                }
+            ),
+            last_step=False,
+        )
+
+    async def async_step_energie(self, user_input: Optional[dict[str, Any]] = None) -> FlowResult:
+        """Handle the energie step of the options flow."""
+
+        if user_input is not None:
+            for cle in ENTITES_ENERGIE:
+                if cle not in user_input:
+                    self.options.pop(cle, None)
+            self.options.update(user_input)
+            return await self.async_step_init()
+
+        return self.async_show_form(
+            step_id="energie",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        "optimisationTarif",
+                        default=self.options.get("optimisationTarif", False),
+                    ): bool,
+                    vol.Optional(
+                        "tarifCapteur",
+                        description={"suggested_value": self.options.get("tarifCapteur")},
+                    ): selector({"entity": {"domain": ["sensor"]}}),
+                    vol.Optional(
+                        "tarifProfil", default=self.options.get("tarifProfil", "")
+                    ): str,
+                    vol.Optional(
+                        "dureeSegmentMinimum",
+                        default=self.options.get("dureeSegmentMinimum", 60),
+                    ): int,
+                    vol.Optional(
+                        "pausePlageMaximum",
+                        default=self.options.get("pausePlageMaximum", 120),
+                    ): int,
+                    vol.Optional(
+                        "capteurExport",
+                        description={"suggested_value": self.options.get("capteurExport")},
+                    ): selector({"entity": {"domain": ["sensor", "input_number"]}}),
+                    vol.Optional(
+                        "seuilSolaireMarche",
+                        default=self.options.get("seuilSolaireMarche", 1000),
+                    ): int,
+                    vol.Optional(
+                        "seuilSolaireArret",
+                        default=self.options.get("seuilSolaireArret", 0),
+                    ): int,
+                    vol.Optional(
+                        "dureeMinimumSolaireMarche",
+                        default=self.options.get("dureeMinimumSolaireMarche", 15),
+                    ): int,
+                    vol.Optional(
+                        "dureeMinimumSolaireArret",
+                        default=self.options.get("dureeMinimumSolaireArret", 10),
+                    ): int,
+                    vol.Optional(
+                        "meteo",
+                        description={"suggested_value": self.options.get("meteo")},
+                    ): selector({"entity": {"domain": ["weather"]}}),
                 }
             ),
             last_step=False,
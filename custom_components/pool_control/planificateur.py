@@ -0,0 +1,159 @@
+"""Shared scheduler multiplexing the pool controllers of the domain."""
+
+import asyncio
+from datetime import timedelta
+import logging
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.event import async_track_time_interval
+
+from .profilage import PhaseStats
+
+_LOGGER = logging.getLogger(__name__)
+
+# Roue d'une minute, une case par seconde
+PLANIFICATEUR_CASES = 60
+
+# Priorités : les échéances du lavage et du surpresseur passent avant les cycles
+PRIORITE_PULL = 0
+PRIORITE_CRON = 1
+
+
+class Tache:
+    """Travail périodique d'un controller, inscrit dans la roue."""
+
+    __slots__ = ("action", "intervalle", "priorite", "phase")
+
+    def __init__(
+        self,
+        action: Callable[[], Awaitable[Any]],
+        intervalle: int,
+        priorite: int,
+        phase: int,
+    ) -> None:
+        """Initialize the Tache."""
+
+        self.action = action
+        self.intervalle = intervalle
+        self.priorite = priorite
+        self.phase = phase
+
+    def cases(self) -> range:
+        """Cases de la roue où la tâche est due."""
+
+        return range(self.phase, PLANIFICATEUR_CASES, self.intervalle)
+
+
+class Planificateur:
+    """Une seule minuterie pour tous les controllers, tâches décalées dans la roue."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the Planificateur."""
+
+        self.hass = hass
+        self.roue = [[] for _ in range(PLANIFICATEUR_CASES)]
+        self.position = 0
+        self.taches = 0
+        self.timerCancel = None
+
+        # Durée de traitement d'une case (toutes tâches confondues)
+        self.dureeTick = PhaseStats()
+
+    def planifier(
+        self,
+        action: Callable[[], Awaitable[Any]],
+        intervalle: int,
+        priorite: int,
+    ) -> Callable[[], None]:
+        """Inscrit une tâche périodique et retourne sa fonction d'annulation."""
+
+        if PLANIFICATEUR_CASES % intervalle:
+            raise ValueError(f"intervalle {intervalle}s incompatible avec la roue")
+
+        tache = Tache(action, intervalle, priorite, self._phaseLibre(intervalle))
+
+        for case in tache.cases():
+            taches = self.roue[case]
+            taches.append(tache)
+            # Ordre de priorité, puis d'inscription
+            taches.sort(key=lambda t: t.priorite)
+
+        self.taches += 1
+        if self.timerCancel is None:
+            self.timerCancel = async_track_time_interval(
+                self.hass, self._async_tick, timedelta(seconds=1)
+            )
+
+        def annuler() -> None:
+            """Retire la tâche de la roue."""
+
+            self._retirer(tache)
+
+        return annuler
+
+    def _phaseLibre(self, intervalle: int) -> int:
+        """Décalage le moins chargé pour une tâche de cet intervalle."""
+
+        return min(
+            range(intervalle),
+            key=lambda phase: sum(
+                len(self.roue[case])
+                for case in range(phase, PLANIFICATEUR_CASES, intervalle)
+            ),
+        )
+
+    def _retirer(self, tache: Tache) -> None:
+        """Retire une tâche ; la minuterie s'arrête avec la dernière."""
+
+        if tache not in self.roue[tache.phase]:
+            return
+
+        for case in tache.cases():
+            self.roue[case].remove(tache)
+
+        self.taches -= 1
+        if self.taches == 0 and self.timerCancel is not None:
+            self.timerCancel()
+            self.timerCancel = None
+
+    async def _async_tick(self, now: Optional[Any] = None) -> None:
+        """Exécute les tâches dues dans la case courante."""
+
+        taches = self.roue[self.position]
+        self.position = (self.position + 1) % PLANIFICATEUR_CASES
+
+        if not taches:
+            return
+
+        debut = time.perf_counter()
+
+        # Les échéances passent avant les cycles ; à priorité égale, les tâches
+        # (bassins différents) tournent ensemble : un bassin lent ne retarde pas
+        # les autres. La case est relue à chaque priorité : une tâche peut en
+        # annuler une autre (fin du surpresseur)
+        for priorite in sorted({tache.priorite for tache in taches}):
+            await asyncio.gather(
+                *(self._executer(tache) for tache in taches if tache.priorite == priorite)
+            )
+
+        self.dureeTick.ajouter(time.perf_counter() - debut)
+
+    async def _executer(self, tache: Tache) -> None:
+        """Exécute une tâche ; son erreur n'interrompt pas les autres."""
+
+        try:
+            await tache.action()
+        except Exception:
+            _LOGGER.exception("Scheduled task %s failed", tache.action)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Charge de la roue et durée des cases, pour les diagnostics."""
+
+        return {
+            "taches": self.taches,
+            "casesOccupees": sum(1 for taches in self.roue if taches),
+            "chargeMaximum": max(len(taches) for taches in self.roue),
+            "dureeTick": self.dureeTick.snapshot(),
+        }
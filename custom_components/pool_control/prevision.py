@@ -0,0 +1,185 @@
+"""Weather forecast planning mixin for pool control integration."""
+
+from datetime import date
+import logging
+from typing import Any, Optional
+
+import voluptuous as vol
+
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+# Rafraîchissement de la prévision (secondes)
+PREVISION_INTERVAL = 30 * 60
+
+# Facteur d'oubli du modèle : les journées anciennes pèsent moins
+PREVISION_OUBLI = 0.95
+
+# Écart maximum entre la prévision et la dernière température mesurée (°C)
+PREVISION_ECART_MAX = 5.0
+
+
+def modeleInitial() -> dict[str, Any]:
+    """Modèle de départ : le pic de demain vaut le pic du jour."""
+
+    return {
+        "theta": [0.0, 0.0, 1.0],
+        "p": [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]],
+        "x": None,
+        "jour": None,
+    }
+
+
+def predireModele(modele: dict[str, Any], x: list[float]) -> float:
+    """Température de l'eau prévue pour les entrées x."""
+
+    return sum(t * v for t, v in zip(modele["theta"], x))
+
+
+def majModele(modele: dict[str, Any], x: list[float], y: float) -> dict[str, Any]:
+    """Met à jour le modèle par moindres carrés récursifs avec un nouvel échantillon."""
+
+    theta = modele["theta"]
+    p = modele["p"]
+    n = len(x)
+
+    px = [sum(p[i][j] * x[j] for j in range(n)) for i in range(n)]
+    denom = PREVISION_OUBLI + sum(x[i] * px[i] for i in range(n))
+    gain = [v / denom for v in px]
+    erreur = y - predireModele(modele, x)
+
+    theta = [theta[i] + gain[i] * erreur for i in range(n)]
+    p = [
+        [(p[i][j] - gain[i] * px[j]) / PREVISION_OUBLI for j in range(n)]
+        for i in range(n)
+    ]
+
+    return {**modele, "theta": theta, "p": p}
+
+
+class PrevisionMixin:
+    """Mixin sizing the next filtration window from the weather forecast."""
+
+    def __init__(self) -> None:
+        """Initialize the PrevisionMixin with default values."""
+
+        super().__init__()
+
+        # Température de l'air maximum prévue, par jour
+        self.previsionTemperaturesAir = {}
+        self.previsionMaj = 0.0
+
+    async def refreshPrevision(self) -> None:
+        """Rafraîchit les températures maximum de l'air prévues par jour."""
+
+        if not self.meteo:
+            return
+
+        timeNow = self.horloge.time()
+        if timeNow - self.previsionMaj < PREVISION_INTERVAL:
+            return
+        self.previsionMaj = timeNow
+
+        forecast = None
+        try:
+            response = await self.hass.services.async_call(
+                "weather",
+                "get_forecasts",
+                {"entity_id": self.meteo, "type": "hourly"},
+                blocking=True,
+                return_response=True,
+            )
+            forecast = (response or {}).get(self.meteo, {}).get("forecast")
+        except (HomeAssistantError, vol.Invalid) as e:
+            # Service absent ou entité sans prévision horaire
+            _LOGGER.debug("weather.get_forecasts failed for %s: %s", self.meteo, e)
+
+        if forecast is None:
+            # Anciennes entités météo : prévision dans les attributs
+            meteoState = self.hass.states.get(self.meteo)
+            if meteoState is None:
+                _LOGGER.error("Weather %s not found", self.meteo)
+                return
+            forecast = meteoState.attributes.get("forecast")
+
+        self.previsionTemperaturesAir = self._temperaturesMaxiParJour(forecast or [])
+
+        _LOGGER.debug("previsionTemperaturesAir=%s", self.previsionTemperaturesAir)
+
+    def _temperaturesMaxiParJour(
+        self, forecast: list[dict[str, Any]]
+    ) -> dict[date, float]:
+        """Température maximum prévue pour chaque journée (heure locale) de la prévision."""
+
+        temperatures = {}
+
+        for item in forecast:
+            debut = dt_util.parse_datetime(str(item.get("datetime", "")))
+            if debut is None or item.get("temperature") is None:
+                continue
+            try:
+                temperature = float(item["temperature"])
+            except (TypeError, ValueError):
+                continue
+
+            jour = dt_util.as_local(debut).date()
+            temperatures[jour] = max(temperature, temperatures.get(jour, temperature))
+
+        return temperatures
+
+    def calculateTemperaturePrevision(
+        self, temperatureMesuree: float, flgTomorrow: bool, jour: date
+    ) -> float:
+        """Température de calcul de la prochaine plage d'après la prévision.
+
+        Le modèle apprend une seule fois chaque journée prévue : quand la
+        plage d'un jour plus tardif est calculée, avec la température maximum
+        mesurée ce jour-là. Il prévoit ensuite le pic de température de l'eau
+        du jour de la plage à partir de la température de l'air prévue pour
+        ce jour ; un nouveau calcul pour le même jour ne fait que prévoir.
+        """
+
+        if not self.meteo or flgTomorrow is not True:
+            return temperatureMesuree
+
+        temperatureAir = self.previsionTemperaturesAir.get(jour)
+
+        modele = dict(self.get_data("previsionModele") or modeleInitial())
+
+        # Apprentissage sur la journée prévue, une fois sa plage passée ;
+        # même jour de plage (bouton Reset...) : prévision sans apprentissage
+        if modele.get("jour") != jour.isoformat():
+            # La mesure doit être celle de la journée prévue
+            if (
+                modele.get("x") is not None
+                and modele.get("jour") == self.horloge.now().date().isoformat()
+            ):
+                modele = majModele(modele, modele["x"], temperatureMesuree)
+            modele["x"] = None
+            modele["jour"] = None
+
+        if temperatureAir is None:
+            self.set_data("previsionModele", modele)
+            return temperatureMesuree
+
+        x = [1.0, temperatureAir, temperatureMesuree]
+        prevision = predireModele(modele, x)
+        prevision = min(
+            max(prevision, temperatureMesuree - PREVISION_ECART_MAX),
+            temperatureMesuree + PREVISION_ECART_MAX,
+        )
+
+        modele["x"] = x
+        modele["jour"] = jour.isoformat()
+        self.set_data("previsionModele", modele)
+
+        _LOGGER.info(
+            "temperaturePrevision=%s (air=%s, eau=%s)",
+            round(prevision, 1),
+            temperatureAir,
+            temperatureMesuree,
+        )
+
+        return round(prevision, 1)
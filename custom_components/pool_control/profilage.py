@@ -0,0 +1,173 @@
+"""Control loop profiling mixin for pool control integration."""
+
+from array import array
+from contextvars import ContextVar
+from functools import wraps
+import inspect
+import time
+from typing import Any, Callable, Optional
+
+# Nombre de mesures conservées par phase (2 heures de cycles d'une minute)
+PROFILAGE_CAPACITE = 120
+
+# Phases mesurées ; les phases s'imbriquent :
+# cycle > capteurs / refresh / solaire / statut > calcul, activation > service
+# pull (routine 5 secondes), sans détail : ses commandes ne sont pas celles d'un cycle
+PROFILAGE_PHASES = (
+    "cycle",
+    "capteurs",
+    "refresh",
+    "solaire",
+    "statut",
+    "calcul",
+    "activation",
+    "service",
+    "pull",
+)
+
+# Phases racines d'un passage ; dans `pull`, les phases imbriquées ne sont pas mesurées
+PROFILAGE_RACINES = ("cycle", "pull")
+
+# Phase racine du passage en cours dans la tâche courante : le cycle et le pull
+# tournent dans des tâches distinctes qui s'entrelacent pendant les temporisations
+_racine: ContextVar[Optional[str]] = ContextVar("profilageRacine", default=None)
+
+
+class PhaseStats:
+    """Durées d'une phase dans un tampon circulaire de taille fixe."""
+
+    __slots__ = ("durees", "index", "nombre", "derniere")
+
+    def __init__(self, capacite: int = PROFILAGE_CAPACITE) -> None:
+        """Initialize the PhaseStats."""
+
+        self.durees = array("d", [0.0]) * capacite
+        self.index = 0
+        self.nombre = 0
+        self.derniere = 0.0
+
+    def ajouter(self, duree: float) -> None:
+        """Enregistre une durée (secondes), en écrasant la plus ancienne."""
+
+        self.durees[self.index] = duree
+        self.index = (self.index + 1) % len(self.durees)
+        self.nombre += 1
+        self.derniere = duree
+
+    def snapshot(self) -> dict[str, Any]:
+        """Statistiques glissantes de la phase, en millisecondes."""
+
+        valeurs = sorted(self.durees[: min(self.nombre, len(self.durees))])
+
+        if not valeurs:
+            return {"nombre": 0}
+
+        return {
+            "nombre": self.nombre,
+            "derniere": round(self.derniere * 1000, 3),
+            "moyenne": round(sum(valeurs) / len(valeurs) * 1000, 3),
+            "p95": round(valeurs[min(len(valeurs) - 1, int(len(valeurs) * 0.95))] * 1000, 3),
+            "max": round(valeurs[-1] * 1000, 3),
+        }
+
+
+class _Chrono:
+    """Mesure la durée d'un bloc `with` dans une phase."""
+
+    __slots__ = ("stats", "debut", "duree", "racine", "jeton")
+
+    def __init__(self, stats: Optional[PhaseStats], racine: Optional[str] = None) -> None:
+        """Initialize the _Chrono, `racine` being the task's root phase during the block."""
+
+        self.stats = stats
+        self.debut = 0.0
+        self.duree = 0.0
+        self.racine = racine
+        self.jeton = None
+
+    def __enter__(self) -> "_Chrono":
+        """Start timing."""
+
+        if self.racine is not None:
+            self.jeton = _racine.set(self.racine)
+        self.debut = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        """Record the elapsed time, exceptions included."""
+
+        self.duree = time.perf_counter() - self.debut
+        if self.stats is not None:
+            self.stats.ajouter(self.duree)
+        if self.jeton is not None:
+            _racine.reset(self.jeton)
+            self.jeton = None
+
+
+def _statsPhase(controller: Any, phase: str) -> Optional[PhaseStats]:
+    """Statistiques de la phase, None si le profilage n'est pas disponible."""
+
+    profilage = getattr(controller, "profilage", None)
+    if profilage is None:
+        return None
+
+    # Commandes de la routine 5 secondes : comptées dans `pull` seulement
+    if phase not in PROFILAGE_RACINES and _racine.get() == "pull":
+        return None
+
+    return profilage.get(phase)
+
+
+def mesurer(phase: str) -> Callable:
+    """Décorateur mesurant chaque appel d'une méthode dans une phase."""
+
+    def decorateur(methode: Callable) -> Callable:
+        if inspect.iscoroutinefunction(methode):
+
+            @wraps(methode)
+            async def wrapper_async(self, *args: Any, **kwargs: Any) -> Any:
+                with _Chrono(_statsPhase(self, phase)):
+                    return await methode(self, *args, **kwargs)
+
+            return wrapper_async
+
+        @wraps(methode)
+        def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+            with _Chrono(_statsPhase(self, phase)):
+                return methode(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorateur
+
+
+class ProfilageMixin:
+    """Mixin timing each stage of the control loop."""
+
+    def __init__(self) -> None:
+        """Initialize the ProfilageMixin with default values."""
+
+        super().__init__()
+
+        self.profilage = {phase: PhaseStats() for phase in PROFILAGE_PHASES}
+
+        # Capteurs de durée publiés à la fin de chaque cycle (optionnels)
+        self.profilageCapteurs = []
+
+    def chronoPhase(self, phase: str) -> _Chrono:
+        """Contexte mesurant la durée d'un bloc dans une phase."""
+
+        if phase in PROFILAGE_RACINES:
+            return _Chrono(_statsPhase(self, phase), phase)
+        return _Chrono(_statsPhase(self, phase))
+
+    def getProfilage(self) -> dict[str, dict[str, Any]]:
+        """Statistiques glissantes de toutes les phases."""
+
+        return {phase: stats.snapshot() for phase, stats in self.profilage.items()}
+
+    def publierProfilage(self) -> None:
+        """Met à jour les capteurs de durée."""
+
+        for capteur in self.profilageCapteurs:
+            capteur.refresh()
@@ -0,0 +1,201 @@
+"""Batched status publishing for pool control integration."""
+
+from typing import Any, Optional
+
+# Statuts publiés par le controller, un capteur par statut
+STATUS_KEYS = (
+    "asservissementStatus",
+    "filtrationTimeStatus",
+    "filtrationScheduleStatus",
+    "filtrationDebutStatus",
+    "filtrationPauseDebutStatus",
+    "filtrationPauseFinStatus",
+    "filtrationFinStatus",
+    "filtrationDureeStatus",
+    "temperatureCalculStatus",
+    "filtrationStatus",
+    "surpresseurStatus",
+    "surpresseurFinStatus",
+    "filtreSableLavageStatus",
+    "filtreSableLavageFinStatus",
+    "filtreSableLavagePhaseStatus",
+)
+
+# Statuts du planning, mémorisés dans le store et republiés au chargement
+PLANNING_KEYS = (
+    "filtrationTimeStatus",
+    "filtrationScheduleStatus",
+    "filtrationDebutStatus",
+    "filtrationPauseDebutStatus",
+    "filtrationPauseFinStatus",
+    "filtrationFinStatus",
+    "filtrationDureeStatus",
+    "temperatureCalculStatus",
+)
+
+
+class StatusHandle:
+    """Statut du controller, publié par le coordinateur."""
+
+    __slots__ = ("coordinator", "key")
+
+    def __init__(self, coordinator: "StatusCoordinator", key: str) -> None:
+        """Initialize the StatusHandle."""
+
+        self.coordinator = coordinator
+        self.key = key
+
+    @property
+    def value(self) -> Any:
+        """Return the last value set."""
+
+        return self.coordinator.values.get(self.key)
+
+    def set_status(self, value: Any) -> None:
+        """Set the status, published at the end of the current batch."""
+
+        self.coordinator.set_status(self.key, value)
+
+
+class StatusCoordinator:
+    """Collecte les statuts d'un passage de contrôle et les publie ensemble."""
+
+    def __init__(self) -> None:
+        """Initialize the StatusCoordinator."""
+
+        self.values = {}
+        self.entities = {}
+
+        # Statuts modifiés pendant le lot en cours, dans l'ordre de modification
+        self.dirty = {}
+        self.depth = 0
+
+    def subscribe(self, key: str, entity: Any) -> None:
+        """Abonne une entité à un statut et lui transmet la dernière valeur."""
+
+        self.entities[key] = entity
+        if key in self.values:
+            entity.set_status(self.values[key])
+
+    def unsubscribe(self, key: str, entity: Any) -> None:
+        """Désabonne une entité."""
+
+        if self.entities.get(key) is entity:
+            del self.entities[key]
+
+    def set_status(self, key: str, value: Any) -> None:
+        """Mémorise un statut ; publié immédiatement hors lot."""
+
+        self.values[key] = value
+
+        if self.depth:
+            self.dirty[key] = None
+        else:
+            self._publish(key)
+
+    def batch(self) -> "_Batch":
+        """Contexte regroupant les publications jusqu'à sa sortie."""
+
+        return _Batch(self)
+
+    def flush(self) -> None:
+        """Publie les statuts modifiés pendant le lot."""
+
+        dirty = self.dirty
+        self.dirty = {}
+        for key in dirty:
+            self._publish(key)
+
+    def _publish(self, key: str) -> None:
+        """Transmet la valeur du statut à son entité."""
+
+        entity = self.entities.get(key)
+        if entity is not None:
+            entity.set_status(self.values[key])
+
+
+class _Batch:
+    """Lot de publications, imbriquable ; publié à la sortie du lot le plus externe."""
+
+    __slots__ = ("coordinator",)
+
+    def __init__(self, coordinator: StatusCoordinator) -> None:
+        """Initialize the _Batch."""
+
+        self.coordinator = coordinator
+
+    def __enter__(self) -> StatusCoordinator:
+        """Open the batch."""
+
+        self.coordinator.depth += 1
+        return self.coordinator
+
+    def __exit__(self, *exc: Any) -> None:
+        """Close the batch and flush when it is the outermost one."""
+
+        self.coordinator.depth -= 1
+        if self.coordinator.depth == 0:
+            self.coordinator.flush()
+
+
+class PublicationMixin:
+    """Mixin exposing the controller statuses through a single coordinator."""
+
+    def __init__(self) -> None:
+        """Initialize the PublicationMixin with default values."""
+
+        super().__init__()
+
+        self.statusCoordinator = StatusCoordinator()
+
+        for key in STATUS_KEYS:
+            setattr(self, key, StatusHandle(self.statusCoordinator, key))
+
+    def publierPlanning(
+        self,
+        filtrationDebut: float,
+        filtrationPauseDebut: Optional[float],
+        filtrationPauseFin: Optional[float],
+        filtrationFin: float,
+        temperatureCalcul: float,
+    ) -> None:
+        """Publie la plage calculée sous forme de valeurs numériques et d'horodatages."""
+
+        # Pas de pause : capteurs de pause inconnus
+        if filtrationPauseDebut == filtrationPauseFin:
+            filtrationPauseDebut = filtrationPauseFin = None
+
+        pauseSecondes = 0
+        if filtrationPauseDebut is not None:
+            pauseSecondes = filtrationPauseFin - filtrationPauseDebut
+
+        self.filtrationDebutStatus.set_status(int(filtrationDebut))
+        self.filtrationPauseDebutStatus.set_status(
+            None if filtrationPauseDebut is None else int(filtrationPauseDebut)
+        )
+        self.filtrationPauseFinStatus.set_status(
+            None if filtrationPauseFin is None else int(filtrationPauseFin)
+        )
+        self.filtrationFinStatus.set_status(int(filtrationFin))
+        self.filtrationDureeStatus.set_status(
+            int(filtrationFin - filtrationDebut - pauseSecondes)
+        )
+        self.temperatureCalculStatus.set_status(round(float(temperatureCalcul), 1))
+
+        self.memoriserPlanning()
+
+    def memoriserPlanning(self) -> None:
+        """Mémorise les statuts du planning publiés, une seule valeur du store."""
+
+        values = self.statusCoordinator.values
+        self.set_data(
+            "planningStatus", {key: values[key] for key in PLANNING_KEYS if key in values}
+        )
+
+    def publierPlanningMemorise(self) -> None:
+        """Republie le planning mémorisé, sans le recalculer."""
+
+        with self.statusCoordinator.batch():
+            for key, value in self.get_data("planningStatus", {}).items():
+                if key in PLANNING_KEYS:
+                    self.statusCoordinator.set_status(key, value)
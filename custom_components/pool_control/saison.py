@@ -2,15 +2,18 @@
 
 from datetime import datetime, timedelta
 import logging
-import time
 from typing import Optional
 
+from .log import DECISION_LOGGER, LazyTimestamp
+from .profilage import mesurer
+
 _LOGGER = logging.getLogger(__name__)
 
 
 class SaisonMixin:
     """Mixin providing seasonal filtration logic for pool control."""
 
+    @mesurer("calcul")
     def calculateTimeFiltration(self, temperatureWater: float, flgTomorrow: bool) -> None:
         """Calculate the filtration time."""
 
@@ -20,23 +23,13 @@ class SaisonMixin:
         if temperatureCalcul == 0:
             temperatureCalcul = temperatureWater
 
-        # Choix du type de calcul (suivant config)
-        if self.methodeCalcul == 1:
-            dureeHeures = self.calculateTimeFiltrationWithCurve(temperatureCalcul)
-        else:
-            dureeHeures = self.calculateTimeFiltrationWithTemperatureReducedByHalf(
-                temperatureCalcul
-            )
-
-        filtrationSecondes, filtrationTime = self.processingTime(dureeHeures)
-
         # Mode normal
 
         # datePivot (suivant config)
         datePivot = self.datePivot  # 13:00
 
         # filtrationPivotSecondes = strtotime(datePivot)
-        todayDate = datetime.today().date()
+        todayDate = self.horloge.now().date()
         combinedDatetime = datetime.strptime(
             str(todayDate) + " " + datePivot, "%Y-%m-%d %H:%M"
         )
@@ -44,24 +37,46 @@ class SaisonMixin:
 
         # la plage doit-elle etre celle de demain ?
         if flgTomorrow is True:
-            if filtrationPivotSecondes < time.time():
+            if filtrationPivotSecondes < self.horloge.time():
                 _LOGGER.info("+1 day")
                 filtrationPivotSecondes += timedelta(days=1).total_seconds()
 
+        # Prévision du pic de température du jour de la plage (suivant config)
+        temperatureCalcul = self.calculateTemperaturePrevision(
+            temperatureCalcul,
+            flgTomorrow,
+            datetime.fromtimestamp(filtrationPivotSecondes).date(),
+        )
+
+        # Choix du type de calcul (suivant config)
+        if self.methodeCalcul == 1:
+            dureeHeures = self.calculateTimeFiltrationWithCurve(temperatureCalcul)
+        else:
+            dureeHeures = self.calculateTimeFiltrationWithTemperatureReducedByHalf(
+                temperatureCalcul
+            )
+
+        filtrationSecondes, filtrationTime = self.processingTime(dureeHeures)
+
+        # Placement de la plage au coût minimum (suivant config)
+        plageTarif = None
+        if self.optimisationTarif is True:
+            plageTarif = self.calculateTimeFiltrationTarif(
+                filtrationSecondes, datePivot, flgTomorrow
+            )
+
         pausePivotSecondes = self.pausePivot * 60  # Temps de pause en secondes
         _LOGGER.debug(
             "duree pausePivot Config=%s",
-            datetime.fromtimestamp(pausePivotSecondes).strftime("%H:%M"),
+            LazyTimestamp(pausePivotSecondes, "%H:%M"),
         )
 
         # si la somme de filtrationSecondes et pausePivotSecondes est superieure a 24h on reduit pausePivotSecondes
         if (filtrationSecondes + pausePivotSecondes) > (3600 * 24):
             _LOGGER.info(
                 "duree pausePivot Ajustée=%s >> %s",
-                datetime.fromtimestamp(pausePivotSecondes).strftime("%H:%M"),
-                datetime.fromtimestamp((3600 * 24) - filtrationSecondes).strftime(
-                    "%H:%M"
-                ),
+                LazyTimestamp(pausePivotSecondes, "%H:%M"),
+                LazyTimestamp((3600 * 24) - filtrationSecondes, "%H:%M"),
             )
             pausePivotSecondes = (3600 * 24) - filtrationSecondes
 
@@ -70,7 +85,15 @@ class SaisonMixin:
         )
 
         # Repartition de la filtration suivant Config
-        if self.distributionDatePivot == 1:
+        if plageTarif is not None:
+            # La pause est placée par l'optimisation tarifaire, pausePivot est ignorée
+            _LOGGER.debug("distributionDatePivot= tarif")
+
+            filtrationDebut, filtrationPauseDebut, filtrationPauseFin, filtrationFin = (
+                plageTarif
+            )
+
+        elif self.distributionDatePivot == 1:
             # 1/2 <> 1/2
             _LOGGER.debug("distributionDatePivot= 1/2 <> 1/2")
 
@@ -119,8 +142,10 @@ class SaisonMixin:
             filtrationDebut = filtrationPivotSecondes - filtrationSecondes
             filtrationFin = filtrationPivotSecondes
 
-            filtrationPauseDebut = filtrationPivotSecondes - (pausePivotSecondes / 2.0)
-            filtrationPauseFin = filtrationPivotSecondes + (pausePivotSecondes / 2.0)
+            # Pause au milieu de la plage, qui se termine au pivot
+            filtrationMilieu = filtrationPivotSecondes - (filtrationSecondes / 2.0)
+            filtrationPauseDebut = filtrationMilieu - (pausePivotSecondes / 2.0)
+            filtrationPauseFin = filtrationMilieu + (pausePivotSecondes / 2.0)
 
         elif self.distributionDatePivot == 5:
             # <> 1/1
@@ -129,8 +154,10 @@ class SaisonMixin:
             filtrationDebut = filtrationPivotSecondes
             filtrationFin = filtrationPivotSecondes + filtrationSecondes
 
-            filtrationPauseDebut = filtrationPivotSecondes - (pausePivotSecondes / 2.0)
-            filtrationPauseFin = filtrationPivotSecondes + (pausePivotSecondes / 2.0)
+            # Pause au milieu de la plage, qui commence au pivot
+            filtrationMilieu = filtrationPivotSecondes + (filtrationSecondes / 2.0)
+            filtrationPauseDebut = filtrationMilieu - (pausePivotSecondes / 2.0)
+            filtrationPauseFin = filtrationMilieu + (pausePivotSecondes / 2.0)
 
         # Memorise les resultats du calcul
         if self.filtrationTimeStatus:
@@ -159,6 +186,14 @@ class SaisonMixin:
             if self.filtrationScheduleStatus:
                 self.filtrationScheduleStatus.set_status(display)
 
+        self.publierPlanning(
+            filtrationDebut,
+            filtrationPauseDebut,
+            filtrationPauseFin,
+            filtrationFin,
+            temperatureCalcul,
+        )
+
         self.set_data("filtrationDebut", int(filtrationDebut))
         self.set_data("filtrationFin", int(filtrationFin))
         self.set_data("filtrationPauseDebut", int(filtrationPauseDebut))
@@ -168,30 +203,32 @@ class SaisonMixin:
 
         if flgTomorrow is True:
             self.set_data("temperatureMaxi", 0)  # reset temperature maxi
+            self.resetCreditSolaire()  # reset temps solaire
 
         _LOGGER.info("temperatureCalcul=%s", temperatureCalcul)
         _LOGGER.info("filtrationTime=%s", filtrationTime)
 
         _LOGGER.info(
             "filtrationDebut=%s",
-            datetime.fromtimestamp(filtrationDebut).strftime("%H:%M %d-%m-%Y"),
+            LazyTimestamp(filtrationDebut),
         )
 
         if filtrationPauseDebut != filtrationPauseFin:
             _LOGGER.info(
                 "filtrationPauseDebut=%s",
-                datetime.fromtimestamp(filtrationPauseDebut).strftime("%H:%M %d-%m-%Y"),
+                LazyTimestamp(filtrationPauseDebut),
             )
             _LOGGER.info(
                 "filtrationPauseFin=%s",
-                datetime.fromtimestamp(filtrationPauseFin).strftime("%H:%M %d-%m-%Y"),
+                LazyTimestamp(filtrationPauseFin),
             )
 
         _LOGGER.info(
             "filtrationFin=%s",
-            datetime.fromtimestamp(filtrationFin).strftime("%H:%M %d-%m-%Y"),
+            LazyTimestamp(filtrationFin),
         )
 
+    @mesurer("statut")
     async def calculateStatusFiltration(self, temperatureWater: float) -> None:
         """Calculate the filtration state in Saison mode."""
 
@@ -201,18 +238,12 @@ class SaisonMixin:
         filtrationPauseFin = self.get_data("filtrationPauseFin", 0)
         filtrationFin = self.get_data("filtrationFin", 0)
 
-        timeNow = time.time()
-        _LOGGER.info(
-            "calculateStatusFiltration: timeNow=%s",
-            datetime.fromtimestamp(timeNow).strftime("%H:%M %d-%m-%Y"),
-        )
-        _LOGGER.info(
-            "calculateStatusFiltration: filtrationDebut=%s",
-            datetime.fromtimestamp(filtrationDebut).strftime("%H:%M %d-%m-%Y"),
-        )
-        _LOGGER.info(
-            "calculateStatusFiltration: filtrationFin=%s",
-            datetime.fromtimestamp(filtrationFin).strftime("%H:%M %d-%m-%Y"),
+        timeNow = self.horloge.time()
+        DECISION_LOGGER.debug(
+            "calculateStatusFiltration: timeNow=%s filtrationDebut=%s filtrationFin=%s",
+            LazyTimestamp(timeNow),
+            LazyTimestamp(filtrationDebut),
+            LazyTimestamp(filtrationFin),
         )
 
         if filtrationDebut == 0 or filtrationFin == 0:
@@ -221,13 +252,16 @@ class SaisonMixin:
 
             # Verifie si la plage calculée est passée
             filtrationFin = self.get_data("filtrationFin", 0)
-            timeNow = time.time()
+            timeNow = self.horloge.time()
 
             if timeNow > filtrationFin:
                 # On est apres la plage de filtration, relancer le calcul pour la plage de demain
                 self.calculateTimeFiltration(temperatureWater, True)
 
         else:
+            # Fin de plage avancée du temps déjà filtré sur le surplus solaire
+            filtrationFinSolaire = self.getFiltrationFinSolaire(timeNow)
+
             if filtrationPauseDebut != filtrationPauseFin:
                 # Pause de filtration active
 
@@ -240,7 +274,7 @@ class SaisonMixin:
                     filtrationTemperature = 1
 
                 # Deuxieme segment
-                if timeNow >= filtrationPauseFin and timeNow <= filtrationFin:
+                if timeNow >= filtrationPauseFin and timeNow <= filtrationFinSolaire:
                     if self.sondeLocalTechnique is True:
                         if timeNow >= filtrationPauseFin + (
                             60 * self.sondeLocalTechniquePause
@@ -252,9 +286,9 @@ class SaisonMixin:
 
                             if temperatureWater > temperatureMaxi:
                                 self.set_data("temperatureMaxi", temperatureWater)
-                                _LOGGER.debug("temperatureMaxi: %s", temperatureMaxi)
-                                _LOGGER.debug("temperatureWater: %s", temperatureWater)
-                                _LOGGER.debug(
+                                DECISION_LOGGER.debug("temperatureMaxi: %s", temperatureMaxi)
+                                DECISION_LOGGER.debug("temperatureWater: %s", temperatureWater)
+                                DECISION_LOGGER.debug(
                                     "(temperatureWater > temperatureMaxi) >> temperatureMaxi=: %s",
                                     temperatureWater,
                                 )
@@ -265,9 +299,9 @@ class SaisonMixin:
 
                         if temperatureWater > temperatureMaxi:
                             self.set_data("temperatureMaxi", temperatureWater)
-                            _LOGGER.debug("temperatureMaxi: %s", temperatureMaxi)
-                            _LOGGER.debug("temperatureWater: %s", temperatureWater)
-                            _LOGGER.debug(
+                            DECISION_LOGGER.debug("temperatureMaxi: %s", temperatureMaxi)
+                            DECISION_LOGGER.debug("temperatureWater: %s", temperatureWater)
+                            DECISION_LOGGER.debug(
                                 "(temperatureWater > temperatureMaxi) >> temperatureMaxi=: %s",
                                 temperatureWater,
                             )
@@ -275,7 +309,7 @@ class SaisonMixin:
                     # Active la filtration
                     filtrationTemperature = 1
 
-            elif timeNow >= filtrationDebut and timeNow <= filtrationFin:
+            elif timeNow >= filtrationDebut and timeNow <= filtrationFinSolaire:
                 if self.sondeLocalTechnique is True:
                     if timeNow >= filtrationDebut + (
                         60 * self.sondeLocalTechniquePause
@@ -288,9 +322,9 @@ class SaisonMixin:
                         if temperatureWater > temperatureMaxi:
                             self.set_data("temperatureMaxi", temperatureWater)
 
-                            _LOGGER.debug("temperatureMaxi: %s", temperatureMaxi)
-                            _LOGGER.debug("temperatureWater: %s", temperatureWater)
-                            _LOGGER.debug(
+                            DECISION_LOGGER.debug("temperatureMaxi: %s", temperatureMaxi)
+                            DECISION_LOGGER.debug("temperatureWater: %s", temperatureWater)
+                            DECISION_LOGGER.debug(
                                 "(temperatureWater > temperatureMaxi) >> temperatureMaxi=: %s",
                                 temperatureWater,
                             )
@@ -302,9 +336,9 @@ class SaisonMixin:
                     if temperatureWater > temperatureMaxi:
                         self.set_data("temperatureMaxi", temperatureWater)
 
-                        _LOGGER.debug("temperatureMaxi: %s", temperatureMaxi)
-                        _LOGGER.debug("temperatureWater: %s", temperatureWater)
-                        _LOGGER.debug(
+                        DECISION_LOGGER.debug("temperatureMaxi: %s", temperatureMaxi)
+                        DECISION_LOGGER.debug("temperatureWater: %s", temperatureWater)
+                        DECISION_LOGGER.debug(
                             "(temperatureWater > temperatureMaxi) >> temperatureMaxi=: %s",
                             temperatureWater,
                         )
@@ -329,6 +363,7 @@ class SaisonMixin:
 
         if int(self.get_data("filtrationTemperature", 0)) != filtrationTemperature:
             self.set_data("filtrationTemperature", filtrationTemperature)
+            _LOGGER.info("filtrationTemperature=%s", filtrationTemperature)
 
         if int(self.get_data("filtrationHivernage", 0)) != 0:
             self.set_data("filtrationHivernage", 0)
@@ -1,14 +1,20 @@
 """Scheduler mixin for pool control integration."""
 
-from datetime import datetime, timedelta
+from datetime import timedelta
 import logging
-import time
 from typing import Any, Optional
 
 from homeassistant.helpers.event import async_track_time_interval
 
+from .lavage import LAVAGE
+from .log import DECISION_LOGGER, LazyTimestamp
+from .planificateur import PRIORITE_CRON, PRIORITE_PULL
+
 _LOGGER = logging.getLogger(__name__)
 
+# Cycles dont la phase minutée est suivie par le pull
+MACHINES = (LAVAGE,)
+
 
 class SchedulerMixin:
     """Scheduler mixin for pool control integration."""
@@ -16,8 +22,14 @@ class SchedulerMixin:
     def __init__(self) -> None:
         """Initialize the SchedulerMixin with default values."""
 
+        super().__init__()
+
+        self.firstCronCancel = None
         self.secondCronCancel = None
 
+        # Planificateur partagé du domaine ; à défaut, minuteries propres
+        self.planificateur = None
+
         # Propriétés de l'objet
         self.filtrationRefreshCounter = 0
 
@@ -28,9 +40,14 @@ class SchedulerMixin:
             self.secondCronCancel()
 
         # Call 'pull' method every 5 secondes
-        self.secondCronCancel = async_track_time_interval(
-            self.hass, self.pull, timedelta(seconds=5)
-        )
+        if self.planificateur is not None:
+            self.secondCronCancel = self.planificateur.planifier(
+                self.pull, 5, PRIORITE_PULL
+            )
+        else:
+            self.secondCronCancel = async_track_time_interval(
+                self.hass, self.pull, timedelta(seconds=5)
+            )
 
         _LOGGER.info("Second cron job started")
 
@@ -48,51 +65,75 @@ class SchedulerMixin:
 
         _LOGGER.debug("pull() begin")
 
-        if int(self.get_data("filtrationSurpresseur", 0)) == 1:
-            timeFin = self.get_data("filtrationTempsRestant", 0)
-            timeRestant = timeFin - time.time()
-
-            if timeRestant > 0:
-                display = (
-                    f"Actif : {datetime.fromtimestamp(timeRestant).strftime('%M:%S')}"
-                )
-                if self.surpresseurStatus:
-                    self.surpresseurStatus.set_status(display)
-            else:
-                await self.executeButtonStop()
+        # Mesurée à part : un pull coûte bien moins qu'un cycle
+        with self.chronoPhase("pull"):
+            await self._pullEcheances()
 
-        if int(self.get_data("filtrationLavageEtat", 0)) in [2, 4]:
-            label = (
-                "Lavage" if self.get_data("filtrationLavageEtat", 0) == 2 else "Rinçage"
-            )
+        _LOGGER.debug("pull() end")
+
+    async def _pullEcheances(self) -> None:
+        """Contrôle l'échéance du surpresseur et de la phase en cours de chaque cycle."""
+
+        # Le décompte est affiché par les capteurs de fin (timestamp) :
+        # seule l'échéance de la phase en cours est contrôlée ici
+        if int(self.get_data("filtrationSurpresseur", 0)) == 1:
             timeFin = self.get_data("filtrationTempsRestant", 0)
-            timeRestant = timeFin - time.time()
+            timeRestant = timeFin - self.horloge.time()
 
-            if timeRestant > 0:
-                display = (
-                    f"{label} : {datetime.fromtimestamp(timeRestant).strftime('%M:%S')}"
-                )
-                if self.filtreSableLavageStatus:
-                    self.filtreSableLavageStatus.set_status(display)
-            else:
-                await self.executeFiltreSableLavageOn()
+            if timeRestant <= 0:
+                await self.executeButtonStop()
 
-        _LOGGER.debug("pull() end")
+        for machine in MACHINES:
+            if machine.echeanceDepassee(self):
+                await machine.avancer(self)
 
     async def startFirstCron(self) -> None:
         """Lance le cron '1 minute'."""
 
-        async_track_time_interval(self.hass, self.cron, timedelta(minutes=1))
+        if self.firstCronCancel is not None:
+            self.firstCronCancel()
+
+        if self.planificateur is not None:
+            self.firstCronCancel = self.planificateur.planifier(
+                self.cron, 60, PRIORITE_CRON
+            )
+        else:
+            self.firstCronCancel = async_track_time_interval(
+                self.hass, self.cron, timedelta(minutes=1)
+            )
 
         _LOGGER.info("First cron job started")
 
+    async def stopFirstCron(self) -> None:
+        """Arrete le cron '1 minute'."""
+
+        if self.firstCronCancel is not None:
+            self.firstCronCancel()
+            self.firstCronCancel = None
+
+            _LOGGER.info("First cron job stopped")
+
     async def cron(self, now: Optional[Any] = None) -> None:
         """Routine toutes les minutes : suivi de la filtration, hivernage, traitements..."""
 
         _LOGGER.debug("cron() begin")
 
-        temperatureWater = self.getTemperatureWater()
-        temperatureOutdoor = self.getTemperatureOutdoor()
+        # Les statuts du passage sont publiés ensemble à la fin du cycle
+        with self.chronoPhase("cycle") as chrono, self.statusCoordinator.batch():
+            await self._cronCycle()
+
+        self.observerCycle(chrono.duree)
+        self.observerEquipements()
+        self.publierProfilage()
+
+        _LOGGER.debug("cron() end")
+
+    async def _cronCycle(self) -> None:
+        """Un cycle de la routine minute, mesuré phase par phase."""
+
+        with self.chronoPhase("capteurs"):
+            temperatureWater = self.getTemperatureWater()
+            temperatureOutdoor = self.getTemperatureOutdoor()
         # leverSoleil = self.getLeverSoleil()
 
         ###########################################################################################
@@ -100,26 +141,29 @@ class SchedulerMixin:
         if self.filtrationRefreshCounter >= 5:
             # Refresh appellé toutes les 5 minutes
 
-            _LOGGER.info(
-                "Time = %s",
-                datetime.fromtimestamp(time.time()).strftime("%H:%M %d-%m-%Y"),
-            )
+            DECISION_LOGGER.debug("Time = %s", LazyTimestamp(self.horloge.time()))
 
             # _LOGGER.info(f"temperatureWater={temperatureWater}")
             # _LOGGER.info(f"temperatureOutdoor={temperatureOutdoor}")
             # _LOGGER.info(f"leverSoleil={leverSoleil}")
 
-            await self.refreshFiltration()
-            await self.refreshSurpresseur()
-            if self.traitement:
-                await self.refreshTraitement()
-            if self.traitement_2:
-                await self.refreshTraitement_2()
+            with self.chronoPhase("refresh"):
+                await self.refreshFiltration()
+                await self.refreshSurpresseur()
+                await self.refreshPrevision()
+                if self.traitement:
+                    await self.refreshTraitement()
+                if self.traitement_2:
+                    await self.refreshTraitement_2()
 
             self.filtrationRefreshCounter = 0
         else:
             self.filtrationRefreshCounter += 1
 
+        if self.capteurExport:
+            with self.chronoPhase("solaire"):
+                await self.evaluateSolaire()
+
         if self.getHivernage():
             await self.calculateStatusFiltrationHivernage(
                 temperatureWater, temperatureOutdoor
@@ -132,5 +176,3 @@ class SchedulerMixin:
         await self.activatingDevices()
 
         ###########################################################################################
-
-        _LOGGER.debug("cron() end")
@@ -1,11 +1,20 @@
 """Pool Control integration sensors."""
 
+from homeassistant.components.sensor import SensorDeviceClass
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import UnitOfTemperature, UnitOfTime
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
-from .entities import PoolControlStatusSensor
+from .entities import (
+    PoolControlLavagePhaseSensor,
+    PoolControlMeasureSensor,
+    PoolControlProfilingSensor,
+    PoolControlStatusSensor,
+    PoolControlTimestampSensor,
+)
+from .profilage import PROFILAGE_PHASES
 
 
 async def async_setup_entry(
@@ -15,7 +24,7 @@ async def async_setup_entry(
 ) -> None:
     """Set up Pool Control sensors."""
 
-    controller = hass.data[DOMAIN]
+    controller = hass.data[DOMAIN][entry.entry_id]
 
     entities = [
         PoolControlStatusSensor(
@@ -39,6 +48,46 @@ async def async_setup_entry(
             "filtrationScheduleStatus",
             default_state="",
         ),
+        PoolControlTimestampSensor(
+            controller,
+            "Début Filtration",
+            "pool_control_filtration_debut",
+            "filtrationDebutStatus",
+        ),
+        PoolControlTimestampSensor(
+            controller,
+            "Début Pause Filtration",
+            "pool_control_filtration_pause_debut",
+            "filtrationPauseDebutStatus",
+        ),
+        PoolControlTimestampSensor(
+            controller,
+            "Fin Pause Filtration",
+            "pool_control_filtration_pause_fin",
+            "filtrationPauseFinStatus",
+        ),
+        PoolControlTimestampSensor(
+            controller,
+            "Fin Filtration",
+            "pool_control_filtration_fin",
+            "filtrationFinStatus",
+        ),
+        PoolControlMeasureSensor(
+            controller,
+            "Durée Filtration",
+            "pool_control_filtration_duree",
+            "filtrationDureeStatus",
+            SensorDeviceClass.DURATION,
+            UnitOfTime.SECONDS,
+        ),
+        PoolControlMeasureSensor(
+            controller,
+            "Température de calcul",
+            "pool_control_temperature_calcul",
+            "temperatureCalculStatus",
+            SensorDeviceClass.TEMPERATURE,
+            UnitOfTemperature.CELSIUS,
+        ),
         PoolControlStatusSensor(
             controller,
             "Status Filtration",
@@ -51,12 +100,41 @@ async def async_setup_entry(
             "pool_control_surpresseur_status",
             "surpresseurStatus",
         ),
+        PoolControlTimestampSensor(
+            controller,
+            "Fin Surpresseur",
+            "pool_control_surpresseur_fin",
+            "surpresseurFinStatus",
+        ),
         PoolControlStatusSensor(
             controller,
             "Status Lavage Filtre",
             "pool_control_filtre_sable_lavage_status",
             "filtreSableLavageStatus",
         ),
+        PoolControlTimestampSensor(
+            controller,
+            "Fin Lavage Filtre",
+            "pool_control_filtre_sable_lavage_fin",
+            "filtreSableLavageFinStatus",
+        ),
+        PoolControlLavagePhaseSensor(
+            controller,
+            "Phase Lavage Filtre",
+            "pool_control_filtre_sable_lavage_phase",
+            "filtreSableLavagePhaseStatus",
+        ),
     ]
 
+    if controller.capteursProfilage:
+        entities += [
+            PoolControlProfilingSensor(
+                controller,
+                f"Durée {phase}",
+                f"pool_control_profilage_{phase}",
+                phase,
+            )
+            for phase in PROFILAGE_PHASES
+        ]
+
     async_add_entities(entities)
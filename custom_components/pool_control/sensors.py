@@ -1,67 +1,165 @@
 """Sensor mixin for Pool Control integration."""
 
-from datetime import datetime
+from functools import partial
 import logging
+from typing import Any, Callable
+
+from .lectures import (
+    LECTURE_ABSENTE,
+    Lecture,
+    horodatageReleve,
+    parseHoraire,
+    parseTemperature,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Capteurs lus via le cache partagé, et leur analyse
+LECTURES_CAPTEURS = (
+    ("temperatureWater", parseTemperature),
+    ("temperatureOutdoor", parseTemperature),
+    ("leverSoleil", parseHoraire),
+)
+
 
 class SensorMixin:
     """Mixin class providing sensor methods for Pool Control integration."""
 
-    def getTemperatureWater(self) -> float:
-        """Récupére la température de l'eau."""
+    def __init__(self) -> None:
+        """Initialize the SensorMixin with default values."""
 
-        temperatureWaterState = self.hass.states.get(self.temperatureWater)
+        super().__init__()
 
-        if temperatureWaterState is None:
-            _LOGGER.error("Temperature water %s not found", self.temperatureWater)
-            return 0.0
+        # Cache des lectures du domaine (None : lecture directe des états)
+        self.cacheLectures = None
+        self.lectures = {}
+        self.lecturesCancel = []
+
+        # Capteurs signalés comme périmés (un avertissement par épisode)
+        self.lecturesPerimees = set()
+
+    async def startLectures(self) -> None:
+        """Abonne les capteurs du bassin au cache partagé."""
+
+        if self.cacheLectures is None:
+            return
+
+        await self.stopLectures()
+
+        for cle, parseur in LECTURES_CAPTEURS:
+            entity_id = getattr(self, cle)
+            if entity_id:
+                self.lecturesCancel.append(
+                    self.cacheLectures.abonner(
+                        entity_id, parseur, partial(self._handleLecture, cle)
+                    )
+                )
+
+    async def stopLectures(self) -> None:
+        """Désabonne les capteurs du bassin."""
+
+        for annuler in self.lecturesCancel:
+            annuler()
+        self.lecturesCancel = []
+        self.lectures = {}
+
+    def _handleLecture(self, cle: str, lecture: Lecture) -> None:
+        """Reçoit une lecture diffusée par le cache."""
+
+        self.lectures[cle] = lecture
+
+        # Premier cycle en attente de capteurs valides
+        self.verifierDemarrage()
+
+    def lireCapteur(self, cle: str, parseur: Callable[[str], Any]) -> Lecture:
+        """Dernière lecture d'un capteur, diffusée par le cache ou lue directement."""
+
+        lecture = self.lectures.get(cle)
+        if lecture is None:
+            lecture = self._lireEtat(cle, parseur)
+
+        self._signalerPeremption(cle, lecture)
+        return lecture
+
+    def _lireEtat(self, cle: str, parseur: Callable[[str], Any]) -> Lecture:
+        """Lecture directe de l'état, sans cache partagé."""
+
+        entity_id = getattr(self, cle)
+        state = self.hass.states.get(entity_id)
+        if state is None:
+            return LECTURE_ABSENTE
 
         try:
-            temperatureWater = float(temperatureWaterState.state)
-        except ValueError:
-            _LOGGER.error("Invalid temperature value: %s", temperatureWaterState.state)
+            return Lecture(parseur(state.state), horodatageReleve(state), False)
+        except (TypeError, ValueError):
+            _LOGGER.error("Invalid value for %s: %s", entity_id, state.state)
+            return LECTURE_ABSENTE
+
+    def lecturePerimee(self, lecture: Lecture) -> bool:
+        """Lecture indisponible ou plus ancienne que l'âge maximum configuré."""
+
+        return lecture.perimee(self.horloge.time(), self.ageMaximumCapteurs * 60)
+
+    def _signalerPeremption(self, cle: str, lecture: Lecture) -> None:
+        """Avertit une fois que le dernier relevé d'un capteur figé est ignoré."""
+
+        # Capteur indisponible : signalé par le cache
+        if lecture.indisponible:
+            return
+
+        if not self.lecturePerimee(lecture):
+            self.lecturesPerimees.discard(cle)
+        elif cle not in self.lecturesPerimees:
+            self.lecturesPerimees.add(cle)
+            _LOGGER.warning(
+                "Sensor %s not updated for %s minutes, ignoring %s",
+                getattr(self, cle),
+                int((self.horloge.time() - lecture.horodatage) // 60),
+                lecture.valeur,
+            )
+
+    def valeurCapteur(self, cle: str, parseur: Callable[[str], Any]) -> Any:
+        """Valeur à jour d'un capteur ; None s'il est absent, indisponible ou périmé."""
+
+        lecture = self.lireCapteur(cle, parseur)
+
+        if lecture.valeur is None or self.lecturePerimee(lecture):
+            return None
+
+        return lecture.valeur
+
+    def getTemperatureWater(self) -> float:
+        """Récupére la température de l'eau."""
+
+        valeur = self.valeurCapteur("temperatureWater", parseTemperature)
+
+        if valeur is None:
+            _LOGGER.error("Temperature water %s not available", self.temperatureWater)
             return 0.0
 
-        return temperatureWater
+        return valeur
 
     def getTemperatureOutdoor(self) -> float:
         """Récupére la température de l'air."""
 
-        temperatureOutdoorState = self.hass.states.get(self.temperatureOutdoor)
+        valeur = self.valeurCapteur("temperatureOutdoor", parseTemperature)
 
-        if temperatureOutdoorState is None:
-            _LOGGER.error("Temperature air %s not found", self.temperatureOutdoor)
+        if valeur is None:
+            _LOGGER.error("Temperature air %s not available", self.temperatureOutdoor)
             return 0.0
 
-        try:
-            temperatureOutdoor = float(temperatureOutdoorState.state)
-        except ValueError:
-            _LOGGER.error(
-                "Invalid temperature value: %s", temperatureOutdoorState.state
-            )
-            return 0.0
-
-        return temperatureOutdoor
+        return valeur
 
     def getLeverSoleil(self) -> str:
         """Récupére l'heure de lever du soleil."""
 
-        leverSoleilState = self.hass.states.get(self.leverSoleil)
+        valeur = self.valeurCapteur("leverSoleil", parseHoraire)
 
-        if leverSoleilState is None:
-            _LOGGER.error("Lever du soleil %s not found", self.leverSoleil)
+        if valeur is None:
+            _LOGGER.error("Lever du soleil %s not available", self.leverSoleil)
             return "06:00"
 
-        # Extraire l'heure de lever du soleil à partir de l'état
-        sunriseTimeStr = leverSoleilState.state
-
-        # Convertir la chaîne de caractères ISO 8601 en objet datetime
-        sunriseTime = datetime.fromisoformat(sunriseTimeStr)
-
-        # Convertir l'objet datetime en chaîne de caractères dans le format "06:00"
-        return sunriseTime.strftime("%H:%M")
+        return valeur
 
     def updateTemperatureDisplay(self, temperature: float) -> None:
         """Met à jour l'affichage de température si l'entité existe."""
@@ -3,12 +3,15 @@
 import logging
 from typing import Any, Optional
 
+from .profilage import mesurer
+
 _LOGGER = logging.getLogger(__name__)
 
 
 class ServiceMixin:
     """Mixin providing safe service call methods."""
 
+    @mesurer("service")
     async def _safe_service_call(
         self,
         domain: str,
@@ -30,8 +33,12 @@ class ServiceMixin:
         """
         try:
             await self.hass.services.async_call(domain, service, service_data)
+            self.tracerCommande(f"{domain}.{service}", service_data.get("entity_id"), True)
+            self.compterCommande(entity_name or service_data.get("entity_id"), "sent")
             return True
         except Exception as e:
+            self.tracerCommande(f"{domain}.{service}", service_data.get("entity_id"), False)
+            self.compterCommande(entity_name or service_data.get("entity_id"), "failed")
             entity_id = service_data.get("entity_id", "unknown")
             entity_label = entity_name or entity_id
             _LOGGER.error(
@@ -0,0 +1,203 @@
+"""Solar surplus filtration mixin for pool control integration."""
+
+import logging
+from typing import Any, Optional
+
+from homeassistant.helpers.event import (
+    async_call_later,
+    async_track_state_change_event,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SolaireMixin:
+    """Mixin running the filtration on exported photovoltaic surplus."""
+
+    def __init__(self) -> None:
+        """Initialize the SolaireMixin with default values."""
+
+        super().__init__()
+
+        self.solaireListenerCancel = None
+        self.solaireTimerCancel = None
+
+        # Dernière puissance exportée lue (W)
+        self.puissanceExport = None
+
+    async def startSolaire(self) -> None:
+        """Abonne le mode solaire aux changements du capteur d'export."""
+
+        if not self.capteurExport:
+            return
+
+        await self.stopSolaire()
+
+        # Puissance courante, sans attendre le prochain changement d'état
+        self.puissanceExport = self._lirePuissanceExport(
+            self.hass.states.get(self.capteurExport)
+        )
+
+        self.solaireListenerCancel = async_track_state_change_event(
+            self.hass, [self.capteurExport], self._handleExportChange
+        )
+
+        _LOGGER.info("Solar surplus tracking started on %s", self.capteurExport)
+
+    async def stopSolaire(self) -> None:
+        """Désabonne le mode solaire."""
+
+        if self.solaireListenerCancel is not None:
+            self.solaireListenerCancel()
+            self.solaireListenerCancel = None
+
+        if self.solaireTimerCancel is not None:
+            self.solaireTimerCancel()
+            self.solaireTimerCancel = None
+
+    async def _handleExportChange(self, event: Any) -> None:
+        """Réagit à un changement de la puissance exportée."""
+
+        newState = event.data.get("new_state")
+        if newState is None:
+            return
+
+        self.puissanceExport = self._lirePuissanceExport(newState)
+
+        with self.statusCoordinator.batch():
+            await self.evaluateSolaire()
+
+    async def _handleSolaireTimer(self, now: Optional[Any] = None) -> None:
+        """Réévalue le mode solaire à la fin d'une durée minimum."""
+
+        self.solaireTimerCancel = None
+
+        with self.statusCoordinator.batch():
+            await self.evaluateSolaire()
+
+    def _lirePuissanceExport(self, state: Optional[Any]) -> Optional[float]:
+        """Puissance exportée d'un état du capteur (W), None si absente ou invalide."""
+
+        if state is None:
+            return None
+
+        try:
+            return float(state.state)
+        except ValueError:
+            _LOGGER.debug("Invalid export power value: %s", state.state)
+            return None
+
+    async def evaluateSolaire(self) -> None:
+        """Décide de la marche solaire avec hystérésis et durées minimum."""
+
+        if not self.capteurExport:
+            return
+
+        timeNow = self.horloge.time()
+        filtrationSolaire = int(self.get_data("filtrationSolaire", 0))
+
+        if (
+            self.getHivernage()
+            or int(self.get_data("arretTotal", 0)) != 0
+            or int(self.get_data("filtrationLavage", 0)) != 0
+            or self.puissanceExport is None
+        ):
+            # Mode solaire non applicable, arrêt immédiat
+            demande = 0
+            dureeMinimum = 0
+        elif filtrationSolaire == 0:
+            demande = 1 if self.puissanceExport >= self.seuilSolaireMarche else 0
+            dureeMinimum = self.dureeMinimumSolaireArret * 60
+        else:
+            demande = 0 if self.puissanceExport < self.seuilSolaireArret else 1
+            dureeMinimum = self.dureeMinimumSolaireMarche * 60
+
+        if demande == filtrationSolaire:
+            return
+
+        # Respecte la durée minimum de marche / d'arrêt avant de changer d'état
+        attente = self.get_data("filtrationSolaireDepuis", 0) + dureeMinimum - timeNow
+        if attente > 0:
+            if self.solaireTimerCancel is None:
+                self.solaireTimerCancel = async_call_later(
+                    self.hass, attente, self._handleSolaireTimer
+                )
+            return
+
+        if demande == 0:
+            self.set_data(
+                "filtrationSolaireCredit",
+                self.getCreditSolaire(timeNow),
+            )
+
+        self.set_data("filtrationSolaire", demande)
+        self.set_data("filtrationSolaireDepuis", int(timeNow))
+        self.set_data("filtrationSolaireDebut", int(timeNow))
+
+        _LOGGER.info(
+            "Filtration solaire %s (export=%s W)",
+            "on" if demande else "off",
+            self.puissanceExport,
+        )
+
+        await self.activatingDevices()
+
+    def getCreditSolaire(self, timeNow: float) -> float:
+        """Temps de filtration solaire effectué hors plage (secondes)."""
+
+        credit = float(self.get_data("filtrationSolaireCredit", 0))
+
+        if int(self.get_data("filtrationSolaire", 0)) == 1:
+            debut = self.get_data("filtrationSolaireDebut", timeNow)
+            credit += (timeNow - debut) - self._recouvrementPlage(debut, timeNow)
+
+        return max(credit, 0.0)
+
+    def _recouvrementPlage(self, debut: float, fin: float) -> float:
+        """Durée de [debut, fin] comprise dans la plage de filtration planifiée."""
+
+        filtrationDebut = self.get_data("filtrationDebut", 0)
+        filtrationPauseDebut = self.get_data("filtrationPauseDebut", 0)
+        filtrationPauseFin = self.get_data("filtrationPauseFin", 0)
+        filtrationFin = self.get_data("filtrationFin", 0)
+
+        if filtrationPauseDebut != filtrationPauseFin:
+            segments = [
+                (filtrationDebut, filtrationPauseDebut),
+                (filtrationPauseFin, filtrationFin),
+            ]
+        else:
+            segments = [(filtrationDebut, filtrationFin)]
+
+        return sum(
+            max(0.0, min(fin, segmentFin) - max(debut, segmentDebut))
+            for segmentDebut, segmentFin in segments
+        )
+
+    def getFiltrationFinSolaire(self, timeNow: float) -> float:
+        """Fin de plage avancée du temps déjà filtré sur le surplus solaire."""
+
+        filtrationFin = self.get_data("filtrationFin", 0)
+
+        if not self.capteurExport:
+            return filtrationFin
+
+        filtrationPauseDebut = self.get_data("filtrationPauseDebut", 0)
+        filtrationPauseFin = self.get_data("filtrationPauseFin", 0)
+
+        if filtrationPauseDebut != filtrationPauseFin:
+            limite = filtrationPauseFin
+        else:
+            limite = self.get_data("filtrationDebut", 0)
+
+        return max(filtrationFin - self.getCreditSolaire(timeNow), limite)
+
+    def resetCreditSolaire(self) -> None:
+        """Remet à zéro le temps solaire pour la prochaine plage."""
+
+        if not self.capteurExport:
+            return
+
+        self.set_data("filtrationSolaireCredit", 0)
+        if int(self.get_data("filtrationSolaire", 0)) == 1:
+            self.set_data("filtrationSolaireDebut", int(self.horloge.time()))
@@ -1,8 +1,6 @@
 """Surpresseur control mixin for pool automation."""
 
-from datetime import datetime
 import logging
-import time
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -17,15 +15,12 @@ class SurpresseurMixin:
             int(self.get_data("filtrationSurpresseur", 0)) == 0
             and int(self.get_data("filtrationLavageEtat", 0)) == 0
         ):
-            timeFin = time.time() + (self.surpresseurDuree * 60)
+            timeFin = self.horloge.time() + (self.surpresseurDuree * 60)
             self.set_data("filtrationTempsRestant", int(timeFin))
 
-            timeRestant = timeFin - time.time()
-            display = "Actif"
-            display += " : "
-            display += datetime.fromtimestamp(timeRestant).strftime("%M:%S")
             if self.surpresseurStatus:
-                self.surpresseurStatus.set_status(display)
+                self.surpresseurStatus.set_status("Actif")
+            self.surpresseurFinStatus.set_status(int(timeFin))
 
             self.set_data("filtrationSurpresseur", 1)
             await self.activatingDevices()
@@ -84,6 +79,7 @@ class SurpresseurMixin:
             return
 
         if not repeat and surpresseurState.state == "on":
+            self.compterCommande("surpresseur", "avoided")
             return
 
         # Active le surpresseur
@@ -113,6 +109,7 @@ class SurpresseurMixin:
             return
 
         if not repeat and surpresseurState.state == "off":
+            self.compterCommande("surpresseur", "avoided")
             return
 
         # Arrête le surpresseur
@@ -0,0 +1,226 @@
+"""Tariff-aware filtration placement for pool control integration."""
+
+from collections import deque
+from datetime import datetime, timedelta
+from functools import lru_cache
+import logging
+import math
+from typing import Optional, Sequence, Tuple
+
+_LOGGER = logging.getLogger(__name__)
+
+# Résolution du placement : créneaux de 15 minutes
+TARIF_RESOLUTION = 15 * 60  # seconds
+TARIF_SLOTS_PER_DAY = (24 * 3600) // TARIF_RESOLUTION
+
+
+@lru_cache(maxsize=16)
+def optimiserPlageTarif(
+    prices: Tuple[float, ...],
+    slots: int,
+    minSegment: int,
+    maxPause: int,
+    pivotSlot: float,
+    minLastSegment: Optional[int] = None,
+) -> Tuple[int, int, int, int]:
+    """Place `slots` créneaux de filtration au coût minimum.
+
+    La plage est composée d'un ou deux segments d'au moins `minSegment`
+    créneaux, séparés par une pause d'au plus `maxPause` créneaux ; le second
+    segment compte au moins `minLastSegment` créneaux (`minSegment` par
+    défaut), pour tenir compte d'un dernier créneau incomplet. Le résultat
+    est (debut, pauseDebut, pauseFin, fin) en indices de créneaux, avec
+    pauseDebut == pauseFin quand il n'y a pas de pause. À coût égal, la plage
+    la plus proche de `pivotSlot` est retenue.
+
+    Le résultat est mis en cache : le calcul n'est refait que si les prix,
+    la durée ou les contraintes changent.
+    """
+
+    n = len(prices)
+    slots = max(0, min(slots, n))
+    if minLastSegment is None:
+        minLastSegment = minSegment
+    if slots == 0 or slots == n:
+        return 0, 0, 0, slots
+
+    prefix = [0.0] * (n + 1)
+    for i, price in enumerate(prices):
+        prefix[i + 1] = prefix[i] + price
+
+    best = None
+    bestKey = None
+
+    # Un seul segment
+    for start in range(0, n - slots + 1):
+        cost = prefix[start + slots] - prefix[start]
+        key = (round(cost, 9), abs(start + slots / 2.0 - pivotSlot))
+        if bestKey is None or key < bestKey:
+            bestKey = key
+            best = (start, start, start, start + slots)
+
+    # Deux segments séparés par une pause de `pause` créneaux
+    if slots >= minSegment + minLastSegment:
+        for pause in range(1, maxPause + 1):
+            span = slots + pause
+            if span > n:
+                break
+
+            # Coût de chaque pause possible, maximum glissant sur les positions autorisées
+            pauseCost = [prefix[q + pause] - prefix[q] for q in range(n - pause + 1)]
+            window = deque()
+            nextQ = minSegment
+
+            for start in range(0, n - span + 1):
+                lastQ = start + slots - minLastSegment
+                while nextQ <= lastQ:
+                    while window and pauseCost[window[-1]] <= pauseCost[nextQ]:
+                        window.pop()
+                    window.append(nextQ)
+                    nextQ += 1
+                while window[0] < start + minSegment:
+                    window.popleft()
+
+                q = window[0]
+                cost = prefix[start + span] - prefix[start] - pauseCost[q]
+                key = (round(cost, 9), abs(start + span / 2.0 - pivotSlot))
+                if key < bestKey:
+                    bestKey = key
+                    best = (start, q, q + pause, start + span)
+
+    return best
+
+
+class TarifMixin:
+    """Mixin providing time-of-use tariff placement of the filtration window."""
+
+    def getTarifProfile(self, dayOffset: int = 0) -> Optional[Tuple[float, ...]]:
+        """Récupère les prix par créneau de 15 minutes pour le jour demandé."""
+
+        if self.tarifCapteur:
+            tarifState = self.hass.states.get(self.tarifCapteur)
+
+            if tarifState is None:
+                _LOGGER.error("Tarif %s not found", self.tarifCapteur)
+                return None
+
+            values = tarifState.attributes.get("tomorrow" if dayOffset else "today")
+            return self._expandTarif(values)
+
+        if self.tarifProfil:
+            return self._parseTarifProfil(self.tarifProfil)
+
+        return None
+
+    def _expandTarif(self, values: Optional[Sequence]) -> Optional[Tuple[float, ...]]:
+        """Convertit des prix horaires (24) ou quart-horaires (96) en créneaux."""
+
+        if not values or len(values) not in (24, TARIF_SLOTS_PER_DAY):
+            return None
+
+        try:
+            prices = [float(value) for value in values]
+        except (TypeError, ValueError):
+            _LOGGER.error("Invalid tarif values: %s", values)
+            return None
+
+        repeat = TARIF_SLOTS_PER_DAY // len(prices)
+        return tuple(price for price in prices for _ in range(repeat))
+
+    def _parseTarifProfil(self, profil: str) -> Optional[Tuple[float, ...]]:
+        """Convertit un profil "HH:MM=prix;HH:MM=prix" en créneaux."""
+
+        changes = []
+        try:
+            for item in profil.replace(",", ";").split(";"):
+                if not item.strip():
+                    continue
+                heure, prix = item.split("=")
+                hh, mm = heure.strip().split(":")
+                changes.append(
+                    ((int(hh) * 3600 + int(mm) * 60) // TARIF_RESOLUTION, float(prix))
+                )
+        except ValueError:
+            _LOGGER.error("Invalid tarif profile: %s", profil)
+            return None
+
+        if not changes:
+            return None
+
+        # Le dernier prix de la journée s'applique aussi avant le premier changement
+        changes.sort()
+        prices = []
+        current = changes[-1][1]
+        index = 0
+        for slot in range(TARIF_SLOTS_PER_DAY):
+            while index < len(changes) and changes[index][0] <= slot:
+                current = changes[index][1]
+                index += 1
+            prices.append(current)
+
+        return tuple(prices)
+
+    def calculateTimeFiltrationTarif(
+        self, filtrationSecondes: float, datePivot: str, flgTomorrow: bool
+    ) -> Optional[Tuple[float, float, float, float]]:
+        """Calcule la plage de filtration au coût minimum.
+
+        Retourne (debut, pauseDebut, pauseFin, fin) en timestamps, ou None si
+        aucun profil tarifaire n'est disponible. La pause éventuelle est placée
+        par l'optimisation (au plus `pausePlageMaximum`) : `pausePivot` ne
+        s'applique pas à ce mode.
+        """
+
+        slots = math.ceil(filtrationSecondes / TARIF_RESOLUTION)
+        minSegment = max(1, math.ceil(self.dureeSegmentMinimum * 60 / TARIF_RESOLUTION))
+        # La plage finit à la durée exacte : le dernier créneau peut être incomplet
+        manque = slots * TARIF_RESOLUTION - filtrationSecondes
+        minLastSegment = max(
+            1,
+            math.ceil((self.dureeSegmentMinimum * 60 + manque) / TARIF_RESOLUTION),
+        )
+        maxPause = max(0, int(self.pausePlageMaximum * 60 // TARIF_RESOLUTION))
+
+        hh, mm = datePivot.split(":")
+        pivotSlot = (int(hh) * 3600 + int(mm) * 60) / TARIF_RESOLUTION
+
+        for dayOffset in (0, 1):
+            prices = self.getTarifProfile(dayOffset)
+            if prices is None:
+                if dayOffset == 0:
+                    _LOGGER.warning("No tarif profile available, using datePivot")
+                    return None
+                # Pas de prix pour demain : on reprend ceux du jour
+                prices = self.getTarifProfile(0)
+
+            debut, pauseDebut, pauseFin, fin = optimiserPlageTarif(
+                prices, slots, minSegment, maxPause, pivotSlot, minLastSegment
+            )
+
+            minuit = datetime.combine(
+                self.horloge.now().date() + timedelta(days=dayOffset),
+                datetime.min.time(),
+            ).timestamp()
+
+            filtrationDebut = minuit + debut * TARIF_RESOLUTION
+            filtrationPauseDebut = minuit + pauseDebut * TARIF_RESOLUTION
+            filtrationPauseFin = minuit + pauseFin * TARIF_RESOLUTION
+            pauseSecondes = filtrationPauseFin - filtrationPauseDebut
+            filtrationFin = filtrationDebut + filtrationSecondes + pauseSecondes
+
+            # la plage doit-elle etre celle de demain ?
+            if not flgTomorrow or filtrationDebut >= self.horloge.time():
+                break
+
+            _LOGGER.info("+1 day")
+
+        _LOGGER.debug(
+            "optimiserPlageTarif: slots=%s debut=%s pause=%s-%s fin=%s",
+            slots,
+            debut,
+            pauseDebut,
+            pauseFin,
+            fin,
+        )
+
+        return filtrationDebut, filtrationPauseDebut, filtrationPauseFin, filtrationFin
@@ -0,0 +1,113 @@
+"""Decision trace mixin for pool control integration."""
+
+from collections import deque
+from contextvars import ContextVar, Token
+from datetime import datetime
+from typing import Any, Optional
+
+# Nombre de décisions conservées en mémoire
+TRACE_CAPACITE = 200
+
+# Drapeaux lus à chaque décision, dans l'ordre de priorité de activatingDevices
+TRACE_ENTREES = (
+    "arretTotal",
+    "filtrationLavage",
+    "filtrationTemperature",
+    "filtrationSolaire",
+    "filtrationHivernage",
+    "filtrationSurpresseur",
+    "marcheForcee",
+)
+
+
+# Décision en cours de la tâche courante, avec le controller qui l'a ouverte.
+# Cycle, pull, événements solaires et boutons tournent dans des tâches
+# distinctes qui s'entrelacent pendant les temporisations de activatingDevices.
+_decisionEnCours: ContextVar[Optional[tuple[Any, "DecisionRecord"]]] = ContextVar(
+    "decisionEnCours", default=None
+)
+
+
+class DecisionRecord:
+    """Décision ayant commandé au moins un actionneur."""
+
+    __slots__ = ("horodatage", "entrees", "raison", "commandes")
+
+    def __init__(self, horodatage: float, entrees: tuple, raison: str) -> None:
+        """Initialize the DecisionRecord."""
+
+        self.horodatage = horodatage
+        self.entrees = entrees
+        self.raison = raison
+        self.commandes = []
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the record as a JSON serialisable dict."""
+
+        return {
+            "horodatage": datetime.fromtimestamp(self.horodatage).isoformat(),
+            "entrees": dict(zip(TRACE_ENTREES, self.entrees)),
+            "raison": self.raison,
+            "commandes": [
+                {"service": service, "entity_id": entity_id, "succes": succes}
+                for service, entity_id, succes in self.commandes
+            ],
+        }
+
+
+class TraceMixin:
+    """Mixin keeping a bounded trace of the actuator decisions."""
+
+    def __init__(self) -> None:
+        """Initialize the TraceMixin with default values."""
+
+        super().__init__()
+
+        self.traceDecisions = deque(maxlen=TRACE_CAPACITE)
+
+    def debutDecision(self, raison: str) -> Token:
+        """Ouvre une décision dans la tâche courante ; retourne le jeton de fermeture."""
+
+        return _decisionEnCours.set(
+            (
+                self,
+                DecisionRecord(
+                    self.horloge.time(),
+                    tuple(int(self.get_data(cle, 0)) for cle in TRACE_ENTREES),
+                    raison,
+                ),
+            )
+        )
+
+    def finDecision(self, jeton: Token) -> None:
+        """Ferme la décision ; elle n'est conservée que si une commande a été émise."""
+
+        controller, decision = _decisionEnCours.get()
+        _decisionEnCours.reset(jeton)
+
+        if controller is self and decision.commandes:
+            decision.commandes = tuple(decision.commandes)
+            self.traceDecisions.append(decision)
+
+    def decisionEnCours(self) -> Optional[DecisionRecord]:
+        """Décision ouverte par ce controller dans la tâche courante."""
+
+        enCours = _decisionEnCours.get()
+        if enCours is None or enCours[0] is not self:
+            return None
+        return enCours[1]
+
+    def tracerCommande(self, service: str, entity_id: Any, succes: bool) -> None:
+        """Ajoute une commande d'actionneur à la décision en cours."""
+
+        decision = self.decisionEnCours()
+        if decision is not None:
+            decision.commandes.append((service, entity_id, succes))
+
+    def getDecisions(self, limite: Optional[int] = None) -> list[dict[str, Any]]:
+        """Décisions les plus récentes d'abord."""
+
+        decisions = list(reversed(self.traceDecisions))
+        if limite is not None:
+            decisions = decisions[:limite]
+        return [decision.as_dict() for decision in decisions]
@@ -60,6 +60,7 @@ class TraitementMixin:
             return
 
         if not repeat and traitementState.state == "on":
+            self.compterCommande("traitement", "avoided")
             return
 
         # Active le traitement
@@ -86,6 +87,7 @@ class TraitementMixin:
             return
 
         if not repeat and traitementState.state == "off":
+            self.compterCommande("traitement", "avoided")
             return
 
         # Arrête le traitement
@@ -152,6 +154,7 @@ class TraitementMixin:
             return
 
         if not repeat and traitementState.state == "on":
+            self.compterCommande("traitement_2", "avoided")
             return
 
         # Active le traitement
@@ -178,6 +181,7 @@ class TraitementMixin:
             return
 
         if not repeat and traitementState.state == "off":
+            self.compterCommande("traitement_2", "avoided")
             return
 
         # Arrête le traitement
@@ -9,18 +9,17 @@ class FiltrationUtilsMixin:
     def processingTime(self, dureeHeures: float) -> Tuple[float, str]:
         """Calculate filtration time in seconds and formatted string from hours."""
 
-        # Arrondi en minutes
-        dureeHeures = int(dureeHeures * 60) / 60
+        # Arrondi en minutes entières (pas d'erreur d'arrondi à l'affichage)
+        dureeMinutes = int(dureeHeures * 60)
 
-        # La durée ne peut pas être supérieure à 24 H
-        dureeHeures = min(dureeHeures, 24.00)
+        # La durée est comprise entre 0 et 24 H
+        dureeMinutes = min(max(dureeMinutes, 0), 24 * 60)
 
         # Conversion en secondes pour les calculs
-        filtrationSecondes = dureeHeures * 3600.0
+        filtrationSecondes = dureeMinutes * 60.0
 
         # Conversion en hh:mm pour l'affichage
-        hh = int(dureeHeures)
-        mm = int((dureeHeures * 60) - (hh * 60))
+        hh, mm = divmod(dureeMinutes, 60)
 
         filtrationTime = f"{hh:02d}:{mm:02d}"
 
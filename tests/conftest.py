@@ -155,6 +155,57 @@ def setup_hass_states(mock_hass, mock_state_factory):
     return _setup
 
 
+@pytest.fixture
+def fake_hass():
+    """Faux Home Assistant en mémoire, sur horloge virtuelle (15 juin 2025, 10h00).
+
+    Les services `turn_on` / `turn_off` changent réellement l'état des entités,
+    chaque changement émet `state_changed` et les minuteries ne se déclenchent
+    qu'avec `await fake_hass.async_avancer(secondes)`.
+    """
+    from tests.fakehass import FakeHass
+    from custom_components.pool_control.horloge import HorlogeVirtuelle
+
+    hass = FakeHass(HorlogeVirtuelle(datetime(2025, 6, 15, 10, 0).timestamp()))
+
+    hass.states.async_set(MOCK_CONFIG_FULL["temperatureWater"], 26.0)
+    hass.states.async_set(MOCK_CONFIG_FULL["temperatureOutdoor"], 24.0)
+    hass.states.async_set(
+        MOCK_CONFIG_FULL["leverSoleil"], datetime(2025, 6, 16, 5, 50).isoformat()
+    )
+    for cle in ("filtration", "traitement", "traitement_2", "surpresseur"):
+        hass.states.async_set(MOCK_CONFIG_FULL[cle], "off")
+
+    return hass
+
+
+@pytest.fixture
+async def fake_pool(fake_hass, mock_pool_config):
+    """Bassin démarré sur le faux Home Assistant : store, planificateur et lectures.
+
+    Le premier cycle tourne après `await fake_hass.async_avancer(60)`.
+    """
+    from tests.fakehass import integrationSimulee
+    from custom_components.pool_control.controller import PoolController
+    from custom_components.pool_control.lectures import CacheLectures
+    from custom_components.pool_control.planificateur import Planificateur
+
+    with integrationSimulee():
+        controller = PoolController(fake_hass, mock_pool_config, "test", "Test")
+        controller.horloge = fake_hass.horloge
+        controller.planificateur = Planificateur(fake_hass)
+        controller.cacheLectures = CacheLectures(fake_hass)
+        await controller.async_initialize()
+        await controller.startLectures()
+        await controller.startFirstCron()
+
+        yield controller
+
+        await controller.stopFirstCron()
+        await controller.stopSecondCron()
+        await controller.stopLectures()
+
+
 # @pytest.fixture(autouse=True)
 # def auto_enable_custom_integrations(enable_custom_integrations):
 #     """Enable custom integration loading for all tests.
@@ -0,0 +1,467 @@
+"""Faux Home Assistant en mémoire pour les tests, les benchmarks et la simulation.
+
+Machine d'états, registre de services, bus, minuteries et store réduits à ce
+que lit et appelle `PoolController`, horodatés par l'horloge du banc. Les
+services `turn_on` / `turn_off` modifient l'état de l'entité commandée, comme
+un relais, et chaque changement d'état émet `state_changed`. Sur horloge
+virtuelle, `async_avancer()` fait avancer le temps en déclenchant les
+minuteries échues dans l'ordre.
+`integrationSimulee()` branche l'intégration sur ces faux : store en mémoire,
+minuteries et suivi d'états pilotés par le banc, sans temporisation entre deux
+commandes d'équipements. `async_setup_entry` y tourne tel quel : les
+plateformes sont importées et installées, les vues HTTP mémorisées.
+"""
+
+import asyncio
+from contextlib import contextmanager
+from datetime import timedelta
+import heapq
+import importlib
+from itertools import count
+import os
+from typing import Any, Callable, Iterable, Iterator, Optional, Union
+from unittest.mock import patch
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import CoreState, Event, State
+from homeassistant.util import dt as dt_util
+
+from custom_components.pool_control.horloge import Horloge
+
+# Services dont l'appel change l'état de l'entité commandée
+SERVICES_ETAT = {"turn_on": "on", "turn_off": "off"}
+
+
+class FakeBus:
+    """Bus d'événements : écouteurs par type, exécutés à l'émission."""
+
+    def __init__(self, hass: "FakeHass") -> None:
+        """Initialize the FakeBus."""
+
+        self.hass = hass
+        self.ecouteurs = {}
+
+    def executer(self, action: Callable[..., Any], *args: Any) -> None:
+        """Appelle un écouteur ; une coroutine devient une tâche, comme un `HassJob`."""
+
+        resultat = action(*args)
+        if asyncio.iscoroutine(resultat):
+            self.hass.async_create_task(resultat)
+
+    def async_fire(self, event_type: str, event_data: Optional[dict] = None) -> None:
+        """Fire an event."""
+
+        ecouteurs = self.ecouteurs.get(event_type)
+        if not ecouteurs:
+            return
+
+        event = Event(event_type, event_data or {})
+        for ecouteur in list(ecouteurs):
+            listener, once = ecouteur
+            if once:
+                ecouteurs.remove(ecouteur)
+            self.executer(listener, event)
+
+    def async_listen(
+        self, event_type: str, listener: Callable, once: bool = False
+    ) -> Callable[[], None]:
+        """Listen for an event."""
+
+        ecouteur = (listener, once)
+        ecouteurs = self.ecouteurs.setdefault(event_type, [])
+        ecouteurs.append(ecouteur)
+
+        def annuler() -> None:
+            """Retire l'écouteur."""
+
+            if ecouteur in ecouteurs:
+                ecouteurs.remove(ecouteur)
+
+        return annuler
+
+    def async_listen_once(self, event_type: str, listener: Callable) -> Callable[[], None]:
+        """Listen once for an event."""
+
+        return self.async_listen(event_type, listener, once=True)
+
+
+class FakeStates:
+    """Machine d'états : dernier `State` par entity_id, écouteurs par entité."""
+
+    def __init__(self, horloge: Horloge, bus: FakeBus) -> None:
+        """Initialize the FakeStates."""
+
+        self.horloge = horloge
+        self.bus = bus
+        self.etats = {}
+        self.ecouteurs = {}
+
+    def get(self, entity_id: Optional[str]) -> Optional[State]:
+        """Return the state of an entity."""
+
+        return self.etats.get(entity_id)
+
+    def async_set(self, entity_id: str, state: Any, attributes: Optional[dict] = None) -> None:
+        """Set the state of an entity."""
+
+        ancien = self.etats.get(entity_id)
+        maintenant = dt_util.utc_from_timestamp(self.horloge.time())
+        nouveau = State(
+            entity_id, str(state), attributes, last_changed=maintenant, last_updated=maintenant
+        )
+        self.etats[entity_id] = nouveau
+
+        donnees = {"entity_id": entity_id, "old_state": ancien, "new_state": nouveau}
+
+        if self.ecouteurs.get(entity_id):
+            event = Event(EVENT_STATE_CHANGED, donnees)
+            for action in list(self.ecouteurs[entity_id]):
+                self.bus.executer(action, event)
+
+        self.bus.async_fire(EVENT_STATE_CHANGED, donnees)
+
+    def ecouter(self, entity_id: str, action: Callable[[Event], Any]) -> Callable[[], None]:
+        """Appelle `action` à chaque changement d'état de l'entité."""
+
+        self.ecouteurs.setdefault(entity_id, []).append(action)
+        return lambda: self.ecouteurs[entity_id].remove(action)
+
+
+class FakeServices:
+    """Registre de services : compte les appels et applique les commandes."""
+
+    def __init__(self, states: FakeStates) -> None:
+        """Initialize the FakeServices."""
+
+        self.states = states
+        self.appels = 0
+        self.services = {}
+
+        # Appels mémorisés (domaine, service, données) quand une liste est fournie
+        self.journal = None
+
+    async def async_call(
+        self, domain: str, service: str, service_data: Optional[dict] = None, **kwargs: Any
+    ) -> Any:
+        """Call a service."""
+
+        self.appels += 1
+        service_data = service_data or {}
+
+        if self.journal is not None:
+            self.journal.append((domain, service, service_data))
+
+        handler = self.services.get((domain, service))
+        if handler is not None:
+            return await handler(service_data)
+
+        if service in SERVICES_ETAT and "entity_id" in service_data:
+            self.states.async_set(service_data["entity_id"], SERVICES_ETAT[service])
+        return None
+
+    def has_service(self, domain: str, service: str) -> bool:
+        """Return whether a service is registered."""
+
+        return (domain, service) in self.services
+
+    def async_register(self, domain: str, service: str, handler: Callable, **kwargs: Any) -> None:
+        """Register a service."""
+
+        self.services[(domain, service)] = handler
+
+    def async_remove(self, domain: str, service: str) -> None:
+        """Remove a service."""
+
+        self.services.pop((domain, service), None)
+
+
+class Minuterie:
+    """Échéance d'une minuterie, périodique si `intervalle` est renseigné."""
+
+    __slots__ = ("echeance", "action", "intervalle", "annulee")
+
+    def __init__(
+        self, echeance: float, action: Callable[..., Any], intervalle: Optional[float]
+    ) -> None:
+        """Initialize the Minuterie."""
+
+        self.echeance = echeance
+        self.action = action
+        self.intervalle = intervalle
+        self.annulee = False
+
+    def annuler(self) -> None:
+        """Annule la minuterie."""
+
+        self.annulee = True
+
+
+class FakeStore:
+    """Store en mémoire comptant les écritures."""
+
+    def __init__(self, key: str, data: Optional[dict] = None) -> None:
+        """Initialize the FakeStore."""
+
+        self.key = key
+        self.data = data
+        self.ecritures = 0
+
+    async def async_load(self) -> Optional[dict]:
+        """Load the data."""
+
+        return self.data
+
+    async def async_save(self, data: dict) -> None:
+        """Save the data."""
+
+        self.data = dict(data)
+        self.ecritures += 1
+
+    async def async_remove(self) -> None:
+        """Remove the data."""
+
+        self.data = None
+
+
+class FakeConfig:
+    """Configuration : dossier où le `Store` de Home Assistant écrit ses fichiers."""
+
+    def __init__(self, dossier: str) -> None:
+        """Initialize the FakeConfig."""
+
+        self.config_dir = dossier
+        self.components = set()
+
+    def path(self, *chemin: str) -> str:
+        """Chemin dans le dossier de configuration."""
+
+        return os.path.join(self.config_dir, *chemin)
+
+
+class FakeConfigEntry:
+    """Config entry réduit : identifiant, titre, données et options."""
+
+    def __init__(
+        self,
+        data: dict,
+        options: Optional[dict] = None,
+        entry_id: str = "entry",
+        title: str = "Pool Control",
+        domain: str = "pool_control",
+    ) -> None:
+        """Initialize the FakeConfigEntry."""
+
+        self.data = data
+        self.options = options or {}
+        self.entry_id = entry_id
+        self.title = title
+        self.domain = domain
+
+
+class FakeConfigEntries:
+    """Chargement des plateformes : entités créées par chaque plateforme, par entry."""
+
+    def __init__(self, hass: "FakeHass") -> None:
+        """Initialize the FakeConfigEntries."""
+
+        self.hass = hass
+        self.entites = {}
+
+    async def async_forward_entry_setups(self, entry: FakeConfigEntry, platforms: list) -> None:
+        """Importe et installe les plateformes de l'intégration."""
+
+        entites = self.entites.setdefault(entry.entry_id, [])
+
+        def ajouter(nouvelles: Iterable[Any], update_before_add: bool = False) -> None:
+            """Mémorise les entités créées."""
+
+            entites.extend(nouvelles)
+
+        for platform in platforms:
+            module = importlib.import_module(f"custom_components.{entry.domain}.{platform}")
+            await module.async_setup_entry(self.hass, entry, ajouter)
+
+    async def async_unload_platforms(self, entry: FakeConfigEntry, platforms: list) -> bool:
+        """Oublie les entités de l'entry."""
+
+        self.entites.pop(entry.entry_id, None)
+        return True
+
+
+class FakeHttp:
+    """Serveur HTTP : vues enregistrées."""
+
+    def __init__(self) -> None:
+        """Initialize the FakeHttp."""
+
+        self.vues = []
+
+    def register_view(self, view: Any) -> None:
+        """Register a view."""
+
+        self.vues.append(view)
+
+
+class FakeHass:
+    """Instance réduite : états, services, bus et tâches en attente."""
+
+    def __init__(self, horloge: Optional[Horloge] = None, dossier: Optional[str] = None) -> None:
+        """Initialize the FakeHass."""
+
+        self.horloge = horloge or Horloge()
+        self.bus = FakeBus(self)
+        self.states = FakeStates(self.horloge, self.bus)
+        self.services = FakeServices(self.states)
+        self.config = FakeConfig(dossier or os.getcwd())
+        self.config_entries = FakeConfigEntries(self)
+        self.http = FakeHttp()
+        self.data = {}
+
+        # Instance démarrée : `not_running` pour simuler un démarrage
+        self.state = CoreState.running
+        self.taches = []
+
+        # Minuteries en attente : tas de (échéance, ordre d'inscription, minuterie)
+        self.minuteries = []
+        self.ordre = count()
+
+    def async_create_task(self, coro: Any, *args: Any, **kwargs: Any) -> asyncio.Task:
+        """Schedule a coroutine, awaited by `async_block_till_done`."""
+
+        tache = asyncio.get_running_loop().create_task(coro)
+        self.taches.append(tache)
+        return tache
+
+    def async_run_hass_job(self, job: Any, *args: Any) -> None:
+        """Run a HassJob."""
+
+        self.bus.executer(job.target, *args)
+
+    def async_add_executor_job(self, cible: Callable[..., Any], *args: Any) -> asyncio.Future:
+        """Run a blocking function in the default executor."""
+
+        return asyncio.get_running_loop().run_in_executor(None, cible, *args)
+
+    async def async_block_till_done(self) -> None:
+        """Wait for the scheduled tasks."""
+
+        while self.taches:
+            taches, self.taches = self.taches, []
+            await asyncio.gather(*taches)
+
+    def planifier(
+        self, delai: float, action: Callable[..., Any], intervalle: Optional[float] = None
+    ) -> Callable[[], None]:
+        """Inscrit une minuterie ; retourne sa fonction d'annulation."""
+
+        minuterie = Minuterie(self.horloge.time() + delai, action, intervalle)
+        heapq.heappush(self.minuteries, (minuterie.echeance, next(self.ordre), minuterie))
+        return minuterie.annuler
+
+    async def async_avancer(self, secondes: float) -> None:
+        """Avance l'horloge virtuelle en déclenchant les minuteries échues.
+
+        Chaque minuterie est exécutée à son échéance, tâches créées comprises,
+        avant de passer à la suivante.
+        """
+
+        cible = self.horloge.time() + secondes
+
+        while self.minuteries and self.minuteries[0][0] <= cible:
+            echeance, _, minuterie = heapq.heappop(self.minuteries)
+            if minuterie.annulee:
+                continue
+
+            self.horloge.avancer(echeance - self.horloge.time())
+
+            if minuterie.intervalle:
+                minuterie.echeance += minuterie.intervalle
+                heapq.heappush(
+                    self.minuteries, (minuterie.echeance, next(self.ordre), minuterie)
+                )
+            else:
+                minuterie.annulee = True
+
+            resultat = minuterie.action(dt_util.utc_from_timestamp(echeance))
+            if asyncio.iscoroutine(resultat):
+                await resultat
+            if self.taches:
+                await self.async_block_till_done()
+
+        self.horloge.avancer(cible - self.horloge.time())
+
+
+def async_track_state_change_event(
+    hass: FakeHass, entity_ids: list, action: Callable[[Event], Any]
+) -> Callable[[], None]:
+    """Remplace le helper de Home Assistant : écoute directe de la machine d'états."""
+
+    annulations = [hass.states.ecouter(entity_id, action) for entity_id in entity_ids]
+
+    def annuler() -> None:
+        """Retire les écouteurs."""
+
+        for annulation in annulations:
+            annulation()
+
+    return annuler
+
+
+def _secondes(duree: Union[float, timedelta]) -> float:
+    """Durée en secondes."""
+
+    return duree.total_seconds() if isinstance(duree, timedelta) else float(duree)
+
+
+def async_track_time_interval(
+    hass: FakeHass, action: Callable[..., Any], interval: timedelta, **kwargs: Any
+) -> Callable[[], None]:
+    """Remplace le helper de Home Assistant : minuterie périodique du faux."""
+
+    return hass.planifier(_secondes(interval), action, _secondes(interval))
+
+
+def async_call_later(
+    hass: FakeHass, delay: Union[float, timedelta], action: Callable[..., Any]
+) -> Callable[[], None]:
+    """Remplace le helper de Home Assistant : minuterie unique du faux."""
+
+    return hass.planifier(_secondes(delay), action)
+
+
+async def _migrerEntites(hass: FakeHass, entry_id: str, migrer: Callable) -> None:
+    """Remplace la migration du registre d'entités : registre vide, rien à migrer."""
+
+
+@contextmanager
+def integrationSimulee(donnees: Optional[dict] = None) -> Iterator[None]:
+    """Branche l'intégration sur le faux Home Assistant.
+
+    Chaque store démarre avec une copie de `donnees`.
+    """
+
+    with patch(
+        "custom_components.pool_control.controller.Store",
+        side_effect=lambda hass, version, key: FakeStore(
+            key, dict(donnees) if donnees else None
+        ),
+    ), patch(
+        "custom_components.pool_control.planificateur.async_track_time_interval",
+        async_track_time_interval,
+    ), patch(
+        "custom_components.pool_control.scheduler.async_track_time_interval",
+        async_track_time_interval,
+    ), patch(
+        "custom_components.pool_control.solaire.async_call_later",
+        async_call_later,
+    ), patch(
+        "custom_components.pool_control.lectures.async_track_state_change_event",
+        async_track_state_change_event,
+    ), patch(
+        "custom_components.pool_control.solaire.async_track_state_change_event",
+        async_track_state_change_event,
+    ), patch(
+        "custom_components.pool_control.er.async_migrate_entries",
+        side_effect=_migrerEntites,
+    ), patch("custom_components.pool_control.activation.DEVICE_ACTIVATION_DELAY", 0):
+        yield
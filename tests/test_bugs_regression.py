@@ -49,13 +49,17 @@ class TestBug1_ExecuteButtonStop:
     @pytest.mark.asyncio
     async def test_pull_calls_execute_button_stop_when_timeout(self, mock_hass, mock_pool_config):
         """Vérifie que pull() appelle executeButtonStop() quand le temps expire."""
+        from custom_components.pool_control.horloge import Horloge
+        from custom_components.pool_control.lavage import LavageMixin
+        from custom_components.pool_control.profilage import ProfilageMixin
         from custom_components.pool_control.scheduler import SchedulerMixin
         import time
 
-        class TestController(SchedulerMixin):
+        class TestController(SchedulerMixin, LavageMixin, ProfilageMixin):
             def __init__(self):
                 super().__init__()
                 self.hass = mock_hass
+                self.horloge = Horloge()
                 self.executeButtonStop = AsyncMock()
                 self.surpresseurStatus = None
 
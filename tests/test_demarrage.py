@@ -0,0 +1,174 @@
+"""Tests for the deferred first cycle at Home Assistant startup.
+
+The controller runs on `fake_hass` (tests/fakehass.py) started in the
+`not_running` state: the sensors are not restored yet, the first cycle waits
+for EVENT_HOMEASSISTANT_STARTED or for every configured sensor to be valid.
+
+Functions tested:
+1. startDemarrage() - Immediate cron on a running instance, deferred otherwise
+2. _demarrer() - First cycle on EVENT_HOMEASSISTANT_STARTED
+3. verifierDemarrage() - First cycle as soon as the sensors are valid
+4. stopDemarrage() - Pending wait cancelled
+5. capteursValides() - Missing, unavailable and restored readings
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+# Skip all tests if Home Assistant is not installed
+pytest.importorskip("homeassistant")
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, STATE_UNAVAILABLE
+from homeassistant.core import CoreState
+
+from tests.const import ENTITY_POOL_TEMPERATURE
+
+
+@pytest.fixture
+async def fake_pool_demarrage(fake_hass, mock_pool_config):
+    """Bassin installé pendant le démarrage de Home Assistant, capteur d'eau non restauré."""
+    from tests.fakehass import integrationSimulee
+    from custom_components.pool_control.controller import PoolController
+    from custom_components.pool_control.lectures import CacheLectures
+    from custom_components.pool_control.planificateur import Planificateur
+
+    fake_hass.state = CoreState.not_running
+    fake_hass.states.async_set(ENTITY_POOL_TEMPERATURE, STATE_UNAVAILABLE)
+
+    with integrationSimulee():
+        controller = PoolController(fake_hass, mock_pool_config, "test", "Test")
+        controller.horloge = fake_hass.horloge
+        controller.planificateur = Planificateur(fake_hass)
+        controller.cacheLectures = CacheLectures(fake_hass)
+        await controller.async_initialize()
+        await controller.startLectures()
+
+        yield controller
+
+        await controller.stopDemarrage()
+        await controller.stopFirstCron()
+        await controller.stopSecondCron()
+        await controller.stopLectures()
+
+
+async def demarrerHomeAssistant(hass):
+    """Home Assistant passe à l'état running et émet homeassistant_started."""
+    hass.state = CoreState.running
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+
+
+@pytest.mark.unit
+class TestStartDemarrage:
+    """Tests for startDemarrage()."""
+
+    async def test_running_starts_cron(self, fake_pool_demarrage, fake_hass):
+        """Test an entry added on a running instance starts the cron at once."""
+        fake_hass.state = CoreState.running
+
+        await fake_pool_demarrage.startDemarrage()
+
+        assert fake_pool_demarrage.firstCronCancel is not None
+        assert fake_pool_demarrage.demarrageCancel is None
+
+    async def test_valid_sensors_start_cron(self, fake_pool_demarrage, fake_hass):
+        """Test sensors already restored start the cron during startup."""
+        fake_hass.states.async_set(ENTITY_POOL_TEMPERATURE, 26.0)
+
+        await fake_pool_demarrage.startDemarrage()
+
+        assert fake_pool_demarrage.firstCronCancel is not None
+        assert fake_pool_demarrage.demarrageCancel is None
+
+    async def test_deferred_until_started(self, fake_pool_demarrage, fake_hass):
+        """Test no cycle runs before homeassistant_started, then one at once."""
+        await fake_pool_demarrage.startDemarrage()
+
+        assert fake_pool_demarrage.demarrageCancel is not None
+        assert fake_pool_demarrage.firstCronCancel is None
+
+        # Aucune plage calculée sur le capteur non restauré
+        await fake_hass.async_avancer(300)
+        assert not fake_pool_demarrage.get_data("filtrationDebut")
+
+        await demarrerHomeAssistant(fake_hass)
+
+        assert fake_pool_demarrage.demarrageCancel is None
+        assert fake_pool_demarrage.firstCronCancel is not None
+        assert fake_pool_demarrage.get_data("filtrationDebut")
+
+
+@pytest.mark.unit
+class TestVerifierDemarrage:
+    """Tests for verifierDemarrage()."""
+
+    async def test_sensors_restored_start_cycle(self, fake_pool_demarrage, fake_hass):
+        """Test the first cycle runs as soon as the water sensor is restored."""
+        await fake_pool_demarrage.startDemarrage()
+        cron = fake_pool_demarrage.cron
+        fake_pool_demarrage.cron = MagicMock(side_effect=cron)
+
+        fake_hass.states.async_set(ENTITY_POOL_TEMPERATURE, 26.0)
+        await fake_hass.async_block_till_done()
+
+        assert fake_pool_demarrage.demarrageCancel is None
+        assert fake_pool_demarrage.firstCronCancel is not None
+        assert fake_pool_demarrage.cron.call_count == 1
+
+        # homeassistant_started ne relance pas de cycle
+        await demarrerHomeAssistant(fake_hass)
+        assert fake_pool_demarrage.cron.call_count == 1
+
+    async def test_not_waiting(self, fake_pool_demarrage, fake_hass):
+        """Test a sensor change without pending wait starts nothing."""
+        fake_hass.states.async_set(ENTITY_POOL_TEMPERATURE, 26.0)
+        await fake_hass.async_block_till_done()
+
+        assert fake_pool_demarrage.firstCronCancel is None
+
+
+@pytest.mark.unit
+class TestStopDemarrage:
+    """Tests for stopDemarrage()."""
+
+    async def test_cancels_wait(self, fake_pool_demarrage, fake_hass):
+        """Test an unloaded entry does not start on homeassistant_started."""
+        await fake_pool_demarrage.startDemarrage()
+
+        await fake_pool_demarrage.stopDemarrage()
+        await demarrerHomeAssistant(fake_hass)
+
+        assert fake_pool_demarrage.demarrageCancel is None
+        assert fake_pool_demarrage.firstCronCancel is None
+
+
+@pytest.mark.unit
+class TestCapteursValides:
+    """Tests for capteursValides()."""
+
+    async def test_unavailable_sensor(self, fake_pool_demarrage):
+        """Test an unavailable configured sensor is not valid."""
+        assert fake_pool_demarrage.capteursValides() is False
+
+    async def test_restored_sensors(self, fake_pool_demarrage, fake_hass):
+        """Test every configured sensor with a fresh reading is valid."""
+        fake_hass.states.async_set(ENTITY_POOL_TEMPERATURE, 26.0)
+
+        assert fake_pool_demarrage.capteursValides() is True
+
+    async def test_stale_reading(self, fake_pool_demarrage, fake_hass):
+        """Test a kept value of a sensor gone unavailable is not valid."""
+        fake_hass.states.async_set(ENTITY_POOL_TEMPERATURE, 26.0)
+        fake_hass.states.async_set(ENTITY_POOL_TEMPERATURE, STATE_UNAVAILABLE)
+
+        assert fake_pool_demarrage.lectures["temperatureWater"].valeur == 26.0
+        assert fake_pool_demarrage.capteursValides() is False
+
+    def test_without_cache(self, mock_hass, mock_pool_config):
+        """Test no sensor is valid without the readings cache."""
+        from custom_components.pool_control.controller import PoolController
+
+        controller = PoolController(mock_hass, mock_pool_config)
+
+        assert controller.capteursValides() is False
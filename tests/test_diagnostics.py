@@ -0,0 +1,134 @@
+"""Tests for diagnostics.py module - Config entry diagnostics.
+
+Functions tested:
+1. async_get_config_entry_diagnostics() - State, windows, actuators, timers and timings
+2. _horodatage() - Store timestamps as ISO dates
+3. _observation() - Last known entity state
+"""
+
+from datetime import datetime
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+# Skip all tests if Home Assistant is not installed
+pytest.importorskip("homeassistant")
+
+from custom_components.pool_control.const import DOMAIN
+from custom_components.pool_control.diagnostics import (
+    _horodatage,
+    _observation,
+    async_get_config_entry_diagnostics,
+)
+
+
+@pytest.fixture
+def mock_diagnostics_controller(mock_hass, mock_pool_config):
+    """Create a controller registered in hass.data."""
+    from custom_components.pool_control.controller import PoolController
+
+    controller = PoolController(mock_hass, mock_pool_config)
+    mock_hass.data = {DOMAIN: {"test_entry_id": controller}}
+
+    return controller
+
+
+@pytest.fixture
+def mock_entry(mock_pool_config):
+    """Create a config entry with options."""
+    entry = MagicMock()
+    entry.entry_id = "test_entry_id"
+    entry.data = dict(mock_pool_config)
+    entry.options = {"lavageDuree": 3}
+    return entry
+
+
+@pytest.mark.unit
+class TestDiagnostics:
+    """Tests for async_get_config_entry_diagnostics()."""
+
+    @pytest.mark.asyncio
+    async def test_sections(self, mock_hass, mock_entry, mock_diagnostics_controller):
+        """Test every section is present in the document."""
+        diagnostics = await async_get_config_entry_diagnostics(mock_hass, mock_entry)
+
+        assert set(diagnostics) == {
+            "config",
+            "etat",
+            "plages",
+            "capteurs",
+            "actionneurs",
+            "minuteurs",
+            "profilage",
+            "planificateur",
+            "lectures",
+            "cacheLectures",
+            "decisions",
+            "ecrituresStatut",
+        }
+        assert diagnostics["config"]["lavageDuree"] == 3
+
+    @pytest.mark.asyncio
+    async def test_windows_and_state(self, mock_hass, mock_entry, mock_diagnostics_controller):
+        """Test the computed windows are exposed as dates and the state as stored."""
+        debut = datetime(2024, 6, 15, 10, 0).timestamp()
+        fin = datetime(2024, 6, 15, 16, 0).timestamp()
+        mock_diagnostics_controller.data = {
+            "filtrationDebut": debut,
+            "filtrationFin": fin,
+            "marcheForcee": 0,
+        }
+
+        diagnostics = await async_get_config_entry_diagnostics(mock_hass, mock_entry)
+
+        assert diagnostics["etat"]["marcheForcee"] == 0
+        assert diagnostics["plages"]["filtrationDebut"] == "2024-06-15T10:00:00"
+        assert diagnostics["plages"]["filtrationFin"] == "2024-06-15T16:00:00"
+        assert diagnostics["plages"]["filtrationPauseDebut"] is None
+        assert diagnostics["plages"]["hivernage"] is False
+
+    @pytest.mark.asyncio
+    async def test_timers(self, mock_hass, mock_entry, mock_diagnostics_controller):
+        """Test the timer handles are reported."""
+        mock_diagnostics_controller.firstCronCancel = Mock()
+
+        diagnostics = await async_get_config_entry_diagnostics(mock_hass, mock_entry)
+
+        assert diagnostics["minuteurs"]["firstCron"] is True
+        assert diagnostics["minuteurs"]["secondCron"] is False
+
+    @pytest.mark.asyncio
+    async def test_no_service_call(self, mock_hass, mock_entry, mock_diagnostics_controller):
+        """Test producing the document does not call any service."""
+        await async_get_config_entry_diagnostics(mock_hass, mock_entry)
+
+        mock_hass.services.async_call.assert_not_called()
+
+
+@pytest.mark.unit
+class TestHelpers:
+    """Tests for the diagnostics helpers."""
+
+    def test_horodatage_empty(self):
+        """Test missing timestamps are reported as None."""
+        assert _horodatage(None) is None
+        assert _horodatage(0) is None
+
+    def test_observation(self, mock_hass, mock_switch_on):
+        """Test the last known state of an actuator is reported."""
+        mock_switch_on.last_changed = datetime(2024, 6, 15, 10, 0)
+        mock_switch_on.last_updated = datetime(2024, 6, 15, 10, 5)
+        mock_hass.states.get = Mock(return_value=mock_switch_on)
+
+        observation = _observation(mock_hass, "switch.pool_pump")
+
+        assert observation["state"] == "on"
+        assert observation["last_changed"] == "2024-06-15T10:00:00"
+
+    def test_observation_missing(self, mock_hass):
+        """Test unknown and unconfigured entities."""
+        assert _observation(mock_hass, None) is None
+        assert _observation(mock_hass, "switch.absent") == {
+            "entity_id": "switch.absent",
+            "state": None,
+        }
@@ -0,0 +1,346 @@
+"""Tests for entities.py module - Status sensor writes.
+
+Tests the redundant state write suppression of PoolControlStatusSensor.
+
+Functions tested:
+1. set_status() - Equality short-circuit
+2. set_status() - Minimum interval between writes
+3. async_will_remove_from_hass() - Pending write cancelled
+4. compterEcritureStatut() - Written / suppressed counters
+5. PoolControlTimestampSensor - Phase end timestamp
+6. PoolControlLavagePhaseSensor - Lavage phase enum
+7. PoolControlMeasureSensor - Schedule numeric values
+8. async_added_to_hass() - Last state restored after a restart
+"""
+
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+# Skip all tests if Home Assistant is not installed
+pytest.importorskip("homeassistant")
+
+from custom_components.pool_control.entities import (
+    PoolControlLavagePhaseSensor,
+    PoolControlMeasureSensor,
+    PoolControlStatusSensor,
+    PoolControlTimestampSensor,
+)
+
+
+@pytest.fixture
+def mock_entities_controller(mock_hass, mock_pool_config):
+    """Create a controller to attach the sensors to."""
+    from custom_components.pool_control.controller import PoolController
+
+    return PoolController(mock_hass, mock_pool_config)
+
+
+async def added_sensor(controller, min_interval=0):
+    """Create a status sensor added to hass."""
+    sensor = PoolControlStatusSensor(
+        controller,
+        "Status Surpresseur",
+        "pool_control_surpresseur_status",
+        "surpresseurStatus",
+        min_interval=min_interval,
+    )
+    sensor.hass = controller.hass
+    sensor.async_write_ha_state = Mock()
+    await sensor.async_added_to_hass()
+    return sensor
+
+
+@pytest.mark.unit
+class TestSetStatus:
+    """Tests for set_status()."""
+
+    @pytest.mark.asyncio
+    async def test_writes_changed_value(self, mock_entities_controller):
+        """Test a new value is written immediately."""
+        sensor = await added_sensor(mock_entities_controller)
+
+        sensor.set_status("Actif")
+
+        assert sensor.state == "Actif"
+        sensor.async_write_ha_state.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_skips_unchanged_value(self, mock_entities_controller):
+        """Test the same value is not written twice."""
+        sensor = await added_sensor(mock_entities_controller)
+
+        sensor.set_status("Actif")
+        sensor.set_status("Actif")
+        sensor.set_status("Actif")
+
+        sensor.async_write_ha_state.assert_called_once()
+        assert mock_entities_controller.metriquesEcrituresStatut == {
+            ("surpresseurStatus", "written"): 1,
+            ("surpresseurStatus", "unchanged"): 2,
+        }
+
+    def test_no_write_before_added(self, mock_entities_controller):
+        """Test the state is only kept until the entity is added."""
+        sensor = PoolControlStatusSensor(
+            mock_entities_controller, "Status", "pool_control_status", "filtrationStatus"
+        )
+        sensor.async_write_ha_state = Mock()
+
+        sensor.set_status("Actif")
+
+        assert sensor.state == "Actif"
+        sensor.async_write_ha_state.assert_not_called()
+
+
+@pytest.mark.unit
+class TestMinInterval:
+    """Tests for the minimum interval between writes."""
+
+    @pytest.mark.asyncio
+    async def test_throttles_and_defers_last_value(self, mock_entities_controller):
+        """Test close writes are held back and the last value published later."""
+        sensor = await added_sensor(mock_entities_controller, min_interval=10)
+        cancel = Mock()
+
+        with patch(
+            "custom_components.pool_control.entities.time.monotonic",
+            side_effect=[100.0, 102.0, 104.0, 110.0],
+        ), patch(
+            "custom_components.pool_control.entities.async_call_later",
+            return_value=cancel,
+        ) as mock_later:
+            sensor.set_status("Actif : 04:55")
+            sensor.set_status("Actif : 04:50")
+            sensor.set_status("Actif : 04:45")
+
+            assert sensor.async_write_ha_state.call_count == 1
+            mock_later.assert_called_once()
+            assert mock_later.call_args[0][1] == pytest.approx(8.0)
+
+            await sensor._async_write_pending()
+
+        assert sensor.async_write_ha_state.call_count == 2
+        assert sensor.state == "Actif : 04:45"
+        assert mock_entities_controller.metriquesEcrituresStatut[
+            ("surpresseurStatus", "throttled")
+        ] == 2
+
+    @pytest.mark.asyncio
+    async def test_writes_after_interval(self, mock_entities_controller):
+        """Test a write after the interval is immediate."""
+        sensor = await added_sensor(mock_entities_controller, min_interval=10)
+
+        with patch(
+            "custom_components.pool_control.entities.time.monotonic",
+            side_effect=[100.0, 111.0, 111.0],
+        ):
+            sensor.set_status("Actif : 04:55")
+            sensor.set_status("Actif : 04:44")
+
+        assert sensor.async_write_ha_state.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_remove_cancels_pending_write(self, mock_entities_controller):
+        """Test a pending write is cancelled when the entity is removed."""
+        sensor = await added_sensor(mock_entities_controller, min_interval=10)
+        cancel = Mock()
+        sensor._pending_write = cancel
+
+        await sensor.async_will_remove_from_hass()
+
+        cancel.assert_called_once()
+        assert sensor._pending_write is None
+
+
+@pytest.mark.unit
+class TestStatusWritesExport:
+    """Tests for the suppressed writes counters export."""
+
+    @pytest.mark.asyncio
+    async def test_exported(self, mock_entities_controller):
+        """Test the counters are exported as Prometheus metrics."""
+        sensor = await added_sensor(mock_entities_controller)
+        sensor.set_status("Arrêté")
+
+        text = mock_entities_controller.exportMetriques()
+
+        assert (
+            'pool_control_status_writes_total{sensor="surpresseurStatus",result="unchanged"} 1'
+            in text
+        )
+
+
+@pytest.mark.unit
+class TestTimestampSensor:
+    """Tests for PoolControlTimestampSensor."""
+
+    def test_no_phase(self, mock_entities_controller):
+        """Test the sensor is unknown while no phase is running."""
+        sensor = PoolControlTimestampSensor(
+            mock_entities_controller,
+            "Fin Surpresseur",
+            "pool_control_surpresseur_fin",
+            "surpresseurFinStatus",
+        )
+
+        assert sensor.native_value is None
+
+    @pytest.mark.asyncio
+    async def test_one_write_per_phase(self, mock_entities_controller):
+        """Test the end of the phase is written once as a UTC datetime."""
+        sensor = PoolControlTimestampSensor(
+            mock_entities_controller,
+            "Fin Surpresseur",
+            "pool_control_surpresseur_fin",
+            "surpresseurFinStatus",
+        )
+        sensor.hass = mock_entities_controller.hass
+        sensor.async_write_ha_state = Mock()
+        await sensor.async_added_to_hass()
+
+        mock_entities_controller.surpresseurFinStatus.set_status(1_700_000_000)
+        mock_entities_controller.surpresseurFinStatus.set_status(1_700_000_000)
+
+        sensor.async_write_ha_state.assert_called_once()
+        assert sensor.native_value == datetime.fromtimestamp(1_700_000_000, timezone.utc)
+
+
+@pytest.mark.unit
+class TestLavagePhaseSensor:
+    """Tests for PoolControlLavagePhaseSensor."""
+
+    def test_options(self, mock_entities_controller):
+        """Test the sensor starts stopped and lists every phase."""
+        from custom_components.pool_control.lavage import LAVAGE_PHASES
+
+        sensor = PoolControlLavagePhaseSensor(
+            mock_entities_controller,
+            "Phase Lavage Filtre",
+            "pool_control_filtre_sable_lavage_phase",
+            "filtreSableLavagePhaseStatus",
+        )
+
+        assert sensor.options == list(LAVAGE_PHASES)
+        assert sensor.native_value == "arret"
+
+        mock_entities_controller.filtreSableLavagePhaseStatus.set_status("rincage")
+
+        assert sensor.native_value == "rincage"
+
+
+@pytest.mark.unit
+class TestMeasureSensor:
+    """Tests for PoolControlMeasureSensor."""
+
+    def test_statistics(self, mock_entities_controller):
+        """Test the sensor is a measurement with its device class and unit."""
+        from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
+        from homeassistant.const import UnitOfTemperature
+
+        sensor = PoolControlMeasureSensor(
+            mock_entities_controller,
+            "Température de calcul",
+            "pool_control_temperature_calcul",
+            "temperatureCalculStatus",
+            SensorDeviceClass.TEMPERATURE,
+            UnitOfTemperature.CELSIUS,
+        )
+
+        assert sensor.state_class == SensorStateClass.MEASUREMENT
+        assert sensor.device_class == SensorDeviceClass.TEMPERATURE
+        assert sensor.native_unit_of_measurement == UnitOfTemperature.CELSIUS
+        assert sensor.native_value is None
+
+        mock_entities_controller.temperatureCalculStatus.set_status(24.5)
+
+        assert sensor.native_value == 24.5
+
+
+def restored(sensor, native_value):
+    """Make the sensor find its last state from before the restart."""
+    from homeassistant.components.sensor import SensorExtraStoredData
+
+    sensor.async_get_last_sensor_data = AsyncMock(
+        return_value=SensorExtraStoredData(native_value, None)
+    )
+
+
+@pytest.mark.unit
+class TestRestore:
+    """Tests for the restoration of the last state."""
+
+    @pytest.mark.asyncio
+    async def test_restores_last_status(self, mock_entities_controller):
+        """Test the last status replaces the default state, without a write."""
+        sensor = PoolControlStatusSensor(
+            mock_entities_controller,
+            "Status Filtration",
+            "pool_control_filtration_status",
+            "filtrationStatus",
+        )
+        sensor.hass = mock_entities_controller.hass
+        sensor.async_write_ha_state = Mock()
+        restored(sensor, "Actif")
+
+        await sensor.async_added_to_hass()
+
+        assert sensor.native_value == "Actif"
+        sensor.async_write_ha_state.assert_not_called()
+
+        # Même valeur recalculée par le cron : aucune écriture
+        mock_entities_controller.filtrationStatus.set_status("Actif")
+        sensor.async_write_ha_state.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_controller_value_wins(self, mock_entities_controller):
+        """Test a status already published by the controller is kept."""
+        mock_entities_controller.filtrationScheduleStatus.set_status("10:00-16:00 : 24.0°C")
+        sensor = PoolControlStatusSensor(
+            mock_entities_controller,
+            "Planning de Filtration",
+            "pool_control_filtration_schedule",
+            "filtrationScheduleStatus",
+            default_state="",
+        )
+        sensor.hass = mock_entities_controller.hass
+        restored(sensor, "08:00-14:00 : 20.0°C")
+
+        await sensor.async_added_to_hass()
+
+        assert sensor.native_value == "10:00-16:00 : 24.0°C"
+        sensor.async_get_last_sensor_data.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_nothing_to_restore(self, mock_entities_controller):
+        """Test the default state is kept without a previous state."""
+        sensor = PoolControlStatusSensor(
+            mock_entities_controller,
+            "Status Surpresseur",
+            "pool_control_surpresseur_status",
+            "surpresseurStatus",
+        )
+        sensor.hass = mock_entities_controller.hass
+        sensor.async_get_last_sensor_data = AsyncMock(return_value=None)
+
+        await sensor.async_added_to_hass()
+
+        assert sensor.native_value == "Arrêté"
+
+    @pytest.mark.asyncio
+    async def test_restores_timestamp(self, mock_entities_controller):
+        """Test the restored datetime becomes the controller timestamp."""
+        sensor = PoolControlTimestampSensor(
+            mock_entities_controller,
+            "Fin Filtration",
+            "pool_control_filtration_fin",
+            "filtrationFinStatus",
+        )
+        sensor.hass = mock_entities_controller.hass
+        restored(sensor, datetime.fromtimestamp(1_700_000_000, timezone.utc))
+
+        await sensor.async_added_to_hass()
+
+        assert sensor._state == 1_700_000_000
+        assert sensor.native_value == datetime.fromtimestamp(1_700_000_000, timezone.utc)
@@ -14,7 +14,7 @@ Functions tested:
 1. getHivernage() - Determine if in winter mode
 2. getStatusHivernage() - Get status with mode suffix
 3. calculateTimeFiltrationHivernage() - Calculate filtration time
-4. calculateStatusFiltrationHivernage() - Determine filtration state
+4. calculateStatusFiltrationHivernage() - Determine filtration state, daily rollover
 5. calculateTimeFiltrationWithTemperatureHivernage() - Temp/3 calculation (from utils)
 """
 
@@ -303,6 +303,25 @@ class TestCalculateTimeFiltrationHivernage:
 
         assert debut_date == expected_date
 
+    def test_tomorrow_flag_later_sunrise(self, mock_hivernage_controller):
+        """Test tomorrow's window is not placed today when the sunrise moves later."""
+        mock_hivernage_controller.data["temperatureMaxi"] = 0
+        # Plage terminée au lever d'aujourd'hui, le lever de demain est plus tard
+        mock_hivernage_controller.getLeverSoleil = Mock(return_value="06:31")
+        mock_hivernage_controller.data["filtrationFin"] = int(
+            datetime(2025, 12, 15, 6, 30).timestamp()
+        )
+        current_time = datetime(2025, 12, 15, 6, 30, 1).timestamp()
+
+        with patch('time.time', return_value=current_time):
+            mock_hivernage_controller.calculateTimeFiltrationHivernage(12.0, True)
+
+        debut = mock_hivernage_controller.get_data("filtrationDebut")
+        fin = mock_hivernage_controller.get_data("filtrationFin")
+
+        assert datetime.fromtimestamp(debut) == datetime(2025, 12, 16, 5, 11)
+        assert datetime.fromtimestamp(fin) == datetime(2025, 12, 16, 9, 11)
+
     def test_tomorrow_flag_resets_temperature_maxi(self, mock_hivernage_controller):
         """Test that flgTomorrow=True resets temperatureMaxi."""
         mock_hivernage_controller.data["temperatureMaxi"] = 15.0
@@ -342,6 +361,21 @@ class TestCalculateTimeFiltrationHivernage:
         assert call_args.startswith("* ")
         assert "°C" in call_args
 
+    def test_publishes_schedule_values(self, mock_hivernage_controller):
+        """Test the winter schedule is published without pause."""
+        mock_hivernage_controller.data["temperatureMaxi"] = 0
+
+        with patch('time.time', return_value=datetime(2025, 12, 15, 5, 0).timestamp()):
+            mock_hivernage_controller.calculateTimeFiltrationHivernage(12.0, False)
+
+        controller = mock_hivernage_controller
+        assert controller.filtrationDebutStatus.value == controller.get_data("filtrationDebut")
+        assert controller.filtrationFinStatus.value == controller.get_data("filtrationFin")
+        assert controller.filtrationPauseDebutStatus.value is None
+        assert controller.filtrationPauseFinStatus.value is None
+        assert controller.filtrationDureeStatus.value == 4 * 3600
+        assert controller.temperatureCalculStatus.value == 12.0
+
 
 @pytest.mark.unit
 class TestCalculateStatusFiltrationHivernage:
@@ -512,8 +546,8 @@ class TestCalculateStatusFiltrationHivernage:
         mock_hivernage_controller.data["filtrationFin"] = int(fin)
 
         # Time is 02:02 (in 5-minute window)
-        with patch('custom_components.pool_control.hivernage.datetime') as mock_dt:
-            mock_dt.now.return_value.strftime.return_value = "0202"
+        with patch.object(mock_hivernage_controller.horloge, "now") as mock_now:
+            mock_now.return_value.strftime.return_value = "0202"
             with patch('time.time', return_value=datetime(2025, 12, 15, 2, 2).timestamp()):
                 await mock_hivernage_controller.calculateStatusFiltrationHivernage(10.0, 5.0)
 
@@ -535,8 +569,8 @@ class TestCalculateStatusFiltrationHivernage:
         time_slots = ["0202", "0502", "0802", "1102", "1402", "1702", "2002", "2302"]
 
         for time_slot in time_slots:
-            with patch('custom_components.pool_control.hivernage.datetime') as mock_dt:
-                mock_dt.now.return_value.strftime.return_value = time_slot
+            with patch.object(mock_hivernage_controller.horloge, "now") as mock_now:
+                mock_now.return_value.strftime.return_value = time_slot
                 with patch('time.time', return_value=datetime(2025, 12, 15, 2, 2).timestamp()):
                     await mock_hivernage_controller.calculateStatusFiltrationHivernage(10.0, 5.0)
 
@@ -556,8 +590,8 @@ class TestCalculateStatusFiltrationHivernage:
         mock_hivernage_controller.data["calculateStatus"] = 0
 
         # Time is 02:10 (outside 5-minute window)
-        with patch('custom_components.pool_control.hivernage.datetime') as mock_dt:
-            mock_dt.now.return_value.strftime.return_value = "0210"
+        with patch.object(mock_hivernage_controller.horloge, "now") as mock_now:
+            mock_now.return_value.strftime.return_value = "0210"
             with patch('time.time', return_value=datetime(2025, 12, 15, 12, 0).timestamp()):
                 with patch.object(mock_hivernage_controller, 'calculateTimeFiltrationHivernage'):
                     await mock_hivernage_controller.calculateStatusFiltrationHivernage(10.0, 5.0)
@@ -602,6 +636,34 @@ class TestCalculateStatusFiltrationHivernage:
             # Should call calculateTimeFiltrationHivernage with flgTomorrow=True
             mock_calc.assert_called_with(10.0, True)
 
+    @pytest.mark.asyncio
+    async def test_daily_window_with_later_sunrise(self, mock_hivernage_controller):
+        """Test the filtration runs every day while the sunrise moves later."""
+        mock_hivernage_controller.distributionDatePivotHivernage = 4  # 1/1 <>
+        debut = datetime(2025, 10, 1, 0, 0, 1)
+        minutesMarche = {}
+
+        for minute in range(4 * 24 * 60):
+            instant = debut + timedelta(minutes=minute)
+            # Lever du lendemain une minute plus tard chaque jour
+            lever = 7 * 60 + 20 + (instant - debut).days + (instant.hour >= 7)
+            mock_hivernage_controller.getLeverSoleil = Mock(
+                return_value=f"{lever // 60:02d}:{lever % 60:02d}"
+            )
+
+            with patch('time.time', return_value=instant.timestamp()):
+                await mock_hivernage_controller.calculateStatusFiltrationHivernage(
+                    12.0, 5.0
+                )
+
+            if mock_hivernage_controller.get_data("filtrationHivernage") == 1:
+                minutesMarche[instant.date()] = minutesMarche.get(instant.date(), 0) + 1
+
+        jours = [debut.date() + timedelta(days=jour) for jour in range(4)]
+        assert [minutesMarche.get(jour, 0) for jour in jours] == [
+            pytest.approx(240, abs=2)
+        ] * 4
+
     @pytest.mark.asyncio
     async def test_resets_filtration_temperature(self, mock_hivernage_controller):
         """Test that filtrationTemperature is reset to 0."""
@@ -0,0 +1,96 @@
+"""Tests for horloge.py module - Injectable clock.
+
+Tests the system clock, the virtual clock and the controller reading every
+deadline from its injected clock.
+
+Functions tested:
+1. Horloge.time() / now() - System clock
+2. HorlogeVirtuelle.time() / now() / avancer() - Virtual clock
+3. PoolController.horloge - Schedules computed on the injected clock
+"""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+# Skip all tests if Home Assistant is not installed
+pytest.importorskip("homeassistant")
+
+from custom_components.pool_control.horloge import Horloge, HorlogeVirtuelle
+
+
+@pytest.fixture
+def mock_horloge_controller(mock_hass, mock_pool_config):
+    """Create a controller running on a virtual clock."""
+    from custom_components.pool_control.controller import PoolController
+
+    controller = PoolController(mock_hass, mock_pool_config)
+    controller.horloge = HorlogeVirtuelle(datetime(2025, 6, 15, 10, 0).timestamp())
+    controller.filtrationTimeStatus = MagicMock()
+    controller.filtrationScheduleStatus = MagicMock()
+    controller.getLeverSoleil = MagicMock(return_value="06:30")
+    return controller
+
+
+@pytest.mark.unit
+class TestHorloge:
+    """Tests for the system clock."""
+
+    def test_follows_time(self):
+        """Test the system clock reads time.time at each call."""
+        instant = datetime(2025, 6, 15, 10, 0)
+
+        with patch("time.time", return_value=instant.timestamp()):
+            assert Horloge().time() == instant.timestamp()
+            assert Horloge().now() == instant
+
+
+@pytest.mark.unit
+class TestHorlogeVirtuelle:
+    """Tests for the virtual clock."""
+
+    def test_avancer(self):
+        """Test the virtual clock only moves when advanced."""
+        horloge = HorlogeVirtuelle(datetime(2025, 6, 15, 23, 59).timestamp())
+
+        horloge.avancer(120)
+
+        assert horloge.now() == datetime(2025, 6, 16, 0, 1)
+        assert horloge.time() == datetime(2025, 6, 16, 0, 1).timestamp()
+
+
+@pytest.mark.unit
+class TestController:
+    """Tests for the controller reading its injected clock."""
+
+    def test_schedule_on_virtual_day(self, mock_horloge_controller):
+        """Test the schedule is computed for the day of the virtual clock."""
+        mock_horloge_controller.calculateTimeFiltration(20.0, False)
+
+        debut = datetime.fromtimestamp(mock_horloge_controller.get_data("filtrationDebut"))
+        assert debut.date() == datetime(2025, 6, 15).date()
+
+    def test_tomorrow_on_virtual_day(self, mock_horloge_controller):
+        """Test the next day schedule follows the virtual clock."""
+        mock_horloge_controller.horloge.avancer(10 * 3600)
+
+        mock_horloge_controller.calculateTimeFiltration(20.0, True)
+
+        debut = datetime.fromtimestamp(mock_horloge_controller.get_data("filtrationDebut"))
+        assert debut.date() == datetime(2025, 6, 16).date()
+
+    @pytest.mark.asyncio
+    async def test_surpresseur_deadline(self, mock_horloge_controller):
+        """Test the booster pump deadline is taken on the virtual clock."""
+        mock_horloge_controller.activatingDevices = AsyncMock()
+        mock_horloge_controller.startSecondCron = AsyncMock()
+        mock_horloge_controller.surpresseurStatus = MagicMock()
+        mock_horloge_controller.surpresseurFinStatus = MagicMock()
+
+        await mock_horloge_controller.executeSurpresseurOn()
+
+        assert mock_horloge_controller.get_data("filtrationTempsRestant") == (
+            datetime(2025, 6, 15, 10, 0).timestamp()
+            + mock_horloge_controller.surpresseurDuree * 60
+        )
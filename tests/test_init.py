@@ -0,0 +1,291 @@
+"""Tests for __init__.py module - Config entry setup with several pools.
+
+Tests one controller per config entry: controllers keyed by entry_id,
+per-entry stores, unique_ids namespaced by entry and platform lookup.
+
+Functions tested:
+1. async_setup_entry() / async_unload_entry() - Many entries in one instance
+2. getController() - Controller lookup by entry_id
+3. _async_migrate_unique_id() - Single-pool unique_ids migration
+4. PoolController.async_migrate_store() - Single-pool store migration
+5. get_decisions service - Pool selection
+6. async_get_options_flow() - Flow modules loaded on demand
+"""
+
+import os
+import subprocess
+import sys
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+
+# Skip all tests if Home Assistant is not installed
+pytest.importorskip("homeassistant")
+
+from homeassistant.core import CoreState
+from homeassistant.exceptions import ServiceValidationError
+
+from custom_components.pool_control import (
+    _async_migrate_unique_id,
+    async_get_options_flow,
+    async_setup_entry,
+    async_unload_entry,
+    getController,
+)
+from custom_components.pool_control.const import DOMAIN, SERVICE_GET_DECISIONS
+
+ENTRIES = 50
+
+
+def make_store(hass, version, key):
+    """Create an in-memory store."""
+    store = MagicMock()
+    store.key = key
+    store.async_load = AsyncMock(return_value=None)
+    store.async_save = AsyncMock()
+    store.async_remove = AsyncMock()
+    return store
+
+
+def make_entry(index, mock_pool_config):
+    """Create a config entry for a pool."""
+    entry = MagicMock()
+    entry.entry_id = f"entry_{index}"
+    entry.title = f"Bassin {index}"
+    entry.data = dict(mock_pool_config)
+    entry.options = {}
+    return entry
+
+
+@pytest.fixture
+def mock_setup_hass(mock_hass):
+    """Create a hass able to set up and unload entries."""
+    # Entries ajoutées sur une instance démarrée
+    mock_hass.state = CoreState.running
+    mock_hass.bus = MagicMock()
+    mock_hass.http = MagicMock()
+    mock_hass.config_entries = MagicMock()
+    mock_hass.config_entries.async_forward_entry_setups = AsyncMock()
+    mock_hass.config_entries.async_unload_platforms = AsyncMock(return_value=True)
+
+    services = set()
+    mock_hass.services.has_service = Mock(side_effect=lambda d, s: (d, s) in services)
+    mock_hass.services.async_register = Mock(
+        side_effect=lambda d, s, *args, **kwargs: services.add((d, s))
+    )
+    mock_hass.services.async_remove = Mock(side_effect=lambda d, s: services.discard((d, s)))
+    mock_hass.registered_services = services
+
+    with patch(
+        "custom_components.pool_control.controller.Store", side_effect=make_store
+    ), patch(
+        "custom_components.pool_control.er.async_migrate_entries", new=AsyncMock()
+    ), patch(
+        "custom_components.pool_control.planificateur.async_track_time_interval",
+        return_value=Mock(),
+    ) as mock_track, patch(
+        "custom_components.pool_control.lectures.async_track_state_change_event",
+        return_value=Mock(),
+    ) as mock_track_state:
+        mock_hass.mock_track = mock_track
+        mock_hass.mock_track_state = mock_track_state
+        yield mock_hass
+
+
+@pytest.fixture
+def entries(mock_pool_config):
+    """Create the config entries of many pools."""
+    return [make_entry(index, mock_pool_config) for index in range(ENTRIES)]
+
+
+@pytest.mark.unit
+class TestSeveralEntries:
+    """Tests for many pools in a single instance."""
+
+    @pytest.mark.asyncio
+    async def test_one_controller_per_entry(self, mock_setup_hass, entries, mock_pool_config):
+        """Test each entry gets its own controller and store."""
+        for entry in entries:
+            assert await async_setup_entry(mock_setup_hass, entry)
+
+        controllers = mock_setup_hass.data[DOMAIN]
+        assert list(controllers) == [entry.entry_id for entry in entries]
+        assert len({id(controller) for controller in controllers.values()}) == ENTRIES
+        assert len({controller.store.key for controller in controllers.values()}) == ENTRIES
+        assert controllers["entry_3"].store.key == "pool_control_data.entry_3"
+        assert controllers["entry_3"].title == "Bassin 3"
+
+        # Un seul service, une seule vue et une seule minuterie pour toutes les entrées
+        mock_setup_hass.services.async_register.assert_called_once()
+        mock_setup_hass.http.register_view.assert_called_once()
+        mock_setup_hass.mock_track.assert_called_once()
+        planificateur = mock_setup_hass.data[f"{DOMAIN}_planificateur"]
+        assert planificateur.taches == ENTRIES
+        assert all(c.planificateur is planificateur for c in controllers.values())
+
+        # Capteurs extérieurs communs : suivis une fois pour toutes les entrées
+        cache = mock_setup_hass.data[f"{DOMAIN}_lectures"]
+        assert set(cache.entrees) == {
+            mock_pool_config["temperatureWater"],
+            mock_pool_config["temperatureOutdoor"],
+            mock_pool_config["leverSoleil"],
+        }
+        assert mock_setup_hass.mock_track_state.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_unique_ids_namespaced(self, mock_setup_hass, entries):
+        """Test platforms set up the entities of the right controller."""
+        from custom_components.pool_control import button, sensor
+
+        unique_ids = []
+        for entry in entries:
+            await async_setup_entry(mock_setup_hass, entry)
+            for platform in (sensor, button):
+                add_entities = Mock()
+                await platform.async_setup_entry(mock_setup_hass, entry, add_entities)
+                for entity in add_entities.call_args[0][0]:
+                    assert entity._controller is mock_setup_hass.data[DOMAIN][entry.entry_id]
+                    assert entity.unique_id.startswith(f"{entry.entry_id}_pool_control_")
+                    assert entity.device_info["name"] == entry.title
+                    unique_ids.append(entity.unique_id)
+
+        assert len(unique_ids) == len(set(unique_ids))
+        assert len(unique_ids) % ENTRIES == 0
+
+    @pytest.mark.asyncio
+    async def test_status_isolated(self, mock_setup_hass, entries):
+        """Test a status of one pool does not reach the sensors of another."""
+        for entry in entries[:2]:
+            await async_setup_entry(mock_setup_hass, entry)
+        piscine, spa = mock_setup_hass.data[DOMAIN].values()
+
+        piscine.filtrationStatus.set_status("Actif")
+
+        assert piscine.filtrationStatus.value == "Actif"
+        assert spa.filtrationStatus.value is None
+
+    @pytest.mark.asyncio
+    async def test_unload_keeps_other_pools(self, mock_setup_hass, entries):
+        """Test unloading one entry keeps the others and the service."""
+        for entry in entries:
+            await async_setup_entry(mock_setup_hass, entry)
+
+        for entry in entries[:-1]:
+            assert await async_unload_entry(mock_setup_hass, entry)
+            assert entry.entry_id not in mock_setup_hass.data[DOMAIN]
+            assert (DOMAIN, SERVICE_GET_DECISIONS) in mock_setup_hass.registered_services
+
+        assert list(mock_setup_hass.data[DOMAIN]) == [entries[-1].entry_id]
+
+        await async_unload_entry(mock_setup_hass, entries[-1])
+
+        assert DOMAIN not in mock_setup_hass.data
+        assert f"{DOMAIN}_planificateur" not in mock_setup_hass.data
+        assert f"{DOMAIN}_lectures" not in mock_setup_hass.data
+        assert (DOMAIN, SERVICE_GET_DECISIONS) not in mock_setup_hass.registered_services
+        mock_setup_hass.mock_track.return_value.assert_called_once()
+        assert mock_setup_hass.mock_track_state.return_value.call_count == 3
+
+
+@pytest.mark.unit
+class TestGetController:
+    """Tests for getController()."""
+
+    def test_lookup(self, mock_hass):
+        """Test the controller is found by entry_id, or alone without it."""
+        piscine, spa = Mock(), Mock()
+
+        mock_hass.data = {DOMAIN: {"piscine": piscine}}
+        assert getController(mock_hass) is piscine
+
+        mock_hass.data = {DOMAIN: {"piscine": piscine, "spa": spa}}
+        assert getController(mock_hass) is None
+        assert getController(mock_hass, "spa") is spa
+        assert getController(mock_hass, "inconnu") is None
+
+    @pytest.mark.asyncio
+    async def test_service_requires_entry_with_several_pools(self, mock_setup_hass, entries):
+        """Test get_decisions asks for the pool when several are loaded."""
+        for entry in entries[:2]:
+            await async_setup_entry(mock_setup_hass, entry)
+        handler = mock_setup_hass.services.async_register.call_args[0][2]
+
+        with pytest.raises(ServiceValidationError):
+            await handler(Mock(data={}))
+
+        mock_setup_hass.data[DOMAIN]["entry_1"].getDecisions = Mock(return_value=[])
+        response = await handler(Mock(data={"config_entry_id": "entry_1"}))
+
+        assert response == {"decisions": []}
+
+
+@pytest.mark.unit
+class TestMigration:
+    """Tests for the migration from the single-pool layout."""
+
+    def test_unique_id(self):
+        """Test single-pool unique_ids are prefixed once."""
+        migrate = _async_migrate_unique_id(Mock(entry_id="test_entry_id"))
+
+        assert migrate(Mock(unique_id="pool_control_reset")) == {
+            "new_unique_id": "test_entry_id_pool_control_reset"
+        }
+        assert migrate(Mock(unique_id="test_entry_id_pool_control_reset")) is None
+
+    @pytest.mark.asyncio
+    async def test_store(self, mock_hass, mock_pool_config):
+        """Test the single-pool store is moved to the entry store."""
+        from custom_components.pool_control.controller import PoolController
+
+        mock_hass.bus = MagicMock()
+        stores = {}
+
+        def store(hass, version, key):
+            stores.setdefault(key, make_store(hass, version, key))
+            return stores[key]
+
+        with patch("custom_components.pool_control.controller.Store", side_effect=store):
+            controller = PoolController(mock_hass, mock_pool_config, "entry")
+            stores["pool_control_data"] = make_store(mock_hass, 1, "pool_control_data")
+            stores["pool_control_data"].async_load.return_value = {"marcheForcee": 1}
+
+            await controller.async_initialize()
+
+        assert controller.data == {"marcheForcee": 1}
+        stores["pool_control_data.entry"].async_save.assert_called_once_with(
+            {"marcheForcee": 1}
+        )
+        stores["pool_control_data"].async_remove.assert_called_once()
+
+
+@pytest.mark.unit
+class TestLazyImports:
+    """Tests for the flow modules loaded only when a flow is opened."""
+
+    def test_import_without_flows(self):
+        """Test importing the integration loads neither flow module."""
+        racine = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        resultat = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, custom_components.pool_control; "
+                "print(sorted(m for m in sys.modules if m.endswith('_flow')))",
+            ],
+            cwd=racine,
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+
+        assert "pool_control" not in resultat.stdout
+
+    async def test_options_flow_on_demand(self):
+        """Test the options flow handler is built when requested."""
+        from custom_components.pool_control.options_flow import (
+            PoolControlOptionsFlowHandler,
+        )
+
+        flow = await async_get_options_flow(MagicMock())
+
+        assert isinstance(flow, PoolControlOptionsFlowHandler)
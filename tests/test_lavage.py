@@ -5,14 +5,16 @@ sand filter cleaning process through multiple states.
 
 State Machine:
 - State 0: Stopped → State 1 (Stop, washing position)
-- State 1: Washing position → State 2 (Washing) or State 4 (if rinse = 0)
-- State 2: Washing → State 3 (Stop, rinse position)
+- State 1: Washing position → State 2 (Washing)
+- State 2: Washing → State 3 (Stop, rinse position) or State 5 (if rinse = 0)
 - State 3: Rinse position → State 4 (Rinsing)
 - State 4: Rinsing → State 5 (Stop, filtration position)
 - State 5: Filtration position → State 0 (Stopped)
 
 Functions tested:
 1. executeFiltreSableLavageOn() - Main state machine function
+2. arreterLavage() / etatLavage() - Interrupted cycle, unknown stored phase
+3. MachineEtats - Table checks, skipped phases, transitions, deadline
 """
 
 import pytest
@@ -89,16 +91,19 @@ class TestLavageStateTransitions:
         mock_lavage_controller.activatingDevices.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_state_1_skip_to_4_when_rinse_zero(self, mock_lavage_controller):
-        """Test state 1 skips to state 4 when rinse duration is 0."""
+    async def test_state_2_skip_to_5_when_rinse_zero(self, mock_lavage_controller):
+        """Test state 2 skips the rinse states when rinse duration is 0."""
         mock_lavage_controller.data["filtrationSurpresseur"] = 0
-        mock_lavage_controller.data["filtrationLavageEtat"] = 1
+        mock_lavage_controller.data["filtrationLavageEtat"] = 2
         mock_lavage_controller.rincageDuree = 0  # No rinse
 
         await mock_lavage_controller.executeFiltreSableLavageOn()
 
-        # Should skip directly to state 4
-        assert mock_lavage_controller.get_data("filtrationLavageEtat") == 4
+        # Should skip directly to state 5
+        assert mock_lavage_controller.get_data("filtrationLavageEtat") == 5
+        mock_lavage_controller.filtreSableLavageStatus.set_status.assert_called_once_with(
+            "Arrêt, position filtration"
+        )
 
     @pytest.mark.asyncio
     async def test_state_2_to_3_transition(self, mock_lavage_controller):
@@ -181,10 +186,10 @@ class TestLavageStatusDisplay:
         with patch('time.time', return_value=1000.0):
             await mock_lavage_controller.executeFiltreSableLavageOn()
 
-        # Status should show "Lavage : MM:SS"
-        call_args = mock_lavage_controller.filtreSableLavageStatus.set_status.call_args[0][0]
-        assert call_args.startswith("Lavage : ")
-        assert ":" in call_args.split(" : ")[1]  # Time format
+        # Status shows the phase, the end timestamp carries the countdown
+        mock_lavage_controller.filtreSableLavageStatus.set_status.assert_called_with("Lavage")
+        assert mock_lavage_controller.filtreSableLavageFinStatus.value == 1300
+        assert mock_lavage_controller.filtreSableLavagePhaseStatus.value == "lavage"
 
     @pytest.mark.asyncio
     async def test_rinsing_status_display_format(self, mock_lavage_controller):
@@ -196,10 +201,10 @@ class TestLavageStatusDisplay:
         with patch('time.time', return_value=2000.0):
             await mock_lavage_controller.executeFiltreSableLavageOn()
 
-        # Status should show "Rinçage : MM:SS"
-        call_args = mock_lavage_controller.filtreSableLavageStatus.set_status.call_args[0][0]
-        assert call_args.startswith("Rinçage : ")
-        assert ":" in call_args.split(" : ")[1]  # Time format
+        # Status shows the phase, the end timestamp carries the countdown
+        mock_lavage_controller.filtreSableLavageStatus.set_status.assert_called_with("Rinçage")
+        assert mock_lavage_controller.filtreSableLavageFinStatus.value == 2120
+        assert mock_lavage_controller.filtreSableLavagePhaseStatus.value == "rincage"
 
     @pytest.mark.asyncio
     async def test_status_not_updated_without_status_object(self, mock_lavage_controller):
@@ -248,8 +253,8 @@ class TestLavageTimeCalculation:
         assert mock_lavage_controller.get_data("filtrationTempsRestant") == expected_end_time
 
     @pytest.mark.asyncio
-    async def test_time_display_accuracy(self, mock_lavage_controller):
-        """Test time display shows minutes and seconds correctly."""
+    async def test_end_timestamp_accuracy(self, mock_lavage_controller):
+        """Test the end timestamp is the start plus the washing duration."""
         mock_lavage_controller.data["filtrationSurpresseur"] = 0
         mock_lavage_controller.data["filtrationLavageEtat"] = 1
         mock_lavage_controller.lavageDuree = 5  # 5 minutes = 300 seconds
@@ -257,10 +262,8 @@ class TestLavageTimeCalculation:
         with patch('time.time', return_value=1000.0):
             await mock_lavage_controller.executeFiltreSableLavageOn()
 
-        # Status should show 05:00
-        call_args = mock_lavage_controller.filtreSableLavageStatus.set_status.call_args[0][0]
-        time_part = call_args.split(" : ")[1]
-        assert time_part == "05:00"
+        # 5 minutes after the start
+        assert mock_lavage_controller.filtreSableLavageFinStatus.value == 1000 + 300
 
 
 @pytest.mark.unit
@@ -400,11 +403,11 @@ class TestLavageFullCycle:
         await mock_lavage_controller.executeFiltreSableLavageOn()
         assert mock_lavage_controller.get_data("filtrationLavageEtat") == 1
 
-        # State 1 -> 4 (skips 2 and 3)
+        # State 1 -> 2
         await mock_lavage_controller.executeFiltreSableLavageOn()
-        assert mock_lavage_controller.get_data("filtrationLavageEtat") == 4
+        assert mock_lavage_controller.get_data("filtrationLavageEtat") == 2
 
-        # State 4 -> 5
+        # State 2 -> 5 (skips 3 and 4)
         await mock_lavage_controller.executeFiltreSableLavageOn()
         assert mock_lavage_controller.get_data("filtrationLavageEtat") == 5
 
@@ -419,7 +422,7 @@ class TestLavageFullCycle:
         mock_lavage_controller.data["filtrationLavageEtat"] = 0
         mock_lavage_controller.rincageDuree = 0  # Simplify
 
-        transitions = [0, 1, 4, 5]
+        transitions = [0, 1, 2, 5]
         for _ in transitions:
             await mock_lavage_controller.executeFiltreSableLavageOn()
 
@@ -453,8 +456,193 @@ class TestLavageFullCycle:
 
         # Verify status sequence
         assert "Arrêt, position lavage" in status_calls
-        assert any("Lavage :" in s for s in status_calls)
+        assert "Lavage" in status_calls
         assert "Arrêt, position rinçage" in status_calls
-        assert any("Rinçage :" in s for s in status_calls)
+        assert "Rinçage" in status_calls
         assert "Arrêt, position filtration" in status_calls
         assert "Arrêté" in status_calls
+
+
+@pytest.mark.unit
+class TestPublierPhase:
+    """Tests for the phase and end timestamp published by MachineEtats.publier()."""
+
+    @pytest.mark.asyncio
+    async def test_one_write_per_phase(self, mock_lavage_controller):
+        """Test each phase publishes its phase and end timestamp once."""
+        phase = Mock()
+        fin = Mock()
+        coordinator = mock_lavage_controller.statusCoordinator
+        coordinator.subscribe("filtreSableLavagePhaseStatus", phase)
+        coordinator.subscribe("filtreSableLavageFinStatus", fin)
+        mock_lavage_controller.data["filtrationSurpresseur"] = 0
+        mock_lavage_controller.data["filtrationLavageEtat"] = 0
+
+        with patch('time.time', return_value=1000.0):
+            for _ in range(6):
+                await mock_lavage_controller.executeFiltreSableLavageOn()
+
+        assert [c[0][0] for c in phase.set_status.call_args_list] == [
+            "position_lavage",
+            "lavage",
+            "position_rincage",
+            "rincage",
+            "position_filtration",
+            "arret",
+        ]
+        assert [c[0][0] for c in fin.set_status.call_args_list] == [
+            None,
+            1300,
+            None,
+            1120,
+            None,
+            None,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_without_rinse(self, mock_lavage_controller):
+        """Test washing without rinse is published as the washing phase."""
+        mock_lavage_controller.data["filtrationSurpresseur"] = 0
+        mock_lavage_controller.data["filtrationLavageEtat"] = 1
+        mock_lavage_controller.rincageDuree = 0
+
+        with patch('time.time', return_value=1000.0):
+            await mock_lavage_controller.executeFiltreSableLavageOn()
+
+        assert mock_lavage_controller.filtreSableLavagePhaseStatus.value == "lavage"
+        assert mock_lavage_controller.filtreSableLavageFinStatus.value == 1300
+
+
+@pytest.mark.unit
+class TestArreterLavage:
+    """Tests for arreterLavage() and etatLavage()."""
+
+    @pytest.mark.asyncio
+    async def test_stop_from_any_phase(self, mock_lavage_controller):
+        """Test the cycle can be interrupted from a timed phase."""
+        mock_lavage_controller.data["filtrationLavageEtat"] = 4
+
+        await mock_lavage_controller.arreterLavage()
+
+        assert mock_lavage_controller.get_data("filtrationLavageEtat") == 0
+        assert mock_lavage_controller.get_data("filtrationLavage") == 0
+        assert mock_lavage_controller.filtreSableLavagePhaseStatus.value == "arret"
+        assert mock_lavage_controller.filtreSableLavageFinStatus.value is None
+        mock_lavage_controller.stopSecondCron.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_stopped_does_nothing(self, mock_lavage_controller):
+        """Test stopping a stopped cycle sends no command."""
+        await mock_lavage_controller.arreterLavage()
+
+        mock_lavage_controller.activatingDevices.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_unknown_stored_phase(self, mock_lavage_controller):
+        """Test an unknown stored phase is read as stopped, the cycle restarts."""
+        mock_lavage_controller.data["filtrationSurpresseur"] = 0
+        mock_lavage_controller.data["filtrationLavageEtat"] = 9
+
+        assert mock_lavage_controller.etatLavage() == 0
+
+        await mock_lavage_controller.executeFiltreSableLavageOn()
+
+        assert mock_lavage_controller.get_data("filtrationLavageEtat") == 1
+
+    @pytest.mark.asyncio
+    async def test_invalid_transition(self, mock_lavage_controller):
+        """Test a jump over a phase is refused."""
+        mock_lavage_controller.data["filtrationLavageEtat"] = 1
+
+        from custom_components.pool_control.lavage import LAVAGE
+
+        with pytest.raises(ValueError):
+            await LAVAGE.changer(mock_lavage_controller, 4)
+
+        assert mock_lavage_controller.get_data("filtrationLavageEtat") == 1
+        mock_lavage_controller.activatingDevices.assert_not_called()
+
+
+def machineTest(phases):
+    """Create a cycle stored under test keys."""
+    from custom_components.pool_control.machine import MachineEtats
+
+    return MachineEtats(
+        phases,
+        cleEtat="testEtat",
+        cleEcheance="testFin",
+        cleCommande="testCommande",
+        statut="testStatus",
+    )
+
+
+@pytest.mark.unit
+class TestMachineEtats:
+    """Tests for the table-driven engine."""
+
+    def test_table_checked(self):
+        """Test duplicate names and a timed first phase are refused."""
+        from custom_components.pool_control.machine import Phase
+
+        with pytest.raises(ValueError):
+            machineTest((Phase("arret", "Arrêté", 0), Phase("arret", "Arrêté", 0)))
+        with pytest.raises(ValueError):
+            machineTest(
+                (Phase("marche", "Marche", 2, duree="d"), Phase("arret", "Arrêté", 0))
+            )
+
+    def test_new_cycle_without_code(self):
+        """Test a new cycle only needs its table: skipped phases, loop to stop."""
+        from custom_components.pool_control.machine import Phase
+
+        options = {"marche": 10, "purge": 0}
+        machine = machineTest(
+            (
+                Phase("arret", "Arrêté", 0),
+                Phase("marche", "Marche", 2, duree="marche"),
+                Phase("purge", "Purge", 2, duree="purge"),
+                Phase("attente", "Attente", 1, requiert="purge"),
+            )
+        )
+
+        assert machine.suivante(0, options.get) == 1
+        assert machine.suivante(1, options.get) == 0
+        assert machine.phase(1).minutee is True
+
+        with pytest.raises(ValueError):
+            machine.valider(1, 2, options.get)
+        machine.valider(1, 0, options.get)
+
+    @pytest.mark.asyncio
+    async def test_driven_on_controller(self, mock_lavage_controller):
+        """Test the machine stores its phase under its own keys and meets its deadline."""
+        from custom_components.pool_control.horloge import HorlogeVirtuelle
+        from custom_components.pool_control.machine import Phase
+
+        controller = mock_lavage_controller
+        controller.horloge = HorlogeVirtuelle(1000.0)
+        controller.marche = 10
+        controller.testStatus = MagicMock()
+        machine = machineTest(
+            (Phase("arret", "Arrêté", 0), Phase("marche", "Marche", 2, duree="marche"))
+        )
+
+        await machine.avancer(controller)
+
+        assert controller.get_data("testEtat") == 1
+        assert controller.get_data("testFin") == 1600
+        assert controller.get_data("testCommande") == 2
+        controller.testStatus.set_status.assert_called_with("Marche")
+        controller.activatingDevices.assert_called_once()
+        # Le cycle du lavage n'est pas touché
+        assert controller.get_data("filtrationLavageEtat", 0) == 0
+
+        controller.horloge.avancer(599)
+        assert machine.echeanceDepassee(controller) is False
+        controller.horloge.avancer(1)
+        assert machine.echeanceDepassee(controller) is True
+
+        await machine.avancer(controller)
+
+        assert controller.get_data("testEtat") == 0
+        assert machine.echeanceDepassee(controller) is False
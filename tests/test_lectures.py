@@ -0,0 +1,309 @@
+"""Tests for lectures.py module - Shared sensor readings cache.
+
+Tests the domain-wide cache parsing each state change once and fanning the
+typed reading out to every subscribed controller.
+
+Functions tested:
+1. CacheLectures.abonner() - Single listener per entity, initial reading
+2. CacheLectures._handleStateChange() - Single parse, fan-out, unavailability
+3. annuler() - Unsubscription, listener stop
+4. SensorMixin.startLectures() / getters - Controllers reading the cache
+5. Lecture.perimee() / SensorMixin.lecturePerimee() / valeurCapteur() - Age of the
+   last report, fallback on stale readings
+"""
+
+from datetime import datetime, timezone
+from functools import partial
+from unittest.mock import Mock, patch
+
+import pytest
+
+# Skip all tests if Home Assistant is not installed
+pytest.importorskip("homeassistant")
+
+from homeassistant.core import State
+
+from custom_components.pool_control.lectures import (
+    LECTURE_ABSENTE,
+    CacheLectures,
+    Lecture,
+    parseHoraire,
+    parseTemperature,
+)
+
+OUTDOOR = "sensor.outdoor_temperature"
+SUNRISE = "sensor.sun_next_rising"
+MAINTENANT = datetime(2024, 6, 15, 10, 0, tzinfo=timezone.utc)
+
+
+def etat(entity_id, valeur):
+    """Create a state updated at a fixed time."""
+    return State(entity_id, valeur, last_updated=MAINTENANT)
+
+
+def changement(entity_id, valeur):
+    """Create a state change event."""
+    return Mock(data={"entity_id": entity_id, "new_state": etat(entity_id, valeur)})
+
+
+@pytest.fixture
+def cache(mock_hass):
+    """Create a cache with the state tracking mocked."""
+    etats = {OUTDOOR: etat(OUTDOOR, "18.5")}
+    mock_hass.states.get = Mock(side_effect=etats.get)
+
+    with patch(
+        "custom_components.pool_control.lectures.async_track_state_change_event",
+        return_value=Mock(),
+    ) as mock_track:
+        cache = CacheLectures(mock_hass)
+        cache.mock_track = mock_track
+        yield cache
+
+
+@pytest.mark.unit
+class TestAbonner:
+    """Tests for abonner()."""
+
+    def test_single_listener(self, cache):
+        """Test an entity read by many controllers is tracked and parsed once."""
+        rappels = [Mock() for _ in range(10)]
+        for rappel in rappels:
+            cache.abonner(OUTDOOR, parseTemperature, rappel)
+
+        cache.mock_track.assert_called_once()
+        assert cache.analyses == 1
+        for rappel in rappels:
+            lecture = rappel.call_args[0][0]
+            assert lecture.valeur == 18.5
+            assert lecture.horodatage == MAINTENANT.timestamp()
+            assert lecture.indisponible is False
+
+    def test_missing_entity(self, cache):
+        """Test an entity without state gives an empty, unavailable reading."""
+        rappel = Mock()
+        cache.abonner(SUNRISE, parseHoraire, rappel)
+
+        lecture = rappel.call_args[0][0]
+        assert lecture.valeur is None
+        assert lecture.indisponible is True
+
+    def test_conflicting_parser(self, cache):
+        """Test an entity cannot be read with two parsers."""
+        cache.abonner(OUTDOOR, parseTemperature, Mock())
+
+        with pytest.raises(ValueError):
+            cache.abonner(OUTDOOR, parseHoraire, Mock())
+
+
+@pytest.mark.unit
+class TestStateChange:
+    """Tests for _handleStateChange()."""
+
+    def test_fan_out(self, cache):
+        """Test a state change is parsed once and sent to every subscriber."""
+        rappels = [Mock() for _ in range(3)]
+        for rappel in rappels:
+            cache.abonner(OUTDOOR, parseTemperature, rappel)
+
+        cache._handleStateChange(changement(OUTDOOR, "21.0"))
+
+        assert cache.analyses == 2
+        lectures = {id(rappel.call_args[0][0]) for rappel in rappels}
+        assert len(lectures) == 1
+        assert cache.lire(OUTDOOR).valeur == 21.0
+
+    @pytest.mark.parametrize("valeur", ["unavailable", "unknown", "abc"])
+    def test_stale(self, cache, valeur):
+        """Test an invalid state keeps the last valid value, flagged unavailable."""
+        cache.abonner(OUTDOOR, parseTemperature, Mock())
+
+        cache._handleStateChange(changement(OUTDOOR, valeur))
+
+        lecture = cache.lire(OUTDOOR)
+        assert lecture.valeur == 18.5
+        assert lecture.horodatage == MAINTENANT.timestamp()
+        assert lecture.indisponible is True
+
+        cache._handleStateChange(changement(OUTDOOR, "19.0"))
+
+        assert cache.lire(OUTDOOR).indisponible is False
+
+    def test_sunrise(self, cache):
+        """Test the sunrise is parsed into an hour."""
+        cache.abonner(SUNRISE, parseHoraire, Mock())
+
+        cache._handleStateChange(changement(SUNRISE, "2024-06-15T06:12:00+02:00"))
+
+        assert cache.lire(SUNRISE).valeur == "06:12"
+
+
+@pytest.mark.unit
+class TestAnnuler:
+    """Tests for the unsubscription."""
+
+    def test_listener_stops_with_last(self, cache):
+        """Test the entity stays tracked until its last subscriber leaves."""
+        premier = cache.abonner(OUTDOOR, parseTemperature, Mock())
+        second = cache.abonner(OUTDOOR, parseTemperature, Mock())
+
+        premier()
+        premier()
+        cache.mock_track.return_value.assert_not_called()
+
+        second()
+        cache.mock_track.return_value.assert_called_once()
+        assert cache.entrees == {}
+        assert cache.lire(OUTDOOR).valeur is None
+
+
+@pytest.mark.unit
+class TestControllers:
+    """Tests for the controllers reading the shared cache."""
+
+    @pytest.mark.asyncio
+    async def test_shared_readings(self, cache, mock_hass, mock_pool_config):
+        """Test pools sharing sensors read them through one cache entry."""
+        from custom_components.pool_control.horloge import HorlogeVirtuelle
+        from custom_components.pool_control.controller import PoolController
+
+        controllers = [PoolController(mock_hass, mock_pool_config) for _ in range(3)]
+        for controller in controllers:
+            controller.horloge = HorlogeVirtuelle(MAINTENANT.timestamp())
+            controller.cacheLectures = cache
+            await controller.startLectures()
+
+        cache._handleStateChange(changement(OUTDOOR, "25.0"))
+        cache._handleStateChange(changement(SUNRISE, "2024-06-15T06:30:00+02:00"))
+
+        assert cache.mock_track.call_count == 3
+        for controller in controllers:
+            assert controller.getTemperatureOutdoor() == 25.0
+            assert controller.getLeverSoleil() == "06:30"
+            # Capteur d'eau absent
+            assert controller.getTemperatureWater() == 0.0
+
+        for controller in controllers:
+            await controller.stopLectures()
+
+        assert cache.entrees == {}
+        assert controllers[0].lectures == {}
+
+    def test_direct_reading(self, mock_hass, mock_pool_config):
+        """Test a controller without cache reads the states directly."""
+        from custom_components.pool_control.horloge import HorlogeVirtuelle
+        from custom_components.pool_control.controller import PoolController
+
+        etats = {
+            OUTDOOR: etat(OUTDOOR, "12.0"),
+            SUNRISE: etat(SUNRISE, "invalide"),
+        }
+        mock_hass.states.get = Mock(side_effect=etats.get)
+        controller = PoolController(mock_hass, mock_pool_config)
+        controller.horloge = HorlogeVirtuelle(MAINTENANT.timestamp())
+
+        assert controller.getTemperatureOutdoor() == 12.0
+        assert controller.getLeverSoleil() == "06:00"
+        assert controller.getTemperatureWater() == 0.0
+
+
+@pytest.mark.unit
+class TestPerimee:
+    """Tests for the staleness computed from the age of the last report."""
+
+    def test_age(self):
+        """Test a reading is stale once older than the maximum age."""
+        lecture = Lecture(18.5, MAINTENANT.timestamp(), False)
+        maintenant = MAINTENANT.timestamp()
+
+        assert lecture.perimee(maintenant + 3600, 7200) is False
+        assert lecture.perimee(maintenant + 7201, 7200) is True
+        # Sans limite
+        assert lecture.perimee(maintenant + 86400, 0) is False
+
+    def test_unavailable(self):
+        """Test an unavailable or missing reading is always stale."""
+        lecture = Lecture(18.5, MAINTENANT.timestamp(), True)
+
+        assert lecture.perimee(MAINTENANT.timestamp(), 7200) is True
+        assert LECTURE_ABSENTE.perimee(MAINTENANT.timestamp(), 0) is True
+
+    def test_controller_clock(self, cache, mock_hass, mock_pool_config, caplog):
+        """Test the controller ignores a stale reading on its clock and warns once."""
+        from custom_components.pool_control.horloge import HorlogeVirtuelle
+        from custom_components.pool_control.controller import PoolController
+
+        controller = PoolController(mock_hass, mock_pool_config)
+        controller.horloge = HorlogeVirtuelle(MAINTENANT.timestamp())
+        controller.cacheLectures = cache
+        controller.ageMaximumCapteurs = 120
+        rappel = partial(controller._handleLecture, "temperatureOutdoor")
+        cache.abonner(OUTDOOR, parseTemperature, rappel)
+
+        lecture = controller.lireCapteur("temperatureOutdoor", parseTemperature)
+        assert controller.lecturePerimee(lecture) is False
+
+        controller.horloge.avancer(3 * 3600)
+        for _ in range(3):
+            assert controller.getTemperatureOutdoor() == 0.0
+
+        assert controller.lecturePerimee(lecture) is True
+        assert caplog.text.count("not updated for 180 minutes, ignoring 18.5") == 1
+
+        # Un nouveau relevé rafraîchit la lecture
+        cache._handleStateChange(
+            Mock(
+                data={
+                    "entity_id": OUTDOOR,
+                    "new_state": State(
+                        OUTDOOR,
+                        "19.0",
+                        last_updated=datetime.fromtimestamp(
+                            controller.horloge.time(), timezone.utc
+                        ),
+                    ),
+                }
+            )
+        )
+        assert controller.getTemperatureOutdoor() == 19.0
+        assert controller.lecturesPerimees == set()
+
+    def test_unavailable_then_stale(self, cache, mock_hass, mock_pool_config):
+        """Test an unavailable sensor keeps its value until it is stale, then falls back."""
+        from custom_components.pool_control.horloge import HorlogeVirtuelle
+        from custom_components.pool_control.controller import PoolController
+
+        controller = PoolController(mock_hass, mock_pool_config)
+        controller.horloge = HorlogeVirtuelle(MAINTENANT.timestamp())
+        controller.cacheLectures = cache
+        controller.ageMaximumCapteurs = 120
+        rappel = partial(controller._handleLecture, "temperatureOutdoor")
+        cache.abonner(OUTDOOR, parseTemperature, rappel)
+
+        cache._handleStateChange(changement(OUTDOOR, "unavailable"))
+        lecture = controller.lireCapteur("temperatureOutdoor", parseTemperature)
+        assert lecture.valeur == 18.5
+        assert lecture.indisponible is True
+        assert controller.getTemperatureOutdoor() == 0.0
+
+        controller.horloge.avancer(3 * 3600)
+        assert controller.getTemperatureOutdoor() == 0.0
+
+    def test_same_fallback_without_cache(self, mock_hass, mock_pool_config):
+        """Test the direct reading falls back like the cache when stale or unavailable."""
+        from custom_components.pool_control.horloge import HorlogeVirtuelle
+        from custom_components.pool_control.controller import PoolController
+
+        etats = {OUTDOOR: etat(OUTDOOR, "18.5")}
+        mock_hass.states.get = Mock(side_effect=etats.get)
+        controller = PoolController(mock_hass, mock_pool_config)
+        controller.horloge = HorlogeVirtuelle(MAINTENANT.timestamp())
+        controller.ageMaximumCapteurs = 120
+
+        assert controller.getTemperatureOutdoor() == 18.5
+
+        controller.horloge.avancer(3 * 3600)
+        assert controller.getTemperatureOutdoor() == 0.0
+
+        etats[OUTDOOR] = etat(OUTDOOR, "unavailable")
+        assert controller.getTemperatureOutdoor() == 0.0
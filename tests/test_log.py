@@ -0,0 +1,46 @@
+"""Tests for log.py module - Logging helpers.
+
+Functions tested:
+1. LazyTimestamp - Formatting deferred until the record is emitted
+2. DECISION_LOGGER - Dedicated decision logger
+"""
+
+import logging
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.pool_control.log import DECISION_LOGGER, LazyTimestamp
+
+
+@pytest.mark.unit
+class TestLazyTimestamp:
+    """Tests for LazyTimestamp."""
+
+    def test_formats_timestamp(self):
+        """Test the timestamp is formatted with the given format."""
+        from datetime import datetime
+
+        timestamp = datetime(2024, 6, 15, 10, 30).timestamp()
+
+        assert str(LazyTimestamp(timestamp)) == "10:30 15-06-2024"
+        assert str(LazyTimestamp(timestamp, "%H:%M")) == "10:30"
+
+    def test_not_formatted_when_disabled(self):
+        """Test nothing is formatted when the debug level is disabled."""
+        DECISION_LOGGER.setLevel(logging.INFO)
+        try:
+            with patch.object(LazyTimestamp, "__str__") as mock_str:
+                DECISION_LOGGER.debug("timeNow=%s", LazyTimestamp(0.0))
+            mock_str.assert_not_called()
+        finally:
+            DECISION_LOGGER.setLevel(logging.NOTSET)
+
+
+@pytest.mark.unit
+class TestDecisionLogger:
+    """Tests for the decision logger."""
+
+    def test_logger_name(self):
+        """Test the decision logger is a child of the integration logger."""
+        assert DECISION_LOGGER.name == "custom_components.pool_control.decision"
@@ -0,0 +1,230 @@
+"""Tests for metriques.py module - Prometheus metrics exporter.
+
+Tests the counters and gauges kept incrementally by the controller and their
+Prometheus text exposition.
+
+Functions tested:
+1. Histogramme - Fixed bucket histogram
+2. compterCommande() - Commands sent / failed / avoided
+3. observerCycle() / observerEquipements() - Passes and device runtime
+4. compterEcritureStore() - Store writes
+5. exportMetriques() - Prometheus text format
+6. PoolControlMetricsView - HTTP view
+"""
+
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+
+# Skip all tests if Home Assistant is not installed
+pytest.importorskip("homeassistant")
+
+from custom_components.pool_control.metriques import (
+    METRIQUES_BORNES,
+    Histogramme,
+    PoolControlMetricsView,
+    _labels,
+)
+
+
+@pytest.fixture
+def mock_metriques_controller(mock_hass, mock_pool_config):
+    """Create a controller with status sensors mocked."""
+    from custom_components.pool_control.controller import PoolController
+
+    controller = PoolController(mock_hass, mock_pool_config)
+
+    controller.filtrationStatus = MagicMock()
+    controller.data = {}
+
+    return controller
+
+
+def metric_lines(text, name):
+    """Return the sample lines of a metric."""
+    return [line for line in text.splitlines() if line.startswith(name)]
+
+
+@pytest.mark.unit
+class TestHistogramme:
+    """Tests for Histogramme."""
+
+    def test_observer(self):
+        """Test observations fall in the first bucket above them."""
+        histogramme = Histogramme()
+
+        histogramme.observer(0.004)
+        histogramme.observer(0.3)
+        histogramme.observer(60.0)
+
+        assert histogramme.compteurs[0] == 1
+        assert histogramme.compteurs[METRIQUES_BORNES.index(0.5)] == 1
+        assert histogramme.compteurs[-1] == 1
+        assert histogramme.nombre == 3
+
+
+@pytest.mark.unit
+class TestCompteurs:
+    """Tests for the incremental counters."""
+
+    @pytest.mark.asyncio
+    async def test_commands_sent_and_failed(self, mock_metriques_controller, mock_switch_off):
+        """Test service calls are counted by result."""
+        mock_metriques_controller.hass.states.get = Mock(return_value=mock_switch_off)
+
+        await mock_metriques_controller.filtrationOn()
+        mock_metriques_controller.hass.services.async_call = AsyncMock(
+            side_effect=Exception("Relay unavailable")
+        )
+        await mock_metriques_controller.filtrationOn()
+
+        assert mock_metriques_controller.metriquesCommandes == {
+            ("filtration", "sent"): 1,
+            ("filtration", "failed"): 1,
+        }
+
+    @pytest.mark.asyncio
+    async def test_commands_avoided(self, mock_metriques_controller, mock_switch_on):
+        """Test commands skipped because the device is already in state are counted."""
+        mock_metriques_controller.hass.states.get = Mock(return_value=mock_switch_on)
+
+        await mock_metriques_controller.filtrationOn()
+
+        assert mock_metriques_controller.metriquesCommandes == {("filtration", "avoided"): 1}
+        mock_metriques_controller.hass.services.async_call.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_store_writes(self, mock_metriques_controller):
+        """Test each store write is counted."""
+        mock_metriques_controller.initialized = True
+        mock_metriques_controller.store = MagicMock()
+        mock_metriques_controller.store.async_save = AsyncMock()
+
+        await mock_metriques_controller.async_save_data()
+
+        assert mock_metriques_controller.metriquesEcrituresStore == 1
+
+    def test_device_runtime(self, mock_metriques_controller, mock_switch_on):
+        """Test the running time accumulates between two observations."""
+        mock_metriques_controller.hass.states.get = Mock(return_value=mock_switch_on)
+
+        with patch("time.time", return_value=1000.0):
+            mock_metriques_controller.observerEquipements()
+        with patch("time.time", return_value=1060.0):
+            mock_metriques_controller.observerEquipements()
+
+        assert mock_metriques_controller.metriquesFonctionnement["filtration"] == 60.0
+
+    def test_device_runtime_off(self, mock_metriques_controller, mock_switch_off):
+        """Test a stopped device does not accumulate running time."""
+        mock_metriques_controller.hass.states.get = Mock(return_value=mock_switch_off)
+
+        with patch("time.time", return_value=1000.0):
+            mock_metriques_controller.observerEquipements()
+        with patch("time.time", return_value=1060.0):
+            mock_metriques_controller.observerEquipements()
+
+        assert mock_metriques_controller.metriquesFonctionnement["filtration"] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_cron_counts_pass(self, mock_metriques_controller):
+        """Test each cron pass is counted with its duration."""
+        mock_metriques_controller._cronCycle = AsyncMock()
+
+        await mock_metriques_controller.cron()
+
+        assert mock_metriques_controller.metriquesCycles == 1
+        assert mock_metriques_controller.metriquesDureeCycle.nombre == 1
+
+
+@pytest.mark.unit
+class TestExportMetriques:
+    """Tests for exportMetriques()."""
+
+    def test_format(self, mock_metriques_controller):
+        """Test the exposition contains every metric family with HELP and TYPE."""
+        mock_metriques_controller.observerCycle(0.02)
+        mock_metriques_controller.compterCommande("filtration", "sent")
+        mock_metriques_controller.data = {"marcheForcee": 1}
+
+        text = mock_metriques_controller.exportMetriques()
+
+        assert "# TYPE pool_control_cycles_total counter" in text
+        assert "pool_control_cycles_total 1" in text
+        assert 'pool_control_cycle_duration_seconds_bucket{le="0.01"} 0' in text
+        assert 'pool_control_cycle_duration_seconds_bucket{le="0.025"} 1' in text
+        assert 'pool_control_cycle_duration_seconds_bucket{le="+Inf"} 1' in text
+        assert 'pool_control_commands_total{device="filtration",result="sent"} 1' in text
+        assert 'pool_control_target_state{flag="marcheForcee"} 1' in text
+        assert text.endswith("\n")
+
+    def test_buckets_are_cumulative(self, mock_metriques_controller):
+        """Test bucket counts never decrease."""
+        for duree in (0.001, 0.2, 0.2, 3.0):
+            mock_metriques_controller.observerCycle(duree)
+
+        lines = metric_lines(
+            mock_metriques_controller.exportMetriques(),
+            "pool_control_cycle_duration_seconds_bucket",
+        )
+        counts = [int(line.rsplit(" ", 1)[1]) for line in lines]
+
+        assert counts == sorted(counts)
+        assert counts[-1] == 4
+
+    def test_label_escaping(self):
+        """Test label values are escaped."""
+        assert _labels(device='a"b\\c') == 'device="a\\"b\\\\c"'
+
+
+@pytest.mark.unit
+class TestMetricsView:
+    """Tests for PoolControlMetricsView."""
+
+    @pytest.mark.asyncio
+    async def test_serves_metrics(self, mock_hass, mock_metriques_controller):
+        """Test the view returns the controller's metrics as text."""
+        from custom_components.pool_control.const import DOMAIN
+
+        mock_hass.data = {DOMAIN: {"test_entry_id": mock_metriques_controller}}
+        request = MagicMock()
+        request.app = {"hass": mock_hass}
+        request.query = {}
+
+        response = await PoolControlMetricsView().get(request)
+
+        assert response.status == 200
+        assert response.content_type == "text/plain"
+        assert "pool_control_cycles_total 0" in response.text
+
+    @pytest.mark.asyncio
+    async def test_not_loaded(self, mock_hass):
+        """Test the view answers 404 when the integration is not loaded."""
+        request = MagicMock()
+        request.app = {"hass": mock_hass}
+        request.query = {}
+
+        response = await PoolControlMetricsView().get(request)
+
+        assert response.status == 404
+
+    @pytest.mark.asyncio
+    async def test_several_pools(self, mock_hass, mock_pool_config):
+        """Test the pool is chosen by entry_id when several are loaded."""
+        from custom_components.pool_control.const import DOMAIN
+        from custom_components.pool_control.controller import PoolController
+
+        piscine = PoolController(mock_hass, mock_pool_config, "piscine")
+        spa = PoolController(mock_hass, mock_pool_config, "spa")
+        spa.observerCycle(0.02)
+        mock_hass.data = {DOMAIN: {"piscine": piscine, "spa": spa}}
+        request = MagicMock()
+        request.app = {"hass": mock_hass}
+
+        request.query = {}
+        assert (await PoolControlMetricsView().get(request)).status == 404
+
+        request.query = {"entry_id": "spa"}
+        response = await PoolControlMetricsView().get(request)
+
+        assert "pool_control_cycles_total 1" in response.text
@@ -0,0 +1,70 @@
+"""Tests for options_flow.py module - Options flow steps.
+
+Tests the optional entity fields of the energy step, which must be saved
+empty and cleared when emptied.
+
+Functions tested:
+1. async_step_energie() - Optional entity selectors, suggested values, clearing
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+# Skip all tests if Home Assistant is not installed
+pytest.importorskip("homeassistant")
+
+
+def options_flow(options):
+    """Create an options flow on an entry with the given options."""
+    from custom_components.pool_control.options_flow import (
+        PoolControlOptionsFlowHandler,
+    )
+
+    entry = MagicMock(data={}, options=options)
+    return PoolControlOptionsFlowHandler(entry)
+
+
+def suggestions(schema):
+    """Suggested value of each field of a form schema."""
+    return {
+        str(cle): (cle.description or {}).get("suggested_value")
+        for cle in schema.schema
+    }
+
+
+@pytest.mark.unit
+class TestStepEnergie:
+    """Tests for async_step_energie()."""
+
+    async def test_saved_without_entities(self):
+        """Test the step validates with every optional entity left empty."""
+        flow = options_flow({})
+
+        result = await flow.async_step_energie()
+        valeurs = result["data_schema"]({})
+
+        assert "tarifCapteur" not in valeurs
+        assert "capteurExport" not in valeurs
+        assert "meteo" not in valeurs
+
+    async def test_entities_suggested(self):
+        """Test configured entities are suggested, not forced as defaults."""
+        flow = options_flow({"tarifCapteur": "sensor.tarif", "meteo": "weather.home"})
+
+        result = await flow.async_step_energie()
+
+        assert suggestions(result["data_schema"])["tarifCapteur"] == "sensor.tarif"
+        assert suggestions(result["data_schema"])["meteo"] == "weather.home"
+        assert suggestions(result["data_schema"])["capteurExport"] is None
+
+    async def test_emptied_entity_cleared(self):
+        """Test an emptied entity field removes the option."""
+        flow = options_flow(
+            {"capteurExport": "sensor.grid_export", "tarifProfil": "0-6:0.15"}
+        )
+
+        await flow.async_step_energie({"tarifProfil": "0-6:0.15"})
+
+        assert "capteurExport" not in flow.options
+        assert flow.options["tarifProfil"] == "0-6:0.15"
@@ -0,0 +1,213 @@
+"""Tests for planificateur.py module - Shared domain scheduler.
+
+Tests the timer wheel multiplexing the periodic work of every controller
+behind a single one-second timer.
+
+Functions tested:
+1. Planificateur.planifier() - Registration, staggering, timer start
+2. Planificateur._async_tick() - Priority order, concurrency, isolation, loop time
+3. annuler() - Removal, timer stop
+4. startFirstCron() / startSecondCron() - Controllers on the shared wheel
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+# Skip all tests if Home Assistant is not installed
+pytest.importorskip("homeassistant")
+
+from custom_components.pool_control.planificateur import (
+    PLANIFICATEUR_CASES,
+    PRIORITE_CRON,
+    PRIORITE_PULL,
+    Planificateur,
+)
+
+
+@pytest.fixture
+def planificateur(mock_hass):
+    """Create a scheduler with its timer mocked."""
+    with patch(
+        "custom_components.pool_control.planificateur.async_track_time_interval",
+        return_value=Mock(),
+    ) as mock_track:
+        planificateur = Planificateur(mock_hass)
+        planificateur.mock_track = mock_track
+        yield planificateur
+
+
+async def tourner(planificateur, secondes=PLANIFICATEUR_CASES):
+    """Run the wheel for a number of seconds."""
+    for _ in range(secondes):
+        await planificateur._async_tick()
+
+
+@pytest.mark.unit
+class TestPlanifier:
+    """Tests for planifier()."""
+
+    def test_single_timer(self, planificateur):
+        """Test one timer is shared by every task."""
+        for _ in range(20):
+            planificateur.planifier(AsyncMock(), 60, PRIORITE_CRON)
+
+        planificateur.mock_track.assert_called_once()
+        assert planificateur.taches == 20
+
+    def test_staggered(self, planificateur):
+        """Test minute tasks are spread over distinct seconds."""
+        for _ in range(20):
+            planificateur.planifier(AsyncMock(), 60, PRIORITE_CRON)
+
+        assert planificateur.snapshot()["casesOccupees"] == 20
+        assert planificateur.snapshot()["chargeMaximum"] == 1
+
+    def test_staggered_with_pulls(self, planificateur):
+        """Test minute tasks avoid the seconds taken by 5-second tasks."""
+        planificateur.planifier(AsyncMock(), 5, PRIORITE_PULL)
+        for _ in range(48):
+            planificateur.planifier(AsyncMock(), 60, PRIORITE_CRON)
+
+        assert planificateur.snapshot()["chargeMaximum"] == 1
+
+    def test_invalid_interval(self, planificateur):
+        """Test an interval not dividing the wheel is refused."""
+        with pytest.raises(ValueError):
+            planificateur.planifier(AsyncMock(), 7, PRIORITE_CRON)
+
+
+@pytest.mark.unit
+class TestTick:
+    """Tests for _async_tick()."""
+
+    @pytest.mark.asyncio
+    async def test_intervals(self, planificateur):
+        """Test each task runs once per interval."""
+        cron = AsyncMock()
+        pull = AsyncMock()
+        planificateur.planifier(cron, 60, PRIORITE_CRON)
+        planificateur.planifier(pull, 5, PRIORITE_PULL)
+
+        await tourner(planificateur, 2 * PLANIFICATEUR_CASES)
+
+        assert cron.call_count == 2
+        assert pull.call_count == 24
+
+    @pytest.mark.asyncio
+    async def test_priority_order(self, planificateur):
+        """Test due tasks run by priority when they share a second."""
+        ordre = []
+        planificateur.planifier(
+            AsyncMock(side_effect=lambda: ordre.append("cron")), 5, PRIORITE_CRON
+        )
+        for _ in range(4):
+            planificateur.planifier(AsyncMock(), 5, PRIORITE_CRON)
+        # Toutes les phases sont également chargées : la tâche rejoint la première
+        planificateur.planifier(
+            AsyncMock(side_effect=lambda: ordre.append("pull")), 5, PRIORITE_PULL
+        )
+
+        await tourner(planificateur, 1)
+
+        assert ordre == ["pull", "cron"]
+
+    @pytest.mark.asyncio
+    async def test_same_priority_concurrent(self, planificateur):
+        """Test a slow task does not delay the other tasks of its second."""
+        debloque = asyncio.Event()
+        lent = AsyncMock(side_effect=debloque.wait)
+        rapide = AsyncMock(side_effect=lambda: debloque.set())
+        # Toutes les secondes : les deux tâches partagent chaque case
+        planificateur.planifier(lent, 1, PRIORITE_CRON)
+        planificateur.planifier(rapide, 1, PRIORITE_CRON)
+
+        # Exécutées l'une après l'autre, la tâche lente attendrait indéfiniment
+        await asyncio.wait_for(tourner(planificateur, 1), 1)
+
+        lent.assert_awaited_once()
+        rapide.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failure_isolated(self, planificateur):
+        """Test a failing task does not prevent the others from running."""
+        planificateur.planifier(AsyncMock(side_effect=RuntimeError("boom")), 5, PRIORITE_PULL)
+        autre = AsyncMock()
+        planificateur.planifier(autre, 5, PRIORITE_PULL)
+
+        await tourner(planificateur, 5)
+
+        autre.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_loop_time(self, planificateur):
+        """Test the time spent per busy second is measured."""
+        planificateur.planifier(AsyncMock(), 60, PRIORITE_CRON)
+
+        await tourner(planificateur)
+
+        assert planificateur.snapshot()["dureeTick"]["nombre"] == 1
+
+
+@pytest.mark.unit
+class TestAnnuler:
+    """Tests for the cancellation of a task."""
+
+    @pytest.mark.asyncio
+    async def test_removed(self, planificateur):
+        """Test a cancelled task no longer runs and the timer stops with the last."""
+        action = AsyncMock()
+        annuler = planificateur.planifier(action, 5, PRIORITE_PULL)
+
+        annuler()
+        annuler()
+        await tourner(planificateur)
+
+        action.assert_not_called()
+        assert planificateur.taches == 0
+        planificateur.mock_track.return_value.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_during_tick(self, planificateur):
+        """Test a task cancelled by another in the same second is skipped."""
+        annulee = AsyncMock()
+        annulations = []
+        planificateur.planifier(
+            AsyncMock(side_effect=lambda: annulations[0]()), 5, PRIORITE_PULL
+        )
+        # Les secondes libres sont prises, la tâche suivante rejoint la première
+        for _ in range(PLANIFICATEUR_CASES - 12):
+            planificateur.planifier(AsyncMock(), 60, PRIORITE_CRON)
+        annulations.append(planificateur.planifier(annulee, 60, PRIORITE_CRON))
+        assert planificateur.roue[0][-1].action is annulee
+
+        await tourner(planificateur, 1)
+
+        annulee.assert_not_called()
+
+
+@pytest.mark.unit
+class TestControllers:
+    """Tests for the controllers running on the shared wheel."""
+
+    @pytest.mark.asyncio
+    async def test_crons_on_the_wheel(self, planificateur, mock_hass, mock_pool_config):
+        """Test the crons of a controller are scheduled on the shared wheel."""
+        from custom_components.pool_control.controller import PoolController
+
+        controllers = [PoolController(mock_hass, mock_pool_config) for _ in range(3)]
+        for controller in controllers:
+            controller.planificateur = planificateur
+            await controller.startFirstCron()
+        await controllers[0].startSecondCron()
+
+        assert planificateur.taches == 4
+        planificateur.mock_track.assert_called_once()
+
+        for controller in controllers:
+            await controller.stopFirstCron()
+        await controllers[0].stopSecondCron()
+
+        assert planificateur.taches == 0
+        assert controllers[0].secondCronCancel is None
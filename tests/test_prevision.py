@@ -0,0 +1,302 @@
+"""Tests for prevision.py module - Forecast-driven duration planning.
+
+Tests the optional planner that predicts tomorrow's peak water temperature
+from a weather entity's hourly forecast.
+
+Functions tested:
+1. majModele() / predireModele() - Incremental recursive least squares model
+2. refreshPrevision() - Forecast retrieval (service response or attributes)
+3. _temperaturesMaxiParJour() - Maximum air temperature of each forecast day
+4. calculateTemperaturePrevision() - Calculation temperature of the next window,
+   one learning step per predicted day
+5. calculateTimeFiltration() - Integration with the schedule, window day
+"""
+
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+
+# Skip all tests if Home Assistant is not installed
+pytest.importorskip("homeassistant")
+
+from homeassistant.exceptions import ServiceNotFound
+
+from custom_components.pool_control.horloge import HorlogeVirtuelle
+from custom_components.pool_control.prevision import (
+    PREVISION_ECART_MAX,
+    PREVISION_INTERVAL,
+    majModele,
+    modeleInitial,
+    predireModele,
+)
+
+
+JOUR = datetime(2025, 7, 11).date()
+
+
+def hourly_forecast(day, temperatures):
+    """Build an hourly forecast list for the given day."""
+    start = datetime.combine(day, datetime.min.time()).astimezone()
+    return [
+        {"datetime": (start + timedelta(hours=i)).isoformat(), "temperature": t}
+        for i, t in enumerate(temperatures)
+    ]
+
+
+def soir(day):
+    """Timestamp of the evening of the given day, after the window."""
+    return datetime.combine(day, datetime.min.time()).replace(hour=20).timestamp()
+
+
+@pytest.fixture
+def mock_prevision_controller(mock_hass, mock_pool_config):
+    """Create a mock controller with a weather entity configured."""
+    from custom_components.pool_control.controller import PoolController
+
+    controller = PoolController(mock_hass, {**mock_pool_config, "meteo": "weather.home"})
+
+    controller.filtrationTimeStatus = MagicMock()
+    controller.filtrationScheduleStatus = MagicMock()
+    controller.data = {}
+
+    return controller
+
+
+@pytest.mark.unit
+class TestModele:
+    """Tests for the recursive least squares model."""
+
+    def test_initial_model_is_persistence(self):
+        """Test the initial model predicts today's peak for tomorrow."""
+        assert predireModele(modeleInitial(), [1.0, 30.0, 24.0]) == 24.0
+
+    def test_update_is_incremental(self):
+        """Test one sample moves the prediction towards the observation."""
+        modele = modeleInitial()
+        x = [1.0, 30.0, 24.0]
+
+        updated = majModele(modele, x, 26.0)
+
+        assert 24.0 < predireModele(updated, x) <= 26.0
+        assert modele["theta"] == [0.0, 0.0, 1.0]  # Input left untouched
+
+    def test_converges_to_thermal_response(self):
+        """Test the model learns a linear air/water response from daily samples."""
+        modele = modeleInitial()
+        water = 22.0
+        for day in range(120):
+            air = 20.0 + 10.0 * ((day * 7) % 11) / 10.0
+            x = [1.0, air, water]
+            y = 1.0 + 0.25 * air + 0.7 * water
+            modele = majModele(modele, x, y)
+            water = y
+
+        x = [1.0, 32.0, 25.0]
+        assert predireModele(modele, x) == pytest.approx(1.0 + 0.25 * 32.0 + 0.7 * 25.0, abs=0.3)
+
+
+@pytest.mark.unit
+class TestRefreshPrevision:
+    """Tests for refreshPrevision() - Forecast retrieval."""
+
+    @pytest.mark.asyncio
+    async def test_uses_get_forecasts_response(self, mock_prevision_controller):
+        """Test the hourly forecast is read from the service response."""
+        tomorrow = (datetime.now() + timedelta(days=1)).date()
+        forecast = hourly_forecast(tomorrow, [18, 22, 31, 27])
+        mock_prevision_controller.hass.services.async_call = AsyncMock(
+            return_value={"weather.home": {"forecast": forecast}}
+        )
+
+        await mock_prevision_controller.refreshPrevision()
+
+        mock_prevision_controller.hass.services.async_call.assert_called_once_with(
+            "weather",
+            "get_forecasts",
+            {"entity_id": "weather.home", "type": "hourly"},
+            blocking=True,
+            return_response=True,
+        )
+        assert mock_prevision_controller.previsionTemperaturesAir == {tomorrow: 31.0}
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_attributes(self, mock_prevision_controller, mock_state_factory):
+        """Test the forecast attribute is used when the service fails."""
+        tomorrow = (datetime.now() + timedelta(days=1)).date()
+        state = mock_state_factory(
+            "weather.home", "sunny", {"forecast": hourly_forecast(tomorrow, [15, 29])}
+        )
+        mock_prevision_controller.hass.services.async_call = AsyncMock(
+            side_effect=ServiceNotFound("weather", "get_forecasts")
+        )
+        mock_prevision_controller.hass.states.get = Mock(return_value=state)
+
+        await mock_prevision_controller.refreshPrevision()
+
+        assert mock_prevision_controller.previsionTemperaturesAir == {tomorrow: 29.0}
+
+    @pytest.mark.asyncio
+    async def test_unexpected_error_raised(self, mock_prevision_controller):
+        """Test an error other than a service failure is not swallowed."""
+        mock_prevision_controller.hass.services.async_call = AsyncMock(
+            side_effect=RuntimeError("bug")
+        )
+
+        with pytest.raises(RuntimeError):
+            await mock_prevision_controller.refreshPrevision()
+
+    @pytest.mark.asyncio
+    async def test_throttled(self, mock_prevision_controller):
+        """Test the forecast is not requested again within the interval."""
+        mock_prevision_controller.hass.services.async_call = AsyncMock(return_value={})
+
+        with patch("time.time", return_value=100000.0):
+            await mock_prevision_controller.refreshPrevision()
+        with patch("time.time", return_value=100000.0 + PREVISION_INTERVAL - 1):
+            await mock_prevision_controller.refreshPrevision()
+
+        assert mock_prevision_controller.hass.services.async_call.call_count == 1
+
+    def test_maximum_per_day(self, mock_prevision_controller):
+        """Test each forecast day keeps its own maximum."""
+        today = datetime.now().date()
+        tomorrow = today + timedelta(days=1)
+        forecast = hourly_forecast(today, [35]) + hourly_forecast(tomorrow, [21, 23])
+
+        assert mock_prevision_controller._temperaturesMaxiParJour(forecast) == {
+            today: 35.0,
+            tomorrow: 23.0,
+        }
+
+    def test_no_forecast(self, mock_prevision_controller):
+        """Test an empty forecast gives no day."""
+        assert mock_prevision_controller._temperaturesMaxiParJour([]) == {}
+
+    @pytest.mark.asyncio
+    async def test_not_configured(self, mock_hass, mock_pool_config):
+        """Test nothing is requested without a weather entity."""
+        from custom_components.pool_control.controller import PoolController
+
+        controller = PoolController(mock_hass, mock_pool_config)
+
+        await controller.refreshPrevision()
+
+        mock_hass.services.async_call.assert_not_called()
+
+
+@pytest.mark.unit
+class TestCalculateTemperaturePrevision:
+    """Tests for calculateTemperaturePrevision()."""
+
+    def test_only_for_tomorrow(self, mock_prevision_controller):
+        """Test the measured temperature is kept for today's window."""
+        mock_prevision_controller.previsionTemperaturesAir = {JOUR: 35.0}
+
+        assert (
+            mock_prevision_controller.calculateTemperaturePrevision(24.0, False, JOUR)
+            == 24.0
+        )
+
+    def test_without_forecast(self, mock_prevision_controller):
+        """Test the measured temperature is kept without forecast."""
+        assert (
+            mock_prevision_controller.calculateTemperaturePrevision(24.0, True, JOUR)
+            == 24.0
+        )
+
+    def test_forecast_of_window_day(self, mock_prevision_controller):
+        """Test the forecast of the window's day is used, not another day."""
+        mock_prevision_controller.previsionTemperaturesAir = {
+            JOUR - timedelta(days=1): 40.0
+        }
+
+        assert (
+            mock_prevision_controller.calculateTemperaturePrevision(24.0, True, JOUR)
+            == 24.0
+        )
+
+    def test_learns_from_previous_day(self, mock_prevision_controller):
+        """Test the model is updated with the observed peak of the predicted day."""
+        controller = mock_prevision_controller
+        controller.horloge = HorlogeVirtuelle(soir(JOUR - timedelta(days=1)))
+        controller.previsionTemperaturesAir = {JOUR: 30.0, JOUR + timedelta(days=1): 31.0}
+        controller.calculateTemperaturePrevision(24.0, True, JOUR)
+        stored = controller.get_data("previsionModele")
+        assert stored["x"] == [1.0, 30.0, 24.0]
+        assert stored["jour"] == JOUR.isoformat()
+
+        # Le pic observé le jour prévu dépasse la prévision : le modèle s'ajuste
+        controller.horloge.avancer(86400)
+        controller.calculateTemperaturePrevision(27.0, True, JOUR + timedelta(days=1))
+
+        updated = controller.get_data("previsionModele")
+        assert updated["theta"] == majModele(modeleInitial(), [1.0, 30.0, 24.0], 27.0)["theta"]
+        assert updated["x"] == [1.0, 31.0, 27.0]
+        assert updated["jour"] == (JOUR + timedelta(days=1)).isoformat()
+
+    def test_same_day_not_learned_twice(self, mock_prevision_controller):
+        """Test a new calculation for the same window day only predicts (Reset button)."""
+        controller = mock_prevision_controller
+        controller.horloge = HorlogeVirtuelle(soir(JOUR))
+        suivant = JOUR + timedelta(days=1)
+        controller.previsionTemperaturesAir = {suivant: 30.0}
+        controller.data["previsionModele"] = {
+            **modeleInitial(),
+            "x": [1.0, 29.0, 24.0],
+            "jour": JOUR.isoformat(),
+        }
+
+        controller.calculateTemperaturePrevision(26.0, True, suivant)
+        appris = controller.get_data("previsionModele")["theta"]
+        for _ in range(3):
+            controller.calculateTemperaturePrevision(26.0, True, suivant)
+
+        assert appris == majModele(modeleInitial(), [1.0, 29.0, 24.0], 26.0)["theta"]
+        assert controller.get_data("previsionModele")["theta"] == appris
+
+    def test_other_day_not_learned(self, mock_prevision_controller):
+        """Test the sample is dropped when the measured day is not the predicted one."""
+        controller = mock_prevision_controller
+        # Journée prévue manquée (arrêt de Home Assistant)
+        controller.horloge = HorlogeVirtuelle(soir(JOUR + timedelta(days=2)))
+        controller.previsionTemperaturesAir = {JOUR + timedelta(days=3): 30.0}
+        controller.data["previsionModele"] = {
+            **modeleInitial(),
+            "x": [1.0, 29.0, 24.0],
+            "jour": JOUR.isoformat(),
+        }
+
+        controller.calculateTemperaturePrevision(26.0, True, JOUR + timedelta(days=3))
+
+        stored = controller.get_data("previsionModele")
+        assert stored["theta"] == modeleInitial()["theta"]
+        assert stored["jour"] == (JOUR + timedelta(days=3)).isoformat()
+
+    def test_prediction_is_clamped(self, mock_prevision_controller):
+        """Test the prediction stays close to the measured temperature."""
+        mock_prevision_controller.previsionTemperaturesAir = {JOUR: 40.0}
+        mock_prevision_controller.data["previsionModele"] = {
+            "theta": [0.0, 2.0, 0.0],
+            "p": modeleInitial()["p"],
+            "x": None,
+        }
+
+        result = mock_prevision_controller.calculateTemperaturePrevision(24.0, True, JOUR)
+
+        assert result == 24.0 + PREVISION_ECART_MAX
+
+    def test_schedule_uses_prediction(self, mock_prevision_controller):
+        """Test calculateTimeFiltration sizes the window from the prediction."""
+        mock_prevision_controller.data["temperatureMaxi"] = 24.0
+        mock_prevision_controller.calculateTemperaturePrevision = Mock(return_value=28.0)
+
+        # Pivot de 13:00 passé : plage de demain
+        with patch("time.time", return_value=datetime(2025, 7, 10, 15, 0).timestamp()):
+            mock_prevision_controller.calculateTimeFiltration(24.0, True)
+
+        mock_prevision_controller.calculateTemperaturePrevision.assert_called_once_with(
+            24.0, True, datetime(2025, 7, 11).date()
+        )
+        display = mock_prevision_controller.filtrationScheduleStatus.set_status.call_args[0][0]
+        assert display.endswith(": 28.0°C")
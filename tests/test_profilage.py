@@ -0,0 +1,273 @@
+"""Tests for profilage.py module - Control loop profiling.
+
+Tests the per-phase timings kept by the controller for each stage of cron().
+
+Functions tested:
+1. PhaseStats - Fixed-size ring buffer and rolling statistics
+2. mesurer() - Method decorator (sync and async)
+3. chronoPhase() - Timing context
+4. cron() / pull() - Stages recorded during a cycle, pull() in its own phase
+5. publierProfilage() - Optional timing sensors
+6. async_get_config_entry_diagnostics() - Diagnostics dump
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+
+# Skip all tests if Home Assistant is not installed
+pytest.importorskip("homeassistant")
+
+from custom_components.pool_control.profilage import (
+    PROFILAGE_PHASES,
+    PhaseStats,
+    mesurer,
+)
+
+
+@pytest.fixture
+def mock_profilage_controller(mock_hass, mock_pool_config, mock_switch_on):
+    """Create a controller whose cron stages are mocked."""
+    from custom_components.pool_control.controller import PoolController
+
+    controller = PoolController(mock_hass, mock_pool_config)
+
+    controller.getTemperatureWater = Mock(return_value=25.0)
+    controller.getTemperatureOutdoor = Mock(return_value=22.0)
+    controller.refreshFiltration = AsyncMock()
+    controller.refreshSurpresseur = AsyncMock()
+    controller.getHivernage = Mock(return_value=False)
+    controller.calculateStatusFiltration = AsyncMock()
+    controller.asservissementStatus = MagicMock()
+    controller.filtrationStatus = MagicMock()
+    controller.surpresseurStatus = MagicMock()
+    controller.data = {"arretTotal": 1}
+    mock_hass.states.get = Mock(return_value=mock_switch_on)
+
+    return controller
+
+
+@pytest.mark.unit
+class TestPhaseStats:
+    """Tests for PhaseStats - Ring buffer statistics."""
+
+    def test_empty(self):
+        """Test an empty phase only reports its count."""
+        assert PhaseStats(4).snapshot() == {"nombre": 0}
+
+    def test_statistics_in_milliseconds(self):
+        """Test the rolling statistics are reported in milliseconds."""
+        stats = PhaseStats(4)
+        for duree in (0.001, 0.003, 0.002):
+            stats.ajouter(duree)
+
+        snapshot = stats.snapshot()
+
+        assert snapshot["nombre"] == 3
+        assert snapshot["derniere"] == 2.0
+        assert snapshot["moyenne"] == 2.0
+        assert snapshot["max"] == 3.0
+
+    def test_buffer_is_bounded(self):
+        """Test the oldest measurements are overwritten."""
+        stats = PhaseStats(2)
+        for duree in (1.0, 0.002, 0.004):
+            stats.ajouter(duree)
+
+        snapshot = stats.snapshot()
+
+        assert len(stats.durees) == 2
+        assert snapshot["nombre"] == 3
+        assert snapshot["max"] == 4.0
+        assert snapshot["moyenne"] == 3.0
+
+
+@pytest.mark.unit
+class TestMesurer:
+    """Tests for the mesurer() decorator and chronoPhase()."""
+
+    def test_sync_method(self, mock_profilage_controller):
+        """Test a decorated method records one measurement per call."""
+
+        class Dummy:
+            profilage = {"calcul": PhaseStats(4)}
+
+            @mesurer("calcul")
+            def calcul(self):
+                return 42
+
+        dummy = Dummy()
+
+        assert dummy.calcul() == 42
+        assert dummy.profilage["calcul"].nombre == 1
+
+    @pytest.mark.asyncio
+    async def test_async_method_records_on_error(self):
+        """Test a failing coroutine is still measured."""
+
+        class Dummy:
+            profilage = {"service": PhaseStats(4)}
+
+            @mesurer("service")
+            async def call(self):
+                raise RuntimeError("relay timeout")
+
+        dummy = Dummy()
+
+        with pytest.raises(RuntimeError):
+            await dummy.call()
+        assert dummy.profilage["service"].nombre == 1
+
+    def test_without_profilage(self):
+        """Test a decorated method works on objects without profiling."""
+
+        class Dummy:
+            @mesurer("calcul")
+            def calcul(self):
+                return 1
+
+        assert Dummy().calcul() == 1
+
+    def test_chrono_phase(self, mock_profilage_controller):
+        """Test chronoPhase measures the duration of a block."""
+        with patch(
+            "custom_components.pool_control.profilage.time.perf_counter",
+            side_effect=[10.0, 10.25],
+        ):
+            with mock_profilage_controller.chronoPhase("refresh"):
+                pass
+
+        assert mock_profilage_controller.getProfilage()["refresh"]["derniere"] == 250.0
+
+
+@pytest.mark.unit
+class TestCronProfilage:
+    """Tests for the stages recorded by cron()."""
+
+    @pytest.mark.asyncio
+    async def test_records_each_stage(self, mock_profilage_controller):
+        """Test one cycle records sensors, status, activation and service calls."""
+        mock_profilage_controller.filtrationRefreshCounter = 5
+
+        await mock_profilage_controller.cron()
+
+        profilage = mock_profilage_controller.getProfilage()
+        assert set(profilage) == set(PROFILAGE_PHASES)
+        assert profilage["cycle"]["nombre"] == 1
+        assert profilage["capteurs"]["nombre"] == 1
+        assert profilage["refresh"]["nombre"] == 1
+        assert profilage["activation"]["nombre"] == 1
+        assert profilage["service"]["nombre"] >= 1
+        assert profilage["solaire"]["nombre"] == 0
+
+    @pytest.mark.asyncio
+    async def test_pull_recorded_apart(self, mock_profilage_controller):
+        """Test pull() is recorded in its own phase, its commands outside the cycle ones."""
+        controller = mock_profilage_controller
+        controller.data["filtrationSurpresseur"] = 1
+        controller.data["filtrationTempsRestant"] = 0
+
+        await controller.pull()
+
+        profilage = controller.getProfilage()
+        assert profilage["pull"]["nombre"] == 1
+        assert profilage["activation"]["nombre"] == 0
+        assert profilage["service"]["nombre"] == 0
+
+        # Le cycle suivant mesure de nouveau ses phases
+        await controller.cron()
+
+        assert controller.getProfilage()["activation"]["nombre"] == 1
+
+    @pytest.mark.asyncio
+    async def test_interleaved_cycle_and_pull(self, mock_profilage_controller):
+        """Test a pull running while a cycle waits keeps each root to its task."""
+        controller = mock_profilage_controller
+        pullDemarre = asyncio.Event()
+        cycleTermine = asyncio.Event()
+
+        async def cycle():
+            """Cycle waiting in its activation delay while a pull starts."""
+            with controller.chronoPhase("cycle"):
+                await pullDemarre.wait()
+                with controller.chronoPhase("activation"):
+                    pass
+            cycleTermine.set()
+
+        async def pull():
+            """Pull whose commands are sent after the cycle has ended."""
+            with controller.chronoPhase("pull"):
+                pullDemarre.set()
+                await cycleTermine.wait()
+                with controller.chronoPhase("service"):
+                    pass
+
+        await asyncio.wait_for(asyncio.gather(cycle(), pull()), timeout=5)
+
+        profilage = controller.getProfilage()
+        assert profilage["activation"]["nombre"] == 1
+        assert profilage["service"]["nombre"] == 0
+
+    @pytest.mark.asyncio
+    async def test_publishes_sensors(self, mock_profilage_controller):
+        """Test the timing sensors are refreshed after each cycle."""
+        capteur = Mock()
+        mock_profilage_controller.profilageCapteurs.append(capteur)
+
+        await mock_profilage_controller.cron()
+
+        capteur.refresh.assert_called_once()
+
+
+@pytest.mark.unit
+class TestProfilingSensor:
+    """Tests for PoolControlProfilingSensor."""
+
+    def test_exposes_phase_statistics(self, mock_profilage_controller):
+        """Test the sensor reports the rolling mean and statistics of its phase."""
+        from custom_components.pool_control.entities import PoolControlProfilingSensor
+
+        sensor = PoolControlProfilingSensor(
+            mock_profilage_controller, "Durée cycle", "pool_control_profilage_cycle", "cycle"
+        )
+        mock_profilage_controller.profilage["cycle"].ajouter(0.5)
+
+        assert sensor in mock_profilage_controller.profilageCapteurs
+        assert sensor.native_value == 500.0
+        assert sensor.extra_state_attributes["max"] == 500.0
+
+    def test_refresh_before_added(self, mock_profilage_controller):
+        """Test refresh does not write the state before the entity is added."""
+        from custom_components.pool_control.entities import PoolControlProfilingSensor
+
+        sensor = PoolControlProfilingSensor(
+            mock_profilage_controller, "Durée cycle", "pool_control_profilage_cycle", "cycle"
+        )
+        sensor.async_write_ha_state = Mock()
+
+        sensor.refresh()
+
+        sensor.async_write_ha_state.assert_not_called()
+
+
+@pytest.mark.unit
+class TestDiagnostics:
+    """Tests for the diagnostics dump."""
+
+    @pytest.mark.asyncio
+    async def test_contains_profilage(self, mock_hass, mock_profilage_controller):
+        """Test the diagnostics expose the control loop timings."""
+        from custom_components.pool_control.const import DOMAIN
+        from custom_components.pool_control.diagnostics import (
+            async_get_config_entry_diagnostics,
+        )
+
+        mock_hass.data = {DOMAIN: {"test_entry_id": mock_profilage_controller}}
+        await mock_profilage_controller.cron()
+
+        diagnostics = await async_get_config_entry_diagnostics(
+            mock_hass, Mock(entry_id="test_entry_id", data={}, options={})
+        )
+
+        assert diagnostics["profilage"]["cycle"]["nombre"] == 1
@@ -0,0 +1,207 @@
+"""Property-based tests for the filtration schedule computation.
+
+Hypothesis generates temperatures, coefficients, pivots, pauses and clock
+instants, and checks the invariants every computed schedule must respect:
+- Segments are ordered (debut <= pause debut <= pause fin <= fin)
+- Total runtime, pause excluded, equals the computed duration
+- Nothing is longer than 24 h, pause included
+- Season without pause and hivernage give the same schedule for the same
+  duration, pivot and distribution
+
+Functions tested:
+1. processingTime() - Rounding and 24 h cap of the duration
+2. calculateTimeFiltration() - Each distributionDatePivot, pausePivot clamping
+3. calculateTimeFiltrationHivernage() - Equivalence with the season schedule
+"""
+
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+# Skip all tests if Home Assistant or Hypothesis is not installed
+pytest.importorskip("homeassistant")
+pytest.importorskip("hypothesis")
+
+from hypothesis import HealthCheck, given, settings, strategies as st
+
+from custom_components.pool_control.horloge import HorlogeVirtuelle
+
+# Le contrôleur est réinitialisé à chaque exemple : la fixture peut être partagée
+PROPRIETES = settings(
+    max_examples=500,
+    deadline=None,
+    suppress_health_check=[HealthCheck.function_scoped_fixture],
+)
+
+# Tolérance sur les horodatages mémorisés (tronqués à la seconde)
+TOLERANCE = 2
+
+JOUR = 24 * 3600
+
+horaires = st.builds(
+    lambda heure, minute: f"{heure:02d}:{minute:02d}",
+    st.integers(0, 23),
+    st.integers(0, 59),
+)
+instants = st.datetimes(min_value=datetime(2025, 1, 1), max_value=datetime(2026, 12, 31))
+temperatures = st.floats(-10.0, 45.0, allow_nan=False)
+coefficients = st.floats(0.3, 1.7, allow_nan=False)
+distributions = st.integers(1, 5)
+pauses = st.integers(0, 24 * 60)
+durees = st.floats(0.0, 30.0, allow_nan=False)
+
+
+@pytest.fixture
+def mock_proprietes_controller(mock_hass, mock_pool_config):
+    """Create a controller whose schedule computation runs unmocked."""
+    from custom_components.pool_control.controller import PoolController
+
+    controller = PoolController(mock_hass, mock_pool_config)
+    controller.filtrationTimeStatus = MagicMock()
+    controller.filtrationScheduleStatus = MagicMock()
+    controller.optimisationTarif = False
+
+    # Pas de sauvegarde du store entre les exemples
+    controller.async_save_data = MagicMock()
+    return controller
+
+
+def initialiser(controller, instant):
+    """Reset the controller state before an example."""
+    controller.data = {}
+    controller.horloge = HorlogeVirtuelle(instant.timestamp())
+    controller.filtrationTimeStatus.reset_mock()
+
+
+def plage(controller):
+    """Stored schedule (debut, pause debut, pause fin, fin)."""
+    return tuple(
+        controller.get_data(cle)
+        for cle in ("filtrationDebut", "filtrationPauseDebut", "filtrationPauseFin", "filtrationFin")
+    )
+
+
+def dureeCalculee(controller):
+    """Computed duration (seconds), from the published "HH:MM"."""
+    heures, minutes = controller.filtrationTimeStatus.set_status.call_args.args[0].split(":")
+    return int(heures) * 3600 + int(minutes) * 60
+
+
+@pytest.mark.unit
+class TestProcessingTime:
+    """Properties of processingTime()."""
+
+    @PROPRIETES
+    @given(dureeHeures=st.floats(-50.0, 100.0, allow_nan=False))
+    def test_bornes(self, mock_proprietes_controller, dureeHeures):
+        """Test the duration is whole minutes between 0 and 24 h."""
+        secondes, affichage = mock_proprietes_controller.processingTime(dureeHeures)
+
+        assert 0 <= secondes <= JOUR
+        assert round(secondes) % 60 == 0
+
+        heures, minutes = affichage.split(":")
+        assert int(heures) * 3600 + int(minutes) * 60 == round(secondes)
+
+
+@pytest.mark.unit
+class TestCalculateTimeFiltration:
+    """Properties of the season schedule."""
+
+    @PROPRIETES
+    @given(
+        temperature=temperatures,
+        coefficient=coefficients,
+        methode=st.sampled_from([1, 2]),
+        datePivot=horaires,
+        pause=pauses,
+        distribution=distributions,
+        instant=instants,
+        demain=st.booleans(),
+    )
+    def test_invariants(
+        self,
+        mock_proprietes_controller,
+        temperature,
+        coefficient,
+        methode,
+        datePivot,
+        pause,
+        distribution,
+        instant,
+        demain,
+    ):
+        """Test ordered segments, runtime equal to the duration, 24 h cap."""
+        controller = mock_proprietes_controller
+        initialiser(controller, instant)
+        controller.methodeCalcul = methode
+        controller.coefficientAjustement = coefficient
+        controller.datePivot = datePivot
+        controller.pausePivot = pause
+        controller.distributionDatePivot = distribution
+
+        controller.calculateTimeFiltration(temperature, demain)
+
+        debut, pauseDebut, pauseFin, fin = plage(controller)
+        duree = dureeCalculee(controller)
+
+        # Segments ordonnés
+        assert debut <= pauseDebut + TOLERANCE
+        assert pauseDebut <= pauseFin
+        assert pauseFin <= fin + TOLERANCE
+
+        # Temps de marche hors pause égal à la durée calculée
+        assert abs((fin - debut) - (pauseFin - pauseDebut) - duree) <= TOLERANCE
+
+        # Rien ne dépasse 24 h, pause comprise
+        assert duree <= JOUR
+        assert fin - debut <= JOUR + TOLERANCE
+
+        # Pause réduite seulement si la plage dépasserait 24 h
+        assert abs((pauseFin - pauseDebut) - min(pause * 60, JOUR - duree)) <= TOLERANCE
+
+    @PROPRIETES
+    @given(
+        dureeHeures=durees,
+        datePivot=horaires,
+        distribution=distributions,
+        instant=instants,
+        demain=st.booleans(),
+    )
+    def test_equivalence_hivernage(
+        self,
+        mock_proprietes_controller,
+        dureeHeures,
+        datePivot,
+        distribution,
+        instant,
+        demain,
+    ):
+        """Test season without pause and hivernage give the same schedule."""
+        controller = mock_proprietes_controller
+
+        # Même durée quelle que soit la méthode de calcul
+        controller.calculateTimeFiltrationWithCurve = lambda temperature: dureeHeures
+        controller.calculateTimeFiltrationWithTemperatureHivernage = (
+            lambda temperature: dureeHeures
+        )
+
+        initialiser(controller, instant)
+        controller.methodeCalcul = 1
+        controller.datePivot = datePivot
+        controller.pausePivot = 0
+        controller.distributionDatePivot = distribution
+        controller.calculateTimeFiltration(20.0, demain)
+        saison = plage(controller)
+        dureeSaison = dureeCalculee(controller)
+
+        initialiser(controller, instant)
+        controller.choixHeureFiltrationHivernage = 2
+        controller.datePivotHivernage = datePivot
+        controller.distributionDatePivotHivernage = distribution
+        controller.calculateTimeFiltrationHivernage(20.0, demain)
+        hivernage = plage(controller)
+
+        assert (saison[0], saison[3]) == (hivernage[0], hivernage[3])
+        assert dureeCalculee(controller) == dureeSaison
@@ -0,0 +1,260 @@
+"""Tests for publication.py module - Batched status publishing.
+
+Tests the coordinator collecting the statuses of a control pass and flushing
+them together at the end of the pass.
+
+Functions tested:
+1. PublicationMixin - Status handles on the controller
+2. StatusCoordinator.subscribe() / unsubscribe() - Entity subscription
+3. StatusCoordinator.set_status() - Immediate publishing outside a batch
+4. StatusCoordinator.batch() / flush() - Batched publishing, nesting
+5. cron() - One flush per control pass
+6. PoolControlButton.async_press() - Batched button actions
+7. memoriserPlanning() / publierPlanningMemorise() - Schedule kept in the store
+"""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+# Skip all tests if Home Assistant is not installed
+pytest.importorskip("homeassistant")
+
+from custom_components.pool_control.publication import (
+    STATUS_KEYS,
+    StatusCoordinator,
+    StatusHandle,
+)
+
+
+@pytest.fixture
+def mock_publication_controller(mock_hass, mock_pool_config):
+    """Create a controller with status entities subscribed."""
+    from custom_components.pool_control.controller import PoolController
+
+    controller = PoolController(mock_hass, mock_pool_config)
+    controller.entities = {}
+    for key in STATUS_KEYS:
+        entity = Mock()
+        controller.statusCoordinator.subscribe(key, entity)
+        controller.entities[key] = entity
+
+    return controller
+
+
+@pytest.mark.unit
+class TestHandles:
+    """Tests for the status handles of the controller."""
+
+    def test_every_status_has_a_handle(self, mock_publication_controller):
+        """Test the controller exposes a handle per status."""
+        for key in STATUS_KEYS:
+            handle = getattr(mock_publication_controller, key)
+            assert isinstance(handle, StatusHandle)
+            assert handle.key == key
+
+    def test_value_kept_without_entity(self, mock_hass, mock_pool_config):
+        """Test a status set before its entity exists is kept and passed on."""
+        from custom_components.pool_control.controller import PoolController
+
+        controller = PoolController(mock_hass, mock_pool_config)
+        controller.filtrationStatus.set_status("Actif")
+
+        entity = Mock()
+        controller.statusCoordinator.subscribe("filtrationStatus", entity)
+
+        assert controller.filtrationStatus.value == "Actif"
+        entity.set_status.assert_called_once_with("Actif")
+
+
+@pytest.mark.unit
+class TestCoordinator:
+    """Tests for StatusCoordinator."""
+
+    def test_immediate_outside_batch(self):
+        """Test a status is published at once outside a batch."""
+        coordinator = StatusCoordinator()
+        entity = Mock()
+        coordinator.subscribe("filtrationStatus", entity)
+
+        coordinator.set_status("filtrationStatus", "Actif")
+
+        entity.set_status.assert_called_once_with("Actif")
+
+    def test_batch_publishes_last_value_once(self):
+        """Test a batch publishes only the last value of each status, at its end."""
+        coordinator = StatusCoordinator()
+        entity = Mock()
+        coordinator.subscribe("filtrationStatus", entity)
+
+        with coordinator.batch():
+            coordinator.set_status("filtrationStatus", "Actif")
+            coordinator.set_status("filtrationStatus", "Arrêté")
+            entity.set_status.assert_not_called()
+
+        entity.set_status.assert_called_once_with("Arrêté")
+
+    def test_nested_batches(self):
+        """Test nested batches flush only when the outermost one ends."""
+        coordinator = StatusCoordinator()
+        entity = Mock()
+        coordinator.subscribe("filtrationStatus", entity)
+
+        with coordinator.batch():
+            with coordinator.batch():
+                coordinator.set_status("filtrationStatus", "Actif")
+            entity.set_status.assert_not_called()
+
+        entity.set_status.assert_called_once_with("Actif")
+
+    def test_flush_on_error(self):
+        """Test the batch is flushed when the pass raises."""
+        coordinator = StatusCoordinator()
+        entity = Mock()
+        coordinator.subscribe("filtrationStatus", entity)
+
+        with pytest.raises(RuntimeError):
+            with coordinator.batch():
+                coordinator.set_status("filtrationStatus", "Actif")
+                raise RuntimeError("boom")
+
+        entity.set_status.assert_called_once_with("Actif")
+        assert coordinator.depth == 0
+
+    def test_unsubscribe(self):
+        """Test an unsubscribed entity no longer receives statuses."""
+        coordinator = StatusCoordinator()
+        entity = Mock()
+        coordinator.subscribe("filtrationStatus", entity)
+        coordinator.unsubscribe("filtrationStatus", entity)
+
+        coordinator.set_status("filtrationStatus", "Actif")
+
+        entity.set_status.assert_not_called()
+
+
+@pytest.mark.unit
+class TestControlPass:
+    """Tests for the batched publishing of a control pass."""
+
+    @pytest.mark.asyncio
+    async def test_cron_flushes_at_end_of_pass(self, mock_publication_controller):
+        """Test the statuses of a pass are written after the pass."""
+        controller = mock_publication_controller
+        entity = controller.entities["filtrationScheduleStatus"]
+
+        async def cycle():
+            controller.filtrationScheduleStatus.set_status("10:00 - 16:00")
+            controller.filtrationTimeStatus.set_status("6h00")
+            entity.set_status.assert_not_called()
+
+        controller._cronCycle = AsyncMock(side_effect=cycle)
+
+        await controller.cron()
+
+        entity.set_status.assert_called_once_with("10:00 - 16:00")
+        controller.entities["filtrationTimeStatus"].set_status.assert_called_once_with("6h00")
+
+    @pytest.mark.asyncio
+    async def test_button_press_is_batched(self, mock_publication_controller):
+        """Test the statuses set by a button action are flushed together."""
+        from custom_components.pool_control.entities import PoolControlButton
+
+        controller = mock_publication_controller
+        entity = controller.entities["asservissementStatus"]
+
+        async def callback():
+            controller.asservissementStatus.set_status("Actif")
+            entity.set_status.assert_not_called()
+
+        button = PoolControlButton(controller, "Actif", "pool_control_actif", callback)
+
+        await button.async_press()
+
+        entity.set_status.assert_called_once_with("Actif")
+
+
+@pytest.mark.unit
+class TestStatusSensorSubscription:
+    """Tests for the subscription of PoolControlStatusSensor."""
+
+    def test_sensor_subscribes(self, mock_hass, mock_pool_config):
+        """Test the sensor subscribes instead of replacing the controller attribute."""
+        from custom_components.pool_control.controller import PoolController
+        from custom_components.pool_control.entities import PoolControlStatusSensor
+
+        controller = PoolController(mock_hass, mock_pool_config)
+        handle = controller.filtrationStatus
+
+        sensor = PoolControlStatusSensor(
+            controller, "Status Filtration", "pool_control_filtration_status", "filtrationStatus"
+        )
+        controller.filtrationStatus.set_status("Actif")
+
+        assert controller.filtrationStatus is handle
+        assert controller.statusCoordinator.entities["filtrationStatus"] is sensor
+        assert sensor.state == "Actif"
+
+
+@pytest.mark.unit
+class TestPlanningMemorise:
+    """Tests for the schedule statuses kept in the store."""
+
+    def test_publier_planning_memorise(self, mock_publication_controller):
+        """Test the published schedule is stored as one value."""
+        controller = mock_publication_controller
+        controller.filtrationScheduleStatus.set_status("10:00-16:00 : 24.0°C")
+
+        controller.publierPlanning(1_750_000_000, None, None, 1_750_021_600, 24.0)
+
+        assert controller.get_data("planningStatus") == {
+            "filtrationScheduleStatus": "10:00-16:00 : 24.0°C",
+            "filtrationDebutStatus": 1_750_000_000,
+            "filtrationPauseDebutStatus": None,
+            "filtrationPauseFinStatus": None,
+            "filtrationFinStatus": 1_750_021_600,
+            "filtrationDureeStatus": 21600,
+            "temperatureCalculStatus": 24.0,
+        }
+
+    @pytest.mark.asyncio
+    async def test_published_at_load(self, mock_publication_controller):
+        """Test the stored schedule is published at load without recomputing it."""
+        controller = mock_publication_controller
+        controller.hass.bus = Mock()
+        controller.store = Mock()
+        controller.store.async_load = AsyncMock(
+            return_value={
+                "filtrationDebut": 1_750_000_000,
+                "planningStatus": {
+                    "filtrationScheduleStatus": "10:00-16:00 : 24.0°C",
+                    "filtrationDebutStatus": 1_750_000_000,
+                    "inconnu": 1,
+                },
+            }
+        )
+        controller.calculateTimeFiltration = Mock()
+
+        await controller.async_initialize()
+
+        controller.entities["filtrationScheduleStatus"].set_status.assert_called_once_with(
+            "10:00-16:00 : 24.0°C"
+        )
+        controller.entities["filtrationDebutStatus"].set_status.assert_called_once_with(
+            1_750_000_000
+        )
+        controller.calculateTimeFiltration.assert_not_called()
+        assert "inconnu" not in controller.statusCoordinator.values
+
+    @pytest.mark.asyncio
+    async def test_empty_store(self, mock_publication_controller):
+        """Test nothing is published without a stored schedule."""
+        controller = mock_publication_controller
+        controller.hass.bus = Mock()
+        controller.store = Mock()
+        controller.store.async_load = AsyncMock(return_value=None)
+        controller.entry_id = None
+
+        await controller.async_initialize()
+
+        assert controller.statusCoordinator.values == {}
@@ -414,6 +414,66 @@ class TestCalculateTimeFiltration:
         # Should contain temperature
         assert "°C" in call_args
 
+    def test_publishes_schedule_values(self, mock_saison_controller):
+        """Test the schedule is published as timestamps, seconds and temperature."""
+        mock_saison_controller.methodeCalcul = 2
+        mock_saison_controller.pausePivot = 60
+
+        with patch('time.time', return_value=datetime(2025, 6, 15, 10, 0).timestamp()):
+            mock_saison_controller.calculateTimeFiltration(20.0, False)  # 10 hours
+
+        controller = mock_saison_controller
+        assert controller.filtrationDebutStatus.value == controller.get_data("filtrationDebut")
+        assert controller.filtrationPauseDebutStatus.value == controller.get_data(
+            "filtrationPauseDebut"
+        )
+        assert controller.filtrationPauseFinStatus.value == controller.get_data(
+            "filtrationPauseFin"
+        )
+        assert controller.filtrationFinStatus.value == controller.get_data("filtrationFin")
+        # Pause excluded from the duration
+        assert controller.filtrationDureeStatus.value == 10 * 3600
+        assert controller.temperatureCalculStatus.value == 20.0
+
+    def test_publishes_no_pause(self, mock_saison_controller):
+        """Test the pause sensors are unknown when there is no pause."""
+        mock_saison_controller.pausePivot = 0
+
+        with patch('time.time', return_value=datetime(2025, 6, 15, 10, 0).timestamp()):
+            mock_saison_controller.calculateTimeFiltration(20.0, False)
+
+        assert mock_saison_controller.filtrationPauseDebutStatus.value is None
+        assert mock_saison_controller.filtrationPauseFinStatus.value is None
+
+    @pytest.mark.asyncio
+    async def test_unchanged_schedule_not_written(self, mock_saison_controller):
+        """Test recomputing the same schedule writes the schedule sensors once."""
+        from homeassistant.components.sensor import SensorDeviceClass
+        from custom_components.pool_control.entities import (
+            PoolControlMeasureSensor,
+            PoolControlTimestampSensor,
+        )
+
+        controller = mock_saison_controller
+        sensors = [
+            PoolControlTimestampSensor(controller, "Début", "debut", "filtrationDebutStatus"),
+            PoolControlMeasureSensor(
+                controller, "Durée", "duree", "filtrationDureeStatus",
+                SensorDeviceClass.DURATION, "s",
+            ),
+        ]
+        for sensor in sensors:
+            sensor.hass = controller.hass
+            sensor.async_write_ha_state = Mock()
+            await sensor.async_added_to_hass()
+
+        with patch('time.time', return_value=datetime(2025, 6, 15, 10, 0).timestamp()):
+            controller.calculateTimeFiltration(20.0, False)
+            controller.calculateTimeFiltration(20.0, False)
+
+        for sensor in sensors:
+            sensor.async_write_ha_state.assert_called_once()
+
 
 @pytest.mark.unit
 class TestCalculateStatusFiltration:
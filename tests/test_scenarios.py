@@ -0,0 +1,127 @@
+"""End-to-end scenarios on the in-process fake Home Assistant.
+
+The controller runs unmocked on `fake_hass` (tests/fakehass.py): relays
+really switch when a service is called, sensor changes reach the controller
+through state_changed events, and the shared scheduler runs on the virtual
+clock advanced by the test.
+
+Functions tested:
+1. FakeHass.async_avancer() - Timers fired in order on the virtual clock
+2. FakeBus.async_fire() - Listeners called, once-listeners removed
+3. cron() - Filtration window followed from start to end
+4. Lectures - Sensor change read by the controller without polling
+5. executeSurpresseurOn() / pull() - Booster pump stopped at its deadline
+6. async_save_data() - Store saved on EVENT_HOMEASSISTANT_STOP
+"""
+
+import pytest
+
+# Skip all tests if Home Assistant is not installed
+pytest.importorskip("homeassistant")
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+
+from tests.const import (
+    ENTITY_BOOSTER,
+    ENTITY_FILTRATION,
+    ENTITY_POOL_TEMPERATURE,
+)
+
+
+def etat(hass, entity_id):
+    """Current state of an entity."""
+    return hass.states.get(entity_id).state
+
+
+@pytest.mark.unit
+class TestFakeHass:
+    """Tests for the fake core itself."""
+
+    async def test_timers_in_order(self, fake_hass):
+        """Test periodic and one-shot timers fire at their deadline, in order."""
+        appels = []
+        debut = fake_hass.horloge.time()
+
+        def noter(nom):
+            """Record the timer name and its virtual elapsed time."""
+            return lambda now: appels.append((nom, fake_hass.horloge.time() - debut))
+
+        fake_hass.planifier(30, noter("interval"), 30)
+        annuler = fake_hass.planifier(45, noter("annule"))
+        fake_hass.planifier(40, noter("later"))
+        annuler()
+
+        await fake_hass.async_avancer(90)
+
+        assert appels == [("interval", 30), ("later", 40), ("interval", 60), ("interval", 90)]
+        assert fake_hass.horloge.time() == debut + 90
+
+    async def test_service_flips_state_and_fires_event(self, fake_hass):
+        """Test turn_on changes the state and fires state_changed."""
+        evenements = []
+        fake_hass.bus.async_listen("state_changed", evenements.append)
+
+        await fake_hass.services.async_call(
+            "switch", "turn_on", {"entity_id": ENTITY_FILTRATION}
+        )
+
+        assert etat(fake_hass, ENTITY_FILTRATION) == "on"
+        assert evenements[0].data["old_state"].state == "off"
+        assert evenements[0].data["new_state"].state == "on"
+
+    async def test_listen_once(self, fake_hass):
+        """Test a once-listener is called a single time."""
+        evenements = []
+        fake_hass.bus.async_listen_once("evenement", evenements.append)
+
+        fake_hass.bus.async_fire("evenement", {"valeur": 1})
+        fake_hass.bus.async_fire("evenement", {"valeur": 2})
+
+        assert [event.data["valeur"] for event in evenements] == [1]
+
+
+@pytest.mark.unit
+class TestScenarios:
+    """End-to-end scenarios on the controller."""
+
+    async def test_filtration_window(self, fake_hass, fake_pool):
+        """Test the filtration starts in its window and stops at its end."""
+        # Premier cycle : calcul de la plage ; second : mise en marche
+        await fake_hass.async_avancer(120)
+
+        assert etat(fake_hass, ENTITY_FILTRATION) == "on"
+
+        fin = fake_pool.get_data("filtrationFin")
+        await fake_hass.async_avancer(fin - fake_hass.horloge.time() + 120)
+
+        assert etat(fake_hass, ENTITY_FILTRATION) == "off"
+        # Plage du lendemain calculée à la fin de celle du jour
+        assert fake_pool.get_data("filtrationDebut") > fake_hass.horloge.time()
+
+    async def test_sensor_change(self, fake_hass, fake_pool):
+        """Test a sensor change is read by the controller without polling."""
+        fake_hass.states.async_set(ENTITY_POOL_TEMPERATURE, 28.5)
+
+        assert fake_pool.getTemperatureWater() == 28.5
+
+    async def test_surpresseur(self, fake_hass, fake_pool):
+        """Test the booster pump stops at its deadline on the virtual clock."""
+        await fake_hass.async_avancer(120)
+
+        await fake_pool.executeSurpresseurOn()
+        await fake_hass.async_block_till_done()
+
+        assert etat(fake_hass, ENTITY_BOOSTER) == "on"
+
+        await fake_hass.async_avancer(fake_pool.surpresseurDuree * 60 + 10)
+
+        assert etat(fake_hass, ENTITY_BOOSTER) == "off"
+
+    async def test_save_on_stop(self, fake_hass, fake_pool):
+        """Test the store is saved when Home Assistant stops."""
+        ecritures = fake_pool.store.ecritures
+
+        fake_hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+        await fake_hass.async_block_till_done()
+
+        assert fake_pool.store.ecritures == ecritures + 1
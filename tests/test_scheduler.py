@@ -50,7 +50,12 @@ def mock_scheduler_controller(mock_hass, mock_pool_config):
     controller.executeButtonStop = AsyncMock()
     controller.executeFiltreSableLavageOn = AsyncMock()
 
-    return controller
+    # Passage du cycle de lavage à la phase suivante
+    from custom_components.pool_control.lavage import LAVAGE
+
+    with patch.object(LAVAGE, "avancer", AsyncMock()) as avancer:
+        controller.avancerLavage = avancer
+        yield controller
 
 
 @pytest.mark.unit
@@ -152,8 +157,8 @@ class TestPull:
     """Tests for pull() - 5-second routine for timer monitoring."""
 
     @pytest.mark.asyncio
-    async def test_updates_surpresseur_timer_display(self, mock_scheduler_controller):
-        """Test pull updates surpresseur status display when timer is active."""
+    async def test_surpresseur_timer_running_no_write(self, mock_scheduler_controller):
+        """Test pull leaves the surpresseur status alone while the timer runs."""
         mock_scheduler_controller.get_data = Mock(
             side_effect=lambda key, default: {
                 "filtrationSurpresseur": 1,  # Active
@@ -165,12 +170,9 @@ class TestPull:
         with patch("time.time", return_value=1000.0):
             await mock_scheduler_controller.pull()
 
-        # Status should be updated with "Actif : MM:SS"
-        mock_scheduler_controller.surpresseurStatus.set_status.assert_called_once()
-        call_arg = (
-            mock_scheduler_controller.surpresseurStatus.set_status.call_args[0][0]
-        )
-        assert call_arg.startswith("Actif : ")
+        # The countdown is shown by the end timestamp sensor: no status write
+        mock_scheduler_controller.surpresseurStatus.set_status.assert_not_called()
+        mock_scheduler_controller.executeButtonStop.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_calls_stop_when_surpresseur_timer_expires(
@@ -192,8 +194,8 @@ class TestPull:
         mock_scheduler_controller.executeButtonStop.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_updates_lavage_timer_display(self, mock_scheduler_controller):
-        """Test pull updates lavage status display during washing (state 2)."""
+    async def test_lavage_timer_running_no_write(self, mock_scheduler_controller):
+        """Test pull leaves the status alone while washing (state 2) runs."""
         mock_scheduler_controller.get_data = Mock(
             side_effect=lambda key, default: {
                 "filtrationSurpresseur": 0,
@@ -205,16 +207,13 @@ class TestPull:
         with patch("time.time", return_value=1000.0):
             await mock_scheduler_controller.pull()
 
-        # Status should be updated with "Lavage : MM:SS"
-        mock_scheduler_controller.filtreSableLavageStatus.set_status.assert_called_once()
-        call_arg = (
-            mock_scheduler_controller.filtreSableLavageStatus.set_status.call_args[0][0]
-        )
-        assert call_arg.startswith("Lavage : ")
+        # The countdown is shown by the end timestamp sensor: no status write
+        mock_scheduler_controller.filtreSableLavageStatus.set_status.assert_not_called()
+        mock_scheduler_controller.avancerLavage.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_updates_rincage_timer_display(self, mock_scheduler_controller):
-        """Test pull updates lavage status display during rinsing (state 4)."""
+    async def test_rincage_timer_running_no_write(self, mock_scheduler_controller):
+        """Test pull leaves the status alone while rinsing (state 4) runs."""
         mock_scheduler_controller.get_data = Mock(
             side_effect=lambda key, default: {
                 "filtrationSurpresseur": 0,
@@ -226,15 +225,13 @@ class TestPull:
         with patch("time.time", return_value=1000.0):
             await mock_scheduler_controller.pull()
 
-        # Status should be updated with "Rinçage : MM:SS"
-        call_arg = (
-            mock_scheduler_controller.filtreSableLavageStatus.set_status.call_args[0][0]
-        )
-        assert call_arg.startswith("Rinçage : ")
+        # The countdown is shown by the end timestamp sensor: no status write
+        mock_scheduler_controller.filtreSableLavageStatus.set_status.assert_not_called()
+        mock_scheduler_controller.avancerLavage.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_calls_lavage_on_when_timer_expires(self, mock_scheduler_controller):
-        """Test pull calls executeFiltreSableLavageOn when lavage timer expires."""
+        """Test pull advances the lavage cycle when its deadline has passed."""
         mock_scheduler_controller.get_data = Mock(
             side_effect=lambda key, default: {
                 "filtrationSurpresseur": 0,
@@ -247,7 +244,9 @@ class TestPull:
             await mock_scheduler_controller.pull()
 
         # Should advance lavage state machine
-        mock_scheduler_controller.executeFiltreSableLavageOn.assert_called_once()
+        mock_scheduler_controller.avancerLavage.assert_called_once_with(
+            mock_scheduler_controller
+        )
 
     @pytest.mark.asyncio
     async def test_skips_when_surpresseur_inactive(self, mock_scheduler_controller):
@@ -281,7 +280,7 @@ class TestPull:
 
         # Should not update lavage status
         mock_scheduler_controller.filtreSableLavageStatus.set_status.assert_not_called()
-        mock_scheduler_controller.executeFiltreSableLavageOn.assert_not_called()
+        mock_scheduler_controller.avancerLavage.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_handles_no_status_objects(self, mock_scheduler_controller):
@@ -472,9 +471,11 @@ class TestSchedulerIntegration:
         with patch("time.time", return_value=1000.0):
             await mock_scheduler_controller.pull()
 
-        # Both status displays should be updated
-        mock_scheduler_controller.surpresseurStatus.set_status.assert_called_once()
-        mock_scheduler_controller.filtreSableLavageStatus.set_status.assert_called_once()
+        # Neither timer has expired: nothing is stopped nor written
+        mock_scheduler_controller.executeButtonStop.assert_not_called()
+        mock_scheduler_controller.avancerLavage.assert_not_called()
+        mock_scheduler_controller.surpresseurStatus.set_status.assert_not_called()
+        mock_scheduler_controller.filtreSableLavageStatus.set_status.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_cron_full_5minute_cycle(self, mock_scheduler_controller):
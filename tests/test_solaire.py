@@ -0,0 +1,387 @@
+"""Tests for solaire.py module - Solar surplus filtration.
+
+Tests the event-driven photovoltaic surplus mode that drives the
+`filtrationSolaire` flag from a grid export power sensor.
+
+Functions tested:
+1. startSolaire() / stopSolaire() - State change subscription, initial power
+2. _handleExportChange() / _handleSolaireTimer() - State event parsing, batching
+3. evaluateSolaire() - Hysteresis and minimum on/off times
+4. getCreditSolaire() - Solar runtime outside the scheduled window
+5. getFiltrationFinSolaire() - Window end shortened by the solar runtime
+6. resetCreditSolaire() - Daily reset
+"""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+
+# Skip all tests if Home Assistant is not installed
+pytest.importorskip("homeassistant")
+
+
+@pytest.fixture
+def mock_solaire_controller(mock_hass, mock_pool_config):
+    """Create a mock controller with SolaireMixin configured."""
+    from custom_components.pool_control.controller import PoolController
+
+    config = {
+        **mock_pool_config,
+        "capteurExport": "sensor.grid_export",
+        "seuilSolaireMarche": 1000,
+        "seuilSolaireArret": 0,
+        "dureeMinimumSolaireMarche": 15,
+        "dureeMinimumSolaireArret": 10,
+    }
+    controller = PoolController(mock_hass, config)
+
+    controller.activatingDevices = AsyncMock()
+    controller.data = {}
+
+    return controller
+
+
+def export_event(value):
+    """Build a state_changed event for the export sensor."""
+    event = MagicMock()
+    event.data = {"new_state": MagicMock(state=str(value))}
+    return event
+
+
+@pytest.mark.unit
+class TestSolaireSubscription:
+    """Tests for startSolaire() / stopSolaire()."""
+
+    @pytest.mark.asyncio
+    async def test_start_subscribes_to_export_sensor(self, mock_solaire_controller):
+        """Test startSolaire tracks state changes of the export sensor."""
+        cancel = Mock()
+
+        with patch(
+            "custom_components.pool_control.solaire.async_track_state_change_event",
+            return_value=cancel,
+        ) as mock_track:
+            await mock_solaire_controller.startSolaire()
+
+        mock_track.assert_called_once_with(
+            mock_solaire_controller.hass,
+            ["sensor.grid_export"],
+            mock_solaire_controller._handleExportChange,
+        )
+        assert mock_solaire_controller.solaireListenerCancel is cancel
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("etat", "puissance"),
+        [
+            (MagicMock(state="1500"), 1500.0),
+            (MagicMock(state="unavailable"), None),
+            (None, None),
+        ],
+    )
+    async def test_start_seeds_export_power(
+        self, mock_solaire_controller, etat, puissance
+    ):
+        """Test startSolaire reads the current export power at once."""
+        mock_solaire_controller.hass.states.get = Mock(return_value=etat)
+
+        with patch(
+            "custom_components.pool_control.solaire.async_track_state_change_event"
+        ):
+            await mock_solaire_controller.startSolaire()
+
+        mock_solaire_controller.hass.states.get.assert_called_once_with(
+            "sensor.grid_export"
+        )
+        assert mock_solaire_controller.puissanceExport == puissance
+
+    @pytest.mark.asyncio
+    async def test_start_without_sensor_does_nothing(self, mock_hass, mock_pool_config):
+        """Test startSolaire is a no-op when no export sensor is configured."""
+        from custom_components.pool_control.controller import PoolController
+
+        controller = PoolController(mock_hass, mock_pool_config)
+
+        with patch(
+            "custom_components.pool_control.solaire.async_track_state_change_event"
+        ) as mock_track:
+            await controller.startSolaire()
+
+        mock_track.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_stop_cancels_listener_and_timer(self, mock_solaire_controller):
+        """Test stopSolaire cancels the listener and any pending timer."""
+        listener = Mock()
+        timer = Mock()
+        mock_solaire_controller.solaireListenerCancel = listener
+        mock_solaire_controller.solaireTimerCancel = timer
+
+        await mock_solaire_controller.stopSolaire()
+
+        listener.assert_called_once()
+        timer.assert_called_once()
+        assert mock_solaire_controller.solaireListenerCancel is None
+        assert mock_solaire_controller.solaireTimerCancel is None
+
+
+@pytest.mark.unit
+class TestEvaluateSolaire:
+    """Tests for evaluateSolaire() - Hysteresis and minimum times."""
+
+    @pytest.mark.asyncio
+    async def test_starts_above_threshold(self, mock_solaire_controller):
+        """Test filtration starts when export exceeds the start threshold."""
+        with patch("time.time", return_value=10000.0):
+            await mock_solaire_controller._handleExportChange(export_event(1500))
+
+        assert mock_solaire_controller.get_data("filtrationSolaire") == 1
+        assert mock_solaire_controller.get_data("filtrationSolaireDepuis") == 10000
+        mock_solaire_controller.activatingDevices.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_stays_off_below_threshold(self, mock_solaire_controller):
+        """Test filtration stays off below the start threshold."""
+        await mock_solaire_controller._handleExportChange(export_event(800))
+
+        assert mock_solaire_controller.get_data("filtrationSolaire", 0) == 0
+        mock_solaire_controller.activatingDevices.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_hysteresis_keeps_running(self, mock_solaire_controller):
+        """Test filtration keeps running between the stop and start thresholds."""
+        mock_solaire_controller.data["filtrationSolaire"] = 1
+        mock_solaire_controller.data["filtrationSolaireDepuis"] = 0
+
+        with patch("time.time", return_value=10000.0):
+            await mock_solaire_controller._handleExportChange(export_event(200))
+
+        assert mock_solaire_controller.get_data("filtrationSolaire") == 1
+        mock_solaire_controller.activatingDevices.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_stops_below_stop_threshold(self, mock_solaire_controller):
+        """Test filtration stops when the house imports power."""
+        mock_solaire_controller.data["filtrationSolaire"] = 1
+        mock_solaire_controller.data["filtrationSolaireDepuis"] = 0
+
+        with patch("time.time", return_value=10000.0):
+            await mock_solaire_controller._handleExportChange(export_event(-300))
+
+        assert mock_solaire_controller.get_data("filtrationSolaire") == 0
+        mock_solaire_controller.activatingDevices.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_minimum_run_time_defers_stop(self, mock_solaire_controller):
+        """Test a stop before the minimum run time is deferred with a timer."""
+        mock_solaire_controller.data["filtrationSolaire"] = 1
+        mock_solaire_controller.data["filtrationSolaireDepuis"] = 10000
+
+        with patch("time.time", return_value=10000.0 + 300), patch(
+            "custom_components.pool_control.solaire.async_call_later",
+            return_value=Mock(),
+        ) as mock_later:
+            await mock_solaire_controller._handleExportChange(export_event(-300))
+
+        assert mock_solaire_controller.get_data("filtrationSolaire") == 1
+        mock_later.assert_called_once()
+        assert mock_later.call_args[0][1] == pytest.approx(15 * 60 - 300)
+
+    @pytest.mark.asyncio
+    async def test_timer_reevaluates(self, mock_solaire_controller):
+        """Test the deferred timer applies the pending decision."""
+        mock_solaire_controller.data["filtrationSolaire"] = 1
+        mock_solaire_controller.data["filtrationSolaireDepuis"] = 10000
+        mock_solaire_controller.puissanceExport = -300.0
+        mock_solaire_controller.solaireTimerCancel = Mock()
+
+        with patch("time.time", return_value=10000.0 + 15 * 60):
+            await mock_solaire_controller._handleSolaireTimer()
+
+        assert mock_solaire_controller.get_data("filtrationSolaire") == 0
+        assert mock_solaire_controller.solaireTimerCancel is None
+
+    @pytest.mark.asyncio
+    async def test_timer_batches_statuses(self, mock_solaire_controller):
+        """Test the deferred timer publishes its statuses as one batch."""
+        mock_solaire_controller.data["filtrationSolaire"] = 1
+        mock_solaire_controller.data["filtrationSolaireDepuis"] = 10000
+        mock_solaire_controller.puissanceExport = -300.0
+        coordinator = mock_solaire_controller.statusCoordinator
+        profondeurs = []
+        mock_solaire_controller.activatingDevices.side_effect = (
+            lambda: profondeurs.append(coordinator.depth)
+        )
+
+        with patch("time.time", return_value=10000.0 + 15 * 60):
+            await mock_solaire_controller._handleSolaireTimer()
+
+        assert profondeurs == [1]
+        assert coordinator.depth == 0
+
+    @pytest.mark.asyncio
+    async def test_stops_in_hivernage(self, mock_solaire_controller):
+        """Test the solar mode stops immediately in hivernage."""
+        mock_solaire_controller.data["filtrationSolaire"] = 1
+        mock_solaire_controller.data["filtrationSolaireDepuis"] = 10000
+        mock_solaire_controller.data["hivernageWidgetStatus"] = 1
+        mock_solaire_controller.puissanceExport = 3000.0
+
+        with patch("time.time", return_value=10001.0):
+            await mock_solaire_controller.evaluateSolaire()
+
+        assert mock_solaire_controller.get_data("filtrationSolaire") == 0
+
+    @pytest.mark.asyncio
+    async def test_unavailable_sensor_stops(self, mock_solaire_controller):
+        """Test an unavailable export sensor stops the solar mode."""
+        mock_solaire_controller.data["filtrationSolaire"] = 1
+        mock_solaire_controller.data["filtrationSolaireDepuis"] = 0
+
+        with patch("time.time", return_value=10000.0):
+            await mock_solaire_controller._handleExportChange(export_event("unavailable"))
+
+        assert mock_solaire_controller.get_data("filtrationSolaire") == 0
+
+
+@pytest.mark.unit
+class TestCreditSolaire:
+    """Tests for getCreditSolaire() and getFiltrationFinSolaire()."""
+
+    def test_credit_outside_window(self, mock_solaire_controller):
+        """Test solar runtime outside the window is credited."""
+        mock_solaire_controller.data.update(
+            {
+                "filtrationDebut": 20000,
+                "filtrationPauseDebut": 20000,
+                "filtrationPauseFin": 20000,
+                "filtrationFin": 30000,
+                "filtrationSolaire": 1,
+                "filtrationSolaireDebut": 10000,
+            }
+        )
+
+        assert mock_solaire_controller.getCreditSolaire(12000) == 2000
+
+    def test_credit_excludes_window(self, mock_solaire_controller):
+        """Test solar runtime inside the window is not credited twice."""
+        mock_solaire_controller.data.update(
+            {
+                "filtrationDebut": 20000,
+                "filtrationPauseDebut": 20000,
+                "filtrationPauseFin": 20000,
+                "filtrationFin": 30000,
+                "filtrationSolaire": 1,
+                "filtrationSolaireDebut": 19000,
+                "filtrationSolaireCredit": 500,
+            }
+        )
+
+        assert mock_solaire_controller.getCreditSolaire(25000) == 1500
+
+    def test_credit_counts_pause(self, mock_solaire_controller):
+        """Test solar runtime during the pause is credited."""
+        mock_solaire_controller.data.update(
+            {
+                "filtrationDebut": 20000,
+                "filtrationPauseDebut": 22000,
+                "filtrationPauseFin": 24000,
+                "filtrationFin": 30000,
+                "filtrationSolaire": 1,
+                "filtrationSolaireDebut": 21000,
+            }
+        )
+
+        assert mock_solaire_controller.getCreditSolaire(25000) == 2000
+
+    @pytest.mark.asyncio
+    async def test_stop_closes_credit(self, mock_solaire_controller):
+        """Test stopping the solar mode stores the credited runtime."""
+        mock_solaire_controller.data.update(
+            {
+                "filtrationDebut": 20000,
+                "filtrationFin": 30000,
+                "filtrationSolaire": 1,
+                "filtrationSolaireDepuis": 10000,
+                "filtrationSolaireDebut": 10000,
+            }
+        )
+        mock_solaire_controller.puissanceExport = -100.0
+
+        with patch("time.time", return_value=13000.0):
+            await mock_solaire_controller.evaluateSolaire()
+
+        assert mock_solaire_controller.get_data("filtrationSolaireCredit") == 3000
+        assert mock_solaire_controller.getCreditSolaire(14000) == 3000
+
+    def test_window_end_advanced(self, mock_solaire_controller):
+        """Test the window end is advanced by the credit."""
+        mock_solaire_controller.data.update(
+            {
+                "filtrationDebut": 20000,
+                "filtrationPauseDebut": 20000,
+                "filtrationPauseFin": 20000,
+                "filtrationFin": 30000,
+                "filtrationSolaireCredit": 3600,
+            }
+        )
+
+        assert mock_solaire_controller.getFiltrationFinSolaire(25000) == 30000 - 3600
+
+    def test_window_end_clamped(self, mock_solaire_controller):
+        """Test the window end never moves before the last segment start."""
+        mock_solaire_controller.data.update(
+            {
+                "filtrationDebut": 20000,
+                "filtrationPauseDebut": 22000,
+                "filtrationPauseFin": 24000,
+                "filtrationFin": 30000,
+                "filtrationSolaireCredit": 50000,
+            }
+        )
+
+        assert mock_solaire_controller.getFiltrationFinSolaire(25000) == 24000
+
+    def test_no_sensor_keeps_window(self, mock_hass, mock_pool_config):
+        """Test the window is unchanged without solar configuration."""
+        from custom_components.pool_control.controller import PoolController
+
+        controller = PoolController(mock_hass, mock_pool_config)
+        controller.data = {"filtrationFin": 30000, "filtrationSolaireCredit": 3600}
+
+        assert controller.getFiltrationFinSolaire(25000) == 30000
+
+    def test_reset_credit(self, mock_solaire_controller):
+        """Test the credit is reset and the running segment restarts now."""
+        mock_solaire_controller.data.update(
+            {"filtrationSolaireCredit": 3600, "filtrationSolaire": 1}
+        )
+
+        with patch("time.time", return_value=40000.0):
+            mock_solaire_controller.resetCreditSolaire()
+
+        assert mock_solaire_controller.get_data("filtrationSolaireCredit") == 0
+        assert mock_solaire_controller.get_data("filtrationSolaireDebut") == 40000
+
+    @pytest.mark.asyncio
+    async def test_status_filtration_ends_early(self, mock_solaire_controller):
+        """Test calculateStatusFiltration stops the window early with a credit."""
+        mock_solaire_controller.updateTemperatureDisplay = Mock()
+        debut = datetime(2025, 6, 15, 10, 0).timestamp()
+        fin = datetime(2025, 6, 15, 14, 0).timestamp()
+        mock_solaire_controller.data.update(
+            {
+                "filtrationDebut": debut,
+                "filtrationPauseDebut": debut,
+                "filtrationPauseFin": debut,
+                "filtrationFin": fin,
+                "filtrationSolaireCredit": 3600,
+                "filtrationTemperature": 1,
+            }
+        )
+
+        with patch("time.time", return_value=datetime(2025, 6, 15, 13, 30).timestamp()):
+            await mock_solaire_controller.calculateStatusFiltration(25.0)
+
+        assert mock_solaire_controller.get_data("filtrationTemperature") == 0
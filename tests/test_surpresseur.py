@@ -62,17 +62,16 @@ class TestExecuteSurpresseurOn:
 
     @pytest.mark.asyncio
     async def test_updates_status_display(self, mock_surpresseur_controller):
-        """Test executeSurpresseurOn updates status display with time remaining."""
+        """Test executeSurpresseurOn sets the status and publishes the end timestamp."""
         mock_surpresseur_controller.get_data = Mock(return_value=0)
         mock_surpresseur_controller.set_data = Mock()
 
         with patch('time.time', return_value=1000.0):
             await mock_surpresseur_controller.executeSurpresseurOn()
 
-        # Status should be updated with "Actif : MM:SS"
-        mock_surpresseur_controller.surpresseurStatus.set_status.assert_called_once()
-        call_arg = mock_surpresseur_controller.surpresseurStatus.set_status.call_args[0][0]
-        assert call_arg.startswith("Actif : ")
+        # Status is set once, the countdown is carried by the end timestamp
+        mock_surpresseur_controller.surpresseurStatus.set_status.assert_called_once_with("Actif")
+        assert mock_surpresseur_controller.surpresseurFinStatus.value is not None
 
     @pytest.mark.asyncio
     async def test_skips_when_surpresseur_active(self, mock_surpresseur_controller):
@@ -427,8 +426,8 @@ class TestSurpresseurIntegration:
         mock_surpresseur_controller.hass.services.async_call.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_timer_display_format(self, mock_surpresseur_controller):
-        """Test that timer display formats time correctly."""
+    async def test_end_timestamp(self, mock_surpresseur_controller):
+        """Test that the end timestamp is the start plus the configured duration."""
         mock_surpresseur_controller.get_data = Mock(return_value=0)
         mock_surpresseur_controller.set_data = Mock()
         mock_surpresseur_controller.surpresseurDuree = 5  # 5 minutes
@@ -436,11 +435,8 @@ class TestSurpresseurIntegration:
         with patch('time.time', return_value=1000.0):
             await mock_surpresseur_controller.executeSurpresseurOn()
 
-        # Check status was set with proper format
-        status_call = mock_surpresseur_controller.surpresseurStatus.set_status.call_args[0][0]
-        assert "Actif : " in status_call
-        # Should show MM:SS format (5 minutes = 05:00)
-        assert ":" in status_call.split("Actif : ")[1]
+        # 5 minutes after the start
+        assert mock_surpresseur_controller.surpresseurFinStatus.value == 1300
 
     @pytest.mark.asyncio
     async def test_concurrent_operation_prevention(self, mock_surpresseur_controller):
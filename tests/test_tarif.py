@@ -0,0 +1,352 @@
+"""Tests for tarif.py module - Tariff-aware filtration placement.
+
+Tests the time-of-use optimizer that places the daily filtration duration on
+the cheapest 15-minute slots of the day.
+
+Functions tested:
+1. optimiserPlageTarif() - Minimum cost placement (one or two segments, minimum
+   length of each segment)
+2. getTarifProfile() - Price profile from sensor attributes or config
+3. _parseTarifProfil() - "HH:MM=prix" profile parsing
+4. calculateTimeFiltrationTarif() - Timestamps of the optimized window
+5. calculateTimeFiltration() - Integration with optimisationTarif
+"""
+
+import time
+from datetime import datetime
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+# Skip all tests if Home Assistant is not installed
+pytest.importorskip("homeassistant")
+
+from custom_components.pool_control.tarif import (
+    TARIF_SLOTS_PER_DAY,
+    optimiserPlageTarif,
+)
+
+
+def brute_force(prices, slots, minSegment, maxPause, minLastSegment=None):
+    """Reference solver enumerating every one or two segment placement."""
+    if minLastSegment is None:
+        minLastSegment = minSegment
+    n = len(prices)
+    best = None
+    for start in range(n - slots + 1):
+        cost = sum(prices[start:start + slots])
+        best = cost if best is None else min(best, cost)
+    if slots >= minSegment + minLastSegment:
+        for pause in range(1, maxPause + 1):
+            for start in range(n - slots - pause + 1):
+                for first in range(minSegment, slots - minLastSegment + 1):
+                    q = start + first
+                    cost = sum(prices[start:q]) + sum(prices[q + pause:start + slots + pause])
+                    best = min(best, cost)
+    return best
+
+
+def plan_cost(prices, plan):
+    """Cost of a (debut, pauseDebut, pauseFin, fin) plan."""
+    debut, pauseDebut, pauseFin, fin = plan
+    return sum(prices[debut:pauseDebut]) + sum(prices[pauseFin:fin])
+
+
+@pytest.fixture
+def mock_tarif_controller(mock_hass, mock_pool_config):
+    """Create a mock controller with TarifMixin enabled."""
+    from custom_components.pool_control.controller import PoolController
+
+    controller = PoolController(mock_hass, mock_pool_config)
+
+    controller.filtrationTimeStatus = MagicMock()
+    controller.filtrationScheduleStatus = MagicMock()
+    controller.updateTemperatureDisplay = Mock()
+    controller.data = {}
+
+    controller.optimisationTarif = True
+    controller.tarifCapteur = None
+    controller.tarifProfil = "00:00=0.15;06:00=0.25;22:00=0.15"
+    controller.dureeSegmentMinimum = 60
+    controller.pausePlageMaximum = 120
+
+    return controller
+
+
+@pytest.mark.unit
+class TestOptimiserPlageTarif:
+    """Tests for optimiserPlageTarif() - Minimum cost placement."""
+
+    def test_single_block_on_cheapest_hours(self):
+        """Test a short duration lands entirely on the cheap period."""
+        prices = tuple([0.25] * 40 + [0.10] * 16 + [0.25] * 40)
+
+        debut, pauseDebut, pauseFin, fin = optimiserPlageTarif(prices, 8, 4, 8, 52.0)
+
+        assert pauseDebut == pauseFin
+        assert 40 <= debut and fin <= 56
+        assert fin - debut == 8
+
+    def test_two_segments_skip_expensive_peak(self):
+        """Test a pause is placed over a short price peak."""
+        prices = tuple([0.30] * 40 + [0.10] * 8 + [0.90] * 4 + [0.10] * 8 + [0.30] * 36)
+
+        plan = optimiserPlageTarif(prices, 16, 4, 8, 52.0)
+
+        assert plan == (40, 48, 52, 60)
+
+    def test_respects_minimum_segment(self):
+        """Test no segment is shorter than the minimum."""
+        prices = tuple([0.30] * 40 + [0.10] * 2 + [0.90] * 4 + [0.10] * 14 + [0.30] * 36)
+
+        debut, pauseDebut, pauseFin, fin = optimiserPlageTarif(prices, 16, 4, 8, 52.0)
+
+        if pauseDebut != pauseFin:
+            assert pauseDebut - debut >= 4
+            assert fin - pauseFin >= 4
+
+    def test_respects_minimum_last_segment(self):
+        """Test the second segment honours its own minimum."""
+        prices = tuple([0.90] * 8 + [0.10] * 5 + [0.90] * 4 + [0.10] * 4 + [0.90] * 8)
+
+        assert optimiserPlageTarif(prices, 9, 4, 8, 12.0) == (8, 13, 17, 21)
+
+        debut, pauseDebut, pauseFin, fin = optimiserPlageTarif(prices, 9, 4, 8, 12.0, 5)
+
+        assert fin - pauseFin >= 5
+        assert pauseDebut - debut >= 4
+
+    def test_respects_maximum_pause(self):
+        """Test the pause never exceeds the maximum."""
+        prices = tuple([0.10] * 8 + [0.90] * 80 + [0.10] * 8)
+
+        debut, pauseDebut, pauseFin, fin = optimiserPlageTarif(prices, 16, 4, 8, 48.0)
+
+        assert pauseFin - pauseDebut <= 8
+        assert (pauseDebut - debut) + (fin - pauseFin) == 16
+
+    def test_flat_tariff_centres_on_pivot(self):
+        """Test a flat tariff falls back to a window centred on the pivot."""
+        prices = tuple([0.20] * TARIF_SLOTS_PER_DAY)
+
+        debut, pauseDebut, pauseFin, fin = optimiserPlageTarif(prices, 8, 4, 8, 52.0)
+
+        assert (debut, fin) == (48, 56)
+        assert pauseDebut == pauseFin
+
+    def test_full_day(self):
+        """Test a 24 h duration covers the whole day."""
+        prices = tuple([0.20] * TARIF_SLOTS_PER_DAY)
+
+        assert optimiserPlageTarif(prices, 96, 4, 8, 52.0) == (0, 0, 0, 96)
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_matches_brute_force(self, seed):
+        """Test the optimizer finds the same minimum cost as an exhaustive search."""
+        import random
+
+        rng = random.Random(seed)
+        prices = tuple(round(rng.uniform(0.05, 0.5), 2) for _ in range(24))
+        slots = rng.randint(1, 20)
+        minSegment = rng.randint(1, 4)
+        maxPause = rng.randint(0, 4)
+
+        plan = optimiserPlageTarif(prices, slots, minSegment, maxPause, 12.0)
+
+        assert plan_cost(prices, plan) == pytest.approx(
+            brute_force(prices, slots, minSegment, maxPause)
+        )
+
+    @pytest.mark.parametrize("seed", range(10))
+    def test_matches_brute_force_last_segment(self, seed):
+        """Test the optimizer matches the exhaustive search with a longer last segment."""
+        import random
+
+        rng = random.Random(seed)
+        prices = tuple(round(rng.uniform(0.05, 0.5), 2) for _ in range(24))
+        slots = rng.randint(1, 20)
+        minSegment = rng.randint(1, 4)
+        maxPause = rng.randint(0, 4)
+
+        plan = optimiserPlageTarif(prices, slots, minSegment, maxPause, 12.0, minSegment + 1)
+
+        assert plan_cost(prices, plan) == pytest.approx(
+            brute_force(prices, slots, minSegment, maxPause, minSegment + 1)
+        )
+        if plan[1] != plan[2]:
+            assert plan[3] - plan[2] >= minSegment + 1
+
+    def test_solves_quickly_at_15_minute_resolution(self):
+        """Test a full day at 15-minute resolution solves in a few milliseconds."""
+        prices = tuple((i * 37 % 23) / 100 for i in range(TARIF_SLOTS_PER_DAY))
+        optimiserPlageTarif.cache_clear()
+
+        start = time.perf_counter()
+        optimiserPlageTarif(prices, 40, 4, 8, 52.0)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.02
+
+    def test_result_is_cached(self):
+        """Test an unchanged profile and duration is not solved again."""
+        prices = tuple([0.20] * TARIF_SLOTS_PER_DAY)
+        optimiserPlageTarif.cache_clear()
+
+        optimiserPlageTarif(prices, 8, 4, 8, 52.0)
+        optimiserPlageTarif(prices, 8, 4, 8, 52.0)
+
+        info = optimiserPlageTarif.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+
+@pytest.mark.unit
+class TestGetTarifProfile:
+    """Tests for getTarifProfile() - Price profile sources."""
+
+    def test_profile_from_config(self, mock_tarif_controller):
+        """Test the config profile is expanded to 96 slots."""
+        prices = mock_tarif_controller.getTarifProfile()
+
+        assert len(prices) == TARIF_SLOTS_PER_DAY
+        assert prices[0] == 0.15
+        assert prices[24] == 0.25  # 06:00
+        assert prices[88] == 0.15  # 22:00
+
+    def test_profile_wraps_before_first_change(self, mock_tarif_controller):
+        """Test the last price of the day applies before the first change."""
+        mock_tarif_controller.tarifProfil = "06:00=0.25;22:00=0.15"
+
+        prices = mock_tarif_controller.getTarifProfile()
+
+        assert prices[0] == 0.15
+        assert prices[24] == 0.25
+
+    def test_invalid_profile(self, mock_tarif_controller):
+        """Test an invalid profile returns None."""
+        mock_tarif_controller.tarifProfil = "06h=cher"
+
+        assert mock_tarif_controller.getTarifProfile() is None
+
+    def test_profile_from_sensor_hourly(self, mock_tarif_controller, mock_state_factory):
+        """Test hourly sensor attributes are expanded to 15-minute slots."""
+        mock_tarif_controller.tarifCapteur = "sensor.prix"
+        state = mock_state_factory(
+            "sensor.prix", "0.2", {"today": list(range(24)), "tomorrow": [1.0] * 24}
+        )
+        mock_tarif_controller.hass.states.get = Mock(return_value=state)
+
+        today = mock_tarif_controller.getTarifProfile(0)
+        tomorrow = mock_tarif_controller.getTarifProfile(1)
+
+        assert len(today) == TARIF_SLOTS_PER_DAY
+        assert today[4:8] == (1.0, 1.0, 1.0, 1.0)
+        assert set(tomorrow) == {1.0}
+
+    def test_sensor_missing_tomorrow(self, mock_tarif_controller, mock_state_factory):
+        """Test missing tomorrow prices return None."""
+        mock_tarif_controller.tarifCapteur = "sensor.prix"
+        state = mock_state_factory("sensor.prix", "0.2", {"today": [0.2] * 24})
+        mock_tarif_controller.hass.states.get = Mock(return_value=state)
+
+        assert mock_tarif_controller.getTarifProfile(1) is None
+
+    def test_sensor_not_found(self, mock_tarif_controller):
+        """Test a missing sensor returns None."""
+        mock_tarif_controller.tarifCapteur = "sensor.prix"
+
+        assert mock_tarif_controller.getTarifProfile() is None
+
+
+@pytest.mark.unit
+class TestCalculateTimeFiltrationTarif:
+    """Tests for calculateTimeFiltration() with optimisationTarif."""
+
+    def test_window_on_cheap_hours(self, mock_tarif_controller):
+        """Test a 4 h filtration is placed at the end of the 00:00-06:00 cheap period."""
+        debut, pauseDebut, pauseFin, fin = mock_tarif_controller.calculateTimeFiltrationTarif(
+            4 * 3600, "13:00", False
+        )
+
+        assert datetime.fromtimestamp(debut) == datetime.now().replace(
+            hour=2, minute=0, second=0, microsecond=0
+        )
+        assert pauseDebut == pauseFin
+        assert fin - debut == 4 * 3600
+
+    def test_runtime_is_exact(self, mock_tarif_controller):
+        """Test the runtime equals the duration even when not a multiple of 15 min."""
+        debut, pauseDebut, pauseFin, fin = mock_tarif_controller.calculateTimeFiltrationTarif(
+            3 * 3600 + 7 * 60, "13:00", False
+        )
+
+        assert fin - debut - (pauseFin - pauseDebut) == 3 * 3600 + 7 * 60
+
+    def test_last_segment_minimum_with_partial_slot(self, mock_tarif_controller):
+        """Test the shortened last segment still lasts the minimum duration."""
+        mock_tarif_controller.tarifProfil = (
+            "00:00=0.30;02:00=0.10;03:15=0.90;04:15=0.10;05:15=0.30"
+        )
+        duree = 2 * 3600 + 7 * 60
+
+        debut, pauseDebut, pauseFin, fin = mock_tarif_controller.calculateTimeFiltrationTarif(
+            duree, "13:00", False
+        )
+
+        assert fin - debut - (pauseFin - pauseDebut) == duree
+        if pauseDebut != pauseFin:
+            assert pauseDebut - debut >= 60 * 60
+            assert fin - pauseFin >= 60 * 60
+
+    def test_tomorrow_when_window_passed(self, mock_tarif_controller):
+        """Test the window moves to tomorrow when today's plan already started."""
+        now = datetime.now().replace(hour=23, minute=59).timestamp()
+
+        with patch("time.time", return_value=now):
+            debut, _, _, _ = mock_tarif_controller.calculateTimeFiltrationTarif(
+                4 * 3600, "13:00", True
+            )
+
+        assert debut > now
+        assert datetime.fromtimestamp(debut).hour == 2
+
+    def test_no_profile_returns_none(self, mock_tarif_controller):
+        """Test no profile falls back to the pivot distribution."""
+        mock_tarif_controller.tarifProfil = ""
+
+        assert mock_tarif_controller.calculateTimeFiltrationTarif(3600, "13:00", False) is None
+
+    def test_calculate_time_filtration_uses_tarif(self, mock_tarif_controller):
+        """Test calculateTimeFiltration stores the optimized window, pausePivot ignored."""
+        mock_tarif_controller.pausePivot = 30
+        mock_tarif_controller.calculateTimeFiltrationTarif = Mock(
+            return_value=(1000.0, 2000.0, 3000.0, 4000.0)
+        )
+
+        mock_tarif_controller.calculateTimeFiltration(25.0, False)
+
+        assert mock_tarif_controller.get_data("filtrationDebut") == 1000
+        assert mock_tarif_controller.get_data("filtrationPauseDebut") == 2000
+        assert mock_tarif_controller.get_data("filtrationPauseFin") == 3000
+        assert mock_tarif_controller.get_data("filtrationFin") == 4000
+
+    def test_calculate_time_filtration_fallback_to_pivot(self, mock_tarif_controller):
+        """Test calculateTimeFiltration uses the pivot when no profile is available."""
+        mock_tarif_controller.tarifProfil = ""
+        mock_tarif_controller.distributionDatePivot = 1
+        mock_tarif_controller.datePivot = "13:00"
+
+        mock_tarif_controller.calculateTimeFiltration(25.0, False)
+
+        debut = mock_tarif_controller.get_data("filtrationDebut")
+        fin = mock_tarif_controller.get_data("filtrationFin")
+        pivot = datetime.combine(datetime.today().date(), datetime.strptime("13:00", "%H:%M").time())
+        assert (debut + fin) / 2 == pytest.approx(pivot.timestamp(), abs=1)
+
+    def test_disabled_by_default(self, mock_hass, mock_pool_config):
+        """Test the optimizer is disabled without configuration."""
+        from custom_components.pool_control.controller import PoolController
+
+        controller = PoolController(mock_hass, mock_pool_config)
+
+        assert controller.optimisationTarif is False
@@ -0,0 +1,236 @@
+"""Tests for trace.py module - Decision trace.
+
+Tests the bounded in-memory trace explaining every actuator change.
+
+Functions tested:
+1. DecisionRecord - Slotted record and serialisation
+2. debutDecision() / finDecision() - Decision lifecycle, one per task
+3. tracerCommande() - Commands issued by _safe_service_call
+4. activatingDevices() - Winning reason and commands of a decision
+5. getDecisions() - Query, most recent first
+6. get_decisions service - Service response
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+import pytest
+
+# Skip all tests if Home Assistant is not installed
+pytest.importorskip("homeassistant")
+
+from custom_components.pool_control.trace import (
+    TRACE_CAPACITE,
+    TRACE_ENTREES,
+    DecisionRecord,
+)
+
+
+@pytest.fixture
+def mock_trace_controller(mock_hass, mock_pool_config, mock_switch_off):
+    """Create a controller whose actuators are off."""
+    from custom_components.pool_control.controller import PoolController
+
+    controller = PoolController(mock_hass, mock_pool_config)
+
+    controller.asservissementStatus = MagicMock()
+    controller.filtrationStatus = MagicMock()
+    controller.surpresseurStatus = MagicMock()
+    controller.traitement = None
+    controller.traitement_2 = None
+    controller.getStateSurpresseur = Mock(return_value=False)
+    controller.surpresseurStop = AsyncMock()
+    controller.data = {}
+    mock_hass.states.get = Mock(return_value=mock_switch_off)
+
+    return controller
+
+
+@pytest.mark.unit
+class TestDecisionRecord:
+    """Tests for DecisionRecord."""
+
+    def test_is_slotted(self):
+        """Test records carry no per-instance dict."""
+        record = DecisionRecord(0.0, (0,) * len(TRACE_ENTREES), "aucune")
+
+        assert not hasattr(record, "__dict__")
+
+    def test_as_dict(self):
+        """Test the record is serialised with named inputs."""
+        record = DecisionRecord(0.0, (0, 0, 1, 0, 0, 0, 0), "filtrationTemperature")
+        record.commandes.append(("switch.turn_on", "switch.pool_pump", True))
+
+        result = record.as_dict()
+
+        assert result["raison"] == "filtrationTemperature"
+        assert result["entrees"]["filtrationTemperature"] == 1
+        assert result["commandes"] == [
+            {"service": "switch.turn_on", "entity_id": "switch.pool_pump", "succes": True}
+        ]
+
+
+@pytest.mark.unit
+class TestDecisionLifecycle:
+    """Tests for debutDecision() / finDecision() / tracerCommande()."""
+
+    def test_kept_only_with_commands(self, mock_trace_controller):
+        """Test a decision without command is not stored."""
+        jeton = mock_trace_controller.debutDecision("aucune")
+        mock_trace_controller.finDecision(jeton)
+
+        assert len(mock_trace_controller.traceDecisions) == 0
+
+    def test_command_outside_decision(self, mock_trace_controller):
+        """Test commands outside a decision are ignored."""
+        mock_trace_controller.tracerCommande("switch.turn_on", "switch.pool_pump", True)
+
+        assert len(mock_trace_controller.traceDecisions) == 0
+
+    def test_nested_decisions(self, mock_trace_controller):
+        """Test a nested decision restores the enclosing one."""
+        externe = mock_trace_controller.debutDecision("marcheForcee")
+        interne = mock_trace_controller.debutDecision("filtrationSolaire")
+        mock_trace_controller.tracerCommande("switch.turn_on", "switch.pool_pump", True)
+        mock_trace_controller.finDecision(interne)
+        mock_trace_controller.tracerCommande("switch.turn_off", "switch.pool_pump", True)
+        mock_trace_controller.finDecision(externe)
+
+        decisions = mock_trace_controller.getDecisions()
+
+        assert [d["raison"] for d in decisions] == ["marcheForcee", "filtrationSolaire"]
+        assert mock_trace_controller.decisionEnCours() is None
+
+    @pytest.mark.asyncio
+    async def test_interleaved_tasks(self, mock_trace_controller):
+        """Test decisions of interleaved tasks keep their own commands."""
+
+        async def decision(raison, entity_id):
+            """Decision waiting between its commands, like activatingDevices."""
+            jeton = mock_trace_controller.debutDecision(raison)
+            await asyncio.sleep(0)
+            mock_trace_controller.tracerCommande("switch.turn_on", entity_id, True)
+            await asyncio.sleep(0)
+            mock_trace_controller.finDecision(jeton)
+
+        await asyncio.gather(
+            decision("marcheForcee", "switch.pool_pump"),
+            decision("filtrationSolaire", "switch.traitement"),
+        )
+
+        commandes = {
+            d["raison"]: [c["entity_id"] for c in d["commandes"]]
+            for d in mock_trace_controller.getDecisions()
+        }
+        assert commandes == {
+            "marcheForcee": ["switch.pool_pump"],
+            "filtrationSolaire": ["switch.traitement"],
+        }
+        assert mock_trace_controller.decisionEnCours() is None
+
+    def test_other_controller_ignored(
+        self, mock_trace_controller, mock_hass, mock_pool_config
+    ):
+        """Test a command of another pool is not added to this decision."""
+        from custom_components.pool_control.controller import PoolController
+
+        autre = PoolController(mock_hass, mock_pool_config)
+        jeton = mock_trace_controller.debutDecision("marcheForcee")
+        autre.tracerCommande("switch.turn_on", "switch.autre_pompe", True)
+        mock_trace_controller.finDecision(jeton)
+
+        assert mock_trace_controller.getDecisions() == []
+
+    def test_memory_bounded(self, mock_trace_controller):
+        """Test the trace never exceeds its capacity."""
+        for _ in range(TRACE_CAPACITE + 10):
+            jeton = mock_trace_controller.debutDecision("aucune")
+            mock_trace_controller.tracerCommande("switch.turn_off", "switch.pool_pump", True)
+            mock_trace_controller.finDecision(jeton)
+
+        assert len(mock_trace_controller.traceDecisions) == TRACE_CAPACITE
+
+
+@pytest.mark.unit
+class TestActivatingDevicesTrace:
+    """Tests for the decisions recorded by activatingDevices()."""
+
+    @pytest.mark.asyncio
+    async def test_records_winning_reason(self, mock_trace_controller):
+        """Test the first flag requesting the filtration is recorded."""
+        mock_trace_controller.data = {"filtrationSolaire": 1, "marcheForcee": 1}
+
+        await mock_trace_controller.activatingDevices()
+
+        decision = mock_trace_controller.getDecisions()[0]
+        assert decision["raison"] == "filtrationSolaire"
+        assert decision["entrees"]["marcheForcee"] == 1
+        assert decision["commandes"][0]["service"] == "switch.turn_on"
+        assert decision["commandes"][0]["entity_id"] == mock_trace_controller.filtration
+
+    @pytest.mark.asyncio
+    async def test_records_failed_command(self, mock_trace_controller):
+        """Test a failing service call is recorded as failed."""
+        mock_trace_controller.data = {"marcheForcee": 1}
+        mock_trace_controller.hass.services.async_call = AsyncMock(
+            side_effect=Exception("Relay unavailable")
+        )
+
+        await mock_trace_controller.activatingDevices()
+
+        decision = mock_trace_controller.getDecisions()[0]
+        assert decision["commandes"][0]["succes"] is False
+
+    @pytest.mark.asyncio
+    async def test_no_record_without_change(self, mock_trace_controller):
+        """Test nothing is recorded when no actuator is switched."""
+        await mock_trace_controller.activatingDevices()
+
+        assert mock_trace_controller.getDecisions() == []
+
+    @pytest.mark.asyncio
+    async def test_stop_all_reason(self, mock_trace_controller, mock_switch_on):
+        """Test the total stop mode is recorded as reason."""
+        mock_trace_controller.data = {"arretTotal": 1, "marcheForcee": 1}
+        mock_trace_controller.hass.states.get = Mock(return_value=mock_switch_on)
+
+        await mock_trace_controller.activatingDevices()
+
+        assert mock_trace_controller.getDecisions()[0]["raison"] == "arretTotal"
+
+
+@pytest.mark.unit
+class TestGetDecisions:
+    """Tests for getDecisions() and the get_decisions service."""
+
+    def test_most_recent_first_with_limit(self, mock_trace_controller):
+        """Test decisions are returned most recent first, up to the limit."""
+        for raison in ("a", "b", "c"):
+            jeton = mock_trace_controller.debutDecision(raison)
+            mock_trace_controller.tracerCommande("switch.turn_on", "switch.pool_pump", True)
+            mock_trace_controller.finDecision(jeton)
+
+        decisions = mock_trace_controller.getDecisions(2)
+
+        assert [d["raison"] for d in decisions] == ["c", "b"]
+
+    @pytest.mark.asyncio
+    async def test_service_response(self, mock_hass, mock_trace_controller):
+        """Test the service returns the decisions of the controller."""
+        from custom_components.pool_control import _async_register_services
+        from custom_components.pool_control.const import DOMAIN, SERVICE_GET_DECISIONS
+
+        mock_hass.data = {DOMAIN: {"test_entry_id": mock_trace_controller}}
+        mock_hass.services.has_service = Mock(return_value=False)
+        mock_hass.services.async_register = Mock()
+        mock_trace_controller.getDecisions = Mock(return_value=[{"raison": "a"}])
+
+        _async_register_services(mock_hass)
+
+        args = mock_hass.services.async_register.call_args
+        assert args[0][1] == SERVICE_GET_DECISIONS
+        handler = args[0][2]
+        response = await handler(Mock(data={"limite": 5}))
+
+        assert response == {"decisions": [{"raison": "a"}]}
+        mock_trace_controller.getDecisions.assert_called_once_with(5)